@@ -0,0 +1 @@
+"""Micro-benchmarks for the operator, run against the in-process fake API in :mod:`tests.fake_k8s`."""
@@ -0,0 +1,72 @@
+"""CPU and allocations of :func:`build_manifest` on large Job fixtures.
+
+"before" is the previous implementation, which deep-copied the whole
+serialised Job (status, annotations, ``managedFields`` …) and then kept
+only the pod template.  "after" is the current :func:`build_manifest`,
+which copies ``spec.template`` alone.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_build_manifest
+"""
+
+from __future__ import annotations
+
+import copy
+import time
+import tracemalloc
+from typing import Any, Callable
+
+from tabulate import tabulate
+
+from flickr_immich_k8s_sync_operator.operator import SERVER_MANAGED_LABELS, build_manifest
+from tests.fake_k8s import large_job_dict
+
+JOB_COUNT: int = 500
+ROUNDS: int = 5
+
+
+def _build_manifest_full_copy(job_dict: dict[str, Any]) -> dict[str, Any]:
+    """The previous :func:`build_manifest`: deep-copy everything, keep the template."""
+    raw = copy.deepcopy(job_dict)
+    template = raw["spec"]["template"]
+    tmpl_labels = template.get("metadata", {}).get("labels", {})
+    for label in SERVER_MANAGED_LABELS:
+        tmpl_labels.pop(label, None)
+    return {
+        "apiVersion": "batch/v1",
+        "kind": "Job",
+        "metadata": {"name": raw["metadata"]["name"], "namespace": raw["metadata"]["namespace"]},
+        "spec": {"backoffLimit": raw["spec"]["backoffLimit"], "template": template},
+    }
+
+
+def main() -> None:
+    jobs = [large_job_dict(f"flickr-downloader-user{i:04d}", active=1) for i in range(JOB_COUNT)]
+    variants: list[tuple[str, Callable[[dict[str, Any]], dict[str, Any]]]] = [
+        ("before (full deepcopy)", _build_manifest_full_copy),
+        ("after (template only)", build_manifest),
+    ]
+
+    rows = []
+    for label, fn in variants:
+        assert fn(jobs[0]) == build_manifest(jobs[0])
+        start = time.process_time()
+        for _ in range(ROUNDS):
+            for job in jobs:
+                fn(job)
+        cpu_us = (time.process_time() - start) * 1_000_000 / (ROUNDS * JOB_COUNT)
+
+        # Keep every result alive so the peak reflects what a full cycle allocates.
+        tracemalloc.start()
+        results = [fn(job) for job in jobs]
+        _, peak = tracemalloc.get_traced_memory()
+        del results
+        tracemalloc.stop()
+        rows.append([label, JOB_COUNT, f"{cpu_us:.1f}", f"{peak / JOB_COUNT / 1024:.1f}"])
+
+    print(tabulate(rows, headers=["variant", "jobs", "CPU µs/job", "peak KiB/job"], tablefmt="mixed_grid"))
+
+
+if __name__ == "__main__":
+    main()
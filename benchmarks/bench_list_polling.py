@@ -0,0 +1,75 @@
+"""Compare API requests and wall time of ``poll`` vs ``list`` check cycles.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_list_polling
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+from tabulate import tabulate
+
+from flickr_immich_k8s_sync_operator.config import OperatorConfig
+from tests.fake_k8s import FakeCluster, job_dict, make_operator
+
+JOB_COUNTS: tuple[int, ...] = (10, 100, 500, 1000)
+
+# Every n-th Job is failed and still waiting out its restart delay.
+FAILED_EVERY: int = 10
+
+
+def _populate(cluster: FakeCluster, count: int) -> list[str]:
+    names = [f"flickr-downloader-user{i:04d}" for i in range(count)]
+    recently = datetime.now(timezone.utc) - timedelta(minutes=5)
+    for i, name in enumerate(names):
+        if i % FAILED_EVERY == 0:
+            cluster.add_job(job_dict(name, failed_at=recently))
+            cluster.add_pod(name, f"{name}-pod0")
+        else:
+            cluster.add_job(job_dict(name, active=1))
+    return names
+
+
+def _measure(count: int, mode: str) -> tuple[int, int, float]:
+    cluster = FakeCluster()
+    names = _populate(cluster, count)
+    cfg = OperatorConfig(
+        namespace="flickr-downloader",
+        job_names=names,
+        check_interval=60,
+        restart_delay=3600,
+        skip_delay_on_oom=False,
+        check_mode=mode,
+    )
+    op = make_operator(cfg, cluster)
+    cycle = op._list_cycle if mode == "list" else op._poll_cycle
+
+    start = time.perf_counter()
+    cycle(threading.Event())
+    elapsed = time.perf_counter() - start
+
+    job_calls = cluster.calls["read_namespaced_job"] + cluster.calls["list_namespaced_job"]
+    return job_calls, sum(cluster.calls.values()), elapsed
+
+
+def main() -> None:
+    rows = []
+    for count in JOB_COUNTS:
+        for mode in ("poll", "list"):
+            job_calls, total_calls, elapsed = _measure(count, mode)
+            rows.append([count, mode, job_calls, total_calls, f"{elapsed * 1000:.1f}"])
+    print(
+        tabulate(
+            rows,
+            headers=["jobs", "mode", "job requests/cycle", "all requests/cycle", "cycle ms"],
+            tablefmt="mixed_grid",
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+"""Measure the operator at growing fleet sizes against a slow, unreliable fake API server.
+
+For every Job count and check mode, a seeded share of the Jobs fails and is
+restarted right away (``restart_delay=0``) while the fake API server adds a
+fixed latency to every request and fails a share of them with ``500``.
+Reported per run:
+
+- the wall time of the cycle restarting the failed Jobs (``poll``/``list``),
+  or from the first failure until the last restart (``watch``);
+- the mean restart latency (delete to recreate) from ``restart_duration``;
+- the API requests of that cycle and the resident memory afterwards.
+
+Log output is disabled so that it does not dominate the timings.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_operator_scale [JOB_COUNT ...]
+"""
+
+from __future__ import annotations
+
+import os
+import random
+import resource
+import sys
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+from loguru import logger
+from tabulate import tabulate
+
+from flickr_immich_k8s_sync_operator.config import OperatorConfig
+from flickr_immich_k8s_sync_operator.operator import JobRestartOperator
+from tests.fake_k8s import FakeCluster, job_dict, make_operator
+
+JOB_COUNTS: tuple[int, ...] = (10, 100, 1000, 5000)
+
+MODES: tuple[str, ...] = ("poll", "list", "watch")
+
+# Share of the Jobs that fail.
+FAILURE_SHARE: float = 0.1
+
+# Seconds added to every API request.
+LATENCY: float = 0.0005
+
+# Share of the API requests answered with ``500``.
+ERROR_RATE: float = 0.01
+
+# Seconds without a new restart after which ``watch`` mode stops waiting; a
+# check failed by an injected error is retried by the work queue after its
+# back-off (1 s for the first error).
+WATCH_QUIET: float = 2.0
+
+SEED: int = 42
+
+FAILED_CONDITION = [{"type": "Failed", "status": "True", "lastTransitionTime": "2025-01-01T00:00:00Z"}]
+
+
+def _rss_mib() -> float:
+    """Return the resident memory of this process (the peak where ``/proc`` is missing)."""
+    try:
+        with open("/proc/self/statm", encoding="ascii") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2**20
+    except OSError:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def _setup(count: int, mode: str) -> tuple[FakeCluster, JobRestartOperator, list[str]]:
+    """Create a cluster of *count* Jobs and pick the ones that will fail."""
+    cluster = FakeCluster(seed=SEED)
+    names = [f"flickr-downloader-user{i:04d}" for i in range(count)]
+    failed = random.Random(SEED).sample(names, max(1, round(count * FAILURE_SHARE)))
+    failed_at = datetime.now(timezone.utc) - timedelta(hours=1)
+    for name in names:
+        if name in failed and mode != "watch":
+            cluster.add_job(job_dict(name, failed_at=failed_at, started_at=failed_at - timedelta(hours=1)))
+        else:
+            cluster.add_job(job_dict(name, active=1))
+        if name in failed:
+            cluster.add_pod(name, f"{name}-pod0", log="Downloading...\nConnection reset by peer\n")
+    cfg = OperatorConfig(
+        namespace="flickr-downloader",
+        job_names=names,
+        check_interval=60,
+        restart_delay=0,
+        skip_delay_on_oom=False,
+        check_mode=mode,
+    )
+    return cluster, make_operator(cfg, cluster), failed
+
+
+def _cycle(cluster: FakeCluster, op: JobRestartOperator, mode: str) -> float:
+    """Run one ``poll``/``list`` check cycle and return its wall time."""
+    cycle = op._list_cycle if mode == "list" else op._poll_cycle
+    start = time.perf_counter()
+    cycle(threading.Event())
+    return time.perf_counter() - start
+
+
+def _watch(cluster: FakeCluster, op: JobRestartOperator, failed: list[str]) -> float:
+    """Fail *failed* under a running watch-mode operator and return the time until the last restart."""
+    shutdown = threading.Event()
+    thread = threading.Thread(target=op.run, args=(shutdown,), daemon=True)
+    thread.start()
+    try:
+        while op._informer is None or not op._informer.wait_for_sync(timeout=0.01):
+            time.sleep(0.001)
+        cluster.reset_calls()
+        start = time.perf_counter()
+        for name in failed:
+            cluster.update_status(name, active=None, conditions=FAILED_CONDITION)
+        restarts, last_restart = 0, start
+        while restarts < len(failed) and time.perf_counter() - last_restart < WATCH_QUIET:
+            time.sleep(0.005)
+            if op.metrics.restart_duration.count() > restarts:
+                restarts, last_restart = op.metrics.restart_duration.count(), time.perf_counter()
+        return last_restart - start
+    finally:
+        shutdown.set()
+        thread.join(timeout=10)
+
+
+def _measure(count: int, mode: str) -> list[object]:
+    cluster, op, failed = _setup(count, mode)
+    cluster.latency = LATENCY
+    cluster.failure_rate = ERROR_RATE
+    if mode == "watch":
+        elapsed = _watch(cluster, op, failed)
+    else:
+        elapsed = _cycle(cluster, op, mode)
+    restarts = op.metrics.restart_duration.count()
+    latency = op.metrics.restart_duration.total() / restarts if restarts else 0.0
+    return [
+        count,
+        mode,
+        f"{restarts}/{len(failed)}",
+        f"{elapsed * 1000:.1f}",
+        f"{latency * 1000:.2f}",
+        sum(cluster.calls.values()),
+        f"{_rss_mib():.1f}",
+    ]
+
+
+def main() -> None:
+    counts = tuple(int(arg) for arg in sys.argv[1:]) or JOB_COUNTS
+    logger.disable("flickr_immich_k8s_sync_operator")
+    rows = [_measure(count, mode) for count in counts for mode in MODES]
+    print(
+        tabulate(
+            rows,
+            headers=["jobs", "mode", "restarted", "cycle ms", "restart latency ms", "requests", "RSS MiB"],
+            tablefmt="mixed_grid",
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
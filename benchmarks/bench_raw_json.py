@@ -0,0 +1,68 @@
+"""CPU and peak memory of a ``list`` check cycle with and without ``RAW_JSON`` (500 large Jobs).
+
+"models" is the default path: the LIST response is deserialised into
+``V1Job`` models and serialised back to dicts for the manifest cache.
+"raw json" requests the LIST with ``_preload_content=False`` and works on
+the parsed JSON directly.  Both variants start with a cold manifest cache
+on every cycle so the full per-Job work is measured.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_raw_json
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+import tracemalloc
+
+from tabulate import tabulate
+
+from flickr_immich_k8s_sync_operator.config import OperatorConfig
+from tests.fake_k8s import FakeCluster, large_job_dict, make_operator
+
+JOB_COUNT: int = 500
+CYCLES: int = 10
+
+
+def main() -> None:
+    cluster = FakeCluster()
+    names = [f"flickr-downloader-user{i:04d}" for i in range(JOB_COUNT)]
+    for name in names:
+        cluster.add_job(large_job_dict(name, active=1))
+    shutdown = threading.Event()
+
+    rows = []
+    for label, raw_json in (("models", False), ("raw json", True)):
+        cfg = OperatorConfig(
+            namespace="flickr-downloader",
+            job_names=names,
+            check_interval=60,
+            restart_delay=3600,
+            skip_delay_on_oom=False,
+            check_mode="list",
+            raw_json=raw_json,
+        )
+        op = make_operator(cfg, cluster)
+        op._list_cycle(shutdown)
+
+        start = time.process_time()
+        for _ in range(CYCLES):
+            op._manifest_keys.clear()
+            op._list_cycle(shutdown)
+        cpu_ms = (time.process_time() - start) * 1000 / CYCLES
+
+        op._manifest_keys.clear()
+        tracemalloc.start()
+        op._list_cycle(shutdown)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        op._executor.shutdown()
+        rows.append([label, JOB_COUNT, f"{cpu_ms:.1f}", f"{peak / 1024 / 1024:.1f}"])
+
+    print(tabulate(rows, headers=["variant", "jobs", "CPU ms/cycle", "peak MiB"], tablefmt="mixed_grid"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""Compare wall time and API requests of the ``recreate`` and ``apply`` restart strategies.
+
+The fake API server keeps a Foreground-deleted Job visible for
+``GC_REQUESTS`` requests, like a Job whose Pods are still terminating, and
+adds ``LATENCY`` seconds to every request.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_restart_strategy
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from datetime import datetime, timezone
+
+from loguru import logger
+from tabulate import tabulate
+
+from flickr_immich_k8s_sync_operator.config import RESTART_STRATEGIES, OperatorConfig
+from flickr_immich_k8s_sync_operator.operator import build_manifest
+from tests.fake_k8s import FakeCluster, job_dict, make_operator
+
+JOB_NAME: str = "flickr-downloader-alice"
+
+RESTARTS: int = 5
+
+# Requests a Foreground-deleted Job stays visible before it is garbage-collected.
+GC_REQUESTS: int = 2
+
+# Seconds added to every API request.
+LATENCY: float = 0.002
+
+
+def _measure(strategy: str) -> tuple[float, float]:
+    cluster = FakeCluster()
+    cluster.gc_requests = GC_REQUESTS
+    cluster.latency = LATENCY
+    cluster.add_job(job_dict(JOB_NAME, failed_at=datetime.now(timezone.utc)))
+    cfg = OperatorConfig(
+        namespace="flickr-downloader",
+        job_names=[JOB_NAME],
+        check_interval=60,
+        restart_delay=0,
+        skip_delay_on_oom=False,
+        restart_strategy=strategy,
+    )
+    op = make_operator(cfg, cluster)
+    op._cached_manifests[JOB_NAME] = build_manifest(cluster.jobs[("flickr-downloader", JOB_NAME)])
+
+    start = time.perf_counter()
+    for _ in range(RESTARTS):
+        op._cached_uids[JOB_NAME] = cluster.jobs[("flickr-downloader", JOB_NAME)]["metadata"]["uid"]
+        op._restart_job(JOB_NAME, threading.Event())
+    elapsed = time.perf_counter() - start
+    return elapsed / RESTARTS, sum(cluster.calls.values()) / RESTARTS
+
+
+def main() -> None:
+    logger.disable("flickr_immich_k8s_sync_operator")
+    rows = []
+    for strategy in RESTART_STRATEGIES:
+        per_restart, requests = _measure(strategy)
+        rows.append([strategy, f"{per_restart * 1000:.1f}", f"{requests:.1f}"])
+    print(tabulate(rows, headers=["strategy", "ms/restart", "requests/restart"], tablefmt="mixed_grid"))
+
+
+if __name__ == "__main__":
+    main()
@@ -3,12 +3,17 @@
 import signal
 import sys
 import threading
+from typing import TYPE_CHECKING
 
 from loguru import logger as glogger
 
 from flickr_immich_k8s_sync_operator import configure_logging, print_startup_banner
 from flickr_immich_k8s_sync_operator.config import OperatorConfig
 from flickr_immich_k8s_sync_operator.operator import JobRestartOperator
+from flickr_immich_k8s_sync_operator.supervisor import NamespaceSupervisor
+
+if TYPE_CHECKING:
+    from flickr_immich_k8s_sync_operator.aio_operator import AsyncJobRestartOperator
 
 configure_logging()
 glogger.enable("flickr_immich_k8s_sync_operator")
@@ -32,8 +37,9 @@ def main() -> None:
     """Run the operator.
 
     Registers signal handlers, prints a startup banner with version and
-    configuration, initialises the Kubernetes client, and enters the
-    operator's main loop.
+    configuration, initialises the Kubernetes client of the configured
+    engine, and enters the operator's main loop — or, with ``NAMESPACES``,
+    the loop of the :class:`NamespaceSupervisor`.
     """
     signal.signal(signal.SIGTERM, _signal_handler)
     signal.signal(signal.SIGINT, _signal_handler)
@@ -45,8 +51,19 @@ def main() -> None:
         glogger.error("Configuration error: {}", exc)
         sys.exit(1)
 
+    operator: JobRestartOperator | AsyncJobRestartOperator | NamespaceSupervisor
     try:
-        operator = JobRestartOperator(cfg)
+        if cfg.engine == "async":
+            from flickr_immich_k8s_sync_operator.aio_operator import AsyncJobRestartOperator
+        if cfg.namespaces:
+            operator = NamespaceSupervisor(cfg)
+        elif cfg.engine == "async":
+            operator = AsyncJobRestartOperator(cfg)
+        else:
+            operator = JobRestartOperator(cfg)
+    except ImportError as exc:
+        glogger.error("ENGINE=async requires the 'async' extra (kubernetes_asyncio): {}", exc)
+        sys.exit(1)
     except Exception as exc:
         glogger.error("Failed to initialise Kubernetes clients: {}", exc)
         sys.exit(1)
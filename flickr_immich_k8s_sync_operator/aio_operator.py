@@ -0,0 +1,699 @@
+"""Asyncio engine — the Job-restart operator on top of ``kubernetes_asyncio``.
+
+Selected with ``ENGINE=async``.  Requires the optional ``async`` extra
+(``pip install flickr-immich-k8s-sync-operator[async]``).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import random
+import textwrap
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, TypeVar
+
+from kubernetes_asyncio import client, config
+from loguru import logger as glogger
+
+from flickr_immich_k8s_sync_operator.classifier import HOLD, IMMEDIATE, FailureClassifier
+from flickr_immich_k8s_sync_operator.config import OperatorConfig
+from flickr_immich_k8s_sync_operator.discovery import ManagedJobs, describe_jobs
+from flickr_immich_k8s_sync_operator.governor import RATE_LIMITED, RestartGovernor
+from flickr_immich_k8s_sync_operator.history import Failure, FailureHistory
+from flickr_immich_k8s_sync_operator.metrics import OperatorMetrics, restart_reason, start_metrics_server
+from flickr_immich_k8s_sync_operator.operator import (
+    APPLY_PATCH_CONTENT_TYPE,
+    CREATE_RETRIES,
+    CREATE_RETRY_BASE,
+    DELETION_POLL_INITIAL,
+    DELETION_POLL_MAX,
+    FIELD_MANAGER,
+    LOGS_UNAVAILABLE,
+    SCHEDULED_RESTART_RETRY,
+    build_manifest,
+    deleted_immediately,
+    failed_since,
+    job_uid,
+    manifest_key,
+    started_at,
+    succeeded,
+    terminated_state,
+)
+from flickr_immich_k8s_sync_operator.state_store import JobRecord, StateStore, open_state_store
+
+_T = TypeVar("_T")
+
+
+def _bridge_shutdown(shutdown_event: threading.Event, loop: asyncio.AbstractEventLoop, stop: asyncio.Event) -> None:
+    """Block until *shutdown_event* is set, then set *stop* on *loop*.
+
+    Runs in a daemon thread rather than the loop's executor: when the loop
+    ends without a shutdown request (an error), the thread stays blocked
+    until the process exits instead of keeping ``asyncio.run`` from
+    returning.
+    """
+    shutdown_event.wait()
+    try:
+        loop.call_soon_threadsafe(stop.set)
+    except RuntimeError:  # the loop has already been closed
+        pass
+
+
+class AsyncJobRestartOperator:
+    """Asyncio counterpart of :class:`~flickr_immich_k8s_sync_operator.operator.JobRestartOperator`.
+
+    All Job checks, pod log fetches and restarts of a cycle run as tasks on
+    a single event loop; ``workers`` bounds how many Jobs are handled at the
+    same time.  Responses are requested with ``_preload_content=False`` and
+    parsed straight into plain dicts.  Supports the ``poll`` and ``list``
+    check modes.  Delayed restarts are scheduled as tasks that sleep until
+    their deadline.
+    """
+
+    def __init__(
+        self,
+        cfg: OperatorConfig,
+        metrics: OperatorMetrics | None = None,
+        governor: RestartGovernor | None = None,
+    ) -> None:
+        """Load the in-cluster configuration and bind a structured logger.
+
+        The API clients themselves are created inside the event loop by
+        :meth:`run`.
+
+        Args:
+            cfg: Operator configuration (namespace, job names, timings).
+            metrics: Metrics to record into, e.g. shared by the operators of
+                several namespaces; new ones are created if omitted.
+            governor: Restart governor, e.g. shared by the operators of several
+                namespaces; a new one is created from *cfg* if omitted.
+        """
+        config.load_incluster_config()
+        self._cfg = cfg
+        self._batch_v1: Any = None
+        self._core_v1: Any = None
+        self._cached_manifests: dict[str, dict[str, Any]] = {}
+        self._cached_uids: dict[str, str] = {}
+        self._manifest_keys: dict[str, str] = {}
+        # job name -> (Job UID, {pod UID: (exit code, reason, log tail)})
+        self._pod_diagnostics: dict[str, tuple[str, dict[str, tuple[int | None, str | None, str]]]] = {}
+        self._managed = ManagedJobs(cfg)
+        self._job_locks: dict[str, asyncio.Lock] = {}
+        self._semaphore: asyncio.Semaphore | None = None
+        # job name -> (UID of the failed instance, monotonic deadline, task)
+        self._scheduled: dict[str, tuple[str, float, asyncio.Task[None]]] = {}
+        self._stop: asyncio.Event | None = None
+        self._log = glogger.bind(classname=self.__class__.__name__)
+        self._state: StateStore = open_state_store(cfg)
+        self.metrics = metrics or OperatorMetrics()
+        self._governor = governor or RestartGovernor.from_config(cfg)
+        self._history = FailureHistory(cfg)
+        self._classifier = FailureClassifier.from_config(cfg)
+        for job_name, record in self._state.load().items():
+            if self._managed.accepts(job_name):
+                self._cached_manifests[job_name] = record.manifest
+                self._cached_uids[job_name] = record.uid
+                self._manifest_keys[job_name] = record.key
+
+    def run(self, shutdown_event: threading.Event) -> None:
+        """Run the operator on a fresh event loop until *shutdown_event* is set.
+
+        Args:
+            shutdown_event: Threading event set by the SIGTERM/SIGINT handler.
+        """
+        asyncio.run(self._main(shutdown_event))
+
+    async def _main(self, shutdown_event: threading.Event) -> None:
+        """Create the API clients and run the main loop."""
+        async with client.ApiClient() as api_client:
+            self._batch_v1 = client.BatchV1Api(api_client)
+            self._core_v1 = client.CoreV1Api(api_client)
+            await self.run_async(shutdown_event)
+
+    async def run_async(self, shutdown_event: threading.Event) -> None:
+        """Run check cycles until *shutdown_event* is set.
+
+        The threading event is bridged into the loop by a thread blocking on
+        it, so the signal handling in ``__main__`` is shared with the
+        synchronous engine.
+
+        Args:
+            shutdown_event: Threading event that, when set, causes the loop
+                to exit gracefully.
+        """
+        loop = asyncio.get_running_loop()
+        self._stop = asyncio.Event()
+        self._semaphore = asyncio.Semaphore(self._cfg.workers)
+        threading.Thread(
+            target=_bridge_shutdown, args=(shutdown_event, loop, self._stop), name="shutdown-bridge", daemon=True
+        ).start()
+        metrics_server = start_metrics_server(self.metrics, self._cfg.metrics_port) if self._cfg.metrics_port else None
+
+        self._log.info(
+            "Async operator started — watching {} in namespace '{}' (mode: {})",
+            describe_jobs(self._cfg),
+            self._cfg.namespace,
+            self._cfg.check_mode,
+        )
+        try:
+            await self._resume_restarts()
+            while not self._stop.is_set():
+                started = time.perf_counter()
+                if self._cfg.check_mode == "list":
+                    await self._list_cycle()
+                else:
+                    await self._poll_cycle()
+                self.metrics.cycle_duration.observe(time.perf_counter() - started, self._cfg.check_mode)
+                if not self._stop.is_set():
+                    self._log.info("Sleeping for {}s", self._cfg.check_interval)
+                    await self._sleep(self._cfg.check_interval)
+        finally:
+            self._state.close()
+            if metrics_server is not None:
+                metrics_server.shutdown()
+
+    async def _sleep(self, seconds: float) -> bool:
+        """Sleep for *seconds* unless shutdown is requested first.
+
+        Returns:
+            ``True`` if shutdown was requested, ``False`` on timeout.
+        """
+        assert self._stop is not None
+        try:
+            await asyncio.wait_for(self._stop.wait(), timeout=seconds)
+        except asyncio.TimeoutError:
+            return False
+        return True
+
+    async def _api(self, verb: str, resource: str, request: Awaitable[_T]) -> _T:
+        """Await a Kubernetes API request, recording its latency and failures.
+
+        Args:
+            verb: Kubernetes verb of the request (``get``, ``list``, ``create``, ``patch``, ``delete``).
+            resource: Resource the request targets (``jobs``, ``pods``, ``pods/log``).
+            request: The pending API call.
+        """
+        started = time.perf_counter()
+        try:
+            return await request
+        except client.ApiException as exc:
+            self.metrics.api_errors.inc(str(exc.status))
+            raise
+        finally:
+            self.metrics.api_latency.observe(time.perf_counter() - started, verb, resource)
+
+    async def _request_json(self, verb: str, resource: str, request: Awaitable[Any]) -> Any:
+        """Await a ``_preload_content=False`` request and decode its JSON body.
+
+        Raises:
+            client.ApiException: For non-2xx responses, which
+                ``kubernetes_asyncio`` does not raise on its own for raw requests.
+        """
+        return await self._api(verb, resource, self._read_json(request))
+
+    @staticmethod
+    async def _read_json(request: Awaitable[Any]) -> Any:
+        """Await a raw response, raise on non-2xx and return the decoded body."""
+        resp = await request
+        try:
+            if not 200 <= resp.status <= 299:
+                raise client.ApiException(status=resp.status, reason=resp.reason)
+            return json.loads(await resp.read())
+        finally:
+            resp.release()
+
+    async def _poll_cycle(self) -> None:
+        """Check every managed Job with its own read, concurrently."""
+        await asyncio.gather(*(self._serialized(name, self._check_job, name) for name in self._managed.names()))
+
+    async def _list_cycle(self) -> None:
+        """Check every managed Job from a single namespace-wide LIST.
+
+        With ``JOB_SELECTOR`` the LIST result is applied to the managed set
+        as a delta first.  Jobs that were steady at an unchanged
+        ``resourceVersion`` are not checked again.
+        """
+        try:
+            job_list = await self._request_json(
+                "list",
+                "jobs",
+                self._batch_v1.list_namespaced_job(
+                    self._cfg.namespace,
+                    label_selector=self._cfg.list_selector,
+                    _preload_content=False,
+                ),
+            )
+        except client.ApiException as exc:
+            self._log.error("Kubernetes API error while listing jobs: {}", exc)
+            return
+        jobs = {
+            item["metadata"]["name"]: item
+            for item in job_list.get("items") or []
+            if self._managed.accepts(item["metadata"]["name"])
+        }
+        for name in self._managed.sync(jobs):
+            self._forget_job(name)
+        names = self._managed.names()
+        due = [
+            name
+            for name in names
+            if name not in jobs or self._managed.needs_check(name, jobs[name]["metadata"].get("resourceVersion"))
+        ]
+        if len(due) < len(names):
+            self._log.debug("Skipping {} unchanged job(s)", len(names) - len(due))
+        await asyncio.gather(*(self._serialized(name, self._check_job_dict, name, jobs.get(name)) for name in due))
+
+    async def _serialized(self, job_name: str, fn: Callable[..., Awaitable[None]], *args: Any) -> bool:
+        """Await ``fn(*args)`` under the worker semaphore and the per-Job lock.
+
+        A Job that is already being handled (e.g. mid-restart) is skipped.
+
+        Returns:
+            ``True`` if *fn* ran, ``False`` if it was skipped.
+        """
+        assert self._semaphore is not None and self._stop is not None
+        lock = self._job_locks.setdefault(job_name, asyncio.Lock())
+        if lock.locked():
+            self._log.debug("{} is already being handled — skipping", job_name)
+            return False
+        async with lock, self._semaphore:
+            if self._stop.is_set():
+                return False
+            await fn(*args)
+        return True
+
+    def _forget_job(self, job_name: str) -> None:
+        """Drop the lock and cached state of a Job that left the managed set, unless it is being handled."""
+        lock = self._job_locks.get(job_name)
+        if lock is not None and lock.locked():
+            return
+        for cache in (
+            self._job_locks,
+            self._cached_manifests,
+            self._cached_uids,
+            self._manifest_keys,
+            self._pod_diagnostics,
+        ):
+            cache.pop(job_name, None)
+
+    async def _check_job(self, job_name: str) -> None:
+        """Read a single Job and act on its status."""
+        try:
+            job_dict = await self._request_json(
+                "get", "jobs", self._batch_v1.read_namespaced_job(job_name, self._cfg.namespace, _preload_content=False)
+            )
+        except client.ApiException as exc:
+            if exc.status == 404:
+                await self._check_job_dict(job_name, None)
+            else:
+                self._log.error("\tKubernetes API error for {}: {}", job_name, exc)
+            return
+        except Exception:
+            self._log.exception("\tUnexpected error for {}", job_name)
+            return
+        await self._check_job_dict(job_name, job_dict)
+
+    async def _check_job_dict(self, job_name: str, job_dict: dict[str, Any] | None) -> None:
+        """Cache the manifest of an already fetched Job and act on its status."""
+        self._log.opt(raw=True).info("\n")
+        self._log.info("Checking {}", job_name)
+        if job_dict is None:
+            self._log.info("\t{} not found. Nothing to do.", job_name)
+            return
+        try:
+            meta = job_dict["metadata"]
+            key = manifest_key(meta.get("uid"), meta.get("generation"), meta.get("resourceVersion"))
+            if self._manifest_keys.get(job_name) != key:
+                manifest = build_manifest(job_dict)
+                self._state.put(job_name, JobRecord(manifest, meta.get("uid") or "", key))
+                self._cached_manifests[job_name] = manifest
+                self._cached_uids[job_name] = meta.get("uid") or ""
+                self._manifest_keys[job_name] = key
+
+            status = job_dict.get("status") or {}
+            failure_time = failed_since(status)
+            if failure_time is None:
+                self._managed.mark_steady(job_name, meta.get("resourceVersion"))
+            else:
+                self._managed.mark_unsteady(job_name)
+            if succeeded(status):
+                self._history.reset(job_name)
+            if status.get("active"):
+                self._log.info("\t{} is running.", job_name)
+            elif failure_time is not None:
+                await self._handle_failed_job(job_name, failure_time, started_at(status))
+            else:
+                self._log.info("\t{} succeeded or still pending. No action needed.", job_name)
+        except client.ApiException as exc:
+            self._log.error("\tKubernetes API error for {}: {}", job_name, exc)
+        except Exception:
+            self._log.exception("\tUnexpected error for {}", job_name)
+
+    async def _handle_failed_job(
+        self, job_name: str, failure_time: datetime, start_time: datetime | None = None
+    ) -> None:
+        """Log pod details and restart the Job now or schedule its restart for when the delay has elapsed."""
+        uid = self._cached_uids.get(job_name, "")
+        scheduled = self._scheduled.get(job_name)
+        if scheduled is not None and scheduled[0] == uid and not scheduled[2].done():
+            remaining = max(0.0, scheduled[1] - time.monotonic())
+            self._log.info("\t{} failed. Restart scheduled in {:.0f}s.", job_name, remaining)
+            return
+
+        elapsed = (datetime.now(timezone.utc) - failure_time).total_seconds()
+
+        reasons = await self._get_pod_failure_reasons(job_name)
+        rule = self._classifier.match(reasons)
+        immediate = rule is not None and rule.action == IMMEDIATE
+        run_duration = (failure_time - start_time).total_seconds() if start_time is not None else None
+        first_seen = self._history.record(job_name, Failure(uid, failure_time, restart_reason(reasons), run_duration))
+        if rule is not None and rule.action == HOLD:
+            (self._log.warning if first_seen else self._log.info)(
+                "\t{} failed with {} — not restarting it automatically ({} failures are held).",
+                job_name,
+                rule.reason,
+                rule.name,
+            )
+            return
+        if rule is not None and rule.delay is not None:
+            restart_delay = float(rule.delay)
+            self._log.info("\t{} failed with {} — restart delay {}s.", job_name, rule.reason, rule.delay)
+        else:
+            restart_delay = self._history.restart_delay(job_name)
+            if self._cfg.adaptive_backoff:
+                self._log.info(
+                    "\t{} failed fast {} time(s) in a row — adaptive restart delay {:.0f}s.",
+                    job_name,
+                    self._history.fast_failure_streak(job_name),
+                    restart_delay,
+                )
+        factor = self._governor.backoff_factor(RATE_LIMITED in reasons, uid)
+        if factor > 1:
+            restart_delay *= factor
+            self._log.info("\t{} was rate-limited again — restart delay raised to {:.0f}s.", job_name, restart_delay)
+        delay = self._governor.admit(0 if immediate else restart_delay - elapsed)
+
+        if delay <= 0 and rule is not None and immediate:
+            self._log.info(
+                "\t{} failed with {} — skipping restart delay, restarting immediately.",
+                job_name,
+                rule.reason,
+            )
+            self.metrics.restarts.inc(restart_reason(reasons))
+            await self._restart_job(job_name)
+        elif delay <= 0:
+            self._log.info(
+                "\t{} failed {:.0f}s ago (>= {:.0f}s). Deleting and recreating...",
+                job_name,
+                elapsed,
+                restart_delay,
+            )
+            self.metrics.restarts.inc(restart_reason(reasons))
+            await self._restart_job(job_name)
+        else:
+            self._log.info("\t{} failed {:.0f}s ago. Restart scheduled in {:.0f}s.", job_name, elapsed, delay)
+            if scheduled is not None and not scheduled[2].done():
+                scheduled[2].cancel()
+            task = asyncio.create_task(self._restart_at(job_name, uid, restart_reason(reasons), delay))
+            self._scheduled[job_name] = (uid, time.monotonic() + delay, task)
+
+    async def _restart_at(self, job_name: str, uid: str, reason: str, delay: float) -> None:
+        """Sleep *delay* seconds, then restart the failed instance *uid* of *job_name*.
+
+        Retries every :data:`SCHEDULED_RESTART_RETRY` seconds while the Job is
+        busy being checked.  The restart budget slot is refunded when the
+        restart is cancelled or shutdown comes first.
+        """
+        try:
+            if await self._sleep(delay):
+                self._governor.refund()
+                return
+            while not await self._serialized(job_name, self._run_scheduled_restart, job_name, uid, reason):
+                if await self._sleep(SCHEDULED_RESTART_RETRY):
+                    self._governor.refund()
+                    return
+        except asyncio.CancelledError:
+            self._governor.refund()
+            raise
+        finally:
+            entry = self._scheduled.get(job_name)
+            if entry is not None and entry[2] is asyncio.current_task():
+                del self._scheduled[job_name]
+
+    async def _run_scheduled_restart(self, job_name: str, uid: str, reason: str) -> None:
+        """Restart *job_name* unless the failed instance *uid* is already gone (refunding its budget slot)."""
+        try:
+            if not await self._job_exists(job_name, uid):
+                self._log.info("{} changed since its restart was scheduled — dropping it.", job_name)
+                self._governor.refund()
+                return
+            self._log.info("{}: restart delay reached. Deleting and recreating...", job_name)
+            self.metrics.restarts.inc(reason)
+            await self._restart_job(job_name)
+        except client.ApiException as exc:
+            self._log.error("\tKubernetes API error while restarting {}: {}", job_name, exc)
+        except Exception:
+            self._log.exception("\tUnexpected error while restarting {}", job_name)
+
+    async def _get_pod_failure_reasons(self, job_name: str) -> set[str]:
+        """Collect termination reasons of a Job's Pods, fetching all log tails concurrently.
+
+        Only the newest ``max_inspected_pods`` Pods are inspected.  Diagnostics
+        of terminated Pods are memoised per Job UID and Pod UID.  The reason
+        labels of the failure classes matching a Pod are added.
+        """
+        reasons: set[str] = set()
+        try:
+            pod_list = await self._request_json(
+                "list",
+                "pods",
+                self._core_v1.list_namespaced_pod(
+                    self._cfg.namespace,
+                    label_selector=f"job-name={job_name}",
+                    _preload_content=False,
+                ),
+            )
+        except Exception:
+            self._log.warning("\tCould not retrieve pod details for {}", job_name)
+            return reasons
+
+        current_uid = self._cached_uids.get(job_name, "")
+        cached = self._pod_diagnostics.get(job_name)
+        if cached is None or cached[0] != current_uid:
+            cached = self._pod_diagnostics[job_name] = (current_uid, {})
+        diagnostics = cached[1]
+
+        pods = sorted(
+            pod_list.get("items") or [],
+            key=lambda pod: pod["metadata"].get("creationTimestamp") or "",
+            reverse=True,
+        )
+        if len(pods) > self._cfg.max_inspected_pods:
+            self._log.debug(
+                "\tInspecting the newest {} of {} pods of {}", self._cfg.max_inspected_pods, len(pods), job_name
+            )
+            pods = pods[: self._cfg.max_inspected_pods]
+        pod_uids = [pod["metadata"].get("uid") or pod["metadata"]["name"] for pod in pods]
+        missing = [pod["metadata"]["name"] for pod, pod_uid in zip(pods, pod_uids) if pod_uid not in diagnostics]
+        fetched = dict(zip(missing, await asyncio.gather(*(self._read_log_tail(name) for name in missing))))
+        for pod, pod_uid in zip(pods, pod_uids):
+            if pod_uid in diagnostics:
+                exit_code, reason, tail = diagnostics[pod_uid]
+            else:
+                exit_code, reason = terminated_state(pod)
+                tail = fetched[pod["metadata"]["name"]]
+                if exit_code is not None and tail != LOGS_UNAVAILABLE:
+                    diagnostics[pod_uid] = (exit_code, reason, tail)
+            if reason:
+                reasons.add(reason)
+            reasons |= self._classifier.classify(reason, tail)
+            self._log.info(
+                "\t{}: exit_code={}, reason={}, last log lines:\n{}",
+                pod["metadata"]["name"],
+                exit_code,
+                reason,
+                textwrap.indent(tail.strip(), "\t"),
+            )
+        return reasons
+
+    async def _read_log_tail(self, pod_name: str) -> str:
+        """Return the last two log lines of *pod_name*, or a placeholder on error."""
+        started = time.perf_counter()
+        try:
+            return str(
+                await self._api(
+                    "get",
+                    "pods/log",
+                    self._core_v1.read_namespaced_pod_log(
+                        pod_name,
+                        self._cfg.namespace,
+                        tail_lines=2,
+                        _request_timeout=self._cfg.pod_log_timeout,
+                    ),
+                )
+            )
+        except Exception:
+            return LOGS_UNAVAILABLE
+        finally:
+            self.metrics.log_fetch_duration.observe(time.perf_counter() - started)
+
+    async def _restart_job(self, job_name: str) -> None:
+        """Delete the Job, wait for its UID to disappear and recreate it.
+
+        Follows the Job's restart strategy like
+        :meth:`~flickr_immich_k8s_sync_operator.operator.JobRestartOperator._restart_job`.
+        """
+        assert self._stop is not None
+        old_uid = self._cached_uids.get(job_name, "")
+        apply = self._cfg.restart_strategy_for(job_name) == "apply"
+        self._mark_restarting(job_name, True)
+        started = time.monotonic()
+        status = await self._api(
+            "delete",
+            "jobs",
+            self._batch_v1.delete_namespaced_job(
+                job_name,
+                self._cfg.namespace,
+                body={"propagationPolicy": "Background" if apply else "Foreground"},
+            ),
+        )
+        gone = apply and deleted_immediately(status)
+        if not gone:
+            gone = await self._wait_for_deletion(job_name, old_uid)
+            if not gone and self._stop.is_set():
+                return
+        if not gone:
+            self._log.warning(
+                "\t{} still present after {}s — trying to recreate anyway.",
+                job_name,
+                self._cfg.delete_timeout,
+            )
+        else:
+            self._log.debug("\t{} deleted after {:.1f}s", job_name, time.monotonic() - started)
+        if gone and apply:
+            await self._apply_job(job_name)
+        elif not await self._create_job(job_name):
+            return
+        self.metrics.restart_duration.observe(time.monotonic() - started)
+        self._pod_diagnostics.pop(job_name, None)
+
+    def _mark_restarting(self, job_name: str, restarting: bool) -> None:
+        """Persist whether *job_name* is between deletion and recreation."""
+        self._state.put(
+            job_name,
+            JobRecord(
+                self._cached_manifests[job_name],
+                self._cached_uids.get(job_name, ""),
+                self._manifest_keys.get(job_name, ""),
+                restarting,
+            ),
+        )
+
+    async def _resume_restarts(self) -> None:
+        """Finish every restart the state store still flags as in progress."""
+        pending = [
+            job_name
+            for job_name, record in self._state.load().items()
+            if record.restarting and self._managed.accepts(job_name)
+        ]
+        if pending:
+            self._log.info("Resuming {} interrupted restart(s): {}", len(pending), ", ".join(sorted(pending)))
+            await asyncio.gather(*(self._serialized(name, self._resume_restart, name) for name in pending))
+
+    async def _resume_restart(self, job_name: str) -> None:
+        """Recreate, restart or just unflag a Job whose restart was interrupted."""
+        try:
+            try:
+                job_dict: dict[str, Any] | None = await self._request_json(
+                    "get",
+                    "jobs",
+                    self._batch_v1.read_namespaced_job(job_name, self._cfg.namespace, _preload_content=False),
+                )
+            except client.ApiException as exc:
+                if exc.status != 404:
+                    raise
+                job_dict = None
+            if job_dict is None:
+                self._log.info("{} is gone — recreating it from the stored manifest.", job_name)
+                await self._create_job(job_name)
+            elif job_uid(job_dict) == self._cached_uids.get(job_name, ""):
+                self._log.info("{} was never deleted — restarting it.", job_name)
+                await self._restart_job(job_name)
+            else:
+                self._log.info("{} has already been recreated.", job_name)
+                self._mark_restarting(job_name, False)
+        except client.ApiException as exc:
+            self._log.error("Kubernetes API error while resuming restart of {}: {}", job_name, exc)
+        except Exception:
+            self._log.exception("Unexpected error while resuming restart of {}", job_name)
+
+    async def _job_exists(self, job_name: str, uid: str) -> bool:
+        """Return whether the Job *job_name* with UID *uid* still exists."""
+        try:
+            job_dict = await self._request_json(
+                "get", "jobs", self._batch_v1.read_namespaced_job(job_name, self._cfg.namespace, _preload_content=False)
+            )
+        except client.ApiException as exc:
+            if exc.status == 404:
+                return False
+            raise
+        return bool(job_dict["metadata"].get("uid", "") == uid)
+
+    async def _wait_for_deletion(self, job_name: str, uid: str) -> bool:
+        """Wait with exponential back-off until the deleted Job has disappeared."""
+        deadline = time.monotonic() + self._cfg.delete_timeout
+        delay = DELETION_POLL_INITIAL
+        while await self._job_exists(job_name, uid):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            if await self._sleep(min(delay, remaining)):
+                return False
+            delay = min(delay * 2, DELETION_POLL_MAX)
+        return True
+
+    async def _apply_job(self, job_name: str) -> None:
+        """Create the Job from its cached manifest through server-side apply under :data:`FIELD_MANAGER`."""
+        await self._api(
+            "patch",
+            "jobs",
+            self._batch_v1.patch_namespaced_job(
+                job_name,
+                self._cfg.namespace,
+                self._cached_manifests[job_name],
+                field_manager=FIELD_MANAGER,
+                force=True,
+                _content_type=APPLY_PATCH_CONTENT_TYPE,
+            ),
+        )
+        self._log.info("\t{} restarted successfully (server-side apply).", job_name)
+        self._mark_restarting(job_name, False)
+
+    async def _create_job(self, job_name: str) -> bool:
+        """Create the Job from its cached manifest, retrying on ``409 AlreadyExists``.
+
+        Returns:
+            ``True`` once the Job has been created, ``False`` on shutdown.
+        """
+        for attempt in range(CREATE_RETRIES):
+            try:
+                await self._api(
+                    "create",
+                    "jobs",
+                    self._batch_v1.create_namespaced_job(self._cfg.namespace, self._cached_manifests[job_name]),
+                )
+                self._log.info("\t{} restarted successfully.", job_name)
+                self._mark_restarting(job_name, False)
+                return True
+            except client.ApiException as exc:
+                if exc.status != 409 or attempt == CREATE_RETRIES - 1:
+                    raise
+            backoff = CREATE_RETRY_BASE * 2**attempt
+            delay = backoff / 2 + random.uniform(0, backoff / 2)
+            self._log.info("\t{} still exists (409) — retrying create in {:.1f}s", job_name, delay)
+            if await self._sleep(delay):
+                return False
+        return False
@@ -0,0 +1,139 @@
+"""Failure classifier — maps termination reasons and log tails to a restart policy."""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from typing import Iterable
+
+from flickr_immich_k8s_sync_operator.config import FAILURE_ACTIONS, OperatorConfig
+from flickr_immich_k8s_sync_operator.governor import RATE_LIMIT_PATTERN, RATE_LIMITED
+
+# Actions of a failure class: restart after the class delay (or the regular,
+# possibly adaptive, one), restart right away, or leave the Job failed for a
+# human to look at (e.g. after a revoked token).
+RESTART, IMMEDIATE, HOLD = FAILURE_ACTIONS
+
+# Built-in failure classes (:data:`~.config.FAILURE_CLASSES`) in priority order: name -> (reason label, pattern).
+# ``oom`` only looks at the termination reason (the first line of the matched
+# text): it may restart immediately, which a log line mentioning memory must
+# not trigger.
+DEFAULT_CLASSES: dict[str, tuple[str, str]] = {
+    "oom": ("OOMKilled", r"\AOOMKilled\n"),
+    "auth": (
+        "AuthFailed",
+        r"\b40[13]\b|unauthori[sz]ed|forbidden|invalid (?:api )?(?:key|token|signature)|oauth_problem",
+    ),
+    "disk_full": ("DiskFull", r"no space left on device|\bENOSPC\b|disk quota exceeded"),
+    "rate_limited": (RATE_LIMITED, RATE_LIMIT_PATTERN.pattern),
+    "network": (
+        "NetworkError",
+        r"connection (?:reset|refused|aborted)|timed? ?out|name resolution|name or service not known"
+        r"|network is unreachable|remote ?disconnected|\b50[234]\b",
+    ),
+}
+
+
+def _combinable(pattern: str) -> bool:
+    """Return whether *pattern* can be an alternative of the combined expression.
+
+    A pattern without groups has no backreferences or group names that the
+    renumbering would break; wrapping it in a group fails on global inline
+    flags such as ``(?x)``, which are only allowed at the start.
+    """
+    try:
+        return re.compile(f"(?:{pattern})").groups == 0
+    except re.error:
+        return False
+
+
+@dataclass(frozen=True)
+class FailureRule:
+    """Restart policy of one failure class.
+
+    Attributes:
+        name: Class name (e.g. ``"network"``).
+        reason: Label added to the failure reasons when the class matches.
+        pattern: Regular expression matched case-insensitively against the
+            termination reason, a newline and the log tail of every
+            inspected Pod; ``\\A`` anchors it to the reason.
+        action: One of :data:`~.config.FAILURE_ACTIONS`.
+        delay: Restart delay in seconds for :data:`RESTART`, or ``None`` to
+            use the regular restart delay.
+    """
+
+    name: str
+    reason: str
+    pattern: str
+    action: str = RESTART
+    delay: int | None = None
+
+
+def default_rules(cfg: OperatorConfig) -> list[FailureRule]:
+    """Return the built-in rules, with ``FAILURE_RULES`` overrides and additions applied.
+
+    Without overrides every class restarts after the regular delay, except
+    ``oom`` which restarts immediately when ``skip_delay_on_oom`` is set.
+    """
+    rules: dict[str, FailureRule] = {
+        name: FailureRule(name, reason, pattern) for name, (reason, pattern) in DEFAULT_CLASSES.items()
+    }
+    if cfg.skip_delay_on_oom:
+        rules["oom"] = FailureRule("oom", *DEFAULT_CLASSES["oom"], action=IMMEDIATE)
+    for name, override in cfg.failure_rules.items():
+        base = rules.get(name) or FailureRule(name, name, override["pattern"])
+        rules[name] = FailureRule(
+            name,
+            base.reason,
+            override.get("pattern", base.pattern),
+            override.get("action", base.action),
+            override.get("delay", base.delay),
+        )
+    return list(rules.values())
+
+
+class FailureClassifier:
+    """Classifies Pod failures with one precompiled regular expression.
+
+    The patterns of all rules are combined into a single alternation with
+    one named group per rule, so every log tail is scanned once no matter
+    how many rules there are.  Patterns with groups of their own (whose
+    backreferences or names would clash in the alternation) or with global
+    inline flags are compiled and scanned on their own instead.  When
+    several classes match a failure, the rule listed first
+    (:data:`DEFAULT_CLASSES` order, then additional classes in
+    configuration order) decides the policy.
+    """
+
+    def __init__(self, rules: Iterable[FailureRule]) -> None:
+        """Compile *rules* into the combined pattern.
+
+        Args:
+            rules: Rules in priority order.
+        """
+        self.rules = list(rules)
+        self._by_group: dict[str, FailureRule] = {}
+        self._separate: list[tuple[re.Pattern[str], FailureRule]] = []
+        for index, rule in enumerate(self.rules):
+            if _combinable(rule.pattern):
+                self._by_group[f"c{index}"] = rule
+            else:
+                self._separate.append((re.compile(rule.pattern, re.IGNORECASE), rule))
+        alternatives = "|".join(f"(?P<{group}>{rule.pattern})" for group, rule in self._by_group.items())
+        self._pattern = re.compile(alternatives or r"(?!)", re.IGNORECASE)
+
+    @classmethod
+    def from_config(cls, cfg: OperatorConfig) -> FailureClassifier:
+        """Build the classifier of :func:`default_rules`."""
+        return cls(default_rules(cfg))
+
+    def classify(self, reason: str | None, log_tail: str) -> set[str]:
+        """Return the reason labels of all classes matching a Pod's *reason* and *log_tail*."""
+        text = f"{reason or ''}\n{log_tail}"
+        labels = {self._by_group[match.lastgroup].reason for match in self._pattern.finditer(text) if match.lastgroup}
+        labels.update(rule.reason for pattern, rule in self._separate if pattern.search(text))
+        return labels
+
+    def match(self, reasons: set[str]) -> FailureRule | None:
+        """Return the highest-priority rule whose reason label is in *reasons*."""
+        return next((rule for rule in self.rules if rule.reason in reasons), None)
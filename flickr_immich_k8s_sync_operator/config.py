@@ -2,8 +2,110 @@
 
 from __future__ import annotations
 
+import json
 import os
-from dataclasses import dataclass
+import re
+import socket
+from dataclasses import dataclass, field
+from typing import Any
+
+# Supported values for ``CHECK_MODE``.
+CHECK_MODES: tuple[str, ...] = ("poll", "list", "watch")
+
+# Supported values for ``ENGINE``.
+ENGINES: tuple[str, ...] = ("sync", "async")
+
+# ``NAMESPACES`` value selecting every namespace of the cluster.
+ALL_NAMESPACES: str = "*"
+
+# Supported values for ``STATE_STORE``.
+STATE_STORES: tuple[str, ...] = ("memory", "file", "sqlite")
+
+# Supported ``action`` values of ``FAILURE_RULES`` entries.
+FAILURE_ACTIONS: tuple[str, ...] = ("restart", "immediate", "hold")
+
+# Built-in failure classes that ``FAILURE_RULES`` can override without a pattern.
+FAILURE_CLASSES: tuple[str, ...] = ("oom", "auth", "disk_full", "rate_limited", "network")
+
+# Supported values for ``RESTART_STRATEGY``.
+RESTART_STRATEGIES: tuple[str, ...] = ("recreate", "apply")
+
+# Supported values for ``TEMPLATE_SOURCE``.
+TEMPLATE_SOURCES: tuple[str, ...] = ("job", "configmap", "cronjob", "flickrsync")
+
+# Label the FlickrSync reconciler puts on every Job and CronJob it creates
+# (value: name of the FlickrSync); the default ``JOB_SELECTOR`` with ``FLICKRSYNC``.
+FLICKRSYNC_LABEL: str = "flickr-immich-k8s-sync-operator/flickrsync"
+
+
+def parse_failure_rules(raw: str) -> dict[str, dict[str, Any]]:
+    """Parse and validate the ``FAILURE_RULES`` JSON object.
+
+    Args:
+        raw: JSON object mapping failure class names to objects with the
+            optional keys ``pattern``, ``action`` and ``delay``.
+
+    Returns:
+        The validated rules, keyed by class name (empty for an empty *raw*).
+
+    Raises:
+        ValueError: If *raw* is not such an object, an action is not one of
+            :data:`FAILURE_ACTIONS`, a delay is not a non-negative integer,
+            a pattern does not compile, or a class that is not one of
+            :data:`FAILURE_CLASSES` has no pattern.
+    """
+    if not raw.strip():
+        return {}
+    try:
+        parsed = json.loads(raw)
+    except json.JSONDecodeError as exc:
+        raise ValueError(f"FAILURE_RULES is not valid JSON: {exc}") from exc
+    if not isinstance(parsed, dict):
+        raise ValueError("FAILURE_RULES must be a JSON object")
+    for name, rule in parsed.items():
+        if not isinstance(rule, dict) or not set(rule) <= {"pattern", "action", "delay"}:
+            raise ValueError(f"FAILURE_RULES[{name!r}] must be an object with pattern, action and/or delay")
+        if rule.get("action", FAILURE_ACTIONS[0]) not in FAILURE_ACTIONS:
+            raise ValueError(f"FAILURE_RULES[{name!r}]: action must be one of {', '.join(FAILURE_ACTIONS)}")
+        delay = rule.get("delay")
+        if delay is not None and (not isinstance(delay, int) or delay < 0):
+            raise ValueError(f"FAILURE_RULES[{name!r}]: delay must be a non-negative integer")
+        if "pattern" in rule:
+            try:
+                re.compile(rule["pattern"])
+            except (re.error, TypeError) as exc:
+                raise ValueError(f"FAILURE_RULES[{name!r}]: invalid pattern: {exc}") from exc
+        elif name not in FAILURE_CLASSES:
+            raise ValueError(f"FAILURE_RULES[{name!r}]: a new failure class needs a pattern")
+    return parsed
+
+
+def parse_restart_strategies(raw: str) -> dict[str, str]:
+    """Parse and validate ``JOB_RESTART_STRATEGIES``.
+
+    Args:
+        raw: Comma-separated ``job=strategy`` pairs.
+
+    Returns:
+        The restart strategy per Job name (empty for an empty *raw*).
+
+    Raises:
+        ValueError: If a pair has no Job name or a strategy is not one of
+            :data:`RESTART_STRATEGIES`.
+    """
+    strategies: dict[str, str] = {}
+    for pair in raw.split(","):
+        if not pair.strip():
+            continue
+        job_name, _, strategy = (part.strip() for part in pair.partition("="))
+        strategy = strategy.lower()
+        if not job_name or strategy not in RESTART_STRATEGIES:
+            raise ValueError(
+                f"JOB_RESTART_STRATEGIES entries must be job=strategy with a strategy out of "
+                f"{', '.join(RESTART_STRATEGIES)} (got {pair.strip()!r})"
+            )
+        strategies[job_name] = strategy
+    return strategies
 
 
 @dataclass(frozen=True)
@@ -18,6 +120,50 @@ class OperatorConfig:
     check_interval: int
     restart_delay: int
     skip_delay_on_oom: bool
+    check_mode: str = "poll"
+    label_selector: str = ""
+    workers: int = 4
+    queue_qps: float = 10.0
+    queue_burst: int = 100
+    delete_timeout: int = 300
+    engine: str = "sync"
+    raw_json: bool = False
+    state_store: str = "memory"
+    state_path: str = ""
+    metrics_port: int = 0
+    pod_log_timeout: float = 10.0
+    max_inspected_pods: int = 10
+    job_selector: str = ""
+    namespaces: list[str] = field(default_factory=list)
+    leader_election: bool = False
+    lease_name: str = "flickr-immich-k8s-sync-operator"
+    lease_duration: int = 15
+    leader_identity: str = ""
+    shard_group: str = ""
+    restart_budget: int = 0
+    restart_budget_window: int = 3600
+    restart_jitter: float = 0.0
+    rate_limit_backoff: float = 1.0
+    adaptive_backoff: bool = False
+    min_restart_delay: int = 60
+    max_restart_delay: int = 86400
+    fast_failure_threshold: int = 600
+    failure_rules: dict[str, dict[str, Any]] = field(default_factory=dict)
+    restart_strategy: str = "recreate"
+    job_restart_strategies: dict[str, str] = field(default_factory=dict)
+    template_source: str = "job"
+    template_configmap: str = ""
+    flickrsync: bool = False
+    status_debounce: float = 2.0
+
+    @property
+    def list_selector(self) -> str | None:
+        """Selector of namespace-wide Job LIST/WATCH requests: ``LABEL_SELECTOR`` and ``JOB_SELECTOR`` combined."""
+        return ",".join(selector for selector in (self.label_selector, self.job_selector) if selector) or None
+
+    def restart_strategy_for(self, job_name: str) -> str:
+        """Return the restart strategy of *job_name*: its ``JOB_RESTART_STRATEGIES`` entry or ``RESTART_STRATEGY``."""
+        return self.job_restart_strategies.get(job_name, self.restart_strategy)
 
     @classmethod
     def from_env(cls) -> OperatorConfig:
@@ -26,27 +172,295 @@ class OperatorConfig:
         Reads the following environment variables:
 
         - ``NAMESPACE`` — Kubernetes namespace to watch (default ``"flickr-downloader"``).
-        - ``JOB_NAMES`` — Comma-separated list of Job names to monitor (**required**).
+        - ``NAMESPACES`` — Comma-separated namespaces, or ``"*"`` for all namespaces,
+          served by one process instead of ``NAMESPACE`` (default ``""``).
+        - ``JOB_NAMES`` — Comma-separated list of Job names to monitor (**required**
+          unless ``JOB_SELECTOR`` or ``FLICKRSYNC`` is set).
+        - ``JOB_SELECTOR`` — Label selector discovering the Jobs to monitor instead
+          of ``JOB_NAMES``; requires the ``list`` or ``watch`` mode (default ``""``,
+          :data:`FLICKRSYNC_LABEL` with ``FLICKRSYNC``).
         - ``CHECK_INTERVAL`` — Seconds between check cycles (default ``60``).
         - ``RESTART_DELAY`` — Seconds after failure before a Job is restarted (default ``3600``).
         - ``SKIP_DELAY_ON_OOM`` — If ``"true"`` (case-insensitive), skip the restart
           delay when the failure reason is ``OOMKilled`` (default ``"false"``).
+        - ``CHECK_MODE`` — ``"poll"`` reads every Job each cycle, ``"list"``
+          lists the namespace once per cycle, ``"watch"`` mirrors the
+          namespace via LIST + WATCH and reacts to Job events (default ``"poll"``).
+        - ``LABEL_SELECTOR`` — Optional label selector narrowing the LIST/WATCH
+          requests of the ``list`` and ``watch`` modes (default ``""``).
+        - ``WORKERS`` — Number of Jobs checked/restarted in parallel (default ``4``).
+        - ``QUEUE_QPS`` — Checks per second that the ``watch`` mode retries after
+          errors, across all Jobs; ``0`` disables the limit (default ``10``).
+        - ``QUEUE_BURST`` — Retries allowed at once before ``QUEUE_QPS`` applies
+          (default ``100``).
+        - ``DELETE_TIMEOUT`` — Maximum seconds to wait for a deleted Job to be
+          garbage-collected before it is recreated (default ``300``).
+        - ``ENGINE`` — ``"sync"`` (threads + ``kubernetes`` client) or ``"async"``
+          (single event loop + ``kubernetes_asyncio``, ``poll``/``list`` modes
+          only) (default ``"sync"``).
+        - ``RAW_JSON`` — If ``"true"``, the sync engine requests Jobs and Pods with
+          ``_preload_content=False`` and works on the parsed JSON dicts instead
+          of ``V1Job``/``V1Pod`` models (default ``"false"``).
+        - ``STATE_STORE`` — Where cached manifests and restart bookkeeping are
+          kept: ``"memory"`` (lost on restart), ``"file"`` (append-only JSON-lines file) or
+          ``"sqlite"`` (SQLite database in WAL mode) (default ``"memory"``).
+        - ``STATE_PATH`` — Path of the state file/database; required for the
+          ``file`` and ``sqlite`` stores (default ``""``).
+        - ``METRICS_PORT`` — Port of the Prometheus ``/metrics`` endpoint;
+          ``0`` disables it (default ``0``).
+        - ``POD_LOG_TIMEOUT`` — Timeout in seconds for fetching the log tail of
+          a single Pod (default ``10``).
+        - ``MAX_INSPECTED_PODS`` — Maximum number of Pods (newest first) whose
+          state and logs are inspected per failed Job (default ``10``).
+        - ``LEADER_ELECTION`` — If ``"true"``, replicas elect a leader through a
+          ``coordination.k8s.io`` Lease; only the leader acts, standbys keep
+          their caches warm (sync engine only, not combined with ``NAMESPACES``)
+          (default ``"false"``).
+        - ``LEASE_NAME`` — Name of the Lease in ``NAMESPACE``; restarts in flight are
+          recorded in the ConfigMap ``<LEASE_NAME>-restarts``
+          (default ``"flickr-immich-k8s-sync-operator"``).
+        - ``LEASE_DURATION`` — Seconds a leader may go without renewing the
+          Lease before a standby takes over (default ``15``).
+        - ``SHARD_GROUP`` — If set, the replicas of this group split the Jobs
+          among themselves by consistent hashing of the Job names; membership
+          is kept in one Lease per replica, restarts in flight in the ConfigMap
+          ``<SHARD_GROUP>-restarts`` (sync engine only, not combined with
+          ``LEADER_ELECTION`` or ``NAMESPACES``) (default ``""``).
+        - ``POD_NAME`` — Identity of this replica in the Leases (default: the host name).
+        - ``RESTART_BUDGET`` — Maximum number of restarts per ``RESTART_BUDGET_WINDOW``
+          across all Jobs; further restarts are postponed to the next free
+          slot. ``0`` disables the budget (default ``0``).
+        - ``RESTART_BUDGET_WINDOW`` — Window of the restart budget and of the
+          rate-limit back-off in seconds (default ``3600``).
+        - ``RESTART_JITTER`` — Maximum random extra delay in seconds added to
+          every restart (default ``0``).
+        - ``RATE_LIMIT_BACKOFF`` — Maximum factor by which the restart delay grows
+          while failures caused by rate limiting (HTTP 429 in the Pod logs) keep
+          repeating within the window; ``1`` disables it (default ``1``).
+        - ``ADAPTIVE_BACKOFF`` — If ``"true"``, the restart delay of each Job follows
+          its recent failure history instead of the fixed ``RESTART_DELAY``
+          (default ``"false"``).
+        - ``MIN_RESTART_DELAY`` — Adaptive delay after a one-off failure, i.e. one
+          that ended a run of at least ``FAST_FAILURE_THRESHOLD`` seconds (default ``60``).
+        - ``MAX_RESTART_DELAY`` — Upper bound of the adaptive delay, which doubles
+          from ``RESTART_DELAY`` with every fast failure in a row (default ``86400``).
+        - ``FAST_FAILURE_THRESHOLD`` — Runs shorter than this many seconds count as
+          fast failures (default ``600``).
+        - ``FAILURE_RULES`` — JSON object overriding the restart policy of failure
+          classes detected in Pod termination reasons and log tails, e.g.
+          ``{"auth": {"action": "hold"}, "network": {"delay": 300}}``; each entry
+          may set ``pattern``, ``action`` (one of :data:`FAILURE_ACTIONS`) and
+          ``delay``, and classes other than :data:`FAILURE_CLASSES` need a
+          ``pattern`` (default ``""``).
+        - ``RESTART_STRATEGY`` — How failed Jobs are restarted: ``"recreate"`` deletes
+          the Job with foreground propagation, waits until it and its Pods are gone
+          and creates it again; ``"apply"`` deletes only the Job object (background
+          propagation, its Pods are garbage-collected afterwards) and recreates it
+          right away through server-side apply (default ``"recreate"``).
+        - ``JOB_RESTART_STRATEGIES`` — Comma-separated ``job=strategy`` pairs overriding
+          ``RESTART_STRATEGY`` for single Jobs, e.g. ``"flickr-downloader-alice=apply"``
+          (default ``""``).
+        - ``TEMPLATE_SOURCE`` — Where the manifest of a restarted Job comes from:
+          ``"job"`` caches a copy of every Job as it is seen, ``"configmap"`` reads
+          the templates from ``TEMPLATE_CONFIGMAP`` (one key per Job name),
+          ``"cronjob"`` uses the ``jobTemplate`` of the Job's owner CronJob (or of
+          the CronJob named like the Job), ``"flickrsync"`` builds it from the
+          Job's ``FlickrSync`` resource; templates are reloaded at most once per
+          ``CHECK_INTERVAL`` (sync engine only) (default ``"job"``, ``"flickrsync"``
+          with ``FLICKRSYNC``).
+        - ``TEMPLATE_CONFIGMAP`` — Name of the ConfigMap in ``NAMESPACE`` holding the
+          templates; required with ``TEMPLATE_SOURCE=configmap`` (default ``""``).
+        - ``FLICKRSYNC`` — If ``"true"``, the operator creates and updates the Job
+          (or CronJob) of every ``FlickrSync`` resource in the namespace once per
+          ``CHECK_INTERVAL`` and reports its status; the Jobs are discovered by
+          label, so ``JOB_NAMES`` cannot be used (sync engine only) (default ``"false"``).
+        - ``STATUS_DEBOUNCE`` — Seconds without further changes after which the
+          status of a ``FlickrSync`` is written (default ``2``).
 
         Returns:
             A fully populated ``OperatorConfig`` instance.
 
         Raises:
-            ValueError: If ``JOB_NAMES`` is missing or contains no non-empty entries.
+            ValueError: If a setting is invalid, i.e. if:
+
+                - neither or both of ``JOB_NAMES`` and ``JOB_SELECTOR`` are given.
+                - ``JOB_NAMES`` is combined with ``FLICKRSYNC``.
+                - ``JOB_SELECTOR`` or ``FLICKRSYNC`` is combined with ``CHECK_MODE=poll``.
+                - ``NAMESPACES`` combines ``*`` with other namespaces.
+                - ``CHECK_MODE`` is not one of :data:`CHECK_MODES`.
+                - ``ENGINE`` is not one of :data:`ENGINES`, or is ``async`` with ``CHECK_MODE=watch``.
+                - ``LEADER_ELECTION`` and ``SHARD_GROUP`` are both set.
+                - ``LEADER_ELECTION`` or ``SHARD_GROUP`` is combined with ``ENGINE=async`` or ``NAMESPACES``.
+                - ``LEASE_DURATION`` is smaller than ``5``.
+                - ``WORKERS``, ``QUEUE_BURST`` or ``MAX_INSPECTED_PODS`` is smaller than ``1``.
+                - ``QUEUE_QPS`` is negative.
+                - ``STATE_STORE`` is not one of :data:`STATE_STORES`.
+                - a persistent store has no ``STATE_PATH``.
+                - ``RESTART_BUDGET`` or ``RESTART_JITTER`` is negative.
+                - ``RESTART_BUDGET_WINDOW`` or ``RATE_LIMIT_BACKOFF`` is smaller than ``1``.
+                - ``MIN_RESTART_DELAY`` is negative with ``ADAPTIVE_BACKOFF`` enabled.
+                - ``MAX_RESTART_DELAY`` is smaller than ``RESTART_DELAY`` with ``ADAPTIVE_BACKOFF`` enabled.
+                - ``FAILURE_RULES`` is invalid (see :func:`parse_failure_rules`).
+                - ``RESTART_STRATEGY`` is not one of :data:`RESTART_STRATEGIES`.
+                - ``JOB_RESTART_STRATEGIES`` is invalid (see :func:`parse_restart_strategies`).
+                - ``FLICKRSYNC`` is combined with ``ENGINE=async``.
+                - ``STATUS_DEBOUNCE`` is negative.
+                - ``TEMPLATE_SOURCE`` is not one of :data:`TEMPLATE_SOURCES`.
+                - ``TEMPLATE_SOURCE`` is not ``job`` with ``ENGINE=async``.
+                - ``TEMPLATE_SOURCE=configmap`` has no ``TEMPLATE_CONFIGMAP``.
         """
         raw_job_names = os.environ.get("JOB_NAMES", "")
         job_names = [name.strip() for name in raw_job_names.split(",") if name.strip()]
-        if not job_names:
+        job_selector = os.environ.get("JOB_SELECTOR", "").strip()
+        flickrsync = os.environ.get("FLICKRSYNC", "false").strip().lower() == "true"
+        if flickrsync and job_names:
+            raise ValueError("JOB_NAMES cannot be combined with FLICKRSYNC (its Jobs are discovered by label)")
+        if flickrsync and not job_selector:
+            job_selector = FLICKRSYNC_LABEL
+        if job_selector and job_names:
+            raise ValueError("JOB_NAMES and JOB_SELECTOR are mutually exclusive")
+        if not job_names and not job_selector:
             raise ValueError("JOB_NAMES environment variable is required and must contain at least one job name")
 
+        namespaces = [ns.strip() for ns in os.environ.get("NAMESPACES", "").split(",") if ns.strip()]
+        if ALL_NAMESPACES in namespaces and len(namespaces) > 1:
+            raise ValueError(f"NAMESPACES={ALL_NAMESPACES} cannot be combined with other namespaces")
+
+        check_mode = os.environ.get("CHECK_MODE", "poll").strip().lower()
+        if check_mode not in CHECK_MODES:
+            raise ValueError(f"CHECK_MODE must be one of {', '.join(CHECK_MODES)} (got {check_mode!r})")
+        if job_selector and check_mode == "poll":
+            setting = "FLICKRSYNC" if flickrsync else "JOB_SELECTOR"
+            raise ValueError(f"{setting} requires CHECK_MODE=list or CHECK_MODE=watch")
+
+        engine = os.environ.get("ENGINE", "sync").strip().lower()
+        if engine not in ENGINES:
+            raise ValueError(f"ENGINE must be one of {', '.join(ENGINES)} (got {engine!r})")
+        if engine == "async" and check_mode == "watch":
+            raise ValueError("CHECK_MODE=watch is not supported with ENGINE=async")
+
+        leader_election = os.environ.get("LEADER_ELECTION", "false").strip().lower() == "true"
+        if leader_election and engine == "async":
+            raise ValueError("LEADER_ELECTION is not supported with ENGINE=async")
+        shard_group = os.environ.get("SHARD_GROUP", "").strip()
+        if shard_group and engine == "async":
+            raise ValueError("SHARD_GROUP is not supported with ENGINE=async")
+        if shard_group and leader_election:
+            raise ValueError("SHARD_GROUP and LEADER_ELECTION are mutually exclusive")
+        if namespaces and (leader_election or shard_group):
+            setting = "LEADER_ELECTION" if leader_election else "SHARD_GROUP"
+            raise ValueError(
+                f"{setting} cannot be combined with NAMESPACES (every namespace would coordinate on its own)"
+            )
+        lease_duration = int(os.environ.get("LEASE_DURATION", "15"))
+        if lease_duration < 5:
+            raise ValueError(f"LEASE_DURATION must be at least 5 seconds (got {lease_duration})")
+
+        workers = int(os.environ.get("WORKERS", "4"))
+        if workers < 1:
+            raise ValueError(f"WORKERS must be at least 1 (got {workers})")
+        queue_qps = float(os.environ.get("QUEUE_QPS", "10"))
+        if queue_qps < 0:
+            raise ValueError(f"QUEUE_QPS must not be negative (got {queue_qps})")
+        queue_burst = int(os.environ.get("QUEUE_BURST", "100"))
+        if queue_burst < 1:
+            raise ValueError(f"QUEUE_BURST must be at least 1 (got {queue_burst})")
+
+        max_inspected_pods = int(os.environ.get("MAX_INSPECTED_PODS", "10"))
+        if max_inspected_pods < 1:
+            raise ValueError(f"MAX_INSPECTED_PODS must be at least 1 (got {max_inspected_pods})")
+
+        state_store = os.environ.get("STATE_STORE", "memory").strip().lower()
+        if state_store not in STATE_STORES:
+            raise ValueError(f"STATE_STORE must be one of {', '.join(STATE_STORES)} (got {state_store!r})")
+        state_path = os.environ.get("STATE_PATH", "").strip()
+        if state_store != "memory" and not state_path:
+            raise ValueError(f"STATE_PATH is required with STATE_STORE={state_store}")
+
+        restart_budget = int(os.environ.get("RESTART_BUDGET", "0"))
+        if restart_budget < 0:
+            raise ValueError(f"RESTART_BUDGET must not be negative (got {restart_budget})")
+        restart_budget_window = int(os.environ.get("RESTART_BUDGET_WINDOW", "3600"))
+        if restart_budget_window < 1:
+            raise ValueError(f"RESTART_BUDGET_WINDOW must be at least 1 second (got {restart_budget_window})")
+        restart_jitter = float(os.environ.get("RESTART_JITTER", "0"))
+        if restart_jitter < 0:
+            raise ValueError(f"RESTART_JITTER must not be negative (got {restart_jitter})")
+        rate_limit_backoff = float(os.environ.get("RATE_LIMIT_BACKOFF", "1"))
+        if rate_limit_backoff < 1:
+            raise ValueError(f"RATE_LIMIT_BACKOFF must be at least 1 (got {rate_limit_backoff})")
+
+        restart_delay = int(os.environ.get("RESTART_DELAY", "3600"))
+        adaptive_backoff = os.environ.get("ADAPTIVE_BACKOFF", "false").strip().lower() == "true"
+        min_restart_delay = int(os.environ.get("MIN_RESTART_DELAY", "60"))
+        max_restart_delay = int(os.environ.get("MAX_RESTART_DELAY", "86400"))
+        if adaptive_backoff and min_restart_delay < 0:
+            raise ValueError(f"MIN_RESTART_DELAY must not be negative (got {min_restart_delay})")
+        if adaptive_backoff and max_restart_delay < restart_delay:
+            raise ValueError(
+                f"MAX_RESTART_DELAY must be at least RESTART_DELAY (got {max_restart_delay} < {restart_delay})"
+            )
+
+        restart_strategy = os.environ.get("RESTART_STRATEGY", "recreate").strip().lower()
+        if restart_strategy not in RESTART_STRATEGIES:
+            raise ValueError(
+                f"RESTART_STRATEGY must be one of {', '.join(RESTART_STRATEGIES)} (got {restart_strategy!r})"
+            )
+
+        if flickrsync and engine == "async":
+            raise ValueError("FLICKRSYNC is not supported with ENGINE=async")
+        status_debounce = float(os.environ.get("STATUS_DEBOUNCE", "2"))
+        if status_debounce < 0:
+            raise ValueError(f"STATUS_DEBOUNCE must not be negative (got {status_debounce})")
+
+        template_source = os.environ.get("TEMPLATE_SOURCE", "flickrsync" if flickrsync else "job").strip().lower()
+        if template_source not in TEMPLATE_SOURCES:
+            raise ValueError(f"TEMPLATE_SOURCE must be one of {', '.join(TEMPLATE_SOURCES)} (got {template_source!r})")
+        if template_source != "job" and engine == "async":
+            raise ValueError(f"TEMPLATE_SOURCE={template_source} is not supported with ENGINE=async")
+        template_configmap = os.environ.get("TEMPLATE_CONFIGMAP", "").strip()
+        if template_source == "configmap" and not template_configmap:
+            raise ValueError("TEMPLATE_CONFIGMAP is required with TEMPLATE_SOURCE=configmap")
+
         return cls(
             namespace=os.environ.get("NAMESPACE", "flickr-downloader").strip(),
             job_names=job_names,
             check_interval=int(os.environ.get("CHECK_INTERVAL", "60")),
-            restart_delay=int(os.environ.get("RESTART_DELAY", "3600")),
+            restart_delay=restart_delay,
             skip_delay_on_oom=os.environ.get("SKIP_DELAY_ON_OOM", "false").strip().lower() == "true",
+            check_mode=check_mode,
+            label_selector=os.environ.get("LABEL_SELECTOR", "").strip(),
+            workers=workers,
+            queue_qps=queue_qps,
+            queue_burst=queue_burst,
+            delete_timeout=int(os.environ.get("DELETE_TIMEOUT", "300")),
+            engine=engine,
+            raw_json=os.environ.get("RAW_JSON", "false").strip().lower() == "true",
+            state_store=state_store,
+            state_path=state_path,
+            metrics_port=int(os.environ.get("METRICS_PORT", "0")),
+            pod_log_timeout=float(os.environ.get("POD_LOG_TIMEOUT", "10")),
+            max_inspected_pods=max_inspected_pods,
+            job_selector=job_selector,
+            namespaces=namespaces,
+            leader_election=leader_election,
+            lease_name=os.environ.get("LEASE_NAME", "flickr-immich-k8s-sync-operator").strip(),
+            lease_duration=lease_duration,
+            leader_identity=os.environ.get("POD_NAME", "").strip() or socket.gethostname(),
+            shard_group=shard_group,
+            restart_budget=restart_budget,
+            restart_budget_window=restart_budget_window,
+            restart_jitter=restart_jitter,
+            rate_limit_backoff=rate_limit_backoff,
+            adaptive_backoff=adaptive_backoff,
+            min_restart_delay=min_restart_delay,
+            max_restart_delay=max_restart_delay,
+            fast_failure_threshold=int(os.environ.get("FAST_FAILURE_THRESHOLD", "600")),
+            failure_rules=parse_failure_rules(os.environ.get("FAILURE_RULES", "")),
+            restart_strategy=restart_strategy,
+            job_restart_strategies=parse_restart_strategies(os.environ.get("JOB_RESTART_STRATEGIES", "")),
+            template_source=template_source,
+            template_configmap=template_configmap,
+            flickrsync=flickrsync,
+            status_debounce=status_debounce,
         )
@@ -0,0 +1,141 @@
+"""Managed Job set — static ``JOB_NAMES`` or Jobs discovered by ``JOB_SELECTOR``."""
+
+from __future__ import annotations
+
+import threading
+from typing import Iterable
+
+from loguru import logger as glogger
+
+from flickr_immich_k8s_sync_operator.config import OperatorConfig
+
+
+def describe_jobs(cfg: OperatorConfig) -> str:
+    """Describe the configured Jobs for the start-up log line."""
+    if cfg.job_selector:
+        return f"jobs matching '{cfg.job_selector}'"
+    return f"{len(cfg.job_names)} job(s)"
+
+
+class ManagedJobs:
+    """The Jobs the operator is responsible for, and which of them need a check.
+
+    With ``JOB_NAMES`` the set is fixed.  With ``JOB_SELECTOR`` it starts
+    empty and is updated incrementally: the informer adds and removes single
+    Jobs as their events arrive, and a LIST result is applied as a delta
+    against the current set (:meth:`sync`).
+
+    Independently of the mode, the set remembers the ``resourceVersion`` at
+    which each Job was last found *steady* (running, succeeded or pending).
+    Such a Job cannot need any action until it changes, so
+    :meth:`needs_check` lets check cycles skip it.  Failed Jobs are never
+    marked steady and are checked every cycle.
+    """
+
+    def __init__(self, cfg: OperatorConfig) -> None:
+        """Initialise the set from the configuration.
+
+        Args:
+            cfg: Operator configuration (``job_names`` or ``job_selector``).
+        """
+        self._dynamic = bool(cfg.job_selector)
+        self._static = list(cfg.job_names)
+        self._names: set[str] = set(cfg.job_names)
+        self._steady: dict[str, str] = {}
+        self._lock = threading.Lock()
+        self._log = glogger.bind(classname=self.__class__.__name__)
+
+    @property
+    def dynamic(self) -> bool:
+        """``True`` if the set is discovered by label selector."""
+        return self._dynamic
+
+    def names(self) -> list[str]:
+        """Return the managed Job names (configuration order, or sorted when discovered)."""
+        if not self._dynamic:
+            return list(self._static)
+        with self._lock:
+            return sorted(self._names)
+
+    def __contains__(self, job_name: object) -> bool:
+        with self._lock:
+            return job_name in self._names
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._names)
+
+    def accepts(self, job_name: str) -> bool:
+        """Return whether *job_name* may be managed at all (any name when discovering)."""
+        return self._dynamic or job_name in self
+
+    def add(self, job_name: str) -> bool:
+        """Start managing a discovered Job.
+
+        Returns:
+            ``True`` if the Job was not managed before (always ``False`` with ``JOB_NAMES``).
+        """
+        if not self._dynamic:
+            return False
+        with self._lock:
+            if job_name in self._names:
+                return False
+            self._names.add(job_name)
+        self._log.info("Discovered {}", job_name)
+        return True
+
+    def discard(self, job_name: str) -> bool:
+        """Stop managing a discovered Job.
+
+        Returns:
+            ``True`` if the Job was managed before (always ``False`` with ``JOB_NAMES``).
+        """
+        if not self._dynamic:
+            return False
+        with self._lock:
+            if job_name not in self._names:
+                return False
+            self._names.discard(job_name)
+            self._steady.pop(job_name, None)
+        self._log.info("{} is gone or no longer matches the job selector", job_name)
+        return True
+
+    def sync(self, listed: Iterable[str]) -> list[str]:
+        """Apply a LIST result: add Jobs that appeared, discard Jobs that vanished.
+
+        Only the difference to the current set is touched.  Does nothing
+        with ``JOB_NAMES``.
+
+        Args:
+            listed: Names of all Jobs returned by a LIST with the job selector.
+
+        Returns:
+            The names of the discarded Jobs.
+        """
+        if not self._dynamic:
+            return []
+        current = set(listed)
+        with self._lock:
+            added = current - self._names
+            removed = self._names - current
+        for job_name in sorted(added):
+            self.add(job_name)
+        return [job_name for job_name in sorted(removed) if self.discard(job_name)]
+
+    def mark_steady(self, job_name: str, resource_version: str | None) -> None:
+        """Record that *job_name* needs no action at *resource_version*."""
+        with self._lock:
+            if resource_version and job_name in self._names:
+                self._steady[job_name] = resource_version
+            else:
+                self._steady.pop(job_name, None)
+
+    def mark_unsteady(self, job_name: str) -> None:
+        """Make sure *job_name* is checked again in the next cycle."""
+        with self._lock:
+            self._steady.pop(job_name, None)
+
+    def needs_check(self, job_name: str, resource_version: str | None) -> bool:
+        """Return ``False`` only if *job_name* was steady at exactly *resource_version*."""
+        with self._lock:
+            return resource_version is None or self._steady.get(job_name) != resource_version
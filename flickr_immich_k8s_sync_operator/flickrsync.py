@@ -0,0 +1,205 @@
+"""FlickrSync custom resource — one user's Flickr download, declared in the cluster instead of in env vars."""
+
+from __future__ import annotations
+
+import copy
+import hashlib
+import json
+import re
+from dataclasses import dataclass, field
+from typing import Any
+
+from kubernetes import client
+
+from flickr_immich_k8s_sync_operator.config import FLICKRSYNC_LABEL, RESTART_STRATEGIES
+
+# API group, version, kind and plural of the custom resource.
+GROUP: str = "flickr.xomox.cc"
+VERSION: str = "v1alpha1"
+KIND: str = "FlickrSync"
+PLURAL: str = "flickrsyncs"
+API_VERSION: str = f"{GROUP}/{VERSION}"
+
+# The Job (or CronJob) of a FlickrSync is named ``<prefix><user>``.
+JOB_NAME_PREFIX: str = "flickr-downloader-"
+
+# Longest allowed Job/CronJob name; the CronJob controller appends 11
+# characters to the names of the Jobs it creates.
+MAX_NAME_LENGTH: int = 52
+
+# Name of the container the operator fills in, and the environment
+# variable that tells it which user to download.
+CONTAINER_NAME: str = "downloader"
+USER_ENV: str = "FLICKR_USER"
+
+# The operator restarts failed Jobs itself, after the restart delay; Pods
+# are not retried by the Job controller in between.
+BACKOFF_LIMIT: int = 0
+
+# Annotations on the Jobs and CronJobs created from a FlickrSync: the hash of
+# the spec they were built from, and the per-Job restart policy honoured by
+# the operator instead of ``RESTART_DELAY`` and ``RESTART_STRATEGY``.
+SPEC_HASH_ANNOTATION: str = "flickr-immich-k8s-sync-operator/spec-hash"
+RESTART_DELAY_ANNOTATION: str = "flickr-immich-k8s-sync-operator/restart-delay"
+RESTART_STRATEGY_ANNOTATION: str = "flickr-immich-k8s-sync-operator/restart-strategy"
+
+# Valid values of ``spec.user`` (a DNS label, since it becomes part of the Job name).
+_USER_PATTERN = re.compile(r"^[a-z0-9]([-a-z0-9]*[a-z0-9])?$")
+
+
+def restart_policy(job: client.V1Job | dict[str, Any]) -> tuple[int | None, str | None]:
+    """Return the restart delay and strategy annotated on *job* (``V1Job`` model or plain dict).
+
+    Missing or invalid annotations yield ``None``.
+    """
+    if isinstance(job, dict):
+        annotations = job["metadata"].get("annotations") or {}
+    else:
+        annotations = (job.metadata and job.metadata.annotations) or {}
+    raw_delay = annotations.get(RESTART_DELAY_ANNOTATION, "")
+    delay = int(raw_delay) if raw_delay.isdigit() else None
+    strategy = annotations.get(RESTART_STRATEGY_ANNOTATION)
+    return delay, strategy if strategy in RESTART_STRATEGIES else None
+
+
+@dataclass(frozen=True)
+class FlickrSync:
+    """The validated spec of a ``FlickrSync`` resource and the manifests built from it.
+
+    Attributes:
+        name: Name of the resource.
+        namespace: Namespace of the resource and of its Job or CronJob.
+        uid: UID of the resource, referenced by its Job or CronJob.
+        user: Flickr user to download; the Job is named ``flickr-downloader-<user>``.
+        image: Image of the ``downloader`` container.
+        schedule: Cron schedule; if set, a CronJob with ``concurrencyPolicy:
+            Forbid`` is created instead of a Job.
+        restart_delay: Restart delay of failed runs, or ``None`` for ``RESTART_DELAY``.
+        restart_strategy: Restart strategy of failed runs, or ``None`` for
+            ``RESTART_STRATEGY``.
+        resources: Resource requests and limits of the ``downloader`` container.
+        pod_template: Pod template the ``downloader`` container is merged into
+            (volumes, further containers, …).
+        spec_hash: Hash of the resource's spec, annotated on its Job or CronJob.
+    """
+
+    name: str
+    namespace: str
+    uid: str
+    user: str
+    image: str
+    schedule: str = ""
+    restart_delay: int | None = None
+    restart_strategy: str | None = None
+    resources: dict[str, Any] = field(default_factory=dict)
+    pod_template: dict[str, Any] = field(default_factory=dict)
+    spec_hash: str = ""
+
+    @classmethod
+    def from_object(cls, obj: dict[str, Any]) -> FlickrSync:
+        """Validate a ``FlickrSync`` as returned by the API server (plain dict).
+
+        Raises:
+            ValueError: If ``spec.user`` is missing or not a DNS label, the Job
+                name would be too long, ``spec.image`` is missing, or
+                ``spec.schedule``, ``spec.restartPolicy``, ``spec.resources`` or
+                ``spec.podTemplate`` are malformed.
+        """
+        meta = obj["metadata"]
+        spec = obj.get("spec") or {}
+        user = spec.get("user")
+        if not isinstance(user, str) or not _USER_PATTERN.match(user):
+            raise ValueError(f"spec.user must be a lowercase DNS label (got {user!r})")
+        if len(JOB_NAME_PREFIX + user) > MAX_NAME_LENGTH:
+            raise ValueError(f"spec.user must be at most {MAX_NAME_LENGTH - len(JOB_NAME_PREFIX)} characters long")
+        image = spec.get("image")
+        if not isinstance(image, str) or not image:
+            raise ValueError("spec.image is required")
+        if not isinstance(spec.get("schedule") or "", str):
+            raise ValueError("spec.schedule must be a cron expression")
+        policy = spec.get("restartPolicy") or {}
+        if not isinstance(policy, dict):
+            raise ValueError("spec.restartPolicy must be an object")
+        delay = policy.get("delay")
+        if delay is not None and (not isinstance(delay, int) or delay < 0):
+            raise ValueError("spec.restartPolicy.delay must be a non-negative integer")
+        strategy = policy.get("strategy")
+        if strategy is not None and strategy not in RESTART_STRATEGIES:
+            raise ValueError(f"spec.restartPolicy.strategy must be one of {', '.join(RESTART_STRATEGIES)}")
+        for key in ("resources", "podTemplate"):
+            if not isinstance(spec.get(key) or {}, dict):
+                raise ValueError(f"spec.{key} must be an object")
+        return cls(
+            name=meta["name"],
+            namespace=meta["namespace"],
+            uid=meta.get("uid") or "",
+            user=user,
+            image=image,
+            schedule=spec.get("schedule") or "",
+            restart_delay=delay,
+            restart_strategy=strategy,
+            resources=spec.get("resources") or {},
+            pod_template=spec.get("podTemplate") or {},
+            spec_hash=hashlib.sha256(json.dumps(spec, sort_keys=True).encode()).hexdigest()[:16],
+        )
+
+    @property
+    def job_name(self) -> str:
+        """Name of the Job, or of the CronJob with a ``schedule``."""
+        return JOB_NAME_PREFIX + self.user
+
+    @property
+    def child_kind(self) -> str:
+        """``"CronJob"`` with a ``schedule``, ``"Job"`` otherwise."""
+        return "CronJob" if self.schedule else "Job"
+
+    def job_metadata(self) -> dict[str, Any]:
+        """Return labels, annotations and the controller owner reference of the Job or CronJob."""
+        annotations = {SPEC_HASH_ANNOTATION: self.spec_hash}
+        if self.restart_delay is not None:
+            annotations[RESTART_DELAY_ANNOTATION] = str(self.restart_delay)
+        if self.restart_strategy is not None:
+            annotations[RESTART_STRATEGY_ANNOTATION] = self.restart_strategy
+        owner = {
+            "apiVersion": API_VERSION,
+            "kind": KIND,
+            "name": self.name,
+            "uid": self.uid,
+            "controller": True,
+            "blockOwnerDeletion": True,
+        }
+        return {"labels": {FLICKRSYNC_LABEL: self.name}, "annotations": annotations, "ownerReferences": [owner]}
+
+    def job_spec(self) -> dict[str, Any]:
+        """Return the Job spec: the Pod template with the ``downloader`` container filled in."""
+        template = copy.deepcopy(self.pod_template)
+        template.setdefault("metadata", {}).setdefault("labels", {})[FLICKRSYNC_LABEL] = self.name
+        pod_spec = template.setdefault("spec", {})
+        pod_spec.setdefault("restartPolicy", "Never")
+        containers = pod_spec.setdefault("containers", [])
+        container = next((c for c in containers if c.get("name") == CONTAINER_NAME), None)
+        if container is None:
+            container = {"name": CONTAINER_NAME}
+            containers.insert(0, container)
+        container["image"] = self.image
+        if self.resources:
+            container["resources"] = self.resources
+        env = [var for var in container.get("env") or [] if var.get("name") != USER_ENV]
+        container["env"] = [{"name": USER_ENV, "value": self.user}, *env]
+        return {"backoffLimit": BACKOFF_LIMIT, "template": template}
+
+    def manifest(self) -> dict[str, Any]:
+        """Return the complete Job or CronJob manifest, as applied by the reconciler."""
+        metadata = {"name": self.job_name, "namespace": self.namespace, **self.job_metadata()}
+        if not self.schedule:
+            return {"apiVersion": "batch/v1", "kind": "Job", "metadata": metadata, "spec": self.job_spec()}
+        job_template = {
+            "metadata": {key: metadata[key] for key in ("labels", "annotations")},
+            "spec": self.job_spec(),
+        }
+        return {
+            "apiVersion": "batch/v1",
+            "kind": "CronJob",
+            "metadata": metadata,
+            "spec": {"schedule": self.schedule, "concurrencyPolicy": "Forbid", "jobTemplate": job_template},
+        }
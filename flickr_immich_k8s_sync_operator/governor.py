@@ -0,0 +1,137 @@
+"""Restart governor — a fleet-wide restart budget with jitter and rate-limit back-off."""
+
+from __future__ import annotations
+
+import random
+import re
+import threading
+import time
+from typing import Callable
+
+from flickr_immich_k8s_sync_operator.config import OperatorConfig
+
+# Pseudo termination reason added to a Job's reasons when its Pod logs show
+# that the download was stopped by an HTTP 429 from Flickr.
+RATE_LIMITED: str = "RateLimited"
+
+# Log output of ``flickr_download`` (``BACKOFF_EXIT_ON_429=true``) that marks a rate-limit exit.
+RATE_LIMIT_PATTERN: re.Pattern[str] = re.compile(r"\b429\b|too many requests|rate[ -]?limit", re.IGNORECASE)
+
+
+def is_rate_limited(log_tail: str) -> bool:
+    """Return whether *log_tail* indicates an exit caused by rate limiting."""
+    return RATE_LIMIT_PATTERN.search(log_tail) is not None
+
+
+class RestartGovernor:
+    """Decides when a failed Job may restart, across all Jobs of the operator.
+
+    Three independent mechanisms, each disabled by its default:
+
+    - **Budget** — a token bucket holding ``budget`` restarts that refills
+      over ``window`` seconds (implemented as GCRA: a "theoretical arrival
+      time" instead of a token count).  Restarts beyond the budget are
+      postponed to the next free slot rather than dropped; the slot of a
+      restart that ends up not happening is handed back with :meth:`refund`.
+    - **Jitter** — a random extra delay of up to ``jitter`` seconds, so Jobs
+      that failed together do not come back together.
+    - **Rate-limit back-off** — when a failure was caused by rate limiting,
+      the restart delay is doubled for every other rate-limited failure
+      within ``window``, up to ``max_backoff`` times the configured delay.
+      Each failed Job instance (UID) counts once, however often it is
+      handled.
+    """
+
+    def __init__(
+        self,
+        budget: int = 0,
+        window: float = 3600.0,
+        jitter: float = 0.0,
+        max_backoff: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+        rand: Callable[[], float] = random.random,
+    ) -> None:
+        """Initialise an idle governor.
+
+        Args:
+            budget: Restarts allowed per *window* (``0`` disables the budget).
+            window: Length of the budget and back-off window in seconds.
+            jitter: Maximum random extra delay in seconds.
+            max_backoff: Maximum factor applied to the restart delay of
+                rate-limited failures (``1`` disables the back-off).
+            clock: Monotonic time source (overridable for tests).
+            rand: Source of uniform random numbers in ``[0, 1)`` (overridable for tests).
+        """
+        self._budget = budget
+        self._window = window
+        self._jitter = jitter
+        self._max_backoff = max_backoff
+        self._clock = clock
+        self._rand = rand
+        self._tat = 0.0
+        # Rate-limited failures in the window, oldest first: key -> (time, factor).
+        self._rate_limited: dict[object, tuple[float, float]] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, cfg: OperatorConfig) -> RestartGovernor:
+        """Build the governor configured by ``RESTART_BUDGET`` and friends."""
+        return cls(cfg.restart_budget, cfg.restart_budget_window, cfg.restart_jitter, cfg.rate_limit_backoff)
+
+    def backoff_factor(self, rate_limited: bool, uid: str | None = None) -> float:
+        """Record a failure and return the factor for its restart delay.
+
+        Args:
+            rate_limited: Whether the failure was caused by rate limiting.
+            uid: UID of the failed Job instance.  A failure already recorded
+                under the same UID gets its earlier factor again instead of
+                extending the streak; without a UID every call counts.
+
+        Returns:
+            ``1`` for other failures; ``2 ** (n - 1)`` (capped at
+            ``max_backoff``) for the *n*-th rate-limited failure within the window.
+        """
+        if not rate_limited:
+            return 1.0
+        now = self._clock()
+        with self._lock:
+            for key, (recorded, _) in list(self._rate_limited.items()):
+                if recorded > now - self._window:
+                    break
+                del self._rate_limited[key]
+            if uid and uid in self._rate_limited:
+                return self._rate_limited[uid][1]
+            factor = float(min(self._max_backoff, 2 ** len(self._rate_limited)))
+            self._rate_limited[uid or object()] = (now, factor)
+            return factor
+
+    def admit(self, delay: float) -> float:
+        """Reserve a restart slot for a restart wanted in *delay* seconds.
+
+        Args:
+            delay: Seconds from now the restart would happen without the governor.
+
+        Returns:
+            Seconds from now the restart may actually happen (at least *delay*).
+        """
+        now = self._clock()
+        start = now + max(0.0, delay)
+        if self._budget > 0:
+            interval = self._window / self._budget
+            with self._lock:
+                start = max(start, self._tat - (self._budget - 1) * interval)
+                self._tat = max(self._tat, start) + interval
+        if self._jitter > 0:
+            start += self._rand() * self._jitter
+        return start - now
+
+    def refund(self, count: int = 1) -> None:
+        """Hand back the budget slots of *count* admitted restarts that will not happen.
+
+        Call it when a restart reserved with :meth:`admit` is dropped before
+        it runs (the Job recovered or went away, or the operator stops), so
+        the slot goes to the next restart instead of being lost.
+        """
+        if self._budget > 0 and count > 0:
+            with self._lock:
+                self._tat -= count * self._window / self._budget
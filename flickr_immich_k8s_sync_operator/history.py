@@ -0,0 +1,105 @@
+"""Failure history — a compact per-Job record of recent failures driving the adaptive restart delay."""
+
+from __future__ import annotations
+
+import collections
+import threading
+from dataclasses import dataclass
+from datetime import datetime
+
+from loguru import logger as glogger
+
+from flickr_immich_k8s_sync_operator.config import OperatorConfig
+
+# Number of failures remembered per Job.
+FAILURE_HISTORY_SIZE: int = 10
+
+
+@dataclass(frozen=True)
+class Failure:
+    """One failure of a Job instance.
+
+    Attributes:
+        uid: UID of the failed Job instance.
+        failed_at: When the Job entered the ``Failed`` condition.
+        reason: Restart reason (see :func:`~.metrics.restart_reason`).
+        run_duration: Seconds from the Job's ``startTime`` to the failure,
+            or ``None`` if the Job never reported a start time.
+    """
+
+    uid: str
+    failed_at: datetime
+    reason: str
+    run_duration: float | None
+
+
+class FailureHistory:
+    """Keeps the last :data:`FAILURE_HISTORY_SIZE` failures of every Job.
+
+    With ``ADAPTIVE_BACKOFF`` enabled, :meth:`restart_delay` derives the
+    restart delay of a Job from its history instead of using the fixed
+    ``RESTART_DELAY``:
+
+    - A failure after a run of at least ``FAST_FAILURE_THRESHOLD`` seconds
+      is a one-off error and is restarted after ``MIN_RESTART_DELAY``.
+    - The *n*-th fast failure in a row waits ``RESTART_DELAY * 2 ** (n - 1)``
+      seconds, capped at ``MAX_RESTART_DELAY``.
+
+    A successful run clears the history (:meth:`reset`).  The history is
+    kept in memory only; after an operator restart every Job starts over.
+    """
+
+    def __init__(self, cfg: OperatorConfig, size: int = FAILURE_HISTORY_SIZE) -> None:
+        """Initialise an empty history.
+
+        Args:
+            cfg: Operator configuration (delays and fast-failure threshold).
+            size: Failures remembered per Job.
+        """
+        self._cfg = cfg
+        self._size = size
+        self._failures: dict[str, collections.deque[Failure]] = {}
+        self._lock = threading.Lock()
+        self._log = glogger.bind(classname=self.__class__.__name__)
+
+    def get(self, job_name: str) -> list[Failure]:
+        """Return the remembered failures of *job_name*, oldest first."""
+        with self._lock:
+            return list(self._failures.get(job_name, ()))
+
+    def record(self, job_name: str, failure: Failure) -> bool:
+        """Remember *failure* unless the same Job instance is already recorded.
+
+        Returns:
+            ``True`` if the failure was new.
+        """
+        with self._lock:
+            failures = self._failures.setdefault(job_name, collections.deque(maxlen=self._size))
+            if failures and failures[-1].uid == failure.uid:
+                return False
+            failures.append(failure)
+            return True
+
+    def reset(self, job_name: str) -> None:
+        """Forget the failures of *job_name* after it completed successfully."""
+        with self._lock:
+            if self._failures.pop(job_name, None):
+                self._log.info("\t{} completed successfully — failure history cleared.", job_name)
+
+    def fast_failure_streak(self, job_name: str) -> int:
+        """Return how many of the latest failures of *job_name* in a row were fast failures."""
+        streak = 0
+        for failure in reversed(self.get(job_name)):
+            if failure.run_duration is not None and failure.run_duration >= self._cfg.fast_failure_threshold:
+                break
+            streak += 1
+        return streak
+
+    def restart_delay(self, job_name: str) -> float:
+        """Return the restart delay of *job_name* in seconds (``RESTART_DELAY`` unless adaptive)."""
+        if not self._cfg.adaptive_backoff:
+            return float(self._cfg.restart_delay)
+        streak = self.fast_failure_streak(job_name)
+        if streak == 0:
+            return float(self._cfg.min_restart_delay)
+        return float(min(self._cfg.max_restart_delay, self._cfg.restart_delay * 2 ** (streak - 1)))
@@ -0,0 +1,330 @@
+"""Job informer — a LIST + WATCH mirror of the Jobs in a namespace (or in all of them)."""
+
+from __future__ import annotations
+
+import json
+import threading
+from typing import Any, Callable, Protocol
+
+from kubernetes import client, watch
+from loguru import logger as glogger
+
+# Server-side timeout for a single WATCH request.  The stream is re-opened
+# from the last seen ``resourceVersion`` afterwards, so this only bounds
+# how long a stop request can go unnoticed on a quiet namespace.
+WATCH_TIMEOUT_SECONDS: int = 60
+
+# Seconds to back off after an unexpected LIST/WATCH error before retrying.
+ERROR_BACKOFF_SECONDS: int = 5
+
+# HTTP status returned when the requested ``resourceVersion`` is too old.
+HTTP_GONE: int = 410
+
+
+class JobStore(Protocol):
+    """What the operator needs from the informer it checks Jobs against."""
+
+    def get(self, name: str) -> dict[str, Any] | None: ...
+
+    def wait_for_sync(self, timeout: float | None = None) -> bool: ...
+
+    def run(self, shutdown_event: threading.Event) -> None: ...
+
+    def stop(self) -> None: ...
+
+
+class JobInformer:
+    """Keeps an in-memory store of all Jobs in a namespace up to date.
+
+    Performs a single LIST to seed the store, then follows a long-running
+    WATCH starting from the LIST's ``resourceVersion``.  When the API server
+    answers ``410 Gone`` (the resource version has been compacted away) the
+    store is rebuilt from a fresh LIST and the WATCH resumes from there.
+
+    Store entries are the plain JSON dicts received from the API server,
+    keyed by Job name — or by ``namespace/name`` when the Jobs of all
+    namespaces are mirrored.  Every change is reported to the optional
+    *on_event* callback as ``(event_type, key)``, where *event_type* is one
+    of ``ADDED``, ``MODIFIED`` or ``DELETED``.
+    """
+
+    def __init__(
+        self,
+        batch_v1: client.BatchV1Api,
+        namespace: str | None,
+        on_event: Callable[[str, str], None] | None = None,
+        label_selector: str | None = None,
+        watch_factory: Callable[[], watch.Watch] = watch.Watch,
+    ) -> None:
+        """Initialise an empty store.
+
+        Args:
+            batch_v1: API client used for the LIST and WATCH requests.
+            namespace: Namespace whose Jobs are mirrored, or ``None`` for all namespaces.
+            on_event: Optional callback invoked for every store change.
+            label_selector: Optional label selector restricting the mirrored Jobs.
+            watch_factory: Factory for :class:`kubernetes.watch.Watch`
+                instances (overridable for tests).
+        """
+        self._batch_v1 = batch_v1
+        self._namespace = namespace
+        self._on_event = on_event
+        self._label_selector = label_selector
+        self._watch_factory = watch_factory
+        self._store: dict[str, dict[str, Any]] = {}
+        self._store_lock = threading.Lock()
+        self._resource_version: str | None = None
+        self._synced = threading.Event()
+        self._watch: watch.Watch | None = None
+        self._log = glogger.bind(classname=self.__class__.__name__)
+
+    @property
+    def resource_version(self) -> str | None:
+        """The ``resourceVersion`` the next WATCH resumes from."""
+        return self._resource_version
+
+    def get(self, name: str) -> dict[str, Any] | None:
+        """Return the stored Job dict for *name*, or ``None`` if unknown."""
+        with self._store_lock:
+            return self._store.get(name)
+
+    def names(self) -> list[str]:
+        """Return the names of all Jobs currently in the store."""
+        with self._store_lock:
+            return list(self._store)
+
+    def wait_for_sync(self, timeout: float | None = None) -> bool:
+        """Block until the initial LIST has populated the store.
+
+        Args:
+            timeout: Maximum seconds to wait, or ``None`` to wait forever.
+
+        Returns:
+            ``True`` once the store is synced, ``False`` on timeout.
+        """
+        return self._synced.wait(timeout=timeout)
+
+    def relist(self) -> None:
+        """Replace the store with the result of a fresh LIST.
+
+        Emits ``DELETED`` for Jobs that vanished while no WATCH was active
+        and ``ADDED``/``MODIFIED`` for everything present in the LIST.
+        """
+        request, args = self._list_request()
+        resp = request(*args, label_selector=self._label_selector, _preload_content=False)
+        job_list = json.loads(resp.data)
+        items: dict[str, dict[str, Any]] = {self._key(item["metadata"]): item for item in job_list.get("items") or []}
+
+        with self._store_lock:
+            previous = self._store
+            self._store = items
+        self._resource_version = job_list["metadata"]["resourceVersion"]
+        self._synced.set()
+        self._log.debug("Listed {} job(s) at resourceVersion {}", len(items), self._resource_version)
+
+        for name in previous.keys() - items.keys():
+            self._emit("DELETED", name)
+        for name, item in items.items():
+            old = previous.get(name)
+            if old is None:
+                self._emit("ADDED", name)
+            elif old["metadata"].get("resourceVersion") != item["metadata"].get("resourceVersion"):
+                self._emit("MODIFIED", name)
+
+    def apply_event(self, event: dict[str, Any]) -> None:
+        """Apply a single WATCH event to the store.
+
+        Args:
+            event: An event as yielded by :meth:`kubernetes.watch.Watch.stream`.
+        """
+        event_type: str = event["type"]
+        obj: dict[str, Any] = event["raw_object"]
+        metadata = obj.get("metadata") or {}
+        if metadata.get("resourceVersion"):
+            self._resource_version = metadata["resourceVersion"]
+        if event_type == "BOOKMARK":
+            return
+
+        name = self._key(metadata)
+        with self._store_lock:
+            if event_type == "DELETED":
+                self._store.pop(name, None)
+            else:
+                self._store[name] = obj
+        self._emit(event_type, name)
+
+    def run(self, shutdown_event: threading.Event) -> None:
+        """LIST, then WATCH until *shutdown_event* is set.
+
+        Args:
+            shutdown_event: Threading event that, when set, stops the WATCH.
+        """
+        while not shutdown_event.is_set():
+            try:
+                if self._resource_version is None:
+                    self.relist()
+                self._watch_once()
+            except client.ApiException as exc:
+                if exc.status == HTTP_GONE:
+                    self._log.info("resourceVersion {} expired (410 Gone) — relisting", self._resource_version)
+                    self._resource_version = None
+                else:
+                    self._log.error("Kubernetes API error while watching jobs: {}", exc)
+                    shutdown_event.wait(timeout=ERROR_BACKOFF_SECONDS)
+            except Exception:
+                self._log.exception("Unexpected error while watching jobs")
+                shutdown_event.wait(timeout=ERROR_BACKOFF_SECONDS)
+
+    def stop(self) -> None:
+        """Ask the currently running WATCH request (if any) to terminate."""
+        if self._watch is not None:
+            self._watch.stop()
+
+    def _watch_once(self) -> None:
+        """Follow one WATCH request until the server closes it."""
+        self._watch = self._watch_factory()
+        request, args = self._list_request()
+        try:
+            for event in self._watch.stream(
+                request,
+                *args,
+                label_selector=self._label_selector,
+                resource_version=self._resource_version,
+                allow_watch_bookmarks=True,
+                timeout_seconds=WATCH_TIMEOUT_SECONDS,
+            ):
+                self.apply_event(event)
+        finally:
+            self._watch = None
+
+    def _list_request(self) -> tuple[Callable[..., Any], tuple[str, ...]]:
+        """Return the API method and positional arguments listing the Jobs of the namespace or of all namespaces."""
+        if self._namespace is None:
+            return self._batch_v1.list_job_for_all_namespaces, ()
+        return self._batch_v1.list_namespaced_job, (self._namespace,)
+
+    def _key(self, metadata: dict[str, Any]) -> str:
+        """Return the store key of a Job: its name, prefixed by its namespace when mirroring all namespaces."""
+        if self._namespace is None:
+            return f"{metadata['namespace']}/{metadata['name']}"
+        return str(metadata["name"])
+
+    def _emit(self, event_type: str, name: str) -> None:
+        """Forward a store change to the ``on_event`` callback."""
+        if self._on_event is not None:
+            self._on_event(event_type, name)
+
+
+class ClusterJobInformer:
+    """One LIST + WATCH of the Jobs of all namespaces, dispatched to a view per namespace.
+
+    Serving ``NAMESPACES=*`` from a single informer keeps the number of
+    requests and watch connections independent of the number of namespaces.
+    """
+
+    def __init__(
+        self,
+        batch_v1: client.BatchV1Api,
+        label_selector: str | None = None,
+        watch_factory: Callable[[], watch.Watch] = watch.Watch,
+    ) -> None:
+        """Initialise an empty store.
+
+        Args:
+            batch_v1: API client used for the LIST and WATCH requests.
+            label_selector: Optional label selector restricting the mirrored Jobs.
+            watch_factory: Factory for :class:`kubernetes.watch.Watch`
+                instances (overridable for tests).
+        """
+        self._informer = JobInformer(batch_v1, None, self._dispatch, label_selector, watch_factory)
+        self._handlers: dict[str, Callable[[str, str], None]] = {}
+        self._lock = threading.Lock()
+
+    def view(self, namespace: str, on_event: Callable[[str, str], None] | None = None) -> NamespaceJobs:
+        """Return the Jobs of *namespace*, reporting their changes to *on_event* while the view runs."""
+        return NamespaceJobs(self, namespace, on_event)
+
+    def run(self, shutdown_event: threading.Event) -> None:
+        """LIST, then WATCH the Jobs of all namespaces until *shutdown_event* is set."""
+        self._informer.run(shutdown_event)
+
+    def stop(self) -> None:
+        """Ask the currently running WATCH request (if any) to terminate."""
+        self._informer.stop()
+
+    def get(self, namespace: str, name: str) -> dict[str, Any] | None:
+        """Return the stored Job dict of *name* in *namespace*, or ``None`` if unknown."""
+        return self._informer.get(f"{namespace}/{name}")
+
+    def wait_for_sync(self, timeout: float | None = None) -> bool:
+        """Block until the initial LIST has populated the store (see :meth:`JobInformer.wait_for_sync`)."""
+        return self._informer.wait_for_sync(timeout)
+
+    def subscribe(self, namespace: str, on_event: Callable[[str, str], None]) -> None:
+        """Report the changes of the Jobs in *namespace* to *on_event*.
+
+        The Jobs already in the store are reported as ``ADDED`` first, so a
+        subscriber that starts late still learns about every Job (one that
+        is being listed right then may be reported twice).
+        """
+        prefix = f"{namespace}/"
+        with self._lock:
+            self._handlers[namespace] = on_event
+            for key in self._informer.names():
+                if key.startswith(prefix):
+                    on_event("ADDED", key[len(prefix) :])
+
+    def unsubscribe(self, namespace: str) -> None:
+        """Stop reporting the changes of the Jobs in *namespace*."""
+        with self._lock:
+            self._handlers.pop(namespace, None)
+
+    def _dispatch(self, event_type: str, key: str) -> None:
+        """Forward a store change to the subscriber of its namespace."""
+        namespace, _, name = key.partition("/")
+        with self._lock:
+            handler = self._handlers.get(namespace)
+            if handler is not None:
+                handler(event_type, name)
+
+
+class NamespaceJobs:
+    """The Jobs of one namespace in a :class:`ClusterJobInformer`, usable in place of a :class:`JobInformer`.
+
+    Running the view subscribes to the changes of the namespace; the shared
+    informer itself is run by its owner.
+    """
+
+    def __init__(
+        self, cluster: ClusterJobInformer, namespace: str, on_event: Callable[[str, str], None] | None = None
+    ) -> None:
+        """Initialise the view.
+
+        Args:
+            cluster: The informer of all namespaces.
+            namespace: Namespace whose Jobs are viewed.
+            on_event: Optional callback invoked for every change in the namespace.
+        """
+        self._cluster = cluster
+        self._namespace = namespace
+        self._on_event = on_event
+
+    def get(self, name: str) -> dict[str, Any] | None:
+        """Return the stored Job dict for *name*, or ``None`` if unknown."""
+        return self._cluster.get(self._namespace, name)
+
+    def wait_for_sync(self, timeout: float | None = None) -> bool:
+        """Block until the shared store is synced."""
+        return self._cluster.wait_for_sync(timeout)
+
+    def run(self, shutdown_event: threading.Event) -> None:
+        """Report the changes of the namespace until *shutdown_event* is set."""
+        if self._on_event is not None:
+            self._cluster.subscribe(self._namespace, self._on_event)
+        try:
+            shutdown_event.wait()
+        finally:
+            self._cluster.unsubscribe(self._namespace)
+
+    def stop(self) -> None:
+        """Nothing to stop; the shared informer is stopped by its owner."""
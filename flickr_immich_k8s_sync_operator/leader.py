@@ -0,0 +1,188 @@
+"""Leader election — a ``coordination.k8s.io/v1`` Lease decides which replica acts."""
+
+from __future__ import annotations
+
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Callable
+
+from kubernetes import client
+from loguru import logger as glogger
+
+# Seconds between two attempts to acquire or renew the Lease.
+RETRY_PERIOD: float = 2.0
+
+# Fraction of the lease duration after which a leader that could not renew
+# steps down — early enough that no other replica can have taken over yet.
+RENEW_DEADLINE_FACTOR: float = 2 / 3
+
+# HTTP status returned when an update is based on a stale ``resourceVersion``.
+HTTP_CONFLICT: int = 409
+
+
+class LeaderElector:
+    """Acquires and renews a Lease so that only one replica acts at a time.
+
+    Follows the algorithm of client-go's ``leaderelection`` package: a
+    replica takes the Lease when it has no holder, or when its holder has
+    not renewed it for ``lease_duration`` seconds.  Expiry is measured on
+    the local monotonic clock from the moment the current Lease record was
+    first observed, so clock skew between nodes does not matter.  All
+    writes are optimistic — a ``409 Conflict`` means another replica was
+    faster.
+
+    On a graceful shutdown :meth:`release` clears the holder, so a standby
+    replica can take over after a single :data:`RETRY_PERIOD`.
+    """
+
+    def __init__(
+        self,
+        coordination_v1: client.CoordinationV1Api,
+        namespace: str,
+        name: str,
+        identity: str,
+        lease_duration: int = 15,
+        on_started_leading: Callable[[], None] | None = None,
+        on_stopped_leading: Callable[[], None] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialise the elector without touching the API.
+
+        Args:
+            coordination_v1: API client used to read and write the Lease.
+            namespace: Namespace of the Lease.
+            name: Name of the Lease.
+            identity: Unique identity of this replica (e.g. the Pod name).
+            lease_duration: Seconds a Lease stays valid without renewal.
+            on_started_leading: Called when this replica became the leader.
+            on_stopped_leading: Called when this replica lost the leadership.
+            clock: Monotonic time source (overridable for tests).
+        """
+        self._coordination_v1 = coordination_v1
+        self._namespace = namespace
+        self._name = name
+        self.identity = identity
+        self._lease_duration = lease_duration
+        self._on_started_leading = on_started_leading
+        self._on_stopped_leading = on_stopped_leading
+        self._clock = clock
+        self._leading = threading.Event()
+        self._last_renew = 0.0
+        # (holder, renewTime) of the last Lease record seen and when it was first seen.
+        self._observed: tuple[str | None, datetime | None] | None = None
+        self._observed_at = 0.0
+        self._log = glogger.bind(classname=self.__class__.__name__)
+
+    def is_leader(self) -> bool:
+        """Return whether this replica currently holds the Lease."""
+        return self._leading.is_set()
+
+    def run(self, shutdown_event: threading.Event) -> None:
+        """Acquire and renew the Lease every :data:`RETRY_PERIOD` seconds until *shutdown_event* is set.
+
+        Args:
+            shutdown_event: Threading event that, when set, stops the loop.
+        """
+        while not shutdown_event.is_set():
+            self.tick()
+            shutdown_event.wait(timeout=RETRY_PERIOD)
+
+    def tick(self) -> None:
+        """Make one acquire/renew attempt and update the leadership state."""
+        try:
+            renewed = self.try_acquire_or_renew()
+        except Exception as exc:
+            self._log.warning("Could not acquire or renew lease {}: {}", self._name, exc)
+            renewed = False
+        now = self._clock()
+        if renewed:
+            self._last_renew = now
+            if not self._leading.is_set():
+                self._leading.set()
+                self._log.info("{} became the leader (lease {})", self.identity, self._name)
+                if self._on_started_leading is not None:
+                    self._on_started_leading()
+        elif self._leading.is_set() and now - self._last_renew > self._lease_duration * RENEW_DEADLINE_FACTOR:
+            self._leading.clear()
+            self._log.warning("{} lost the leadership (lease {})", self.identity, self._name)
+            if self._on_stopped_leading is not None:
+                self._on_stopped_leading()
+
+    def try_acquire_or_renew(self) -> bool:
+        """Take or renew the Lease if possible.
+
+        Returns:
+            ``True`` if this replica holds the Lease afterwards.
+
+        Raises:
+            client.ApiException: On API errors other than ``404`` and ``409``.
+        """
+        now = datetime.now(timezone.utc)
+        try:
+            lease = self._coordination_v1.read_namespaced_lease(self._name, self._namespace)
+        except client.ApiException as exc:
+            if exc.status != 404:
+                raise
+            return self._create(now)
+
+        spec = lease.spec or client.V1LeaseSpec()
+        record = (spec.holder_identity, spec.renew_time)
+        if record != self._observed:
+            self._observed = record
+            self._observed_at = self._clock()
+        held_by_other = bool(spec.holder_identity) and spec.holder_identity != self.identity
+        if held_by_other and self._clock() < self._observed_at + (spec.lease_duration_seconds or self._lease_duration):
+            return False
+
+        if spec.holder_identity != self.identity:
+            spec.acquire_time = now
+            spec.lease_transitions = (spec.lease_transitions or 0) + 1
+        spec.holder_identity = self.identity
+        spec.renew_time = now
+        spec.lease_duration_seconds = self._lease_duration
+        lease.spec = spec
+        try:
+            self._coordination_v1.replace_namespaced_lease(self._name, self._namespace, lease)
+        except client.ApiException as exc:
+            if exc.status == HTTP_CONFLICT:
+                return False
+            raise
+        return True
+
+    def release(self) -> None:
+        """Give up the Lease (if held) so that a standby replica can take over immediately."""
+        if not self._leading.is_set():
+            return
+        self._leading.clear()
+        try:
+            lease = self._coordination_v1.read_namespaced_lease(self._name, self._namespace)
+            if lease.spec is None or lease.spec.holder_identity != self.identity:
+                return
+            lease.spec.holder_identity = None
+            lease.spec.renew_time = datetime.now(timezone.utc)
+            lease.spec.lease_duration_seconds = 1
+            self._coordination_v1.replace_namespaced_lease(self._name, self._namespace, lease)
+            self._log.info("{} released lease {}", self.identity, self._name)
+        except client.ApiException as exc:
+            self._log.warning("Could not release lease {}: {}", self._name, exc)
+
+    def _create(self, now: datetime) -> bool:
+        """Create the Lease with this replica as holder; ``False`` if another replica created it first."""
+        lease = client.V1Lease(
+            metadata=client.V1ObjectMeta(name=self._name, namespace=self._namespace),
+            spec=client.V1LeaseSpec(
+                holder_identity=self.identity,
+                lease_duration_seconds=self._lease_duration,
+                acquire_time=now,
+                renew_time=now,
+                lease_transitions=0,
+            ),
+        )
+        try:
+            self._coordination_v1.create_namespaced_lease(self._namespace, lease)
+        except client.ApiException as exc:
+            if exc.status == HTTP_CONFLICT:
+                return False
+            raise
+        return True
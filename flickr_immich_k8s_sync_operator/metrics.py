@@ -0,0 +1,251 @@
+"""Prometheus metrics — histograms, counters and a minimal ``/metrics`` HTTP endpoint.
+
+Implemented on the standard library only: the text exposition format is
+simple enough that pulling in ``prometheus_client`` is not worth it.
+"""
+
+from __future__ import annotations
+
+import bisect
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from loguru import logger as glogger
+
+# Default latency buckets in seconds (the ``prometheus_client`` defaults).
+DEFAULT_BUCKETS: tuple[float, ...] = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Buckets for restarts, which include waiting for garbage collection.
+RESTART_BUCKETS: tuple[float, ...] = (0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0, 600.0)
+
+# Buckets for whole check cycles.
+CYCLE_BUCKETS: tuple[float, ...] = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 300.0)
+
+CONTENT_TYPE: str = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _format_labels(names: tuple[str, ...], values: tuple[str, ...], extra: str = "") -> str:
+    """Render a ``{name="value",...}`` label set (empty string if there are no labels)."""
+    parts = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _escape(value: str) -> str:
+    """Escape a label value for the text exposition format."""
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_float(value: float) -> str:
+    """Render *value* the way Prometheus expects (``+Inf``, integers without fraction)."""
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if value != int(value) else str(int(value))
+
+
+class Counter:
+    """A monotonically increasing counter with optional labels."""
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()) -> None:
+        """Create a counter.
+
+        Args:
+            name: Metric name; should end in ``_total``.
+            documentation: ``# HELP`` text.
+            labelnames: Names of the labels every sample carries.
+        """
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self._values: dict[tuple[str, ...], float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *labelvalues: str, amount: float = 1.0) -> None:
+        """Increase the counter of the given label values by *amount*."""
+        with self._lock:
+            self._values[labelvalues] = self._values.get(labelvalues, 0.0) + amount
+
+    def value(self, *labelvalues: str) -> float:
+        """Return the current value for the given label values (``0`` if never incremented)."""
+        with self._lock:
+            return self._values.get(labelvalues, 0.0)
+
+    def render(self) -> list[str]:
+        """Return the exposition lines of this counter."""
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            for labelvalues, value in sorted(self._values.items()):
+                lines.append(f"{self.name}{_format_labels(self.labelnames, labelvalues)} {_format_float(value)}")
+        return lines
+
+
+class Histogram:
+    """A cumulative histogram with fixed buckets and optional labels."""
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> None:
+        """Create a histogram.
+
+        Args:
+            name: Metric name; should end in the unit (e.g. ``_seconds``).
+            documentation: ``# HELP`` text.
+            labelnames: Names of the labels every sample carries.
+            buckets: Sorted upper bounds; ``+Inf`` is added implicitly.
+        """
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self.buckets = tuple(sorted(buckets))
+        # Per label set: [bucket counts (non-cumulative, +Inf last), sum]
+        self._series: dict[tuple[str, ...], tuple[list[int], list[float]]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, *labelvalues: str) -> None:
+        """Record one observation of *value* for the given label values."""
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labelvalues)
+            if series is None:
+                series = self._series[labelvalues] = ([0] * (len(self.buckets) + 1), [0.0])
+            series[0][index] += 1
+            series[1][0] += value
+
+    def count(self, *labelvalues: str) -> int:
+        """Return the number of observations for the given label values."""
+        with self._lock:
+            series = self._series.get(labelvalues)
+            return sum(series[0]) if series else 0
+
+    def total(self, *labelvalues: str) -> float:
+        """Return the sum of all observations for the given label values."""
+        with self._lock:
+            series = self._series.get(labelvalues)
+            return series[1][0] if series else 0.0
+
+    def render(self) -> list[str]:
+        """Return the exposition lines of this histogram."""
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            for labelvalues, (counts, total) in sorted(self._series.items()):
+                cumulative = 0
+                for bound, count in zip((*self.buckets, float("inf")), counts):
+                    cumulative += count
+                    le = f'le="{_format_float(bound)}"'
+                    lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, labelvalues, le)} {cumulative}")
+                labels = _format_labels(self.labelnames, labelvalues)
+                lines.append(f"{self.name}_sum{labels} {_format_float(total[0])}")
+                lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+class OperatorMetrics:
+    """All metrics exported by the operator.
+
+    Attributes:
+        api_latency: Kubernetes API request latency by ``verb`` and ``resource``.
+        api_errors: Failed Kubernetes API requests by HTTP ``status``.
+        cycle_duration: Duration of a full check cycle by ``mode``.
+        restart_duration: Time from deleting a Job to its recreation.
+        log_fetch_duration: Time to fetch the log tail of one Pod.
+        restarts: Restarts triggered, by pod termination ``reason``.
+    """
+
+    def __init__(self) -> None:
+        """Create the (empty) metrics."""
+        self.api_latency = Histogram(
+            "flickr_operator_api_request_duration_seconds",
+            "Latency of Kubernetes API requests.",
+            ("verb", "resource"),
+        )
+        self.api_errors = Counter(
+            "flickr_operator_api_errors_total",
+            "Kubernetes API requests that failed, by HTTP status code.",
+            ("status",),
+        )
+        self.cycle_duration = Histogram(
+            "flickr_operator_cycle_duration_seconds",
+            "Duration of a check cycle over all configured Jobs.",
+            ("mode",),
+            CYCLE_BUCKETS,
+        )
+        self.restart_duration = Histogram(
+            "flickr_operator_restart_duration_seconds",
+            "Time from deleting a failed Job until it has been recreated.",
+            buckets=RESTART_BUCKETS,
+        )
+        self.log_fetch_duration = Histogram(
+            "flickr_operator_pod_log_fetch_duration_seconds",
+            "Time to fetch the log tail of a single Pod.",
+        )
+        self.restarts = Counter(
+            "flickr_operator_restarts_total",
+            "Job restarts triggered, by pod termination reason.",
+            ("reason",),
+        )
+
+    def render(self) -> str:
+        """Return all metrics in the Prometheus text exposition format."""
+        lines: list[str] = []
+        for metric in (
+            self.api_latency,
+            self.api_errors,
+            self.cycle_duration,
+            self.restart_duration,
+            self.log_fetch_duration,
+            self.restarts,
+        ):
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+def restart_reason(reasons: set[str]) -> str:
+    """Pick the label value for :attr:`OperatorMetrics.restarts` from a set of pod termination reasons.
+
+    ``OOMKilled`` wins over any other reason, followed by ``RateLimited``;
+    without any reason ``"Unknown"`` is used.
+    """
+    if "OOMKilled" in reasons:
+        return "OOMKilled"
+    if "RateLimited" in reasons:
+        return "RateLimited"
+    return min(reasons) if reasons else "Unknown"
+
+
+def start_metrics_server(metrics: OperatorMetrics, port: int, host: str = "") -> ThreadingHTTPServer:
+    """Serve *metrics* on ``http://<host>:<port>/metrics`` from a daemon thread.
+
+    Args:
+        metrics: The metrics to expose.
+        port: TCP port to listen on (``0`` picks a free port).
+        host: Interface to bind to (default: all interfaces).
+
+    Returns:
+        The running server; call ``shutdown()`` on it to stop serving.
+    """
+
+    class _Handler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:  # noqa: N802 — name required by BaseHTTPRequestHandler
+            if self.path.split("?", 1)[0] != "/metrics":
+                self.send_error(404)
+                return
+            body = metrics.render().encode()
+            self.send_response(200)
+            self.send_header("Content-Type", CONTENT_TYPE)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format: str, *args: object) -> None:  # noqa: A002 — signature of the base class
+            pass
+
+    server = ThreadingHTTPServer((host, port), _Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="metrics-server", daemon=True).start()
+    glogger.bind(classname="MetricsServer").info("Serving metrics on port {}", server.server_address[1])
+    return server
@@ -3,14 +3,67 @@
 from __future__ import annotations
 
 import copy
+import json
+import random
 import textwrap
 import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any, Callable, TypeVar
 
 from kubernetes import client, config
 from loguru import logger as glogger
 
+from flickr_immich_k8s_sync_operator.classifier import HOLD, IMMEDIATE, FailureClassifier
 from flickr_immich_k8s_sync_operator.config import OperatorConfig
+from flickr_immich_k8s_sync_operator.discovery import ManagedJobs, describe_jobs
+from flickr_immich_k8s_sync_operator.flickrsync import restart_policy
+from flickr_immich_k8s_sync_operator.governor import RATE_LIMITED, RestartGovernor
+from flickr_immich_k8s_sync_operator.history import Failure, FailureHistory
+from flickr_immich_k8s_sync_operator.informer import ClusterJobInformer, JobInformer, JobStore
+from flickr_immich_k8s_sync_operator.leader import LeaderElector
+from flickr_immich_k8s_sync_operator.metrics import OperatorMetrics, restart_reason, start_metrics_server
+from flickr_immich_k8s_sync_operator.restart_markers import RestartMarkers
+from flickr_immich_k8s_sync_operator.scheduler import RestartScheduler
+from flickr_immich_k8s_sync_operator.sharding import ShardMembership
+from flickr_immich_k8s_sync_operator.state_store import JobRecord, StateStore, open_state_store
+from flickr_immich_k8s_sync_operator.templates import JobTemplates, cronjob_owner_reference, open_job_templates
+from flickr_immich_k8s_sync_operator.workqueue import WorkQueue
+
+if TYPE_CHECKING:
+    from flickr_immich_k8s_sync_operator.reconciler import FlickrSyncReconciler
+
+_T = TypeVar("_T")
+
+# Back-off (seconds) between checks whether a deleted Job is gone; doubles
+# after every check up to the maximum.
+DELETION_POLL_INITIAL: float = 0.25
+DELETION_POLL_MAX: float = 5.0
+
+# Placeholder logged when the log tail of a Pod cannot be fetched.
+LOGS_UNAVAILABLE: str = "<logs unavailable>"
+
+# Size of the thread pool fetching Pod log tails concurrently.
+LOG_FETCH_WORKERS: int = 8
+
+# Seconds after which a scheduled restart is retried when its Job was busy
+# (being checked by another worker) at the moment the restart became due.
+SCHEDULED_RESTART_RETRY: float = 1.0
+
+# Seconds after which a Job handed out by the work queue is queued again when
+# its per-Job lock was held elsewhere (e.g. by the FlickrSync reconciler).
+QUEUE_BUSY_RETRY: float = 1.0
+
+# Attempts and base back-off (seconds) for ``create_namespaced_job`` when the
+# old Job still exists (HTTP 409 AlreadyExists).
+CREATE_RETRIES: int = 6
+CREATE_RETRY_BASE: float = 1.0
+
+# Field manager and content type of the server-side apply requests of the
+# ``apply`` restart strategy (JSON is valid YAML).
+FIELD_MANAGER: str = "flickr-immich-k8s-sync-operator"
+APPLY_PATCH_CONTENT_TYPE: str = "application/apply-patch+yaml"
 
 # Labels auto-added by the Job controller that reference the old
 # Job's UID — must be stripped before creating a new Job.
@@ -35,7 +88,9 @@ def build_manifest(job_dict: dict) -> dict:  # type: ignore[type-arg]
     ``create_namespaced_job`` — server-managed metadata, status, and
     controller labels on the pod template are removed.
 
-    The *job_dict* is **not** mutated.
+    The *job_dict* is **not** mutated.  Only ``spec.template`` is copied
+    (the pod template labels into a fresh, filtered dict) — status,
+    ``managedFields`` and the remaining metadata are never duplicated.
 
     Args:
         job_dict: A serialised Kubernetes Job dictionary.
@@ -43,192 +98,1135 @@ def build_manifest(job_dict: dict) -> dict:  # type: ignore[type-arg]
     Returns:
         A minimal Job manifest dict suitable for ``create_namespaced_job``.
     """
-    raw = copy.deepcopy(job_dict)
-
-    template = raw["spec"]["template"]
+    src_template = job_dict["spec"]["template"]
+    template = {key: copy.deepcopy(value) for key, value in src_template.items() if key != "metadata"}
 
     # Strip server-managed labels from pod template
-    tmpl_labels = template.get("metadata", {}).get("labels", {})
-    for label in SERVER_MANAGED_LABELS:
-        tmpl_labels.pop(label, None)
+    if "metadata" in src_template:
+        src_meta = src_template["metadata"]
+        tmpl_meta = {key: copy.deepcopy(value) for key, value in src_meta.items() if key != "labels"}
+        if "labels" in src_meta:
+            tmpl_meta["labels"] = {
+                key: value for key, value in (src_meta["labels"] or {}).items() if key not in SERVER_MANAGED_LABELS
+            }
+        template["metadata"] = tmpl_meta
 
     return {
         "apiVersion": "batch/v1",
         "kind": "Job",
         "metadata": {
-            "name": raw["metadata"]["name"],
-            "namespace": raw["metadata"]["namespace"],
+            "name": job_dict["metadata"]["name"],
+            "namespace": job_dict["metadata"]["namespace"],
         },
         "spec": {
-            "backoffLimit": raw["spec"]["backoffLimit"],
+            "backoffLimit": job_dict["spec"]["backoffLimit"],
             "template": template,
         },
     }
 
 
+def manifest_key(uid: str | None, generation: int | None, resource_version: str | None) -> str:
+    """Return the key under which a Job's cached manifest stays valid.
+
+    ``metadata.generation`` only changes when the spec changes, so together
+    with the UID (a recreated Job starts again at generation 1) it identifies
+    the manifest exactly while ignoring pure status updates.  Falls back to
+    ``resourceVersion`` when no generation is available.
+
+    Args:
+        uid: ``metadata.uid`` of the Job.
+        generation: ``metadata.generation`` of the Job, if known.
+        resource_version: ``metadata.resourceVersion`` of the Job.
+
+    Returns:
+        An opaque cache key.
+    """
+    if generation is not None:
+        return f"{uid}/{generation}"
+    return f"{uid}@{resource_version}"
+
+
+def job_uid(job: client.V1Job | dict[str, Any]) -> str:
+    """Return the UID of a Job given as ``V1Job`` model or plain dict (``""`` if unset)."""
+    if isinstance(job, dict):
+        return str((job.get("metadata") or {}).get("uid") or "")
+    return (job.metadata and job.metadata.uid) or ""
+
+
+def job_resource_version(job: client.V1Job | dict[str, Any]) -> str | None:
+    """Return the ``resourceVersion`` of a Job given as ``V1Job`` model or plain dict."""
+    if isinstance(job, dict):
+        return (job.get("metadata") or {}).get("resourceVersion")
+    return job.metadata.resource_version if job.metadata else None
+
+
+def failed_since(status: dict[str, Any]) -> datetime | None:
+    """Return the time a Job entered the ``Failed`` condition, if it did.
+
+    Args:
+        status: The ``status`` section of a serialised Job dict.
+
+    Returns:
+        The ``lastTransitionTime`` of the ``Failed=True`` condition as an
+        aware ``datetime``, or ``None`` when the Job has not failed.
+    """
+    for condition in status.get("conditions") or []:
+        if condition.get("type") == "Failed" and condition.get("status") == "True":
+            transition = condition.get("lastTransitionTime")
+            if isinstance(transition, datetime):
+                return transition
+            return datetime.fromisoformat(transition)
+    return None
+
+
+def started_at(status: dict[str, Any]) -> datetime | None:
+    """Return the ``startTime`` of a Job from its serialised ``status``, if set."""
+    start = status.get("startTime")
+    if start is None or isinstance(start, datetime):
+        return start
+    return datetime.fromisoformat(start)
+
+
+def succeeded(status: dict[str, Any]) -> bool:
+    """Return whether a Job's serialised ``status`` has the ``Complete=True`` condition."""
+    return any(
+        condition.get("type") == "Complete" and condition.get("status") == "True"
+        for condition in status.get("conditions") or []
+    )
+
+
+def deleted_immediately(status: Any) -> bool:
+    """Return whether the response to a DELETE shows that the object is already gone.
+
+    The API server answers with a ``Status`` once the object has been
+    removed, and with the object itself while finalizers still hold it.
+    """
+    return getattr(status, "kind", None) == "Status"
+
+
+def terminated_state(pod: dict[str, Any]) -> tuple[int | None, str | None]:
+    """Return exit code and reason of the last terminated container of a Pod.
+
+    Args:
+        pod: A serialised (camelCase) Pod dict.
+
+    Returns:
+        ``(exit_code, reason)`` of the last container status with a
+        ``terminated`` state, or ``(None, None)`` if no container terminated.
+    """
+    exit_code = None
+    reason = None
+    for cs in (pod.get("status") or {}).get("containerStatuses") or []:
+        terminated = (cs.get("state") or {}).get("terminated")
+        if terminated:
+            exit_code = terminated.get("exitCode")
+            reason = terminated.get("reason")
+    return exit_code, reason
+
+
 class JobRestartOperator:
     """Watches a set of Kubernetes Jobs and restarts failed ones after a delay.
 
-    Connects to the in-cluster Kubernetes API on initialisation and
-    continuously polls the configured Jobs.  Failed Jobs are deleted and
-    recreated from a cached manifest once the configured restart delay has
-    elapsed (or immediately when an OOMKill is detected and
-    ``skip_delay_on_oom`` is enabled).
+    Jobs are polled, listed or followed through a :class:`JobInformer`
+    (``check_mode``) and checked on a pool of ``workers`` threads, with a
+    per-Job lock and, in ``watch`` mode, a :class:`WorkQueue` in between.
+
+    Failed Jobs are deleted and recreated from a cached manifest or a
+    :class:`JobTemplates` template (by ``create`` or, with the ``apply``
+    restart strategy, server-side apply) once the delay set by the
+    :class:`RestartScheduler`, :class:`RestartGovernor` and
+    :class:`FailureHistory` has elapsed.
+
+    Restarts in flight are recorded in a :class:`StateStore` and, with
+    ``leader_election`` or a ``shard_group`` (:class:`ShardMembership`), in
+    :class:`RestartMarkers`, so whichever replica acts next finishes them.
+
+    With ``flickrsync`` a :class:`FlickrSyncReconciler` creates the Jobs
+    from ``FlickrSync`` resources alongside.
     """
 
-    def __init__(self, cfg: OperatorConfig) -> None:
+    def __init__(
+        self,
+        cfg: OperatorConfig,
+        api_client: client.ApiClient | None = None,
+        metrics: OperatorMetrics | None = None,
+        governor: RestartGovernor | None = None,
+        cluster_jobs: ClusterJobInformer | None = None,
+    ) -> None:
         """Initialise Kubernetes API clients and bind a structured logger.
 
         Args:
             cfg: Operator configuration (namespace, job names, timings).
+            api_client: API client (and thereby connection pool) to use; a new
+                one is created from the in-cluster configuration if omitted.
+            metrics: Metrics to record into, e.g. shared by the operators of
+                several namespaces; new ones are created if omitted.
+            governor: Restart governor, e.g. shared by the operators of several
+                namespaces; a new one is created from *cfg* if omitted.
+            cluster_jobs: Informer of the Jobs of all namespaces, run by the
+                caller, to take this namespace's Jobs from in ``watch`` mode;
+                the operator runs its own informer if omitted.
         """
-        config.load_incluster_config()
-        self._batch_v1 = client.BatchV1Api()
-        self._core_v1 = client.CoreV1Api()
-        self._api_client = client.ApiClient()
+        if api_client is None:
+            config.load_incluster_config()
+            api_client = client.ApiClient()
+        self._batch_v1 = client.BatchV1Api(api_client)
+        self._core_v1 = client.CoreV1Api(api_client)
+        self._api_client = api_client
         self._cfg = cfg
         self._cached_manifests: dict[str, dict] = {}  # type: ignore[type-arg]
+        self._cached_uids: dict[str, str] = {}
+        self._manifest_keys: dict[str, str] = {}
+        self._templates: JobTemplates | None = open_job_templates(cfg, api_client)
+        # job name -> owner reference of the CronJob that spawned it (with a template source)
+        self._cronjob_owners: dict[str, dict[str, Any]] = {}
+        # job name -> (restart delay, restart strategy) annotated on the Job, e.g. by a FlickrSync
+        self._restart_policies: dict[str, tuple[int | None, str | None]] = {}
+        # job name -> (Job UID, {pod UID: (exit code, reason, log tail)})
+        self._pod_diagnostics: dict[str, tuple[str, dict[str, tuple[int | None, str | None, str]]]] = {}
+        self._managed = ManagedJobs(cfg)
+        self._queue = WorkQueue(cfg.queue_qps, cfg.queue_burst)
+        # job name -> work items (function, extra arguments, future) waiting in the work queue (``watch`` mode)
+        self._queued_work: dict[str, list[tuple[Callable[..., object], tuple[Any, ...], Future[bool]]]] = {}
+        self._queued_work_guard = threading.Lock()
+        self._cluster_jobs = cluster_jobs
+        self._informer: JobStore | None = None
+        self._executor = ThreadPoolExecutor(max_workers=cfg.workers, thread_name_prefix="job-worker")
+        self._log_executor = ThreadPoolExecutor(max_workers=LOG_FETCH_WORKERS, thread_name_prefix="pod-log")
+        self._job_locks: dict[str, threading.Lock] = {}
+        self._job_locks_guard = threading.Lock()
         self._log = glogger.bind(classname=self.__class__.__name__)
+        self._state: StateStore = open_state_store(cfg)
+        self._load_state()
+        self.metrics = metrics or OperatorMetrics()
+        self._governor = governor or RestartGovernor.from_config(cfg)
+        self._history = FailureHistory(cfg)
+        self._classifier = FailureClassifier.from_config(cfg)
+        self._scheduler = RestartScheduler()
+        self._takeover = threading.Event()
+        self._leader: LeaderElector | None = None
+        if cfg.leader_election:
+            self._leader = LeaderElector(
+                client.CoordinationV1Api(api_client),
+                cfg.namespace,
+                cfg.lease_name,
+                cfg.leader_identity,
+                cfg.lease_duration,
+                on_started_leading=self._takeover.set,
+            )
+        self._markers: RestartMarkers | None = None
+        if cfg.leader_election or cfg.shard_group:
+            self._markers = RestartMarkers(
+                api_client,
+                cfg.namespace,
+                f"{cfg.shard_group or cfg.lease_name}-restarts",
+                cfg.leader_identity,
+                api=self._api,
+            )
+        self._shard: ShardMembership | None = None
+        if cfg.shard_group:
+            self._shard = ShardMembership(
+                client.CoordinationV1Api(api_client),
+                cfg.namespace,
+                cfg.shard_group,
+                cfg.leader_identity,
+                cfg.lease_duration,
+                on_change=self._takeover.set,
+            )
+        self._reconciler: FlickrSyncReconciler | None = None
+        if cfg.flickrsync:
+            # Imported here: the reconciler module builds on this one.
+            from flickr_immich_k8s_sync_operator.reconciler import FlickrSyncReconciler
+
+            self._reconciler = FlickrSyncReconciler(
+                api_client,
+                cfg.namespace,
+                cfg.check_interval,
+                cfg.status_debounce,
+                api=self._api,
+                acts_on=self._acts_on,
+                job_lock=self._job_lock,
+            )
+
+    def _load_state(self) -> None:
+        """Seed the manifest cache from the records of the state store."""
+        for job_name, record in self._state.load().items():
+            if self._managed.accepts(job_name):
+                if record.manifest:
+                    self._cached_manifests[job_name] = record.manifest
+                self._cached_uids[job_name] = record.uid
+                self._manifest_keys[job_name] = record.key
 
     def run(self, shutdown_event: threading.Event) -> None:
         """Run the main operator loop until *shutdown_event* is set.
 
-        Iterates over all configured Job names each cycle, sleeping for
-        ``check_interval`` seconds between cycles.
+        Dispatches to :meth:`_run_watch` in ``watch`` mode and to
+        :meth:`_run_poll` otherwise.
 
         Args:
             shutdown_event: Threading event that, when set, causes the loop
                 to exit gracefully.
         """
         self._log.info(
-            "Operator started — watching {} job(s) in namespace '{}'",
-            len(self._cfg.job_names),
+            "Operator started — watching {} in namespace '{}' (mode: {})",
+            describe_jobs(self._cfg),
             self._cfg.namespace,
+            self._cfg.check_mode,
+        )
+        metrics_server = start_metrics_server(self.metrics, self._cfg.metrics_port) if self._cfg.metrics_port else None
+        scheduler_thread = threading.Thread(
+            target=self._scheduler.run,
+            args=(lambda job_name, uid, reason: self._on_restart_due(job_name, uid, reason, shutdown_event),),
+            name="restart-scheduler",
+            daemon=True,
         )
+        scheduler_thread.start()
+        coordinator = self._leader or self._shard
+        coordinator_thread: threading.Thread | None = None
+        if coordinator is not None:
+            coordinator_thread = threading.Thread(
+                target=coordinator.run, args=(shutdown_event,), name="coordinator", daemon=True
+            )
+            coordinator_thread.start()
+        reconciler_thread: threading.Thread | None = None
+        if self._reconciler is not None:
+            reconciler_thread = threading.Thread(
+                target=self._reconciler.run, args=(shutdown_event,), name="flickrsync-reconciler", daemon=True
+            )
+            reconciler_thread.start()
+        try:
+            if self._cfg.check_mode == "watch":
+                self._run_watch(shutdown_event, resume=coordinator is None)
+            else:
+                if coordinator is None:
+                    self._resume_restarts(shutdown_event)
+                self._run_poll(shutdown_event)
+        finally:
+            self._scheduler.stop()
+            scheduler_thread.join(timeout=5)
+            self._governor.refund(self._scheduler.clear())
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._log_executor.shutdown(wait=True, cancel_futures=True)
+            if coordinator is not None and coordinator_thread is not None:
+                coordinator_thread.join(timeout=5)
+                coordinator.release()
+            if reconciler_thread is not None:
+                reconciler_thread.join(timeout=5)
+            self._state.close()
+            if metrics_server is not None:
+                metrics_server.shutdown()
+
+    def _acts_on(self, job_name: str) -> bool:
+        """Return whether this replica may act on *job_name* (leader and owner of its shard)."""
+        if self._leader is not None and not self._leader.is_leader():
+            return False
+        return self._shard is None or self._shard.owns(job_name)
+
+    def _owned_names(self) -> list[str]:
+        """Return the managed Jobs of this replica's shard (all of them without sharding)."""
+        names = self._managed.names()
+        if self._shard is None:
+            return names
+        return [job_name for job_name in names if self._shard.owns(job_name)]
+
+    def _take_over_if_needed(self, shutdown_event: threading.Event) -> bool:
+        """Finish interrupted restarts once after this replica became responsible for more Jobs.
+
+        That is the case when it was elected leader or when its shard group
+        was rebalanced.
+
+        Returns:
+            ``True`` if the replica just took over.
+        """
+        if not self._takeover.is_set():
+            return False
+        self._takeover.clear()
+        self._log.info("Took over {}", "as leader" if self._leader is not None else "a rebalanced shard")
+        self._resume_restarts(shutdown_event)
+        return True
+
+    def _resume_restarts(self, shutdown_event: threading.Event) -> None:
+        """Finish every restart the state store or the restart markers still flag as in progress.
+
+        The markers of other replicas (see :class:`RestartMarkers`) seed the
+        manifest cache, so a restart interrupted by a replica that died is
+        finished from the manifest that replica recorded.
+
+        Args:
+            shutdown_event: Threading event checked for early exit.
+        """
+        flagged = {job_name for job_name, record in self._state.load().items() if record.restarting}
+        if self._markers is not None:
+            try:
+                markers = self._markers.load()
+            except client.ApiException as exc:
+                self._log.error("Could not load the restart markers: {}", exc)
+                markers = {}
+            for job_name, marker in markers.items():
+                if not (self._managed.accepts(job_name) and self._acts_on(job_name)):
+                    continue
+                self._cached_uids[job_name] = marker.uid
+                if marker.manifest:
+                    self._cached_manifests[job_name] = marker.manifest
+                if marker.owner:
+                    self._cronjob_owners[job_name] = marker.owner
+                flagged.add(job_name)
+        pending = sorted(
+            job_name for job_name in flagged if self._managed.accepts(job_name) and self._acts_on(job_name)
+        )
+        if pending:
+            self._log.info("Resuming {} interrupted restart(s): {}", len(pending), ", ".join(sorted(pending)))
+            wait([self._dispatch(job_name, shutdown_event, self._resume_restart) for job_name in pending])
+
+    def _run_poll(self, shutdown_event: threading.Event) -> None:
+        """Run a check cycle, then sleep ``check_interval`` seconds, until shut down.
+
+        In ``poll`` mode every configured Job is read individually; in
+        ``list`` mode one namespace-wide LIST per cycle serves all of them.
+
+        Args:
+            shutdown_event: Threading event that, when set, causes the loop
+                to exit gracefully.
+        """
         while not shutdown_event.is_set():
-            for job_name in self._cfg.job_names:
-                if shutdown_event.is_set():
-                    break
-                self._check_job(job_name, shutdown_event)
+            self._take_over_if_needed(shutdown_event)
+            started = time.perf_counter()
+            if self._cfg.check_mode == "list":
+                self._list_cycle(shutdown_event)
+            else:
+                self._poll_cycle(shutdown_event)
+            self.metrics.cycle_duration.observe(time.perf_counter() - started, self._cfg.check_mode)
             if not shutdown_event.is_set():
                 self._log.info("Sleeping for {}s", self._cfg.check_interval)
                 shutdown_event.wait(timeout=self._cfg.check_interval)
 
-    def _check_job(self, job_name: str, shutdown_event: threading.Event) -> None:
-        """Read a single Job and dispatch to the appropriate handler.
+    def _poll_cycle(self, shutdown_event: threading.Event) -> None:
+        """Check every configured Job with one ``read_namespaced_job`` each.
 
-        Caches the cleaned manifest on every successful read so that
-        ``_restart_job`` can recreate it later.
+        The reads run concurrently on the worker pool; the cycle ends when
+        the slowest Job has been handled.
+
+        Args:
+            shutdown_event: Threading event checked for early exit.
+        """
+        wait([self._dispatch(job_name, shutdown_event, self._check_job) for job_name in self._owned_names()])
+
+    def _list_cycle(self, shutdown_event: threading.Event) -> None:
+        """Check every managed Job from a single ``list_namespaced_job`` call.
+
+        Only the managed Jobs in the LIST result are serialised; Jobs missing
+        from it are reported as not found.  With ``JOB_SELECTOR`` the LIST
+        result is applied to the managed set as a delta first.  Jobs that
+        were steady at an unchanged ``resourceVersion`` are not checked again.
+
+        Args:
+            shutdown_event: Threading event checked for early exit.
+        """
+        try:
+            jobs = self._list_jobs()
+        except client.ApiException as exc:
+            self._log.error("Kubernetes API error while listing jobs: {}", exc)
+            return
+
+        for job_name in self._managed.sync(jobs):
+            self._forget_job(job_name)
+        names = self._owned_names()
+        due = [
+            job_name
+            for job_name in names
+            if job_name not in jobs or self._managed.needs_check(job_name, job_resource_version(jobs[job_name]))
+        ]
+        if len(due) < len(names):
+            self._log.debug("Skipping {} unchanged job(s)", len(names) - len(due))
+        wait(
+            [self._dispatch(job_name, shutdown_event, self._check_fetched_job, jobs.get(job_name)) for job_name in due]
+        )
+
+    def _read_job(self, job_name: str) -> client.V1Job | dict[str, Any]:
+        """Read a single Job — as a plain dict when ``raw_json`` is enabled.
+
+        Args:
+            job_name: Name of the Kubernetes Job to read.
+
+        Returns:
+            The Job as ``V1Job`` model, or as parsed JSON dict in raw mode.
+
+        Raises:
+            client.ApiException: If the API request fails (e.g. 404).
+        """
+        if self._cfg.raw_json:
+            resp = self._api(
+                "get", "jobs", self._batch_v1.read_namespaced_job, job_name, self._cfg.namespace, _preload_content=False
+            )
+            return json.loads(resp.data)  # type: ignore[no-any-return, attr-defined]
+        return self._api("get", "jobs", self._batch_v1.read_namespaced_job, job_name, self._cfg.namespace)
+
+    def _list_jobs(self) -> dict[str, client.V1Job | dict[str, Any]]:
+        """List the namespace once and return the managed Jobs by name.
+
+        With ``JOB_SELECTOR`` every listed Job is returned.
+
+        Jobs are returned as ``V1Job`` models, or as parsed JSON dicts when
+        ``raw_json`` is enabled.
+
+        Raises:
+            client.ApiException: If the LIST request fails.
+        """
+        jobs: dict[str, client.V1Job | dict[str, Any]] = {}
+        if self._cfg.raw_json:
+            resp = self._api(
+                "list",
+                "jobs",
+                self._batch_v1.list_namespaced_job,
+                self._cfg.namespace,
+                label_selector=self._cfg.list_selector,
+                _preload_content=False,
+            )
+            for raw_item in json.loads(resp.data).get("items") or []:  # type: ignore[attr-defined]
+                if self._managed.accepts(raw_item["metadata"]["name"]):
+                    jobs[raw_item["metadata"]["name"]] = raw_item
+            return jobs
+
+        job_list = self._api(
+            "list",
+            "jobs",
+            self._batch_v1.list_namespaced_job,
+            self._cfg.namespace,
+            label_selector=self._cfg.list_selector,
+        )
+        for item in job_list.items:
+            if item.metadata and item.metadata.name and self._managed.accepts(item.metadata.name):
+                jobs[item.metadata.name] = item
+        return jobs
+
+    def _api(self, verb: str, resource: str, request: Callable[..., _T], *args: Any, **kwargs: Any) -> _T:
+        """Perform a Kubernetes API request, recording its latency and failures.
+
+        Args:
+            verb: Kubernetes verb of the request (``get``, ``list``, ``create``, ``patch``, ``delete``).
+            resource: Resource the request targets (``jobs``, ``pods``, ``pods/log``).
+            request: The API client method to call.
+            *args: Positional arguments for *request*.
+            **kwargs: Keyword arguments for *request*.
+
+        Returns:
+            Whatever *request* returns.
+        """
+        started = time.perf_counter()
+        try:
+            return request(*args, **kwargs)
+        except client.ApiException as exc:
+            self.metrics.api_errors.inc(str(exc.status))
+            raise
+        finally:
+            self.metrics.api_latency.observe(time.perf_counter() - started, verb, resource)
+
+    def _run_watch(self, shutdown_event: threading.Event, resume: bool = False) -> None:
+        """Drive checks from informer events instead of a fixed timer.
+
+        Starts a :class:`JobInformer` (or a view of the shared
+        :class:`ClusterJobInformer`) in a background thread and adds a Job to
+        the :class:`WorkQueue` as soon as an event for it arrives; ``workers``
+        threads take the Jobs from there (see :meth:`_run_queue_worker`), and
+        so do scheduled and resumed restarts (see :meth:`_dispatch`).
+        Every ``check_interval`` seconds all configured Jobs are re-checked
+        from the store (no API reads) as a safety net against missed events;
+        Jobs that were steady at their stored ``resourceVersion`` are left out.
+
+        Args:
+            shutdown_event: Threading event that, when set, causes the loop
+                to exit gracefully.
+            resume: Whether to resume interrupted restarts once the workers run.
+        """
+        informer: JobStore
+        if self._cluster_jobs is not None:
+            informer = self._cluster_jobs.view(self._cfg.namespace, self._on_job_event)
+        else:
+            informer = JobInformer(
+                self._batch_v1,
+                self._cfg.namespace,
+                on_event=self._on_job_event,
+                label_selector=self._cfg.list_selector,
+            )
+        self._informer = informer
+        informer_thread = threading.Thread(
+            target=informer.run, args=(shutdown_event,), name="job-informer", daemon=True
+        )
+        informer_thread.start()
+        worker_threads = [
+            threading.Thread(
+                target=self._run_queue_worker, args=(shutdown_event,), name=f"queue-worker-{index}", daemon=True
+            )
+            for index in range(self._cfg.workers)
+        ]
+        for worker_thread in worker_threads:
+            worker_thread.start()
+        if resume:
+            self._resume_restarts(shutdown_event)
+
+        while not shutdown_event.is_set() and not informer.wait_for_sync(timeout=1.0):
+            pass
+
+        next_resync = time.monotonic()
+        while not shutdown_event.is_set():
+            if self._take_over_if_needed(shutdown_event):
+                next_resync = time.monotonic()
+            now = time.monotonic()
+            if now >= next_resync:
+                self._log.debug("Resyncing {} job(s) from informer store", len(self._managed))
+                for job_name in self._owned_names():
+                    stored = informer.get(job_name)
+                    if stored is None or self._managed.needs_check(job_name, job_resource_version(stored)):
+                        self._queue.add(job_name)
+                next_resync = now + self._cfg.check_interval
+            shutdown_event.wait(timeout=min(1.0, max(0.0, next_resync - now)))
+
+        self._queue.shut_down()
+        for worker_thread in worker_threads:
+            worker_thread.join(timeout=5)
+        informer.stop()
+        informer_thread.join(timeout=5)
+
+    def _run_queue_worker(self, shutdown_event: threading.Event) -> None:
+        """Handle the Jobs handed out by the work queue until shut down.
+
+        Args:
+            shutdown_event: Threading event that, when set, causes the loop
+                to exit gracefully.
+        """
+        while not shutdown_event.is_set():
+            job_name = self._queue.get(timeout=1.0)
+            if job_name is None:
+                continue
+            try:
+                self._handle_queued_job(job_name, shutdown_event)
+            finally:
+                self._queue.done(job_name)
+        self._drop_queued_work()
+
+    def _handle_queued_job(self, job_name: str, shutdown_event: threading.Event) -> None:
+        """Run the work items queued for *job_name* and check it, holding its per-Job lock.
+
+        If the lock is held elsewhere the Job is queued again after
+        :data:`QUEUE_BUSY_RETRY` seconds, so neither the event nor the work
+        items are lost.
+
+        Args:
+            job_name: Name of the Job handed out by the work queue.
+            shutdown_event: Threading event checked for early exit.
+        """
+        with self._queued_work_guard:
+            work = self._queued_work.pop(job_name, [])
+        if self._run_serialized(job_name, shutdown_event, self._run_queued_work, work):
+            return
+        with self._queued_work_guard:
+            self._queued_work[job_name] = work + self._queued_work.get(job_name, [])
+        if shutdown_event.is_set():
+            self._drop_queued_work()
+            return
+        self._log.debug("{} is busy — queueing it again in {:.0f}s", job_name, QUEUE_BUSY_RETRY)
+        self._queue.add_after(job_name, QUEUE_BUSY_RETRY)
+
+    def _run_queued_work(
+        self,
+        job_name: str,
+        work: list[tuple[Callable[..., object], tuple[Any, ...], Future[bool]]],
+        shutdown_event: threading.Event,
+    ) -> None:
+        """Run the work items of *job_name* (under its lock), then check it from the store."""
+        for fn, args, future in work:
+            try:
+                fn(job_name, *args, shutdown_event)
+            except Exception as exc:
+                future.set_exception(exc)
+            else:
+                future.set_result(True)
+        self._check_queued_job(job_name, shutdown_event)
+
+    def _drop_queued_work(self) -> None:
+        """Resolve the futures of all queued work items as skipped (on shutdown)."""
+        with self._queued_work_guard:
+            work = [item for items in self._queued_work.values() for item in items]
+            self._queued_work.clear()
+        for _, _, future in work:
+            future.set_result(False)
+
+    def _check_queued_job(self, job_name: str, shutdown_event: threading.Event) -> None:
+        """Work-queue worker function — check a Job from the store and retry it with back-off on errors.
+
+        Args:
+            job_name: Name of the Kubernetes Job to inspect.
+            shutdown_event: Threading event checked for early exit.
+        """
+        if self._check_job_from_store(job_name, shutdown_event):
+            self._queue.forget(job_name)
+        elif not shutdown_event.is_set():
+            delay = self._queue.add_rate_limited(job_name)
+            self._log.info(
+                "\tRetrying {} in {:.0f}s (attempt {}).", job_name, delay, self._queue.num_requeues(job_name)
+            )
+
+    def _on_job_event(self, event_type: str, job_name: str) -> None:
+        """Informer callback — queue a managed Job for checking.
+
+        With ``JOB_SELECTOR`` the event also updates the managed set: the
+        informer only sees matching Jobs, so every ``ADDED``/``MODIFIED`` Job
+        is managed and a ``DELETED`` one is dropped (see :meth:`_forget_job`).
+
+        Args:
+            event_type: Watch event type (``ADDED``, ``MODIFIED``, ``DELETED``).
+            job_name: Name of the Job the event refers to.
+        """
+        if event_type == "DELETED":
+            if self._managed.discard(job_name):
+                self._forget_job(job_name)
+        else:
+            self._managed.add(job_name)
+        if job_name in self._managed and (self._shard is None or self._shard.owns(job_name)):
+            self._log.debug("{} event for {}", event_type, job_name)
+            self._queue.add(job_name)
+
+    def _dispatch(
+        self,
+        job_name: str,
+        shutdown_event: threading.Event,
+        fn: Callable[..., object],
+        *args: Any,
+    ) -> Future[bool]:
+        """Submit ``fn(job_name, *args, shutdown_event)`` to the worker pool.
+
+        In ``watch`` mode the work item is queued for *job_name* in the
+        :class:`WorkQueue` instead, so the queue workers are the only threads
+        acting on Jobs.
+
+        Args:
+            job_name: Name of the Job the work item belongs to.
+            shutdown_event: Threading event checked before the work starts.
+            fn: One of the ``_check_job*`` methods.
+            *args: Extra positional arguments placed between *job_name* and
+                *shutdown_event*.
+
+        Returns:
+            The future of the submitted work item.
+        """
+        if self._cfg.check_mode != "watch":
+            return self._executor.submit(self._run_serialized, job_name, shutdown_event, fn, *args)
+        future: Future[bool] = Future()
+        with self._queued_work_guard:
+            self._queued_work.setdefault(job_name, []).append((fn, args, future))
+        self._queue.add(job_name)
+        if shutdown_event.is_set():
+            self._drop_queued_work()
+        return future
+
+    def _run_serialized(
+        self,
+        job_name: str,
+        shutdown_event: threading.Event,
+        fn: Callable[..., object],
+        *args: Any,
+    ) -> bool:
+        """Run a work item while holding the per-Job lock of *job_name*.
+
+        If another worker is already handling the same Job (e.g. waiting for
+        a restart to finish) the item is skipped instead of queued behind it.
+
+        Returns:
+            ``True`` if the work item ran, ``False`` if it was skipped.
+        """
+        if shutdown_event.is_set():
+            return False
+        lock = self._job_lock(job_name)
+        if not lock.acquire(blocking=False):
+            self._log.debug("{} is already being handled by another worker — skipping", job_name)
+            return False
+        if self._job_locks.get(job_name) is not lock:
+            # Forgotten between lookup and acquire; a fresh lock may already be held elsewhere.
+            lock.release()
+            return False
+        try:
+            fn(job_name, *args, shutdown_event)
+        finally:
+            lock.release()
+        return True
+
+    def _job_lock(self, job_name: str) -> threading.Lock:
+        """Return the lock held while a worker (or the FlickrSync reconciler) handles *job_name*."""
+        with self._job_locks_guard:
+            return self._job_locks.setdefault(job_name, threading.Lock())
+
+    def _forget_job(self, job_name: str) -> None:
+        """Drop the lock and cached state of a Job that left the managed set.
+
+        Nothing is dropped while the Job's lock is held: a worker is then
+        restarting it (the deletion is its own) and still needs the state.
+        A Job that comes back is cached again by its next check; restarts
+        interrupted meanwhile are resumed from the state store.
+        """
+        with self._job_locks_guard:
+            lock = self._job_locks.get(job_name)
+            if lock is not None and not lock.acquire(blocking=False):
+                return
+            self._job_locks.pop(job_name, None)
+        try:
+            for cache in (
+                self._cached_manifests,
+                self._cached_uids,
+                self._manifest_keys,
+                self._cronjob_owners,
+                self._restart_policies,
+                self._pod_diagnostics,
+            ):
+                cache.pop(job_name, None)
+        finally:
+            if lock is not None:
+                lock.release()
+
+    def _check_job_from_store(self, job_name: str, shutdown_event: threading.Event) -> bool:
+        """Check a single Job using the informer store instead of an API read.
 
         Args:
             job_name: Name of the Kubernetes Job to inspect.
             shutdown_event: Threading event checked for early exit.
+
+        Returns:
+            ``False`` if the check failed with an error, ``True`` otherwise.
+        """
+        assert self._informer is not None
+        return self._check_fetched_job(job_name, self._informer.get(job_name), shutdown_event)
+
+    def _check_fetched_job(
+        self,
+        job_name: str,
+        job: client.V1Job | dict[str, Any] | None,
+        shutdown_event: threading.Event,
+    ) -> bool:
+        """Check a single Job that was already fetched by a LIST or the informer.
+
+        Args:
+            job_name: Name of the Kubernetes Job to inspect.
+            job: The Job as model or plain dict, or ``None`` if it does not exist.
+            shutdown_event: Threading event checked for early exit.
+
+        Returns:
+            ``False`` if the check failed with an error, ``True`` otherwise.
         """
         self._log.opt(raw=True).info("\n")
         self._log.info("Checking {}", job_name)
+        if job is None:
+            self._log.info("\t{} not found. Nothing to do.", job_name)
+            return True
         try:
-            job = self._batch_v1.read_namespaced_job(job_name, self._cfg.namespace)
-            self._cached_manifests[job_name] = build_manifest(self._api_client.sanitize_for_serialization(job))
+            self._evaluate_job(job_name, job, shutdown_event)
+        except client.ApiException as exc:
+            self._log.error("\tKubernetes API error for {}: {}", job_name, exc)
+            return False
+        except Exception:
+            self._log.exception("\tUnexpected error for {}", job_name)
+            return False
+        return True
 
-            conditions = job.status.conditions or []
-            failed = any(c.type == "Failed" and c.status == "True" for c in conditions)
+    def _check_job(self, job_name: str, shutdown_event: threading.Event) -> bool:
+        """Read a single Job and dispatch to the appropriate handler.
 
-            if job.status.active:
-                self._log.info("\t{} is running.", job_name)
-            elif failed:
-                fail_condition = next(c for c in conditions if c.type == "Failed" and c.status == "True")
-                self._handle_failed_job(job_name, fail_condition.last_transition_time, shutdown_event)
-            else:
-                self._log.info("\t{} succeeded or still pending. No action needed.", job_name)
+        Caches the cleaned manifest whenever the Job changed so that
+        ``_restart_job`` can recreate it later.
+
+        Args:
+            job_name: Name of the Kubernetes Job to inspect.
+            shutdown_event: Threading event checked for early exit.
+
+        Returns:
+            ``False`` if the check failed with an error, ``True`` otherwise
+            (also when the Job does not exist).
+        """
+        self._log.opt(raw=True).info("\n")
+        self._log.info("Checking {}", job_name)
+        try:
+            self._evaluate_job(job_name, self._read_job(job_name), shutdown_event)
         except client.ApiException as exc:
-            if exc.status == 404:
-                self._log.info("\t{} not found. Nothing to do.", job_name)
-            else:
+            if exc.status != 404:
                 self._log.error("\tKubernetes API error for {}: {}", job_name, exc)
+                return False
+            self._log.info("\t{} not found. Nothing to do.", job_name)
         except Exception:
             self._log.exception("\tUnexpected error for {}", job_name)
+            return False
+        return True
+
+    def _evaluate_job(
+        self,
+        job_name: str,
+        job: client.V1Job | dict[str, Any],
+        shutdown_event: threading.Event,
+    ) -> None:
+        """Cache the manifest of a fetched Job and act on its status.
+
+        The manifest is only rebuilt when the Job's :func:`manifest_key`
+        changed; otherwise just the (small) status section is serialised.
+        With a template source no manifest is built at all.
+
+        Args:
+            job_name: Name of the Kubernetes Job.
+            job: The Job as ``V1Job`` model or plain (camelCase) dict.
+            shutdown_event: Threading event checked for early exit.
+        """
+        if isinstance(job, dict):
+            meta = job["metadata"]
+            key = manifest_key(meta.get("uid"), meta.get("generation"), meta.get("resourceVersion"))
+            if self._manifest_keys.get(job_name) != key:
+                self._store_manifest(job_name, key, meta.get("uid") or "", job)
+            status = job.get("status") or {}
+        else:
+            assert job.metadata is not None
+            key = manifest_key(job.metadata.uid, job.metadata.generation, job.metadata.resource_version)
+            if self._manifest_keys.get(job_name) == key:
+                status = self._api_client.sanitize_for_serialization(job.status) or {}
+            elif self._templates is not None:
+                self._store_manifest(job_name, key, job.metadata.uid or "", job)
+                status = self._api_client.sanitize_for_serialization(job.status) or {}
+            else:
+                job_dict = self._api_client.sanitize_for_serialization(job)
+                self._store_manifest(job_name, key, job.metadata.uid or "", job_dict)
+                status = job_dict.get("status") or {}
+
+        failure_time = failed_since(status)
+        if failure_time is None:
+            self._managed.mark_steady(job_name, job_resource_version(job))
+        else:
+            self._managed.mark_unsteady(job_name)
+        if succeeded(status):
+            self._history.reset(job_name)
+        if not self._acts_on(job_name):
+            self._log.debug("\tNot acting on {} (standby replica or another shard)", job_name)
+            return
+
+        if status.get("active"):
+            self._log.info("\t{} is running.", job_name)
+        elif failure_time is not None:
+            self._handle_failed_job(job_name, failure_time, shutdown_event, started_at(status))
+        else:
+            self._log.info("\t{} succeeded or still pending. No action needed.", job_name)
+
+    def _store_manifest(self, job_name: str, key: str, uid: str, job: client.V1Job | dict[str, Any]) -> None:
+        """Build and cache the manifest of *job* under *key*, writing it through to the state store.
+
+        With a template source only the instance (UID, key and owner
+        CronJob) is remembered; *job* may then also be a ``V1Job`` model.
+        The restart policy annotated on the Job is remembered as well.
+        """
+        policy = restart_policy(job)
+        if policy != (None, None):
+            self._restart_policies[job_name] = policy
+        else:
+            self._restart_policies.pop(job_name, None)
+        if self._templates is not None:
+            owner = cronjob_owner_reference(job)
+            if owner is not None:
+                self._cronjob_owners[job_name] = owner
+            else:
+                self._cronjob_owners.pop(job_name, None)
+            manifest: dict[str, Any] = {}
+        else:
+            assert isinstance(job, dict)
+            manifest = build_manifest(job)
+            self._cached_manifests[job_name] = manifest
+        self._state.put(job_name, JobRecord(manifest, uid, key))
+        self._cached_uids[job_name] = uid
+        self._manifest_keys[job_name] = key
+
+    def _mark_restarting(self, job_name: str, restarting: bool) -> None:
+        """Persist whether *job_name* is between deletion and recreation, locally and in the restart markers."""
+        manifest = self._cached_manifests.get(job_name, {})
+        uid = self._cached_uids.get(job_name, "")
+        self._state.put(job_name, JobRecord(manifest, uid, self._manifest_keys.get(job_name, ""), restarting))
+        if self._markers is None:
+            return
+        if restarting:
+            self._markers.mark(job_name, uid, manifest, self._cronjob_owners.get(job_name))
+        else:
+            self._markers.clear(job_name)
 
     def _handle_failed_job(
         self,
         job_name: str,
         failure_time: datetime,
         shutdown_event: threading.Event,
+        start_time: datetime | None = None,
     ) -> None:
         """Log pod details and restart the Job if the restart delay has elapsed.
 
-        When ``skip_delay_on_oom`` is enabled and the failure reason includes
-        ``OOMKilled``, the Job is restarted immediately regardless of the
-        configured delay.
+        The :class:`FailureClassifier` picks the rule of the failure: it may
+        hold the Job (no restart), restart it immediately (``OOMKilled`` with
+        ``skip_delay_on_oom``) or set its delay.  Without a rule delay the
+        delay annotated on the Job (see :func:`restart_policy`) applies, or
+        else the Job's :class:`FailureHistory` yields it (the fixed ``restart_delay``
+        unless ``adaptive_backoff`` is enabled).  Failures caused by rate
+        limiting stretch the delay by the governor's back-off factor, and the
+        governor may postpone the restart further to stay within the restart
+        budget.
 
         Args:
             job_name: Name of the failed Kubernetes Job.
             failure_time: UTC timestamp of the last failure transition.
             shutdown_event: Threading event checked for early exit.
+            start_time: The Job's ``startTime``, if known.
         """
+        uid = self._cached_uids.get(job_name, "")
+        remaining = self._scheduler.deadline(job_name, uid)
+        if remaining is not None:
+            self._log.info("\t{} failed. Restart scheduled in {:.0f}s.", job_name, remaining)
+            return
+
         elapsed = (datetime.now(timezone.utc) - failure_time).total_seconds()
 
         reasons = self._get_pod_failure_reasons(job_name)
-        skip_delay = self._cfg.skip_delay_on_oom and "OOMKilled" in reasons
+        rule = self._classifier.match(reasons)
+        immediate = rule is not None and rule.action == IMMEDIATE
+        run_duration = (failure_time - start_time).total_seconds() if start_time is not None else None
+        annotated_delay = self._restart_policies.get(job_name, (None, None))[0]
+        first_seen = self._history.record(job_name, Failure(uid, failure_time, restart_reason(reasons), run_duration))
+        if rule is not None and rule.action == HOLD:
+            (self._log.warning if first_seen else self._log.info)(
+                "\t{} failed with {} — not restarting it automatically ({} failures are held).",
+                job_name,
+                rule.reason,
+                rule.name,
+            )
+            return
+        if rule is not None and rule.delay is not None:
+            restart_delay = float(rule.delay)
+            self._log.info("\t{} failed with {} — restart delay {}s.", job_name, rule.reason, rule.delay)
+        elif annotated_delay is not None:
+            restart_delay = float(annotated_delay)
+        else:
+            restart_delay = self._history.restart_delay(job_name)
+            if self._cfg.adaptive_backoff:
+                self._log.info(
+                    "\t{} failed fast {} time(s) in a row — adaptive restart delay {:.0f}s.",
+                    job_name,
+                    self._history.fast_failure_streak(job_name),
+                    restart_delay,
+                )
+        factor = self._governor.backoff_factor(RATE_LIMITED in reasons, uid)
+        if factor > 1:
+            restart_delay *= factor
+            self._log.info("\t{} was rate-limited again — restart delay raised to {:.0f}s.", job_name, restart_delay)
+        delay = self._governor.admit(0 if immediate else restart_delay - elapsed)
 
-        if skip_delay:
+        if delay <= 0 and rule is not None and immediate:
             self._log.info(
-                "\t{} failed with OOMKilled — skipping restart delay, restarting immediately.",
+                "\t{} failed with {} — skipping restart delay, restarting immediately.",
                 job_name,
+                rule.reason,
             )
+            self.metrics.restarts.inc(restart_reason(reasons))
             self._restart_job(job_name, shutdown_event)
-        elif elapsed >= self._cfg.restart_delay:
+        elif delay <= 0:
             self._log.info(
-                "\t{} failed {:.0f}s ago (>= {}s). Deleting and recreating...",
+                "\t{} failed {:.0f}s ago (>= {:.0f}s). Deleting and recreating...",
                 job_name,
                 elapsed,
-                self._cfg.restart_delay,
+                restart_delay,
             )
+            self.metrics.restarts.inc(restart_reason(reasons))
             self._restart_job(job_name, shutdown_event)
         else:
-            remaining = self._cfg.restart_delay - elapsed
             self._log.info(
-                "\t{} failed {:.0f}s ago. Waiting {:.0f}s more before restart.",
+                "\t{} failed {:.0f}s ago. Restart scheduled in {:.0f}s.",
                 job_name,
                 elapsed,
-                remaining,
+                delay,
             )
+            if self._scheduler.schedule(job_name, uid, restart_reason(reasons), delay):
+                self._governor.refund()  # the restart of the previous instance will not happen
+
+    def _on_restart_due(self, job_name: str, uid: str, reason: str, shutdown_event: threading.Event) -> None:
+        """Scheduler callback — hand a due restart to the worker pool.
+
+        If the Job is busy at that moment the restart is rescheduled
+        :data:`SCHEDULED_RESTART_RETRY` seconds later; if it is skipped on
+        shutdown its restart budget slot is refunded.
+        """
+
+        def _reschedule_if_skipped(future: Future[bool]) -> None:
+            if future.cancelled() or (future.result() is False and shutdown_event.is_set()):
+                self._governor.refund()
+            elif future.result() is False:
+                self._scheduler.schedule(job_name, uid, reason, SCHEDULED_RESTART_RETRY)
+
+        future = self._dispatch(job_name, shutdown_event, self._run_scheduled_restart, uid, reason)
+        future.add_done_callback(_reschedule_if_skipped)
+
+    def _run_scheduled_restart(self, job_name: str, uid: str, reason: str, shutdown_event: threading.Event) -> None:
+        """Restart *job_name* once its restart deadline has been reached.
+
+        The restart is dropped, and its restart budget slot refunded, if the
+        failed instance *uid* no longer exists (the Job was deleted or
+        recreated in the meantime) or another replica took over the Job.
+
+        Args:
+            job_name: Name of the failed Kubernetes Job.
+            uid: UID of the failed instance the restart was scheduled for.
+            reason: Termination reason recorded in the restart metrics.
+            shutdown_event: Threading event checked for early exit.
+        """
+        try:
+            if not self._acts_on(job_name):
+                self._log.info("{}: no longer responsible — leaving the scheduled restart to the new owner.", job_name)
+                self._governor.refund()
+                return
+            if not self._job_exists(job_name, uid):
+                self._log.info("{} changed since its restart was scheduled — dropping it.", job_name)
+                self._governor.refund()
+                return
+            self._log.info("{}: restart delay reached. Deleting and recreating...", job_name)
+            self.metrics.restarts.inc(reason)
+            self._restart_job(job_name, shutdown_event)
+        except client.ApiException as exc:
+            self._log.error("\tKubernetes API error while restarting {}: {}", job_name, exc)
+        except Exception:
+            self._log.exception("\tUnexpected error while restarting {}", job_name)
 
     def _get_pod_failure_reasons(self, job_name: str) -> set[str]:
         """Collect termination reasons from all Pods belonging to a Job.
 
         For each Pod, logs the exit code, termination reason, and the last
-        two lines of container output.
+        two lines of container output.  Only the newest
+        ``max_inspected_pods`` Pods are inspected; their log tails are
+        fetched concurrently, each bounded by ``pod_log_timeout`` seconds.
+        The diagnostics of terminated Pods
+        are memoised per Job UID and Pod UID, so each Pod's log is fetched
+        only once per failure; the memo is dropped when the Job is recreated.
 
         Args:
             job_name: Name of the Kubernetes Job whose Pods are inspected.
 
         Returns:
-            A set of termination reason strings (e.g. ``{"OOMKilled", "Error"}``).
+            A set of termination reason strings (e.g. ``{"OOMKilled", "Error"}``),
+            plus the reason labels of the :class:`FailureClassifier` classes
+            matching any Pod's reason or log tail (e.g. ``"RateLimited"``).
         """
         reasons: set[str] = set()
+        current_uid = self._cached_uids.get(job_name, "")
+        cached = self._pod_diagnostics.get(job_name)
+        if cached is None or cached[0] != current_uid:
+            cached = self._pod_diagnostics[job_name] = (current_uid, {})
+        diagnostics = cached[1]
         try:
-            pods = self._core_v1.list_namespaced_pod(
-                self._cfg.namespace,
-                label_selector=f"job-name={job_name}",
-            )
-            for pod in pods.items:
-                pod_name: str = pod.metadata.name
-                exit_code = None
-                reason = None
-                for cs in pod.status.container_statuses or []:
-                    if cs.state and cs.state.terminated:
-                        exit_code = cs.state.terminated.exit_code
-                        reason = cs.state.terminated.reason
-                        if reason:
-                            reasons.add(reason)
-                try:
-                    tail = self._core_v1.read_namespaced_pod_log(
-                        pod_name,
-                        self._cfg.namespace,
-                        tail_lines=2,
-                    )
-                except Exception:
-                    tail = "<logs unavailable>"
+            states = self._list_pod_states(job_name)
+            missing = [pod_name for pod_uid, pod_name, _, _ in states if pod_uid not in diagnostics]
+            fetched = dict(zip(missing, self._log_executor.map(self._read_log_tail, missing)))
+            for pod_uid, pod_name, exit_code, reason in states:
+                if reason:
+                    reasons.add(reason)
+                if pod_uid in diagnostics:
+                    exit_code, reason, tail = diagnostics[pod_uid]
+                else:
+                    tail = fetched[pod_name]
+                    if exit_code is not None and tail != LOGS_UNAVAILABLE:
+                        diagnostics[pod_uid] = (exit_code, reason, tail)
+                reasons |= self._classifier.classify(reason, tail)
                 indented_tail = textwrap.indent(tail.strip(), "\t")
                 self._log.info(
                     "\t{}: exit_code={}, reason={}, last log lines:\n{}",
@@ -241,28 +1239,271 @@ class JobRestartOperator:
             self._log.warning("\tCould not retrieve pod details for {}", job_name)
         return reasons
 
+    def _read_log_tail(self, pod_name: str) -> str:
+        """Return the last two log lines of *pod_name*, or :data:`LOGS_UNAVAILABLE` on error."""
+        started = time.perf_counter()
+        try:
+            return self._api(
+                "get",
+                "pods/log",
+                self._core_v1.read_namespaced_pod_log,
+                pod_name,
+                self._cfg.namespace,
+                tail_lines=2,
+                _request_timeout=self._cfg.pod_log_timeout,
+            )
+        except Exception:
+            return LOGS_UNAVAILABLE
+        finally:
+            self.metrics.log_fetch_duration.observe(time.perf_counter() - started)
+
+    def _list_pod_states(self, job_name: str) -> list[tuple[str, str, int | None, str | None]]:
+        """List a Job's Pods and extract the termination state of each.
+
+        In ``raw_json`` mode the Pod list is parsed as plain JSON and scanned
+        with :func:`terminated_state` instead of building ``V1Pod`` models.
+
+        Args:
+            job_name: Name of the Kubernetes Job whose Pods are listed.
+
+        Returns:
+            ``(pod_uid, pod_name, exit_code, reason)`` for the newest
+            ``max_inspected_pods`` Pods of the Job, newest first.
+        """
+        # (creationTimestamp, state) — timestamps compare correctly as ISO strings.
+        pods: list[tuple[str, tuple[str, str, int | None, str | None]]] = []
+        if self._cfg.raw_json:
+            resp = self._api(
+                "list",
+                "pods",
+                self._core_v1.list_namespaced_pod,
+                self._cfg.namespace,
+                label_selector=f"job-name={job_name}",
+                _preload_content=False,
+            )
+            for raw_pod in json.loads(resp.data).get("items") or []:  # type: ignore[attr-defined]
+                meta = raw_pod["metadata"]
+                state = (meta.get("uid") or meta["name"], meta["name"], *terminated_state(raw_pod))
+                pods.append((meta.get("creationTimestamp") or "", state))
+        else:
+            pod_list = self._api(
+                "list",
+                "pods",
+                self._core_v1.list_namespaced_pod,
+                self._cfg.namespace,
+                label_selector=f"job-name={job_name}",
+            )
+            for pod in pod_list.items:
+                exit_code = None
+                reason = None
+                for cs in (pod.status and pod.status.container_statuses) or []:
+                    if cs.state and cs.state.terminated:
+                        exit_code = cs.state.terminated.exit_code
+                        reason = cs.state.terminated.reason
+                pod_name = (pod.metadata and pod.metadata.name) or ""
+                created = pod.metadata.creation_timestamp if pod.metadata else None
+                pods.append(
+                    (
+                        created.isoformat() if created else "",
+                        ((pod.metadata and pod.metadata.uid) or pod_name, pod_name, exit_code, reason),
+                    )
+                )
+
+        pods.sort(key=lambda item: item[0], reverse=True)
+        if len(pods) > self._cfg.max_inspected_pods:
+            self._log.debug(
+                "\tInspecting the newest {} of {} pods of {}", self._cfg.max_inspected_pods, len(pods), job_name
+            )
+        return [state for _, state in pods[: self._cfg.max_inspected_pods]]
+
     def _restart_job(self, job_name: str, shutdown_event: threading.Event) -> None:
         """Delete and recreate a Job from the cached manifest.
 
-        Deletes the Job with foreground propagation policy, waits 15 seconds
-        for Kubernetes to clean up resources, then creates a new Job from the
-        previously cached manifest.
+        ``recreate`` deletes the Job in the foreground and creates it again
+        once its UID is gone; ``apply`` deletes only the Job object and
+        re-applies the manifest server-side.
 
         Args:
             job_name: Name of the Kubernetes Job to restart.
             shutdown_event: Threading event; if set during the cleanup wait
                 the recreation is skipped for a clean shutdown.
         """
-        self._batch_v1.delete_namespaced_job(
+        if self._manifest(job_name) is None:
+            self._log.error("\tNo template for {} — not restarting it.", job_name)
+            return
+        old_uid = self._cached_uids.get(job_name, "")
+        apply = self._restart_strategy(job_name) == "apply"
+        self._mark_restarting(job_name, True)
+        started = time.monotonic()
+        status = self._api(
+            "delete",
+            "jobs",
+            self._batch_v1.delete_namespaced_job,
             job_name,
             self._cfg.namespace,
-            body=client.V1DeleteOptions(propagation_policy="Foreground"),
+            body=client.V1DeleteOptions(propagation_policy="Background" if apply else "Foreground"),
         )
-        # Wait for Kubernetes to clean up resources (interruptible).
-        if shutdown_event.wait(timeout=15):
+        gone = apply and deleted_immediately(status)
+        if not gone:
+            gone = self._wait_for_deletion(job_name, old_uid, shutdown_event)
+            if not gone and shutdown_event.is_set():
+                return
+        if not gone:
+            self._log.warning(
+                "\t{} still present after {}s — trying to recreate anyway.",
+                job_name,
+                self._cfg.delete_timeout,
+            )
+        else:
+            self._log.debug("\t{} deleted after {:.1f}s", job_name, time.monotonic() - started)
+        if gone and apply:
+            self._apply_job(job_name)
+        elif not self._create_job(job_name, shutdown_event):
             return
-        self._batch_v1.create_namespaced_job(
+        self.metrics.restart_duration.observe(time.monotonic() - started)
+        self._pod_diagnostics.pop(job_name, None)
+
+    def _restart_strategy(self, job_name: str) -> str:
+        """Return the restart strategy of *job_name*: annotated on the Job, or from the configuration."""
+        return self._restart_policies.get(job_name, (None, None))[1] or self._cfg.restart_strategy_for(job_name)
+
+    def _resume_restart(self, job_name: str, shutdown_event: threading.Event) -> None:
+        """Finish a restart that an earlier operator instance left unfinished.
+
+        Recreates the Job if it is gone, restarts it again if the old
+        instance was never deleted, and just clears the flag if the Job has
+        already been recreated.
+
+        Args:
+            job_name: Name of the Kubernetes Job flagged as restarting.
+            shutdown_event: Threading event checked for early exit.
+        """
+        try:
+            try:
+                job: client.V1Job | dict[str, Any] | None = self._read_job(job_name)
+            except client.ApiException as exc:
+                if exc.status != 404:
+                    raise
+                job = None
+            if job is None:
+                self._log.info("{} is gone — recreating it from the stored manifest.", job_name)
+                self._create_job(job_name, shutdown_event)
+            elif job_uid(job) == self._cached_uids.get(job_name, ""):
+                self._log.info("{} was never deleted — restarting it.", job_name)
+                self._restart_job(job_name, shutdown_event)
+            else:
+                self._log.info("{} has already been recreated.", job_name)
+                self._mark_restarting(job_name, False)
+        except client.ApiException as exc:
+            self._log.error("Kubernetes API error while resuming restart of {}: {}", job_name, exc)
+        except Exception:
+            self._log.exception("Unexpected error while resuming restart of {}", job_name)
+
+    def _job_exists(self, job_name: str, uid: str) -> bool:
+        """Return whether the Job *job_name* with UID *uid* still exists.
+
+        Uses the informer store in ``watch`` mode and a single read otherwise.
+        A Job with the same name but a different UID counts as gone.
+        """
+        if self._informer is not None:
+            job_dict = self._informer.get(job_name)
+            return job_dict is not None and job_dict["metadata"].get("uid", "") == uid
+        try:
+            job = self._read_job(job_name)
+        except client.ApiException as exc:
+            if exc.status == 404:
+                return False
+            raise
+        return job_uid(job) == uid
+
+    def _wait_for_deletion(self, job_name: str, uid: str, shutdown_event: threading.Event) -> bool:
+        """Wait with exponential back-off until the deleted Job has disappeared.
+
+        Args:
+            job_name: Name of the deleted Job.
+            uid: UID of the deleted Job instance.
+            shutdown_event: Threading event that aborts the wait when set.
+
+        Returns:
+            ``True`` once the Job is gone, ``False`` on shutdown or after
+            ``delete_timeout`` seconds.
+        """
+        deadline = time.monotonic() + self._cfg.delete_timeout
+        delay = DELETION_POLL_INITIAL
+        while self._job_exists(job_name, uid):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            if shutdown_event.wait(timeout=min(delay, remaining)):
+                return False
+            delay = min(delay * 2, DELETION_POLL_MAX)
+        return True
+
+    def _manifest(self, job_name: str) -> dict[str, Any] | None:
+        """Return the manifest recreating *job_name*: from the template source or the manifest cache."""
+        if self._templates is not None:
+            return self._templates.manifest(job_name, self._cronjob_owners.get(job_name))
+        return self._cached_manifests.get(job_name)
+
+    def _apply_job(self, job_name: str) -> None:
+        """Create the Job from its cached manifest through server-side apply.
+
+        The apply runs under the stable :data:`FIELD_MANAGER` with ``force``,
+        so repeating it (e.g. when resuming an interrupted restart) is safe.
+        Only called once the old Job is gone: applied to a Job that is still
+        terminating, the manifest would be lost along with it.
+        """
+        self._api(
+            "patch",
+            "jobs",
+            self._batch_v1.patch_namespaced_job,
+            job_name,
             self._cfg.namespace,
-            self._cached_manifests[job_name],
+            self._manifest(job_name),
+            field_manager=FIELD_MANAGER,
+            force=True,
+            _content_type=APPLY_PATCH_CONTENT_TYPE,
         )
-        self._log.info("\t{} restarted successfully.", job_name)
+        self._log.info("\t{} restarted successfully (server-side apply).", job_name)
+        self._mark_restarting(job_name, False)
+
+    def _create_job(self, job_name: str, shutdown_event: threading.Event) -> bool:
+        """Create the Job from its cached manifest, retrying on ``409 AlreadyExists``.
+
+        Retries up to :data:`CREATE_RETRIES` times with jittered exponential
+        back-off so a Job whose garbage collection outlasts the deletion
+        wait is still recreated.
+
+        Args:
+            job_name: Name of the Kubernetes Job to create.
+            shutdown_event: Threading event that aborts the retries when set.
+
+        Returns:
+            ``True`` once the Job has been created, ``False`` on shutdown or
+            when there is no manifest for it.
+        """
+        manifest = self._manifest(job_name)
+        if manifest is None:
+            self._log.error("\tNo template for {} — cannot recreate it.", job_name)
+            return False
+        for attempt in range(CREATE_RETRIES):
+            try:
+                self._api(
+                    "create",
+                    "jobs",
+                    self._batch_v1.create_namespaced_job,
+                    self._cfg.namespace,
+                    manifest,
+                )
+                self._log.info("\t{} restarted successfully.", job_name)
+                self._mark_restarting(job_name, False)
+                return True
+            except client.ApiException as exc:
+                if exc.status != 409 or attempt == CREATE_RETRIES - 1:
+                    raise
+            backoff = CREATE_RETRY_BASE * 2**attempt
+            delay = backoff / 2 + random.uniform(0, backoff / 2)
+            self._log.info("\t{} still exists (409) — retrying create in {:.1f}s", job_name, delay)
+            if shutdown_event.wait(timeout=delay):
+                return False
+        return False
@@ -0,0 +1,371 @@
+"""FlickrSync reconciler — creates the Job of every ``FlickrSync`` resource and reports its status."""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from typing import Any, Callable
+
+from kubernetes import client
+from loguru import logger as glogger
+
+from flickr_immich_k8s_sync_operator.config import FLICKRSYNC_LABEL
+from flickr_immich_k8s_sync_operator.flickrsync import GROUP, PLURAL, SPEC_HASH_ANNOTATION, VERSION, FlickrSync
+from flickr_immich_k8s_sync_operator.operator import (
+    APPLY_PATCH_CONTENT_TYPE,
+    FIELD_MANAGER,
+    deleted_immediately,
+    failed_since,
+    succeeded,
+)
+from flickr_immich_k8s_sync_operator.restart_markers import MERGE_PATCH_CONTENT_TYPE
+
+# Values of ``status.phase``: the state of the Job (``Scheduled`` for a
+# CronJob), or ``Invalid`` when the spec was rejected (see ``status.message``).
+PENDING, RUNNING, SUCCEEDED, FAILED, SCHEDULED, INVALID = (
+    "Pending",
+    "Running",
+    "Succeeded",
+    "Failed",
+    "Scheduled",
+    "Invalid",
+)
+
+# A status that keeps changing is still written after this many debounce intervals.
+STATUS_MAX_DEBOUNCES: int = 5
+
+
+def job_phase(job: dict[str, Any]) -> str:
+    """Return the ``status.phase`` reported for a Job (plain dict)."""
+    status = job.get("status") or {}
+    if status.get("active"):
+        return RUNNING
+    if failed_since(status) is not None:
+        return FAILED
+    if succeeded(status):
+        return SUCCEEDED
+    return PENDING
+
+
+def _call(verb: str, resource: str, request: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """Perform an API request without recording it (see ``JobRestartOperator._api``)."""
+    return request(*args, **kwargs)
+
+
+class StatusBatcher:
+    """Coalesces the status changes of ``FlickrSync`` resources and writes them in batches.
+
+    Changes to the same resource are merged; they are written in one
+    request once no further change arrived for ``debounce`` seconds, or
+    at the latest :data:`STATUS_MAX_DEBOUNCES` intervals after the first.
+    All due writes happen in one :meth:`flush`.  A failed write is retried
+    with the next flush; one for a resource that is gone is dropped.
+    """
+
+    def __init__(
+        self,
+        write: Callable[[str, dict[str, Any]], None],
+        debounce: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialise an empty batch.
+
+        Args:
+            write: Writes the status changes of one resource (by name).
+            debounce: Seconds without further changes before a write.
+            clock: Monotonic time source (overridable for tests).
+        """
+        self._write = write
+        self._debounce = debounce
+        self._clock = clock
+        # name -> (merged changes, time of the first change, time of the last change)
+        self._pending: dict[str, tuple[dict[str, Any], float, float]] = {}
+        self._lock = threading.Lock()
+        self._log = glogger.bind(classname=self.__class__.__name__)
+
+    def pending(self, name: str) -> dict[str, Any]:
+        """Return the changes not yet written for *name*."""
+        with self._lock:
+            entry = self._pending.get(name)
+            return dict(entry[0]) if entry is not None else {}
+
+    def update(self, name: str, changes: dict[str, Any]) -> None:
+        """Merge *changes* into the pending status of *name*."""
+        now = self._clock()
+        with self._lock:
+            merged, first, _ = self._pending.get(name, ({}, now, now))
+            self._pending[name] = ({**merged, **changes}, first, now)
+
+    def next_due(self) -> float | None:
+        """Return the seconds until the next write is due (``0`` if overdue), or ``None`` if nothing is pending."""
+        with self._lock:
+            if not self._pending:
+                return None
+            due = min(self._due(first, last) for _, first, last in self._pending.values())
+        return max(due - self._clock(), 0.0)
+
+    def flush(self, force: bool = False) -> int:
+        """Write every due status (all of them with *force*).
+
+        Returns:
+            The number of resources whose status was written.
+        """
+        now = self._clock()
+        with self._lock:
+            due = [name for name, (_, first, last) in self._pending.items() if force or self._due(first, last) <= now]
+            batch = {name: self._pending.pop(name)[0] for name in due}
+        written = 0
+        for name, changes in batch.items():
+            try:
+                self._write(name, changes)
+                written += 1
+            except client.ApiException as exc:
+                if exc.status == 404:
+                    continue
+                self._log.warning("Could not update the status of FlickrSync {}: {}", name, exc)
+                self.update(name, changes)
+        if written:
+            self._log.debug("Updated the status of {} FlickrSync(s)", written)
+        return written
+
+    def _due(self, first: float, last: float) -> float:
+        """Return when a status changed first at *first* and last at *last* is due."""
+        return min(last + self._debounce, first + STATUS_MAX_DEBOUNCES * self._debounce)
+
+
+class FlickrSyncReconciler:
+    """Keeps the Job (or CronJob) of every ``FlickrSync`` in a namespace in line with its spec.
+
+    Every pass lists the ``FlickrSync`` resources and the Jobs and CronJobs
+    carrying :data:`~.config.FLICKRSYNC_LABEL`.  A resource whose
+    ``metadata.generation`` equals its ``status.observedGeneration`` and
+    whose Job exists is up to date: the pass only refreshes its phase,
+    without a single write.  Otherwise the Job is server-side applied under
+    :data:`~.operator.FIELD_MANAGER`.  As the Pod template of a Job is
+    immutable, a Job built from an older spec (see
+    :data:`~.flickrsync.SPEC_HASH_ANNOTATION`) is deleted first and applied
+    again in the same pass, or in the next one while it is still being
+    deleted.  Jobs are owned by their resource and garbage-collected with it.
+
+    Failed Jobs are left to the restart logic of the operator; a Job it is
+    restarting is skipped.  Status changes go through a :class:`StatusBatcher`.
+    """
+
+    def __init__(
+        self,
+        api_client: client.ApiClient,
+        namespace: str,
+        interval: float,
+        status_debounce: float,
+        api: Callable[..., Any] = _call,
+        acts_on: Callable[[str], bool] = lambda job_name: True,
+        job_lock: Callable[[str], threading.Lock] | None = None,
+    ) -> None:
+        """Initialise the API clients and the status batch.
+
+        Args:
+            api_client: API client shared with the operator.
+            namespace: Namespace of the resources and their Jobs.
+            interval: Seconds between two passes.
+            status_debounce: See :class:`StatusBatcher`.
+            api: Performs an API request as ``api(verb, resource, request,
+                *args, **kwargs)``, e.g. recording metrics.
+            acts_on: Whether this replica may act on a Job (leader and owner
+                of its shard).
+            job_lock: Returns the lock of a Job held while the operator works
+                on it; the Job is skipped while it is held elsewhere.
+        """
+        self._custom_objects = client.CustomObjectsApi(api_client)
+        self._batch_v1 = client.BatchV1Api(api_client)
+        self._namespace = namespace
+        self._interval = interval
+        self._api = api
+        self._acts_on = acts_on
+        self._job_lock = job_lock or (lambda job_name: threading.Lock())
+        self._status = StatusBatcher(self._write_status, status_debounce)
+        self._log = glogger.bind(classname=self.__class__.__name__)
+
+    def run(self, shutdown_event: threading.Event) -> None:
+        """Reconcile every ``interval`` seconds and write due statuses in between, until shut down.
+
+        Args:
+            shutdown_event: Threading event that, when set, ends the loop
+                after writing all pending statuses.
+        """
+        self._log.info("Reconciling FlickrSyncs in namespace '{}' every {}s", self._namespace, self._interval)
+        next_pass = time.monotonic()
+        while not shutdown_event.is_set():
+            if time.monotonic() >= next_pass:
+                try:
+                    self.reconcile()
+                except client.ApiException as exc:
+                    self._log.error("Kubernetes API error while reconciling FlickrSyncs: {}", exc)
+                except Exception:
+                    self._log.exception("Unexpected error while reconciling FlickrSyncs")
+                next_pass = time.monotonic() + self._interval
+            self._status.flush()
+            timeout = next_pass - time.monotonic()
+            due = self._status.next_due()
+            shutdown_event.wait(timeout=max(min(timeout, due) if due is not None else timeout, 0))
+        self._status.flush(force=True)
+
+    def reconcile(self) -> int:
+        """Reconcile every ``FlickrSync`` in the namespace once.
+
+        Returns:
+            The number of Jobs and CronJobs applied.
+        """
+        syncs = self._list(
+            "flickrsyncs", self._custom_objects.list_namespaced_custom_object, GROUP, VERSION, self._namespace, PLURAL
+        )
+        children = {
+            "Job": self._index(self._list("jobs", self._batch_v1.list_namespaced_job, self._namespace)),
+            "CronJob": self._index(self._list("cronjobs", self._batch_v1.list_namespaced_cron_job, self._namespace)),
+        }
+        applied = 0
+        for obj in syncs:
+            try:
+                applied += self._reconcile_one(obj, children)
+            except client.ApiException as exc:
+                self._log.error(
+                    "Kubernetes API error while reconciling FlickrSync {}: {}", obj["metadata"]["name"], exc
+                )
+        return applied
+
+    def flush_status(self) -> int:
+        """Write all pending statuses now (see :meth:`StatusBatcher.flush`)."""
+        return self._status.flush(force=True)
+
+    def _reconcile_one(self, obj: dict[str, Any], children: dict[str, dict[str, dict[str, Any]]]) -> bool:
+        """Bring the Job of one resource in line with its spec.
+
+        Returns:
+            ``True`` if its Job or CronJob was applied.
+        """
+        meta = obj["metadata"]
+        generation = meta.get("generation")
+        try:
+            sync = FlickrSync.from_object(obj)
+        except ValueError as exc:
+            self._set_status(obj, {"observedGeneration": generation, "phase": INVALID, "message": str(exc)})
+            return False
+        if not self._acts_on(sync.job_name):
+            return False
+        child = children[sync.child_kind].get(sync.job_name)
+        if child is not None and (obj.get("status") or {}).get("observedGeneration") == generation:
+            self._set_status(obj, {"phase": self._phase(sync, child)})
+            return False
+
+        lock = self._job_lock(sync.job_name)
+        if not lock.acquire(blocking=False):
+            self._log.debug("{} is being handled by the operator — reconciling it later", sync.job_name)
+            return False
+        try:
+            stale_kind = "Job" if sync.schedule else "CronJob"
+            if sync.job_name in children[stale_kind]:
+                self._delete(stale_kind, sync.job_name)
+            if child is not None and self._annotation(child, SPEC_HASH_ANNOTATION) == sync.spec_hash:
+                applied = False
+            elif child is not None and sync.child_kind == "Job" and not self._delete("Job", sync.job_name):
+                self._log.info("{} is still being deleted — applying FlickrSync {} later", sync.job_name, sync.name)
+                return False
+            else:
+                self._apply(sync)
+                child = None
+                applied = True
+        finally:
+            lock.release()
+        phase = self._phase(sync, child)
+        self._set_status(
+            obj, {"observedGeneration": generation, "jobName": sync.job_name, "phase": phase, "message": ""}
+        )
+        return applied
+
+    def _apply(self, sync: FlickrSync) -> None:
+        """Create or update the Job or CronJob of *sync* through server-side apply."""
+        request: Callable[..., Any]
+        if sync.schedule:
+            resource, request = "cronjobs", self._batch_v1.patch_namespaced_cron_job
+        else:
+            resource, request = "jobs", self._batch_v1.patch_namespaced_job
+        self._api(
+            "patch",
+            resource,
+            request,
+            sync.job_name,
+            self._namespace,
+            sync.manifest(),
+            field_manager=FIELD_MANAGER,
+            force=True,
+            _content_type=APPLY_PATCH_CONTENT_TYPE,
+        )
+        self._log.info("Applied {} {} of FlickrSync {}", sync.child_kind, sync.job_name, sync.name)
+
+    def _delete(self, kind: str, name: str) -> bool:
+        """Delete a Job or CronJob in the background.
+
+        Returns:
+            ``True`` if it is gone right away (or was already), ``False`` while
+            it is still being deleted.
+        """
+        request: Callable[..., Any]
+        if kind == "Job":
+            resource, request = "jobs", self._batch_v1.delete_namespaced_job
+        else:
+            resource, request = "cronjobs", self._batch_v1.delete_namespaced_cron_job
+        try:
+            status = self._api(
+                "delete", resource, request, name, self._namespace, body={"propagationPolicy": "Background"}
+            )
+        except client.ApiException as exc:
+            if exc.status == 404:
+                return True
+            raise
+        self._log.info("Deleted {} {} (built from an outdated spec)", kind, name)
+        return deleted_immediately(status)
+
+    def _set_status(self, obj: dict[str, Any], changes: dict[str, Any]) -> None:
+        """Queue the status *changes* of *obj* unless its status (or pending update) already has them."""
+        name = obj["metadata"]["name"]
+        current = {**(obj.get("status") or {}), **self._status.pending(name)}
+        if any(current.get(key) != value for key, value in changes.items()):
+            self._status.update(name, changes)
+
+    def _write_status(self, name: str, changes: dict[str, Any]) -> None:
+        """Merge *changes* into the status subresource of the ``FlickrSync`` *name*."""
+        self._api(
+            "patch",
+            "flickrsyncs/status",
+            self._custom_objects.patch_namespaced_custom_object_status,
+            GROUP,
+            VERSION,
+            self._namespace,
+            PLURAL,
+            name,
+            {"status": changes},
+            _content_type=MERGE_PATCH_CONTENT_TYPE,
+        )
+
+    def _list(self, resource: str, request: Callable[..., Any], *args: Any) -> list[dict[str, Any]]:
+        """LIST *resource* (only the labelled Jobs and CronJobs) and return the items as plain dicts."""
+        selector = None if resource == "flickrsyncs" else FLICKRSYNC_LABEL
+        resp = self._api("list", resource, request, *args, label_selector=selector, _preload_content=False)
+        return json.loads(resp.data).get("items") or []  # type: ignore[no-any-return]
+
+    @staticmethod
+    def _index(items: list[dict[str, Any]]) -> dict[str, dict[str, Any]]:
+        """Index LIST *items* by name."""
+        return {item["metadata"]["name"]: item for item in items}
+
+    @staticmethod
+    def _annotation(obj: dict[str, Any], key: str) -> str | None:
+        """Return the annotation *key* of *obj*, if set."""
+        return (obj["metadata"].get("annotations") or {}).get(key)
+
+    @staticmethod
+    def _phase(sync: FlickrSync, child: dict[str, Any] | None) -> str:
+        """Return the phase of *sync* given its current Job or CronJob (``None`` if just applied)."""
+        if sync.schedule:
+            return SCHEDULED
+        return job_phase(child) if child is not None else PENDING
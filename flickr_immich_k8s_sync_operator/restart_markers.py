@@ -0,0 +1,131 @@
+"""Restart markers — in-flight restarts recorded in a ConfigMap that every replica can read."""
+
+from __future__ import annotations
+
+import json
+from dataclasses import asdict, dataclass, field
+from typing import Any, Callable
+
+from kubernetes import client
+from loguru import logger as glogger
+
+# Content type of the ConfigMap updates (and of other partial updates).
+MERGE_PATCH_CONTENT_TYPE: str = "application/merge-patch+json"
+
+
+@dataclass(frozen=True)
+class RestartMarker:
+    """A restart that was started but may not have been finished.
+
+    Attributes:
+        uid: UID of the Job instance being deleted.
+        holder: Identity of the replica that started the restart.
+        manifest: The cached manifest the Job is recreated from (empty with a template source).
+        owner: Owner reference of the CronJob that spawned the Job, with a template source.
+    """
+
+    uid: str
+    holder: str
+    manifest: dict[str, Any] = field(default_factory=dict)
+    owner: dict[str, Any] = field(default_factory=dict)
+
+
+class RestartMarkers:
+    """Markers of in-flight restarts, one ConfigMap key per Job.
+
+    A replica writes the marker before it deletes a Job and removes it once
+    the Job has been recreated.  The local :class:`StateStore` only helps
+    the same replica after a restart; the markers let another replica —
+    a new leader, or the new owner of a rebalanced shard — finish a
+    restart whose replica died between the delete and the create.
+    All updates are JSON merge patches of single keys, so replicas marking
+    different Jobs do not conflict.
+    """
+
+    def __init__(
+        self,
+        api_client: client.ApiClient,
+        namespace: str,
+        name: str,
+        identity: str,
+        api: Callable[..., Any],
+    ) -> None:
+        """Initialise the markers without touching the API.
+
+        Args:
+            api_client: API client shared with the operator.
+            namespace: Namespace of the ConfigMap.
+            name: Name of the ConfigMap; it is created on the first marker.
+            identity: Identity of this replica, recorded in its markers.
+            api: Performs an API request as ``api(verb, resource, request,
+                *args, **kwargs)``, e.g. recording metrics.
+        """
+        self._core_v1 = client.CoreV1Api(api_client)
+        self._namespace = namespace
+        self._name = name
+        self._identity = identity
+        self._api = api
+        self._log = glogger.bind(classname=self.__class__.__name__)
+
+    def mark(self, job_name: str, uid: str, manifest: dict[str, Any], owner: dict[str, Any] | None = None) -> None:
+        """Record that *job_name* (instance *uid*) is about to be deleted and recreated.
+
+        Raises:
+            client.ApiException: If the marker could not be written; the
+                restart must not go ahead then.
+        """
+        value = json.dumps(asdict(RestartMarker(uid, self._identity, manifest, owner or {})))
+        try:
+            self._patch({job_name: value})
+        except client.ApiException as exc:
+            if exc.status != 404:
+                raise
+            body = {"metadata": {"name": self._name}, "data": {job_name: value}}
+            try:
+                self._api("create", "configmaps", self._core_v1.create_namespaced_config_map, self._namespace, body)
+            except client.ApiException as create_exc:
+                if create_exc.status != 409:
+                    raise
+                self._patch({job_name: value})
+
+    def clear(self, job_name: str) -> None:
+        """Remove the marker of *job_name*; a failure is only logged (a stale marker is harmless)."""
+        try:
+            self._patch({job_name: None})
+        except client.ApiException as exc:
+            if exc.status != 404:
+                self._log.warning("Could not clear the restart marker of {}: {}", job_name, exc)
+
+    def load(self) -> dict[str, RestartMarker]:
+        """Return the markers of all replicas, keyed by Job name (malformed ones are skipped)."""
+        try:
+            resp = self._api(
+                "get",
+                "configmaps",
+                self._core_v1.read_namespaced_config_map,
+                self._name,
+                self._namespace,
+                _preload_content=False,
+            )
+        except client.ApiException as exc:
+            if exc.status == 404:
+                return {}
+            raise
+        markers: dict[str, RestartMarker] = {}
+        for job_name, value in (json.loads(resp.data).get("data") or {}).items():
+            try:
+                markers[job_name] = RestartMarker(**json.loads(value))
+            except (TypeError, ValueError):
+                self._log.warning("Ignoring malformed restart marker of {}", job_name)
+        return markers
+
+    def _patch(self, data: dict[str, str | None]) -> None:
+        self._api(
+            "patch",
+            "configmaps",
+            self._core_v1.patch_namespaced_config_map,
+            self._name,
+            self._namespace,
+            {"data": data},
+            _content_type=MERGE_PATCH_CONTENT_TYPE,
+        )
@@ -0,0 +1,121 @@
+"""Restart scheduler — fires delayed Job restarts at their exact deadline."""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import threading
+import time
+from typing import Callable
+
+from loguru import logger as glogger
+
+
+class RestartScheduler:
+    """Keeps the restart deadlines of failed Jobs in a heap and fires them on time.
+
+    Every failed Job is scheduled once with the UID of the failed instance
+    and the termination reason that caused the restart.  :meth:`run` sleeps
+    until the earliest deadline and then hands ``(job_name, uid, reason)``
+    to its callback.  Re-scheduling a Job replaces its previous deadline;
+    superseded heap entries are skipped lazily when they come up.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic) -> None:
+        """Initialise an empty schedule.
+
+        Args:
+            clock: Monotonic time source (overridable for tests).
+        """
+        self._clock = clock
+        self._heap: list[tuple[float, int, str]] = []
+        self._entries: dict[str, tuple[float, str, str]] = {}
+        self._seq = itertools.count()
+        self._cond = threading.Condition()
+        self._stopped = False
+        self._log = glogger.bind(classname=self.__class__.__name__)
+
+    def schedule(self, job_name: str, uid: str, reason: str, delay: float) -> bool:
+        """Schedule a restart of *job_name* (instance *uid*) in *delay* seconds.
+
+        Args:
+            job_name: Name of the failed Job.
+            uid: UID of the failed Job instance.
+            reason: Termination reason reported with the restart.
+            delay: Seconds from now until the restart is due.
+
+        Returns:
+            Whether a pending restart of *job_name* was replaced.
+        """
+        deadline = self._clock() + max(0.0, delay)
+        with self._cond:
+            replaced = job_name in self._entries
+            self._entries[job_name] = (deadline, uid, reason)
+            heapq.heappush(self._heap, (deadline, next(self._seq), job_name))
+            self._cond.notify()
+        return replaced
+
+    def deadline(self, job_name: str, uid: str) -> float | None:
+        """Return the seconds until *job_name*'s restart is due, or ``None``.
+
+        ``None`` is also returned when the scheduled restart belongs to a
+        different instance of the Job than *uid*.
+        """
+        with self._cond:
+            entry = self._entries.get(job_name)
+            if entry is None or entry[1] != uid:
+                return None
+            return max(0.0, entry[0] - self._clock())
+
+    def pop_due(self) -> list[tuple[str, str, str]]:
+        """Remove and return every restart whose deadline has passed.
+
+        Returns:
+            ``(job_name, uid, reason)`` tuples in deadline order.
+        """
+        now = self._clock()
+        due: list[tuple[str, str, str]] = []
+        with self._cond:
+            while self._heap and self._heap[0][0] <= now:
+                deadline, _, job_name = heapq.heappop(self._heap)
+                entry = self._entries.get(job_name)
+                if entry is None or entry[0] != deadline:
+                    continue  # superseded by a later schedule() call
+                del self._entries[job_name]
+                due.append((job_name, entry[1], entry[2]))
+        return due
+
+    def run(self, on_due: Callable[[str, str, str], None]) -> None:
+        """Sleep until the next deadline and fire *on_due* for each due restart, until :meth:`stop`.
+
+        Args:
+            on_due: Called as ``on_due(job_name, uid, reason)`` from the
+                scheduler thread; it should hand the work off quickly.
+        """
+        while True:
+            with self._cond:
+                if self._stopped:
+                    return
+                timeout = self._heap[0][0] - self._clock() if self._heap else None
+                if timeout is None or timeout > 0:
+                    self._cond.wait(timeout=timeout)
+                    continue
+            for job_name, uid, reason in self.pop_due():
+                try:
+                    on_due(job_name, uid, reason)
+                except Exception:
+                    self._log.exception("Failed to fire scheduled restart of {}", job_name)
+
+    def clear(self) -> int:
+        """Drop every pending restart and return how many there were."""
+        with self._cond:
+            count = len(self._entries)
+            self._entries.clear()
+            self._heap.clear()
+        return count
+
+    def stop(self) -> None:
+        """Make :meth:`run` return."""
+        with self._cond:
+            self._stopped = True
+            self._cond.notify()
@@ -0,0 +1,216 @@
+"""Sharding — spreads the managed Jobs over operator replicas by consistent hashing."""
+
+from __future__ import annotations
+
+import bisect
+import hashlib
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Callable, Iterable
+
+from kubernetes import client
+from loguru import logger as glogger
+
+from flickr_immich_k8s_sync_operator.leader import RENEW_DEADLINE_FACTOR, RETRY_PERIOD
+
+# Points per member on the hash ring; more points spread Jobs more evenly.
+VIRTUAL_NODES: int = 100
+
+# Label carrying the shard group on the membership Leases.
+SHARD_GROUP_LABEL: str = "flickr-immich-k8s-sync-operator/shard-group"
+
+
+def _hash(value: str) -> int:
+    """Map *value* to a position on the ring (stable across processes, unlike ``hash()``)."""
+    return int.from_bytes(hashlib.sha1(value.encode()).digest()[:8], "big")
+
+
+class HashRing:
+    """Consistent-hash ring assigning every key to one member.
+
+    Each member is placed on the ring :data:`VIRTUAL_NODES` times; a key
+    belongs to the first member point at or after the key's position.
+    When a member joins, it only takes over the keys that fall onto its
+    own points — about ``1/N`` of all keys — and when one leaves, only its
+    keys move.
+    """
+
+    def __init__(self, members: Iterable[str] = (), vnodes: int = VIRTUAL_NODES) -> None:
+        """Build the ring.
+
+        Args:
+            members: Identities of the members.
+            vnodes: Points per member.
+        """
+        self.members: frozenset[str] = frozenset(members)
+        points = sorted((_hash(f"{member}#{i}"), member) for member in self.members for i in range(vnodes))
+        self._positions = [position for position, _ in points]
+        self._owners = [member for _, member in points]
+
+    def owner(self, key: str) -> str | None:
+        """Return the member owning *key*, or ``None`` if the ring is empty."""
+        if not self._owners:
+            return None
+        index = bisect.bisect_left(self._positions, _hash(key)) % len(self._positions)
+        return self._owners[index]
+
+
+class ShardMembership:
+    """Announces this replica in a shard group and tracks the live members.
+
+    Every replica keeps its own ``coordination.k8s.io/v1`` Lease, labelled
+    with the shard group, and renews it every :data:`RETRY_PERIOD` seconds.
+    The live members are the holders of all Leases of the group that were
+    renewed within their lease duration (measured locally from when each
+    renewal was first observed, as in :class:`~.leader.LeaderElector`).
+    Job ownership follows a :class:`HashRing` over the live members.
+
+    A replica that could not renew its own Lease for a while owns nothing,
+    since the other replicas will soon consider it gone.
+    """
+
+    def __init__(
+        self,
+        coordination_v1: client.CoordinationV1Api,
+        namespace: str,
+        group: str,
+        identity: str,
+        lease_duration: int = 15,
+        on_change: Callable[[], None] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialise the membership without touching the API.
+
+        Args:
+            coordination_v1: API client used for the Leases.
+            namespace: Namespace of the Leases.
+            group: Name of the shard group (also the Lease name prefix).
+            identity: Unique identity of this replica (e.g. the Pod name).
+            lease_duration: Seconds a member stays live without renewing.
+            on_change: Called after the set of live members changed.
+            clock: Monotonic time source (overridable for tests).
+        """
+        self._coordination_v1 = coordination_v1
+        self._namespace = namespace
+        self._group = group
+        self.identity = identity
+        self._lease_name = f"{group}-{identity}"
+        self._lease_duration = lease_duration
+        self._on_change = on_change
+        self._clock = clock
+        self._ring = HashRing()
+        self._last_renew: float | None = None
+        # Lease name -> (renewTime, when that renewTime was first observed)
+        self._observed: dict[str, tuple[datetime | None, float]] = {}
+        self._lock = threading.Lock()
+        self._log = glogger.bind(classname=self.__class__.__name__)
+
+    def members(self) -> frozenset[str]:
+        """Return the live members as of the last :meth:`tick`."""
+        with self._lock:
+            return self._ring.members
+
+    def owns(self, job_name: str) -> bool:
+        """Return whether this replica is responsible for *job_name*."""
+        with self._lock:
+            if self._last_renew is None:
+                return False
+            if self._clock() - self._last_renew > self._lease_duration * RENEW_DEADLINE_FACTOR:
+                return False
+            return self._ring.owner(job_name) == self.identity
+
+    def run(self, shutdown_event: threading.Event) -> None:
+        """Renew the membership and refresh the members every :data:`RETRY_PERIOD` seconds until shut down."""
+        while not shutdown_event.is_set():
+            self.tick()
+            shutdown_event.wait(timeout=RETRY_PERIOD)
+
+    def tick(self) -> None:
+        """Renew this replica's Lease and recompute the live members."""
+        try:
+            self._renew()
+            renewed_at: float | None = self._clock()
+        except Exception as exc:
+            self._log.warning("Could not renew shard membership {}: {}", self._lease_name, exc)
+            renewed_at = None
+        try:
+            live = self._live_members()
+        except Exception as exc:
+            self._log.warning("Could not list the members of shard group {}: {}", self._group, exc)
+            live = None
+
+        with self._lock:
+            if renewed_at is not None:
+                self._last_renew = renewed_at
+            changed = live is not None and live != self._ring.members
+            if changed and live is not None:
+                self._ring = HashRing(live)
+        if changed:
+            self._log.info("Shard group {} now has {} member(s): {}", self._group, len(live or ()), sorted(live or ()))
+            if self._on_change is not None:
+                self._on_change()
+
+    def release(self) -> None:
+        """Delete this replica's Lease so that the others rebalance right away."""
+        with self._lock:
+            self._last_renew = None
+        try:
+            self._coordination_v1.delete_namespaced_lease(self._lease_name, self._namespace)
+            self._log.info("Left shard group {}", self._group)
+        except client.ApiException as exc:
+            self._log.warning("Could not delete membership lease {}: {}", self._lease_name, exc)
+
+    def _renew(self) -> None:
+        """Create or renew this replica's membership Lease."""
+        now = datetime.now(timezone.utc)
+        try:
+            lease = self._coordination_v1.read_namespaced_lease(self._lease_name, self._namespace)
+        except client.ApiException as exc:
+            if exc.status != 404:
+                raise
+            self._coordination_v1.create_namespaced_lease(
+                self._namespace,
+                client.V1Lease(
+                    metadata=client.V1ObjectMeta(
+                        name=self._lease_name,
+                        namespace=self._namespace,
+                        labels={SHARD_GROUP_LABEL: self._group},
+                    ),
+                    spec=client.V1LeaseSpec(
+                        holder_identity=self.identity,
+                        lease_duration_seconds=self._lease_duration,
+                        acquire_time=now,
+                        renew_time=now,
+                    ),
+                ),
+            )
+            return
+        lease.spec = lease.spec or client.V1LeaseSpec()
+        lease.spec.holder_identity = self.identity
+        lease.spec.renew_time = now
+        lease.spec.lease_duration_seconds = self._lease_duration
+        self._coordination_v1.replace_namespaced_lease(self._lease_name, self._namespace, lease)
+
+    def _live_members(self) -> frozenset[str]:
+        """List the group's Leases and return the holders that are still renewing."""
+        leases = self._coordination_v1.list_namespaced_lease(
+            self._namespace, label_selector=f"{SHARD_GROUP_LABEL}={self._group}"
+        )
+        now = self._clock()
+        live: set[str] = set()
+        observed: dict[str, tuple[datetime | None, float]] = {}
+        for lease in leases.items:
+            name = (lease.metadata and lease.metadata.name) or ""
+            spec = lease.spec
+            if not name or spec is None or not spec.holder_identity:
+                continue
+            previous = self._observed.get(name)
+            seen_at = previous[1] if previous is not None and previous[0] == spec.renew_time else now
+            observed[name] = (spec.renew_time, seen_at)
+            if spec.holder_identity == self.identity or now - seen_at <= (
+                spec.lease_duration_seconds or self._lease_duration
+            ):
+                live.add(spec.holder_identity)
+        self._observed = observed
+        return frozenset(live)
@@ -0,0 +1,212 @@
+"""Persistent restart state — cached manifests and restart bookkeeping that survive operator restarts."""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+from dataclasses import asdict, dataclass
+from typing import Any
+
+from loguru import logger as glogger
+
+from flickr_immich_k8s_sync_operator.config import OperatorConfig
+
+# Schema version written by :class:`FileStateStore` (version 1 files are still read).
+FILE_FORMAT_VERSION: int = 2
+
+# :class:`FileStateStore` compacts its log once it holds more appended
+# records than this, and more than there are Jobs.
+COMPACT_MIN_ENTRIES: int = 64
+
+
+@dataclass(frozen=True)
+class JobRecord:
+    """Everything needed to recreate a Job after the operator restarted.
+
+    Attributes:
+        manifest: The cached manifest (see :func:`~flickr_immich_k8s_sync_operator.operator.build_manifest`).
+        uid: UID of the Job instance the manifest was taken from.
+        key: The :func:`~flickr_immich_k8s_sync_operator.operator.manifest_key` of that instance.
+        restarting: ``True`` between deleting the Job and successfully recreating it.
+    """
+
+    manifest: dict[str, Any]
+    uid: str
+    key: str
+    restarting: bool = False
+
+
+class StateStore:
+    """Thread-safe state store keeping :class:`JobRecord` entries in memory only.
+
+    This is the default backend (``STATE_STORE=memory``) and the base class
+    of the persistent backends, which additionally write every change
+    through to durable storage *before* :meth:`put` returns — a record
+    flagged ``restarting`` is therefore on disk before the Job is deleted.
+    """
+
+    def __init__(self) -> None:
+        """Initialise an empty store."""
+        self._records: dict[str, JobRecord] = {}
+        self._lock = threading.Lock()
+        self._log = glogger.bind(classname=self.__class__.__name__)
+
+    def load(self) -> dict[str, JobRecord]:
+        """Return a snapshot of all stored records, keyed by Job name."""
+        with self._lock:
+            return dict(self._records)
+
+    def get(self, job_name: str) -> JobRecord | None:
+        """Return the record of *job_name*, or ``None`` if unknown."""
+        with self._lock:
+            return self._records.get(job_name)
+
+    def put(self, job_name: str, record: JobRecord) -> None:
+        """Store *record* for *job_name*, persisting it before returning."""
+        with self._lock:
+            self._records[job_name] = record
+            self._persist(job_name, record)
+
+    def close(self) -> None:
+        """Release any resources held by the backend."""
+
+    def _persist(self, job_name: str, record: JobRecord) -> None:
+        """Write *record* to durable storage (called with the lock held)."""
+
+
+class FileStateStore(StateStore):
+    """State store backed by an append-only JSON-lines file.
+
+    Each line is either a snapshot of all records (``{"version", "jobs"}``,
+    the whole content of a version 1 file) or a single changed record
+    (``{"name", "record"}``); later lines win.  Every :meth:`put` appends
+    one line and ``fsync``-s it, so a write costs the size of one record
+    instead of the whole file.  Once the appended lines outnumber both
+    :data:`COMPACT_MIN_ENTRIES` and the records, the file is compacted: a
+    fresh snapshot is written to a temporary file, ``fsync``-ed and renamed
+    over the old one, which keeps the cost of the writes linear overall.
+    """
+
+    def __init__(self, path: str) -> None:
+        """Load existing records from *path* (if the file exists) and compact it.
+
+        Args:
+            path: Location of the state file.  Its directory must exist.
+        """
+        super().__init__()
+        self._path = path
+        self._appended = 0
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as fh:
+                for number, line in enumerate(fh, 1):
+                    self._replay(line, number)
+            self._log.info("Loaded {} job record(s) from {}", len(self._records), path)
+        # Rewriting the file on start also drops a line torn by a crash.
+        self._compact()
+
+    def close(self) -> None:
+        with self._lock:
+            self._fh.close()
+
+    def _replay(self, line: str, number: int) -> None:
+        """Apply one line of the file to the records."""
+        try:
+            entry = json.loads(line)
+            if "jobs" in entry:
+                self._records = {name: JobRecord(**values) for name, values in entry["jobs"].items()}
+            else:
+                self._records[entry["name"]] = JobRecord(**entry["record"])
+        except (ValueError, TypeError, KeyError):
+            self._log.warning("Ignoring malformed line {} of {}", number, self._path)
+
+    def _persist(self, job_name: str, record: JobRecord) -> None:
+        self._fh.write(json.dumps({"name": job_name, "record": asdict(record)}) + "\n")
+        self._fh.flush()
+        os.fsync(self._fh.fileno())
+        self._appended += 1
+        if self._appended > max(COMPACT_MIN_ENTRIES, len(self._records)):
+            self._fh.close()
+            self._compact()
+
+    def _compact(self) -> None:
+        """Replace the file with a snapshot of the records and reopen it for appending."""
+        data = {
+            "version": FILE_FORMAT_VERSION,
+            "jobs": {name: asdict(rec) for name, rec in self._records.items()},
+        }
+        directory = os.path.dirname(os.path.abspath(self._path))
+        fd, tmp_path = tempfile.mkstemp(prefix=".state-", dir=directory)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                fh.write(json.dumps(data) + "\n")
+                fh.flush()
+                os.fsync(fh.fileno())
+            os.replace(tmp_path, self._path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        self._fh = open(self._path, "a", encoding="utf-8")
+        self._appended = 0
+
+
+class SQLiteStateStore(StateStore):
+    """State store backed by an SQLite database in WAL journal mode.
+
+    Each :meth:`put` is a single committed ``INSERT OR REPLACE``; with
+    ``synchronous=FULL`` the write is durable once :meth:`put` returns.
+    """
+
+    def __init__(self, path: str) -> None:
+        """Open (or create) the database at *path* and load existing records.
+
+        Args:
+            path: Location of the SQLite database file.  Its directory must exist.
+        """
+        super().__init__()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=FULL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS jobs ("
+            " name TEXT PRIMARY KEY,"
+            " uid TEXT NOT NULL,"
+            " key TEXT NOT NULL,"
+            " restarting INTEGER NOT NULL,"
+            " manifest TEXT NOT NULL)"
+        )
+        self._conn.commit()
+        for name, uid, key, restarting, manifest in self._conn.execute(
+            "SELECT name, uid, key, restarting, manifest FROM jobs"
+        ):
+            self._records[name] = JobRecord(json.loads(manifest), uid, key, bool(restarting))
+        self._log.info("Loaded {} job record(s) from {}", len(self._records), path)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def _persist(self, job_name: str, record: JobRecord) -> None:
+        with self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO jobs (name, uid, key, restarting, manifest) VALUES (?, ?, ?, ?, ?)",
+                (job_name, record.uid, record.key, int(record.restarting), json.dumps(record.manifest)),
+            )
+
+
+def open_state_store(cfg: OperatorConfig) -> StateStore:
+    """Create the state store backend selected by ``cfg.state_store``.
+
+    Args:
+        cfg: Operator configuration (``state_store`` and ``state_path``).
+
+    Returns:
+        A :class:`StateStore`, :class:`FileStateStore` or :class:`SQLiteStateStore`.
+    """
+    if cfg.state_store == "file":
+        return FileStateStore(cfg.state_path)
+    if cfg.state_store == "sqlite":
+        return SQLiteStateStore(cfg.state_path)
+    return StateStore()
@@ -0,0 +1,249 @@
+"""Namespace supervisor — serves several namespaces (or the whole cluster) from one process."""
+
+from __future__ import annotations
+
+import dataclasses
+import os
+import threading
+import time
+from typing import Callable, Protocol
+
+from kubernetes import client, config
+from loguru import logger as glogger
+
+from flickr_immich_k8s_sync_operator.config import ALL_NAMESPACES, OperatorConfig
+from flickr_immich_k8s_sync_operator.governor import RestartGovernor
+from flickr_immich_k8s_sync_operator.informer import ClusterJobInformer
+from flickr_immich_k8s_sync_operator.metrics import OperatorMetrics, start_metrics_server
+from flickr_immich_k8s_sync_operator.operator import JobRestartOperator
+
+# Seconds to wait for the operator of a namespace to finish on shutdown.
+STOP_TIMEOUT: float = 30.0
+
+# Seconds between two checks whether the operators are still running.
+SUPERVISE_INTERVAL: float = 5.0
+
+# Back-off (seconds) before a crashed operator (or one that could not be
+# created) is started again; doubles with every failure in a row up to the
+# maximum.  An operator that ran for at least the maximum before it crashed
+# starts over with the initial back-off.
+RESTART_BACKOFF_INITIAL: float = 1.0
+RESTART_BACKOFF_MAX: float = 300.0
+
+
+class NamespaceOperator(Protocol):
+    """What the supervisor needs from the operator of a single namespace."""
+
+    def run(self, shutdown_event: threading.Event) -> None: ...
+
+
+def partition_state_path(path: str, namespace: str) -> str:
+    """Return the state file of *namespace*: ``/state/op.db`` becomes ``/state/op.<namespace>.db``."""
+    root, ext = os.path.splitext(path)
+    return f"{root}.{namespace}{ext}"
+
+
+def namespace_config(cfg: OperatorConfig, namespace: str) -> OperatorConfig:
+    """Derive the configuration of the operator serving *namespace*.
+
+    The state store is partitioned per namespace and the metrics endpoint
+    is served once by the supervisor rather than by every operator.
+    """
+    return dataclasses.replace(
+        cfg,
+        namespace=namespace,
+        namespaces=[],
+        state_path=partition_state_path(cfg.state_path, namespace) if cfg.state_path else "",
+        metrics_port=0,
+    )
+
+
+class NamespaceSupervisor:
+    """Runs an independent operator per namespace inside one process.
+
+    Every namespace gets its own operator — with its own worker pool,
+    restart scheduler, caches and state store partition — so a burst of
+    failures in one namespace cannot occupy the workers of another.  The
+    operators of the synchronous engine share a single API client and
+    thereby one HTTP connection pool; the asynchronous engine runs every
+    namespace on its own event loop and client.  All operators share one
+    :class:`~.governor.RestartGovernor`, so the restart budget applies to
+    the whole fleet.
+
+    With ``NAMESPACES=*`` the namespaces of the cluster are listed every
+    ``check_interval`` seconds: operators are started for new namespaces
+    and stopped for deleted ones.  In ``watch`` mode they all take their
+    Jobs from one :class:`~.informer.ClusterJobInformer`, so a single LIST
+    and WATCH serve the whole cluster.  An operator that crashed (or
+    returned, or could not be created) is started again after an
+    exponential back-off.
+    """
+
+    def __init__(
+        self,
+        cfg: OperatorConfig,
+        api_client: client.ApiClient | None = None,
+        operator_factory: Callable[[OperatorConfig], NamespaceOperator] | None = None,
+    ) -> None:
+        """Create the shared API client and metrics.
+
+        Args:
+            cfg: Operator configuration with a non-empty ``namespaces`` list.
+            api_client: API client shared by all operators; a new one is
+                created from the in-cluster configuration if omitted.
+            operator_factory: Builds the operator of one namespace from its
+                configuration (overridable for tests).
+        """
+        if api_client is None:
+            config.load_incluster_config()
+            api_client = client.ApiClient()
+        self._cfg = cfg
+        self._api_client = api_client
+        self._core_v1 = client.CoreV1Api(api_client)
+        self._factory = operator_factory or self._make_operator
+        self._operators: dict[str, tuple[threading.Event, threading.Thread]] = {}
+        # namespace -> monotonic start time of its current operator
+        self._started_at: dict[str, float] = {}
+        # namespace -> crashes (or failed starts) in a row of its operator
+        self._crashes: dict[str, int] = {}
+        # namespace -> monotonic time at which its crashed operator is started again
+        self._restart_at: dict[str, float] = {}
+        self._log = glogger.bind(classname=self.__class__.__name__)
+        self.metrics = OperatorMetrics()
+        self.governor = RestartGovernor.from_config(cfg)
+        self._cluster_jobs: ClusterJobInformer | None = None
+        if ALL_NAMESPACES in cfg.namespaces and cfg.check_mode == "watch":
+            self._cluster_jobs = ClusterJobInformer(client.BatchV1Api(api_client), cfg.list_selector)
+
+    def run(self, shutdown_event: threading.Event) -> None:
+        """Run the operators of all target namespaces until *shutdown_event* is set.
+
+        Args:
+            shutdown_event: Threading event that, when set, stops every
+                operator and makes this method return.
+        """
+        self._log.info("Supervisor started — namespaces: {}", ", ".join(self._cfg.namespaces))
+        metrics_server = start_metrics_server(self.metrics, self._cfg.metrics_port) if self._cfg.metrics_port else None
+        informer_thread: threading.Thread | None = None
+        if self._cluster_jobs is not None:
+            informer_thread = threading.Thread(
+                target=self._cluster_jobs.run, args=(shutdown_event,), name="cluster-job-informer", daemon=True
+            )
+            informer_thread.start()
+        next_listing = time.monotonic()
+        try:
+            while not shutdown_event.is_set():
+                if time.monotonic() >= next_listing:
+                    namespaces = self._target_namespaces()
+                    if namespaces is not None:
+                        self._reconcile(namespaces)
+                    # A fixed list needs no request and is reconciled on every tick.
+                    if ALL_NAMESPACES in self._cfg.namespaces:
+                        next_listing = time.monotonic() + self._cfg.check_interval
+                self._restart_crashed()
+                shutdown_event.wait(timeout=SUPERVISE_INTERVAL)
+        finally:
+            for stop, _ in self._operators.values():
+                stop.set()
+            for _, thread in self._operators.values():
+                thread.join(timeout=STOP_TIMEOUT)
+            if self._cluster_jobs is not None and informer_thread is not None:
+                self._cluster_jobs.stop()
+                informer_thread.join(timeout=STOP_TIMEOUT)
+            if metrics_server is not None:
+                metrics_server.shutdown()
+
+    def namespaces(self) -> list[str]:
+        """Return the namespaces an operator is currently running for."""
+        return sorted(self._operators)
+
+    def _target_namespaces(self) -> set[str] | None:
+        """Return the namespaces to serve, or ``None`` if they cannot be listed right now."""
+        if ALL_NAMESPACES not in self._cfg.namespaces:
+            return set(self._cfg.namespaces)
+        try:
+            namespace_list = self._core_v1.list_namespace()
+        except client.ApiException as exc:
+            self._log.error("Kubernetes API error while listing namespaces: {}", exc)
+            return None
+        return {item.metadata.name for item in namespace_list.items if item.metadata and item.metadata.name}
+
+    def _reconcile(self, namespaces: set[str]) -> None:
+        """Start operators for new namespaces and stop those of vanished ones.
+
+        Namespaces waiting for the restart of their operator are left to
+        :meth:`_restart_crashed`.
+        """
+        for namespace in sorted(namespaces - self._operators.keys() - self._restart_at.keys()):
+            self._start(namespace)
+        for namespace in sorted((self._operators.keys() | self._restart_at.keys()) - namespaces):
+            operator = self._operators.pop(namespace, None)
+            if operator is not None:
+                operator[0].set()
+            self._started_at.pop(namespace, None)
+            self._crashes.pop(namespace, None)
+            self._restart_at.pop(namespace, None)
+            self._log.info("Stopped operator for vanished namespace '{}'", namespace)
+
+    def _start(self, namespace: str) -> None:
+        """Create the operator of *namespace* and run it in a new thread, or schedule another attempt."""
+        try:
+            operator = self._factory(namespace_config(self._cfg, namespace))
+        except Exception:
+            self._log.exception("Failed to create the operator for namespace '{}'", namespace)
+            self._schedule_restart(namespace)
+            return
+        stop = threading.Event()
+        thread = threading.Thread(
+            target=self._run_operator, args=(namespace, operator, stop), name=f"operator-{namespace}", daemon=True
+        )
+        self._operators[namespace] = (stop, thread)
+        self._started_at[namespace] = time.monotonic()
+        thread.start()
+        self._log.info("Started operator for namespace '{}'", namespace)
+
+    def _restart_crashed(self) -> None:
+        """Schedule a restart for every operator that stopped by itself and start those that are due."""
+        for namespace, (stop, thread) in list(self._operators.items()):
+            if not thread.is_alive() and not stop.is_set():
+                del self._operators[namespace]
+                self._log.warning("Operator for namespace '{}' stopped", namespace)
+                self._schedule_restart(namespace)
+        now = time.monotonic()
+        for namespace, restart_at in sorted(self._restart_at.items()):
+            if now >= restart_at:
+                del self._restart_at[namespace]
+                self._start(namespace)
+
+    def _schedule_restart(self, namespace: str) -> None:
+        """Start the operator of *namespace* again after its exponential back-off."""
+        now = time.monotonic()
+        crashes = self._crashes.get(namespace, 0)
+        started_at = self._started_at.pop(namespace, None)
+        if started_at is not None and now - started_at >= RESTART_BACKOFF_MAX:
+            crashes = 0
+        delay = min(RESTART_BACKOFF_INITIAL * 2**crashes, RESTART_BACKOFF_MAX)
+        self._crashes[namespace] = crashes + 1
+        self._restart_at[namespace] = now + delay
+        self._log.warning("Starting the operator for namespace '{}' again in {:.0f}s", namespace, delay)
+
+    def _run_operator(self, namespace: str, operator: NamespaceOperator, stop: threading.Event) -> None:
+        """Thread target — run *operator* until *stop* is set, logging a crash instead of dying silently."""
+        try:
+            operator.run(stop)
+        except Exception:
+            self._log.exception("Operator for namespace '{}' crashed", namespace)
+
+    def _make_operator(self, cfg: OperatorConfig) -> NamespaceOperator:
+        """Build the operator of one namespace for the configured engine."""
+        if cfg.engine == "async":
+            from flickr_immich_k8s_sync_operator.aio_operator import AsyncJobRestartOperator
+
+            return AsyncJobRestartOperator(cfg, metrics=self.metrics, governor=self.governor)
+        return JobRestartOperator(
+            cfg,
+            api_client=self._api_client,
+            metrics=self.metrics,
+            governor=self.governor,
+            cluster_jobs=self._cluster_jobs,
+        )
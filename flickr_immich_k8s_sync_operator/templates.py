@@ -0,0 +1,243 @@
+"""Job templates — restart manifests kept in a ConfigMap, CronJobs or FlickrSyncs instead of copied from every Job."""
+
+from __future__ import annotations
+
+import abc
+import json
+import threading
+import time
+from typing import Any, Callable
+
+import yaml
+from kubernetes import client
+from loguru import logger as glogger
+
+from flickr_immich_k8s_sync_operator.config import OperatorConfig
+from flickr_immich_k8s_sync_operator.flickrsync import GROUP, PLURAL, VERSION, FlickrSync
+
+# File name suffixes stripped from ConfigMap keys to get the Job name.
+TEMPLATE_KEY_SUFFIXES: tuple[str, ...] = (".yaml", ".yml", ".json")
+
+
+def cronjob_owner_reference(job: client.V1Job | dict[str, Any]) -> dict[str, Any] | None:
+    """Return the owner reference of the CronJob owning *job* (``V1Job`` model or plain dict), if any."""
+    if isinstance(job, dict):
+        references = list(job["metadata"].get("ownerReferences") or [])
+    else:
+        references = [
+            {
+                "apiVersion": ref.api_version,
+                "kind": ref.kind,
+                "name": ref.name,
+                "uid": ref.uid,
+                "controller": ref.controller,
+                "blockOwnerDeletion": ref.block_owner_deletion,
+            }
+            for ref in (job.metadata and job.metadata.owner_references) or []
+        ]
+    reference = next((ref for ref in references if ref.get("kind") == "CronJob" and ref.get("name")), None)
+    return None if reference is None else {key: value for key, value in reference.items() if value is not None}
+
+
+def cronjob_owner(job: client.V1Job | dict[str, Any]) -> str | None:
+    """Return the name of the CronJob owning *job* (``V1Job`` model or plain dict), if any."""
+    reference = cronjob_owner_reference(job)
+    return None if reference is None else reference["name"]
+
+
+def normalize_template(template: Any) -> dict[str, Any] | None:
+    """Return *template* as ``{"metadata": ..., "spec": <Job spec>}``, or ``None`` if it is none.
+
+    Accepts a Job manifest, a CronJob ``jobTemplate`` or a bare Pod template
+    (whose ``spec`` has ``containers``), which becomes the Job's ``spec.template``.
+    """
+    if not isinstance(template, dict) or not isinstance(template.get("spec"), dict):
+        return None
+    spec = template["spec"]
+    if "containers" in spec:
+        return {"metadata": {}, "spec": {"template": template}}
+    if not isinstance(spec.get("template"), dict):
+        return None
+    return {"metadata": template.get("metadata") or {}, "spec": spec}
+
+
+class JobTemplates(abc.ABC):
+    """Index of Job templates by name, loaded with a single request.
+
+    The index is built on first use and reloaded at most once per ``ttl``
+    seconds.  When a reload fails, the previous index stays in use.
+    Subclasses implement :meth:`_load`.
+    """
+
+    def __init__(self, namespace: str, ttl: float, clock: Callable[[], float] = time.monotonic) -> None:
+        """Initialise an empty index.
+
+        Args:
+            namespace: Namespace of the templates and of the Jobs created from them.
+            ttl: Seconds after which the index is reloaded on the next lookup.
+            clock: Monotonic time source (overridable for tests).
+        """
+        self._namespace = namespace
+        self._ttl = ttl
+        self._clock = clock
+        self._index: dict[str, dict[str, Any]] = {}
+        self._loaded_at: float | None = None
+        self._lock = threading.Lock()
+        self._log = glogger.bind(classname=self.__class__.__name__)
+
+    def manifest(self, job_name: str, owner: dict[str, Any] | None = None) -> dict[str, Any] | None:
+        """Return the manifest recreating *job_name*, or ``None`` if there is no template.
+
+        Args:
+            job_name: Name of the Job to create.
+            owner: Owner reference of the CronJob that spawned the Job, if any.
+                The template is then looked up by the CronJob name, and the
+                new Job is owned by the CronJob again (so it stays in the
+                CronJob's history and is found by the next restart).
+        """
+        with self._lock:
+            if self._loaded_at is None or self._clock() - self._loaded_at >= self._ttl:
+                self._refresh()
+            template = self._index.get(owner["name"] if owner else job_name)
+        if template is None:
+            return None
+        metadata: dict[str, Any] = {"name": job_name, "namespace": self._namespace}
+        for field in ("labels", "annotations", "ownerReferences"):
+            if template["metadata"].get(field):
+                metadata[field] = template["metadata"][field]
+        if owner:
+            metadata["ownerReferences"] = [owner]
+        return {"apiVersion": "batch/v1", "kind": "Job", "metadata": metadata, "spec": template["spec"]}
+
+    def _refresh(self) -> None:
+        """Reload the index (called with the lock held)."""
+        self._loaded_at = self._clock()
+        try:
+            self._index = self._load()
+        except client.ApiException as exc:
+            self._log.warning("Could not load the Job templates: {}", exc)
+            return
+        self._log.debug("Loaded {} Job template(s)", len(self._index))
+
+    @abc.abstractmethod
+    def _load(self) -> dict[str, dict[str, Any]]:
+        """Fetch and parse all templates, keyed by name."""
+
+
+class ConfigMapTemplates(JobTemplates):
+    """Templates stored in one ConfigMap, one key per Job.
+
+    Each key is a Job name (optionally ending in ``.yaml``, ``.yml`` or
+    ``.json``); its value is a Job manifest, a Job template or a Pod
+    template in YAML or JSON.
+    """
+
+    def __init__(self, core_v1: client.CoreV1Api, namespace: str, name: str, ttl: float) -> None:
+        """Initialise the source.
+
+        Args:
+            core_v1: API client used to read the ConfigMap.
+            namespace: Namespace of the ConfigMap and the Jobs.
+            name: Name of the ConfigMap.
+            ttl: Seconds after which the ConfigMap is read again.
+        """
+        super().__init__(namespace, ttl)
+        self._core_v1 = core_v1
+        self._name = name
+
+    def _load(self) -> dict[str, dict[str, Any]]:
+        resp = self._core_v1.read_namespaced_config_map(self._name, self._namespace, _preload_content=False)
+        data = json.loads(resp.data).get("data") or {}  # type: ignore[arg-type]
+        index: dict[str, dict[str, Any]] = {}
+        for key, value in data.items():
+            job_name = next((key[: -len(suffix)] for suffix in TEMPLATE_KEY_SUFFIXES if key.endswith(suffix)), key)
+            try:
+                template = normalize_template(yaml.safe_load(value))
+            except yaml.YAMLError as exc:
+                self._log.warning("Ignoring key {} of ConfigMap {}: {}", key, self._name, exc)
+                continue
+            if template is None:
+                self._log.warning("Ignoring key {} of ConfigMap {}: not a Job or Pod template", key, self._name)
+                continue
+            index[job_name] = template
+        return index
+
+
+class CronJobTemplates(JobTemplates):
+    """Templates taken from the ``jobTemplate`` of the CronJobs in the namespace, keyed by CronJob name."""
+
+    def __init__(self, batch_v1: client.BatchV1Api, namespace: str, ttl: float) -> None:
+        """Initialise the source.
+
+        Args:
+            batch_v1: API client used to list the CronJobs.
+            namespace: Namespace of the CronJobs and the Jobs.
+            ttl: Seconds after which the CronJobs are listed again.
+        """
+        super().__init__(namespace, ttl)
+        self._batch_v1 = batch_v1
+
+    def _load(self) -> dict[str, dict[str, Any]]:
+        resp = self._batch_v1.list_namespaced_cron_job(self._namespace, _preload_content=False)
+        index: dict[str, dict[str, Any]] = {}
+        for cronjob in json.loads(resp.data).get("items") or []:  # type: ignore[attr-defined]
+            template = normalize_template((cronjob.get("spec") or {}).get("jobTemplate"))
+            if template is not None:
+                index[cronjob["metadata"]["name"]] = template
+        return index
+
+
+class FlickrSyncTemplates(JobTemplates):
+    """Templates built from the ``FlickrSync`` resources in the namespace, keyed by Job (or CronJob) name.
+
+    The manifests keep the owner reference to the ``FlickrSync``, so a
+    restarted Job is still deleted along with its resource.
+    """
+
+    def __init__(self, custom_objects: client.CustomObjectsApi, namespace: str, ttl: float) -> None:
+        """Initialise the source.
+
+        Args:
+            custom_objects: API client used to list the ``FlickrSync`` resources.
+            namespace: Namespace of the resources and the Jobs.
+            ttl: Seconds after which the resources are listed again.
+        """
+        super().__init__(namespace, ttl)
+        self._custom_objects = custom_objects
+
+    def _load(self) -> dict[str, dict[str, Any]]:
+        resp = self._custom_objects.list_namespaced_custom_object(
+            GROUP, VERSION, self._namespace, PLURAL, _preload_content=False
+        )
+        index: dict[str, dict[str, Any]] = {}
+        for obj in json.loads(resp.data).get("items") or []:  # type: ignore[attr-defined]
+            try:
+                sync = FlickrSync.from_object(obj)
+            except ValueError:
+                continue
+            index[sync.job_name] = {"metadata": sync.job_metadata(), "spec": sync.job_spec()}
+        return index
+
+
+def open_job_templates(cfg: OperatorConfig, api_client: client.ApiClient) -> JobTemplates | None:
+    """Create the template source selected by ``cfg.template_source``.
+
+    Args:
+        cfg: Operator configuration (``template_source``, ``template_configmap``
+            and ``check_interval`` as reload interval).
+        api_client: API client shared with the operator.
+
+    Returns:
+        A :class:`ConfigMapTemplates`, :class:`CronJobTemplates` or
+        :class:`FlickrSyncTemplates`, or ``None`` for ``job`` (manifests are
+        copied from the Jobs themselves).
+    """
+    if cfg.template_source == "configmap":
+        return ConfigMapTemplates(
+            client.CoreV1Api(api_client), cfg.namespace, cfg.template_configmap, cfg.check_interval
+        )
+    if cfg.template_source == "cronjob":
+        return CronJobTemplates(client.BatchV1Api(api_client), cfg.namespace, cfg.check_interval)
+    if cfg.template_source == "flickrsync":
+        return FlickrSyncTemplates(client.CustomObjectsApi(api_client), cfg.namespace, cfg.check_interval)
+    return None
@@ -0,0 +1,173 @@
+"""Work queue of Job names — deduplicated, serialised per key and retried with back-off, like client-go's."""
+
+from __future__ import annotations
+
+import heapq
+import threading
+import time
+from collections import deque
+from typing import Callable
+
+# Per-key back-off (seconds) of a key whose processing failed; doubles with
+# every failure in a row up to the maximum.
+RETRY_BASE: float = 1.0
+RETRY_MAX: float = 300.0
+
+
+class WorkQueue:
+    """Queue of keys handed to a pool of workers.
+
+    A key added while it is already queued is not queued again, and a key
+    added while a worker processes it is queued only once that worker calls
+    :meth:`done` — so the same key is never processed by two workers at
+    once, and a burst of events for one key results in at most one more run.
+
+    Keys whose processing failed are re-added through :meth:`add_rate_limited`
+    after the larger of two delays: the per-key exponential back-off
+    (``retry_base`` doubling up to ``retry_max`` until :meth:`forget`) and
+    the overall token bucket of ``qps`` retries per second with a ``burst``.
+    """
+
+    def __init__(
+        self,
+        qps: float = 0.0,
+        burst: int = 1,
+        retry_base: float = RETRY_BASE,
+        retry_max: float = RETRY_MAX,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialise an empty queue.
+
+        Args:
+            qps: Retries per second across all keys; ``0`` disables the overall limit.
+            burst: Retries allowed at once before ``qps`` applies.
+            retry_base: Back-off after the first failure of a key.
+            retry_max: Upper bound of the per-key back-off.
+            clock: Monotonic time source (overridable for tests).
+        """
+        self._qps = qps
+        self._burst = burst
+        self._retry_base = retry_base
+        self._retry_max = retry_max
+        self._clock = clock
+        self._queue: deque[str] = deque()
+        # keys waiting to be processed: queued, or re-added while being processed
+        self._dirty: set[str] = set()
+        self._processing: set[str] = set()
+        # (due time, key) of keys added with a delay
+        self._delayed: list[tuple[float, str]] = []
+        self._failures: dict[str, int] = {}
+        self._tokens = float(burst)
+        self._refilled_at = clock()
+        self._shutting_down = False
+        self._cond = threading.Condition()
+
+    def __len__(self) -> int:
+        """Return the number of keys ready to be handed out."""
+        with self._cond:
+            return len(self._queue)
+
+    def add(self, key: str) -> None:
+        """Queue *key* unless it is already waiting."""
+        with self._cond:
+            self._add(key)
+
+    def add_after(self, key: str, delay: float) -> None:
+        """Queue *key* once *delay* seconds have passed."""
+        if delay <= 0:
+            self.add(key)
+            return
+        with self._cond:
+            if self._shutting_down:
+                return
+            heapq.heappush(self._delayed, (self._clock() + delay, key))
+            self._cond.notify()
+
+    def add_rate_limited(self, key: str) -> float:
+        """Re-add *key* after a failure, delayed by its back-off and the overall rate limit.
+
+        Returns:
+            The delay in seconds.
+        """
+        with self._cond:
+            failures = self._failures.get(key, 0)
+            self._failures[key] = failures + 1
+            delay = max(min(self._retry_base * 2**failures, self._retry_max), self._reserve(self._clock()))
+        self.add_after(key, delay)
+        return delay
+
+    def forget(self, key: str) -> None:
+        """Reset the back-off of *key* after it was processed successfully."""
+        with self._cond:
+            self._failures.pop(key, None)
+
+    def num_requeues(self, key: str) -> int:
+        """Return how often *key* failed in a row."""
+        with self._cond:
+            return self._failures.get(key, 0)
+
+    def get(self, timeout: float | None = None) -> str | None:
+        """Hand out the next key; the caller must call :meth:`done` with it afterwards.
+
+        Args:
+            timeout: Maximum seconds to wait for a key; ``None`` waits until
+                one is ready or the queue is shut down.
+
+        Returns:
+            The key, or ``None`` on timeout or shutdown.
+        """
+        with self._cond:
+            deadline = None if timeout is None else self._clock() + timeout
+            while True:
+                now = self._clock()
+                self._promote(now)
+                if self._shutting_down:
+                    return None
+                if self._queue:
+                    key = self._queue.popleft()
+                    self._dirty.discard(key)
+                    self._processing.add(key)
+                    return key
+                wait = self._delayed[0][0] - now if self._delayed else None
+                if deadline is not None:
+                    if deadline <= now:
+                        return None
+                    wait = deadline - now if wait is None else min(wait, deadline - now)
+                self._cond.wait(wait)
+
+    def done(self, key: str) -> None:
+        """Mark *key* as processed; it is queued again if it was re-added in the meantime."""
+        with self._cond:
+            self._processing.discard(key)
+            if key in self._dirty:
+                self._queue.append(key)
+                self._cond.notify()
+
+    def shut_down(self) -> None:
+        """Stop handing out keys and wake up all waiting workers."""
+        with self._cond:
+            self._shutting_down = True
+            self._cond.notify_all()
+
+    def _add(self, key: str) -> None:
+        """Queue *key* (called with the lock held)."""
+        if self._shutting_down or key in self._dirty:
+            return
+        self._dirty.add(key)
+        if key not in self._processing:
+            self._queue.append(key)
+            self._cond.notify()
+
+    def _promote(self, now: float) -> None:
+        """Queue the delayed keys that are due (called with the lock held)."""
+        while self._delayed and self._delayed[0][0] <= now:
+            self._add(heapq.heappop(self._delayed)[1])
+
+    def _reserve(self, now: float) -> float:
+        """Take a token of the overall bucket and return the seconds until it is available (lock held)."""
+        if self._qps <= 0:
+            return 0.0
+        self._tokens = min(float(self._burst), self._tokens + (now - self._refilled_at) * self._qps)
+        self._refilled_at = now
+        self._tokens -= 1
+        return max(0.0, -self._tokens / self._qps)
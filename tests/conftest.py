@@ -1 +1,23 @@
+from typing import Callable
+
 import pytest
+
+from flickr_immich_k8s_sync_operator.config import OperatorConfig
+from flickr_immich_k8s_sync_operator.operator import JobRestartOperator
+from tests.fake_k8s import FakeCluster, make_operator
+
+
+@pytest.fixture
+def cluster() -> FakeCluster:
+    """Return an empty in-process fake Kubernetes cluster."""
+    return FakeCluster()
+
+
+@pytest.fixture
+def operator_for(cluster: FakeCluster) -> Callable[[OperatorConfig], JobRestartOperator]:
+    """Return a factory that builds a :class:`JobRestartOperator` wired to the ``cluster`` fixture."""
+
+    def _make(cfg: OperatorConfig) -> JobRestartOperator:
+        return make_operator(cfg, cluster)
+
+    return _make
@@ -0,0 +1,729 @@
+"""In-process fake of the Kubernetes API endpoints used by the operator.
+
+:class:`FakeCluster` holds Jobs, Pods, Pod logs (and the other resources the
+operator reads, like CronJobs and ``FlickrSync`` resources) in memory and hands out
+``batch_v1`` / ``core_v1`` stand-ins that mimic the methods of
+:class:`kubernetes.client.BatchV1Api` and :class:`kubernetes.client.CoreV1Api`
+the operator calls — including WATCH streams of Jobs, which
+:class:`kubernetes.watch.Watch` consumes like those of a real API server.
+Every request is counted per method in :attr:`FakeCluster.calls` so tests
+and benchmarks can assert on API traffic, and can be slowed down
+(:attr:`FakeCluster.latency`) or failed at random
+(:attr:`FakeCluster.failure_rate`).
+"""
+
+from __future__ import annotations
+
+import bisect
+import json
+import random
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from typing import Any, Iterator
+from unittest import mock
+
+from kubernetes import client
+
+from flickr_immich_k8s_sync_operator import operator as operator_module
+from flickr_immich_k8s_sync_operator.config import OperatorConfig
+from flickr_immich_k8s_sync_operator.operator import JobRestartOperator
+
+_API_CLIENT = client.ApiClient()
+
+# Seconds an idle WATCH stream waits for changes before it sends a BOOKMARK event.
+BOOKMARK_INTERVAL: float = 0.05
+
+
+def _deserialize(payload: Any, type_name: str) -> Any:
+    """Turn a JSON-compatible *payload* into a kubernetes model of *type_name*."""
+    text = json.dumps(payload)
+    try:
+        return _API_CLIENT.deserialize(text, type_name, "application/json")  # type: ignore[call-arg]
+    except TypeError:
+        # kubernetes < 31 expects a response-like object instead of the text.
+        return _API_CLIENT.deserialize(SimpleNamespace(data=text), type_name)  # type: ignore[call-arg, arg-type]
+
+
+class _RawResponse:
+    """Mimics the urllib3 response returned for ``_preload_content=False``."""
+
+    def __init__(self, payload: Any) -> None:
+        self.data = json.dumps(payload).encode()
+
+
+def _matches(labels: dict[str, str], label_selector: str | None) -> bool:
+    """Evaluate an equality-based label selector (``a=b,c=d``, or ``a`` for existence) against *labels*."""
+    if not label_selector:
+        return True
+    for term in label_selector.split(","):
+        key, equals, value = term.partition("=")
+        if equals and labels.get(key.strip()) != value.strip():
+            return False
+        if not equals and key.strip() not in labels:
+            return False
+    return True
+
+
+def _iso(ts: datetime) -> str:
+    return ts.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def job_dict(
+    name: str,
+    namespace: str = "flickr-downloader",
+    *,
+    active: int = 0,
+    failed_at: datetime | None = None,
+    succeeded: bool = False,
+    started_at: datetime | None = None,
+    labels: dict[str, str] | None = None,
+) -> dict[str, Any]:
+    """Return a realistic serialised Job dict in the requested state."""
+    conditions: list[dict[str, Any]] = []
+    if failed_at is not None:
+        conditions.append(
+            {
+                "type": "Failed",
+                "status": "True",
+                "reason": "BackoffLimitExceeded",
+                "lastTransitionTime": _iso(failed_at),
+            }
+        )
+    elif succeeded:
+        conditions.append(
+            {"type": "Complete", "status": "True", "lastTransitionTime": _iso(datetime.now(timezone.utc))}
+        )
+    return {
+        "apiVersion": "batch/v1",
+        "kind": "Job",
+        "metadata": {
+            "name": name,
+            "namespace": namespace,
+            "labels": dict(labels or {"app": "flickr-downloader"}),
+        },
+        "spec": {
+            "backoffLimit": 3,
+            "template": {
+                "metadata": {"labels": {"app": "flickr-downloader"}},
+                "spec": {
+                    "containers": [{"name": "downloader", "image": "flickr-dl:latest"}],
+                    "restartPolicy": "Never",
+                },
+            },
+        },
+        "status": {
+            "active": active or None,
+            "conditions": conditions or None,
+            "startTime": _iso(started_at) if started_at is not None else None,
+        },
+    }
+
+
+def large_job_dict(
+    name: str,
+    namespace: str = "flickr-downloader",
+    *,
+    env_vars: int = 40,
+    volumes: int = 12,
+    managed_fields: int = 6,
+    **state: Any,
+) -> dict[str, Any]:
+    """Return a :func:`job_dict` bulked up like a real per-user download Job.
+
+    Adds environment variables, hostPath volumes and mounts, annotations
+    and ``managedFields`` entries, which dominate the size of real Jobs.
+    """
+    job = job_dict(name, namespace, **state)
+    container = job["spec"]["template"]["spec"]["containers"][0]
+    container["env"] = [{"name": f"FLICKR_SETTING_{i}", "value": f"value-{i}-" + "x" * 40} for i in range(env_vars)]
+    container["volumeMounts"] = [{"name": f"vol-{i}", "mountPath": f"/data/mount-{i}"} for i in range(volumes)]
+    container["resources"] = {"requests": {"cpu": "50m", "memory": "128Mi"}, "limits": {"memory": "512Mi"}}
+    job["spec"]["template"]["spec"]["volumes"] = [
+        {"name": f"vol-{i}", "hostPath": {"path": f"/srv/flickr/{name}/dir-{i}", "type": "DirectoryOrCreate"}}
+        for i in range(volumes)
+    ]
+    job["metadata"]["annotations"] = {
+        "kubectl.kubernetes.io/last-applied-configuration": json.dumps(job["spec"]),
+    }
+    job["metadata"]["managedFields"] = [
+        {
+            "manager": f"manager-{i}",
+            "operation": "Update",
+            "apiVersion": "batch/v1",
+            "time": "2025-01-01T00:00:00Z",
+            "fieldsType": "FieldsV1",
+            "fieldsV1": {f"f:spec": {f"f:field-{j}": {} for j in range(20)}},
+        }
+        for i in range(managed_fields)
+    ]
+    return job
+
+
+class _WatchResponse:
+    """Mimics the streaming urllib3 response of a Job WATCH request.
+
+    Replays the Job events after *resource_version* from the cluster's event
+    log and then follows new ones as they happen.  While nothing changes a
+    ``BOOKMARK`` event is sent every :data:`BOOKMARK_INTERVAL` seconds, which
+    also lets :meth:`kubernetes.watch.Watch.stop` take effect promptly.
+    """
+
+    status = 200
+
+    def __init__(
+        self,
+        cluster: FakeCluster,
+        namespace: str | None,
+        label_selector: str | None,
+        resource_version: str | None,
+        timeout_seconds: float | None,
+    ) -> None:
+        self._cluster = cluster
+        self._namespace = namespace
+        self._label_selector = label_selector
+        self._last = int(resource_version or 0)
+        self._deadline = time.monotonic() + (timeout_seconds or 3600)
+        self._closed = False
+
+    def stream(self, amt: int | None = None, decode_content: bool = False) -> Iterator[bytes]:
+        while not self._closed and time.monotonic() < self._deadline:
+            events = self._cluster.events_since(self._last, timeout=BOOKMARK_INTERVAL)
+            if not events:
+                bookmark = {"kind": "Job", "apiVersion": "batch/v1", "metadata": {"resourceVersion": str(self._last)}}
+                yield json.dumps({"type": "BOOKMARK", "object": bookmark}).encode() + b"\n"
+                continue
+            for resource_version, namespace, labels, line in events:
+                self._last = resource_version
+                if self._namespace in (None, namespace) and _matches(labels, self._label_selector):
+                    yield line
+
+    def close(self) -> None:
+        self._closed = True
+
+    def release_conn(self) -> None:
+        pass
+
+
+class FakeCluster:
+    """In-memory Jobs/Pods/logs plus per-method request counters."""
+
+    def __init__(self, seed: int = 0) -> None:
+        """Create an empty cluster.
+
+        Args:
+            seed: Seed of the random generator deciding injected failures.
+        """
+        self.jobs: dict[tuple[str, str], dict[str, Any]] = {}
+        self.pods: dict[tuple[str, str], dict[str, Any]] = {}
+        self.logs: dict[tuple[str, str], str] = {}
+        self.leases: dict[tuple[str, str], dict[str, Any]] = {}
+        self.config_maps: dict[tuple[str, str], dict[str, Any]] = {}
+        self.cron_jobs: dict[tuple[str, str], dict[str, Any]] = {}
+        self.flickrsyncs: dict[tuple[str, str], dict[str, Any]] = {}
+        self.calls: Counter[str] = Counter()
+        # Number of API requests a Foreground-deleted Job stays visible
+        # (with ``deletionTimestamp`` set) before garbage collection removes it.
+        self.gc_requests = 0
+        self._terminating: dict[tuple[str, str], int] = {}
+        # Seconds every request takes, to simulate API server latency.
+        self.latency = 0.0
+        # Probability that a request fails with ``failure_status`` instead of being served.
+        self.failure_rate = 0.0
+        self.failure_status = 500
+        self.random = random.Random(seed)
+        # Job events as (resourceVersion, namespace, labels, encoded WATCH line), oldest first.
+        self._events: list[tuple[int, str, dict[str, str], bytes]] = []
+        self._event_versions: list[int] = []
+        self._changed = threading.Condition()
+        self._resource_version = 0
+        self._uid = 0
+        self.batch_v1 = FakeBatchV1Api(self)
+        self.core_v1 = FakeCoreV1Api(self)
+        self.coordination_v1 = FakeCoordinationV1Api(self)
+        self.custom_objects = FakeCustomObjectsApi(self)
+
+    def next_resource_version(self) -> str:
+        with self._changed:
+            self._resource_version += 1
+            return str(self._resource_version)
+
+    def add_job(self, job: dict[str, Any]) -> dict[str, Any]:
+        """Store *job*, assigning server-managed metadata like a real API server."""
+        meta = job["metadata"]
+        self._uid += 1
+        meta["uid"] = f"uid-{self._uid}"
+        meta.setdefault("generation", 1)
+        meta.setdefault("creationTimestamp", _iso(datetime.now(timezone.utc)))
+        labels = job["spec"]["template"].setdefault("metadata", {}).setdefault("labels", {})
+        labels["controller-uid"] = meta["uid"]
+        labels["job-name"] = meta["name"]
+        self.jobs[(meta["namespace"], meta["name"])] = job
+        self._emit("ADDED", job)
+        return job
+
+    def add_pod(
+        self,
+        job_name: str,
+        pod_name: str,
+        namespace: str = "flickr-downloader",
+        *,
+        exit_code: int = 1,
+        reason: str = "Error",
+        log: str = "line 1\nline 2\n",
+        created: datetime | None = None,
+    ) -> None:
+        """Add a terminated Pod owned by *job_name* with the given log output (created *created*, default now)."""
+        self._uid += 1
+        self.pods[(namespace, pod_name)] = {
+            "metadata": {
+                "name": pod_name,
+                "namespace": namespace,
+                "uid": f"pod-uid-{self._uid}",
+                "creationTimestamp": _iso(created or datetime.now(timezone.utc)),
+                "labels": {"job-name": job_name},
+            },
+            "status": {
+                "containerStatuses": [
+                    {
+                        "name": "downloader",
+                        "image": "flickr-dl:latest",
+                        "imageID": "",
+                        "ready": False,
+                        "restartCount": 0,
+                        "state": {"terminated": {"exitCode": exit_code, "reason": reason}},
+                    }
+                ]
+            },
+        }
+        self.logs[(namespace, pod_name)] = log
+
+    def update_status(self, name: str, namespace: str = "flickr-downloader", **status: Any) -> None:
+        """Replace fields of a Job's status, bumping its ``resourceVersion`` (but not its generation)."""
+        job = self.jobs[(namespace, name)]
+        job["status"].update(status)
+        self._emit("MODIFIED", job)
+
+    def add_flickrsync(self, name: str, spec: dict[str, Any], namespace: str = "flickr-downloader") -> dict[str, Any]:
+        """Store a ``FlickrSync`` resource with *spec*, or replace the spec of an existing one (bumping its generation)."""
+        obj = self.flickrsyncs.get((namespace, name))
+        if obj is None:
+            self._uid += 1
+            obj = {
+                "apiVersion": "flickr.xomox.cc/v1alpha1",
+                "kind": "FlickrSync",
+                "metadata": {"name": name, "namespace": namespace, "uid": f"uid-{self._uid}", "generation": 0},
+            }
+            self.flickrsyncs[(namespace, name)] = obj
+        obj["spec"] = spec
+        obj["metadata"]["generation"] += 1
+        obj["metadata"]["resourceVersion"] = self.next_resource_version()
+        return obj
+
+    def reset_calls(self) -> None:
+        self.calls.clear()
+
+    def record(self, method: str) -> None:
+        """Count a request to *method*, advance pending garbage collection and apply latency and failures.
+
+        Raises:
+            client.ApiException: With :attr:`failure_status` for the share
+                :attr:`failure_rate` of all requests.
+        """
+        self.calls[method] += 1
+        for key in list(self._terminating):
+            self._terminating[key] -= 1
+            if self._terminating[key] <= 0:
+                del self._terminating[key]
+                self._collect(key)
+        if self.latency:
+            time.sleep(self.latency)
+        if self.failure_rate and self.random.random() < self.failure_rate:
+            raise client.ApiException(status=self.failure_status, reason="Injected failure")
+
+    def events_since(self, resource_version: int, timeout: float = 0.0) -> list[tuple[int, str, dict[str, str], bytes]]:
+        """Return the Job events after *resource_version*, waiting up to *timeout* seconds for one."""
+        with self._changed:
+            index = bisect.bisect_right(self._event_versions, resource_version)
+            if index == len(self._events) and timeout > 0:
+                self._changed.wait(timeout=timeout)
+                index = bisect.bisect_right(self._event_versions, resource_version)
+            return self._events[index:]
+
+    def _emit(self, event_type: str, job: dict[str, Any]) -> None:
+        """Give *job* a new ``resourceVersion``, append a WATCH event for it and wake up the streams."""
+        meta = job["metadata"]
+        with self._changed:
+            meta["resourceVersion"] = self.next_resource_version()
+            resource_version = int(meta["resourceVersion"])
+            line = json.dumps({"type": event_type, "object": job}).encode() + b"\n"
+            self._events.append((resource_version, meta["namespace"], dict(meta.get("labels") or {}), line))
+            self._event_versions.append(resource_version)
+            self._changed.notify_all()
+
+    def _collect(self, key: tuple[str, str]) -> None:
+        """Remove a Job and the Pods it owns."""
+        namespace, name = key
+        job = self.jobs.pop(key, None)
+        if job is not None:
+            self._emit("DELETED", job)
+        for pod_key in [
+            k for k, pod in self.pods.items() if k[0] == namespace and pod["metadata"]["labels"].get("job-name") == name
+        ]:
+            self.pods.pop(pod_key)
+            self.logs.pop(pod_key, None)
+
+
+class FakeBatchV1Api:
+    """Subset of :class:`kubernetes.client.BatchV1Api` backed by a :class:`FakeCluster`."""
+
+    def __init__(self, cluster: FakeCluster) -> None:
+        self._cluster = cluster
+
+    def read_namespaced_job(self, name: str, namespace: str, **kwargs: Any) -> Any:
+        self._cluster.record("read_namespaced_job")
+        job = self._cluster.jobs.get((namespace, name))
+        if job is None:
+            raise client.ApiException(status=404, reason="Not Found")
+        if kwargs.get("_preload_content", True) is False:
+            return _RawResponse(job)
+        return _deserialize(job, "V1Job")
+
+    def list_namespaced_job(self, namespace: str, label_selector: str | None = None, **kwargs: Any) -> Any:
+        return self._list_jobs("namespaced", namespace, label_selector, **kwargs)
+
+    def list_job_for_all_namespaces(self, label_selector: str | None = None, **kwargs: Any) -> Any:
+        return self._list_jobs("all_namespaces", None, label_selector, **kwargs)
+
+    def _list_jobs(self, scope: str, namespace: str | None, label_selector: str | None, **kwargs: Any) -> Any:
+        """Serve a LIST or WATCH of the Jobs of *namespace* (``None``: all namespaces), counted per *scope*."""
+        if kwargs.get("watch"):
+            self._cluster.record(f"watch_{scope}_job")
+            return _WatchResponse(
+                self._cluster, namespace, label_selector, kwargs.get("resource_version"), kwargs.get("timeout_seconds")
+            )
+        self._cluster.record(f"list_{scope}_job")
+        items = [
+            job
+            for (ns, _), job in self._cluster.jobs.items()
+            if namespace in (None, ns) and _matches(job["metadata"].get("labels") or {}, label_selector)
+        ]
+        payload = {
+            "apiVersion": "batch/v1",
+            "kind": "JobList",
+            "metadata": {"resourceVersion": str(self._cluster._resource_version)},
+            "items": items,
+        }
+        if kwargs.get("_preload_content", True) is False:
+            return _RawResponse(payload)
+        return _deserialize(payload, "V1JobList")
+
+    def delete_namespaced_job(self, name: str, namespace: str, **kwargs: Any) -> Any:
+        self._cluster.record("delete_namespaced_job")
+        key = (namespace, name)
+        job = self._cluster.jobs.get(key)
+        if job is None:
+            raise client.ApiException(status=404, reason="Not Found")
+        body = kwargs.get("body")
+        policy = body.get("propagationPolicy") if isinstance(body, dict) else getattr(body, "propagation_policy", None)
+        if self._cluster.gc_requests > 0 and policy != "Background":
+            job["metadata"]["deletionTimestamp"] = _iso(datetime.now(timezone.utc))
+            self._cluster._emit("MODIFIED", job)
+            self._cluster._terminating.setdefault(key, self._cluster.gc_requests)
+            # A real API server returns the Job itself while finalizers hold it.
+            return _deserialize({"kind": "Job", "apiVersion": "batch/v1"}, "V1Status")
+        self._cluster._collect(key)
+        return _deserialize({"kind": "Status", "apiVersion": "v1", "status": "Success"}, "V1Status")
+
+    def create_namespaced_job(self, namespace: str, body: Any, **kwargs: Any) -> Any:
+        self._cluster.record("create_namespaced_job")
+        manifest = json.loads(json.dumps(_API_CLIENT.sanitize_for_serialization(body)))
+        name = manifest["metadata"]["name"]
+        if (namespace, name) in self._cluster.jobs:
+            raise client.ApiException(status=409, reason="AlreadyExists")
+        manifest.setdefault("status", {})
+        return self._cluster.add_job(manifest)
+
+    def list_namespaced_cron_job(self, namespace: str, label_selector: str | None = None, **kwargs: Any) -> Any:
+        self._cluster.record("list_namespaced_cron_job")
+        items = [
+            cronjob
+            for (ns, _), cronjob in self._cluster.cron_jobs.items()
+            if ns == namespace and _matches(cronjob["metadata"].get("labels") or {}, label_selector)
+        ]
+        payload = {"apiVersion": "batch/v1", "kind": "CronJobList", "metadata": {}, "items": items}
+        if kwargs.get("_preload_content", True) is False:
+            return _RawResponse(payload)
+        return _deserialize(payload, "V1CronJobList")
+
+    def patch_namespaced_job(self, name: str, namespace: str, body: Any, **kwargs: Any) -> Any:
+        """Serve server-side apply requests only, the way the operator sends them."""
+        self._cluster.record("patch_namespaced_job")
+        if kwargs.get("_content_type") != "application/apply-patch+yaml":
+            raise client.ApiException(status=415, reason="Unsupported Media Type")
+        if not kwargs.get("field_manager"):
+            raise client.ApiException(status=400, reason="fieldManager is required for apply requests")
+        manifest = json.loads(json.dumps(_API_CLIENT.sanitize_for_serialization(body)))
+        managed_fields = [{"manager": kwargs["field_manager"], "operation": "Apply"}]
+        job = self._cluster.jobs.get((namespace, name))
+        if job is None:
+            manifest.setdefault("status", {})
+            manifest["metadata"]["managedFields"] = managed_fields
+            job = self._cluster.add_job(manifest)
+        else:
+            job["spec"].update(manifest["spec"])
+            job["metadata"]["generation"] += 1
+            job["metadata"]["managedFields"] = managed_fields
+            self._cluster._emit("MODIFIED", job)
+        return _deserialize(job, "V1Job")
+
+    def patch_namespaced_cron_job(self, name: str, namespace: str, body: Any, **kwargs: Any) -> Any:
+        """Serve server-side apply requests only; the CronJob replaces any existing one."""
+        self._cluster.record("patch_namespaced_cron_job")
+        if kwargs.get("_content_type") != "application/apply-patch+yaml":
+            raise client.ApiException(status=415, reason="Unsupported Media Type")
+        manifest = json.loads(json.dumps(_API_CLIENT.sanitize_for_serialization(body)))
+        manifest["metadata"]["resourceVersion"] = self._cluster.next_resource_version()
+        self._cluster.cron_jobs[(namespace, name)] = manifest
+        return _deserialize(manifest, "V1CronJob")
+
+    def delete_namespaced_cron_job(self, name: str, namespace: str, **kwargs: Any) -> Any:
+        self._cluster.record("delete_namespaced_cron_job")
+        if self._cluster.cron_jobs.pop((namespace, name), None) is None:
+            raise client.ApiException(status=404, reason="Not Found")
+        return _deserialize({"kind": "Status", "apiVersion": "v1", "status": "Success"}, "V1Status")
+
+
+class FakeCoreV1Api:
+    """Subset of :class:`kubernetes.client.CoreV1Api` backed by a :class:`FakeCluster`."""
+
+    def __init__(self, cluster: FakeCluster) -> None:
+        self._cluster = cluster
+
+    def list_namespace(self, **kwargs: Any) -> Any:
+        """List every namespace that contains a Job or Pod."""
+        self._cluster.record("list_namespace")
+        names = sorted({ns for ns, _ in self._cluster.jobs} | {ns for ns, _ in self._cluster.pods})
+        items = [{"metadata": {"name": name}} for name in names]
+        return _deserialize(
+            {"apiVersion": "v1", "kind": "NamespaceList", "metadata": {}, "items": items}, "V1NamespaceList"
+        )
+
+    def read_namespaced_config_map(self, name: str, namespace: str, **kwargs: Any) -> Any:
+        self._cluster.record("read_namespaced_config_map")
+        config_map = self._cluster.config_maps.get((namespace, name))
+        if config_map is None:
+            raise client.ApiException(status=404, reason="Not Found")
+        if kwargs.get("_preload_content", True) is False:
+            return _RawResponse(config_map)
+        return _deserialize(config_map, "V1ConfigMap")
+
+    def create_namespaced_config_map(self, namespace: str, body: Any, **kwargs: Any) -> Any:
+        self._cluster.record("create_namespaced_config_map")
+        config_map = json.loads(json.dumps(_API_CLIENT.sanitize_for_serialization(body)))
+        key = (namespace, config_map["metadata"]["name"])
+        if key in self._cluster.config_maps:
+            raise client.ApiException(status=409, reason="AlreadyExists")
+        config_map["metadata"]["resourceVersion"] = self._cluster.next_resource_version()
+        self._cluster.config_maps[key] = config_map
+        return _deserialize(config_map, "V1ConfigMap")
+
+    def patch_namespaced_config_map(self, name: str, namespace: str, body: Any, **kwargs: Any) -> Any:
+        """Apply a JSON merge patch of ``data`` (``None`` removes a key)."""
+        self._cluster.record("patch_namespaced_config_map")
+        if kwargs.get("_content_type") != "application/merge-patch+json":
+            raise client.ApiException(status=415, reason="Unsupported Media Type")
+        config_map = self._cluster.config_maps.get((namespace, name))
+        if config_map is None:
+            raise client.ApiException(status=404, reason="Not Found")
+        data = config_map.setdefault("data", {})
+        for key, value in (body.get("data") or {}).items():
+            if value is None:
+                data.pop(key, None)
+            else:
+                data[key] = value
+        config_map["metadata"]["resourceVersion"] = self._cluster.next_resource_version()
+        return _deserialize(config_map, "V1ConfigMap")
+
+    def list_namespaced_pod(self, namespace: str, label_selector: str | None = None, **kwargs: Any) -> Any:
+        self._cluster.record("list_namespaced_pod")
+        items = [
+            pod
+            for (ns, _), pod in self._cluster.pods.items()
+            if ns == namespace and _matches(pod["metadata"].get("labels") or {}, label_selector)
+        ]
+        payload = {"apiVersion": "v1", "kind": "PodList", "metadata": {}, "items": items}
+        if kwargs.get("_preload_content", True) is False:
+            return _RawResponse(payload)
+        return _deserialize(payload, "V1PodList")
+
+    def read_namespaced_pod_log(self, name: str, namespace: str, tail_lines: int | None = None, **kwargs: Any) -> str:
+        self._cluster.record("read_namespaced_pod_log")
+        log = self._cluster.logs.get((namespace, name))
+        if log is None:
+            raise client.ApiException(status=404, reason="Not Found")
+        lines = log.splitlines()
+        if tail_lines is not None:
+            lines = lines[-tail_lines:]
+        return "\n".join(lines)
+
+
+class FakeCoordinationV1Api:
+    """Subset of :class:`kubernetes.client.CoordinationV1Api` with optimistic concurrency on Leases."""
+
+    def __init__(self, cluster: FakeCluster) -> None:
+        self._cluster = cluster
+
+    def read_namespaced_lease(self, name: str, namespace: str, **kwargs: Any) -> Any:
+        self._cluster.record("read_namespaced_lease")
+        lease = self._cluster.leases.get((namespace, name))
+        if lease is None:
+            raise client.ApiException(status=404, reason="Not Found")
+        return _deserialize(lease, "V1Lease")
+
+    def create_namespaced_lease(self, namespace: str, body: Any, **kwargs: Any) -> Any:
+        self._cluster.record("create_namespaced_lease")
+        lease = _API_CLIENT.sanitize_for_serialization(body)
+        key = (namespace, lease["metadata"]["name"])
+        if key in self._cluster.leases:
+            raise client.ApiException(status=409, reason="AlreadyExists")
+        lease["metadata"]["resourceVersion"] = self._cluster.next_resource_version()
+        self._cluster.leases[key] = lease
+        return _deserialize(lease, "V1Lease")
+
+    def list_namespaced_lease(self, namespace: str, label_selector: str | None = None, **kwargs: Any) -> Any:
+        self._cluster.record("list_namespaced_lease")
+        items = [
+            lease
+            for (ns, _), lease in self._cluster.leases.items()
+            if ns == namespace and _matches(lease["metadata"].get("labels") or {}, label_selector)
+        ]
+        return _deserialize(
+            {"apiVersion": "coordination.k8s.io/v1", "kind": "LeaseList", "items": items}, "V1LeaseList"
+        )
+
+    def delete_namespaced_lease(self, name: str, namespace: str, **kwargs: Any) -> None:
+        self._cluster.record("delete_namespaced_lease")
+        if self._cluster.leases.pop((namespace, name), None) is None:
+            raise client.ApiException(status=404, reason="Not Found")
+
+    def replace_namespaced_lease(self, name: str, namespace: str, body: Any, **kwargs: Any) -> Any:
+        self._cluster.record("replace_namespaced_lease")
+        lease = _API_CLIENT.sanitize_for_serialization(body)
+        current = self._cluster.leases.get((namespace, name))
+        if current is None:
+            raise client.ApiException(status=404, reason="Not Found")
+        if lease["metadata"].get("resourceVersion") != current["metadata"]["resourceVersion"]:
+            raise client.ApiException(status=409, reason="Conflict")
+        lease["metadata"]["resourceVersion"] = self._cluster.next_resource_version()
+        self._cluster.leases[(namespace, name)] = lease
+        return _deserialize(lease, "V1Lease")
+
+
+class FakeCustomObjectsApi:
+    """Subset of :class:`kubernetes.client.CustomObjectsApi` serving ``FlickrSync`` resources."""
+
+    def __init__(self, cluster: FakeCluster) -> None:
+        self._cluster = cluster
+
+    def list_namespaced_custom_object(
+        self, group: str, version: str, namespace: str, plural: str, label_selector: str | None = None, **kwargs: Any
+    ) -> Any:
+        self._cluster.record("list_namespaced_custom_object")
+        items = [
+            obj
+            for (ns, _), obj in self._cluster.flickrsyncs.items()
+            if ns == namespace and _matches(obj["metadata"].get("labels") or {}, label_selector)
+        ]
+        payload = {"apiVersion": f"{group}/{version}", "kind": "FlickrSyncList", "metadata": {}, "items": items}
+        if kwargs.get("_preload_content", True) is False:
+            return _RawResponse(payload)
+        return json.loads(json.dumps(payload))
+
+    def patch_namespaced_custom_object_status(
+        self, group: str, version: str, namespace: str, plural: str, name: str, body: Any, **kwargs: Any
+    ) -> Any:
+        """Merge ``body["status"]`` into the status; the spec and generation are left alone."""
+        self._cluster.record("patch_namespaced_custom_object_status")
+        if kwargs.get("_content_type") != "application/merge-patch+json":
+            raise client.ApiException(status=415, reason="Unsupported Media Type")
+        obj = self._cluster.flickrsyncs.get((namespace, name))
+        if obj is None:
+            raise client.ApiException(status=404, reason="Not Found")
+        obj.setdefault("status", {}).update(body.get("status") or {})
+        obj["metadata"]["resourceVersion"] = self._cluster.next_resource_version()
+        return json.loads(json.dumps(obj))
+
+
+def make_operator(cfg: OperatorConfig, cluster: FakeCluster | None = None) -> JobRestartOperator:
+    """Build a :class:`JobRestartOperator` wired to *cluster* instead of a real API server."""
+    with mock.patch.object(operator_module.config, "load_incluster_config"):
+        op = JobRestartOperator(cfg)
+    if cluster is not None:
+        op._batch_v1 = cluster.batch_v1  # type: ignore[assignment]
+        op._core_v1 = cluster.core_v1  # type: ignore[assignment]
+        if op._reconciler is not None:
+            op._reconciler._batch_v1 = cluster.batch_v1  # type: ignore[assignment]
+            op._reconciler._custom_objects = cluster.custom_objects  # type: ignore[assignment]
+        if op._markers is not None:
+            op._markers._core_v1 = cluster.core_v1  # type: ignore[assignment]
+    return op
+
+
+class _AsyncRawResponse:
+    """Mimics the aiohttp response ``kubernetes_asyncio`` returns for ``_preload_content=False``."""
+
+    def __init__(self, status: int, payload: Any = None, reason: str = "OK") -> None:
+        self.status = status
+        self.reason = reason
+        self._body = json.dumps(payload).encode()
+
+    async def read(self) -> bytes:
+        return self._body
+
+    def release(self) -> None:
+        pass
+
+
+class _AsyncAdapter:
+    """Exposes the methods of a sync fake API as coroutines, the way ``kubernetes_asyncio`` does.
+
+    ``_preload_content=False`` requests return a response object instead of
+    raising on non-2xx status codes, and exceptions are re-raised as
+    ``kubernetes_asyncio`` :class:`ApiException` instances.
+    """
+
+    def __init__(self, sync_api: Any) -> None:
+        self._sync_api = sync_api
+
+    def __getattr__(self, name: str) -> Any:
+        method = getattr(self._sync_api, name)
+
+        async def call(*args: Any, **kwargs: Any) -> Any:
+            from kubernetes_asyncio.client import ApiException as AsyncApiException
+
+            raw = kwargs.get("_preload_content", True) is False
+            try:
+                result = method(*args, **kwargs)
+            except client.ApiException as exc:
+                if raw:
+                    return _AsyncRawResponse(exc.status, {"kind": "Status", "code": exc.status}, exc.reason)
+                raise AsyncApiException(status=exc.status, reason=exc.reason) from exc
+            if raw:
+                return _AsyncRawResponse(200, json.loads(result.data))
+            return result
+
+        return call
+
+
+def make_async_operator(cfg: OperatorConfig, cluster: FakeCluster) -> Any:
+    """Build an ``AsyncJobRestartOperator`` wired to *cluster* through coroutine adapters."""
+    from flickr_immich_k8s_sync_operator import aio_operator
+
+    with mock.patch.object(aio_operator.config, "load_incluster_config"):
+        op = aio_operator.AsyncJobRestartOperator(cfg)
+    op._batch_v1 = _AsyncAdapter(cluster.batch_v1)
+    op._core_v1 = _AsyncAdapter(cluster.core_v1)
+    return op
@@ -0,0 +1,216 @@
+"""Tests for :mod:`flickr_immich_k8s_sync_operator.aio_operator`."""
+
+import asyncio
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+
+from flickr_immich_k8s_sync_operator.config import OperatorConfig
+from flickr_immich_k8s_sync_operator.operator import build_manifest
+from flickr_immich_k8s_sync_operator.state_store import FileStateStore, JobRecord
+from tests.fake_k8s import FakeCluster, job_dict, make_async_operator
+
+pytest.importorskip("kubernetes_asyncio")
+
+
+def _config(**overrides: object) -> OperatorConfig:
+    """Return an :class:`OperatorConfig` for the async engine."""
+    values: dict = {  # type: ignore[type-arg]
+        "namespace": "flickr-downloader",
+        "job_names": ["job-a", "job-b"],
+        "check_interval": 60,
+        "restart_delay": 60,
+        "skip_delay_on_oom": False,
+        "engine": "async",
+    }
+    values.update(overrides)
+    return OperatorConfig(**values)
+
+
+def _run_cycle(op: object, cycle: str) -> None:
+    """Run a single check cycle of *op* on a fresh event loop."""
+
+    async def _main() -> None:
+        op._stop = asyncio.Event()  # type: ignore[attr-defined]
+        op._semaphore = asyncio.Semaphore(op._cfg.workers)  # type: ignore[attr-defined]
+        await getattr(op, cycle)()
+
+    asyncio.run(_main())
+
+
+class TestAsyncJobRestartOperator:
+    """Tests for :class:`AsyncJobRestartOperator`."""
+
+    def test_list_cycle_restarts_failed_job(self, cluster: FakeCluster) -> None:
+        long_ago = datetime.now(timezone.utc) - timedelta(hours=2)
+        cluster.add_job(job_dict("job-a", failed_at=long_ago))
+        cluster.add_pod("job-a", "job-a-pod0", reason="OOMKilled", exit_code=137)
+        cluster.add_job(job_dict("job-b", active=1))
+        op = make_async_operator(_config(check_mode="list"), cluster)
+
+        _run_cycle(op, "_list_cycle")
+
+        assert cluster.calls["list_namespaced_job"] == 1
+        assert cluster.calls["read_namespaced_pod_log"] == 1
+        assert cluster.calls["delete_namespaced_job"] == 1
+        assert cluster.calls["create_namespaced_job"] == 1
+        assert set(op._cached_manifests) == {"job-a", "job-b"}
+        assert op.metrics.restarts.value("OOMKilled") == 1
+        assert op.metrics.api_latency.count("list", "jobs") == 1
+        assert op.metrics.restart_duration.count() == 1
+
+    def test_apply_strategy_restarts_through_server_side_apply(self, cluster: FakeCluster) -> None:
+        cluster.gc_requests = 3
+        cluster.add_job(job_dict("job-a", failed_at=datetime.now(timezone.utc) - timedelta(hours=2)))
+        cluster.add_pod("job-a", "job-a-pod0")
+        op = make_async_operator(_config(job_names=["job-a"], check_mode="list", restart_strategy="apply"), cluster)
+
+        _run_cycle(op, "_list_cycle")
+
+        assert cluster.calls["delete_namespaced_job"] == 1
+        assert cluster.calls["patch_namespaced_job"] == 1
+        assert cluster.calls["read_namespaced_job"] == 0
+        assert cluster.calls["create_namespaced_job"] == 0
+        assert op.metrics.restart_duration.count() == 1
+
+    def test_poll_cycle_reports_missing_job(self, cluster: FakeCluster) -> None:
+        cluster.add_job(job_dict("job-a", active=1))
+        op = make_async_operator(_config(), cluster)
+
+        _run_cycle(op, "_poll_cycle")
+
+        assert cluster.calls["read_namespaced_job"] == 2
+        assert set(op._cached_manifests) == {"job-a"}
+
+    def test_jobs_are_handled_concurrently(self, cluster: FakeCluster) -> None:
+        long_ago = datetime.now(timezone.utc) - timedelta(hours=2)
+        names = [f"job-{i}" for i in range(5)]
+        for name in names:
+            cluster.add_job(job_dict(name, failed_at=long_ago))
+        op = make_async_operator(_config(job_names=names, workers=5), cluster)
+        create_job = op._create_job
+
+        async def slow_create(job_name: str) -> None:
+            await asyncio.sleep(0.2)
+            await create_job(job_name)
+
+        op._create_job = slow_create
+
+        start = time.monotonic()
+        _run_cycle(op, "_poll_cycle")
+
+        assert cluster.calls["create_namespaced_job"] == 5
+        assert time.monotonic() - start < 0.8
+
+    def test_run_async_stops_on_shutdown_event(self, cluster: FakeCluster) -> None:
+        cluster.add_job(job_dict("job-a", active=1))
+        op = make_async_operator(_config(job_names=["job-a"]), cluster)
+        shutdown = threading.Event()
+        threading.Timer(0.2, shutdown.set).start()
+
+        start = time.monotonic()
+        asyncio.run(op.run_async(shutdown))
+
+        assert time.monotonic() - start < 2
+        assert cluster.calls["read_namespaced_job"] == 1
+
+    def test_run_async_leaves_shutdown_event_alone_on_error(self, cluster: FakeCluster) -> None:
+        op = make_async_operator(_config(job_names=["job-a"]), cluster)
+        shutdown = threading.Event()
+
+        async def fail() -> None:
+            raise RuntimeError("boom")
+
+        op._resume_restarts = fail  # type: ignore[method-assign]
+
+        with pytest.raises(RuntimeError):
+            asyncio.run(op.run_async(shutdown))
+
+        assert not shutdown.is_set()
+
+    def test_resumes_interrupted_restart(self, cluster: FakeCluster, tmp_path: Path) -> None:
+        path = str(tmp_path / "state.json")
+        job = cluster.add_job(job_dict("job-a", failed_at=datetime.now(timezone.utc)))
+        FileStateStore(path).put(
+            "job-a", JobRecord(build_manifest(job), job["metadata"]["uid"], "uid-1/1", restarting=True)
+        )
+        del cluster.jobs[("flickr-downloader", "job-a")]
+        op = make_async_operator(_config(job_names=["job-a"], state_store="file", state_path=path), cluster)
+
+        _run_cycle(op, "_resume_restarts")
+
+        assert cluster.calls["create_namespaced_job"] == 1
+        assert FileStateStore(path).load()["job-a"].restarting is False
+
+    def test_delayed_restart_fires_at_deadline(self, cluster: FakeCluster) -> None:
+        # Condition timestamps have second precision, so the remaining delay is between 1 and 2 seconds.
+        op = make_async_operator(_config(job_names=["job-a"], restart_delay=2), cluster)
+        cluster.add_job(job_dict("job-a", failed_at=datetime.now(timezone.utc)))
+        cluster.add_pod("job-a", "job-a-pod0")
+
+        async def _main() -> None:
+            op._stop = asyncio.Event()
+            op._semaphore = asyncio.Semaphore(op._cfg.workers)
+            await op._poll_cycle()
+            await op._poll_cycle()
+            assert cluster.calls["delete_namespaced_job"] == 0
+            await asyncio.wait_for(op._scheduled["job-a"][2], timeout=5)
+
+        asyncio.run(_main())
+
+        assert cluster.calls["list_namespaced_pod"] == 1
+        assert cluster.calls["delete_namespaced_job"] == 1
+        assert cluster.calls["create_namespaced_job"] == 1
+        assert op._scheduled == {}
+
+    def test_pod_logs_are_read_once_per_failure(self, cluster: FakeCluster) -> None:
+        cluster.add_job(job_dict("job-a", failed_at=datetime.now(timezone.utc)))
+        cluster.add_pod("job-a", "job-a-pod0")
+        cluster.add_pod("job-a", "job-a-pod1")
+        op = make_async_operator(_config(job_names=["job-a"], restart_delay=3600), cluster)
+
+        async def _main() -> None:
+            await op._get_pod_failure_reasons("job-a")
+            await op._get_pod_failure_reasons("job-a")
+
+        asyncio.run(_main())
+
+        assert cluster.calls["list_namespaced_pod"] == 2
+        assert cluster.calls["read_namespaced_pod_log"] == 2
+
+    def test_only_newest_pods_are_inspected(self, cluster: FakeCluster) -> None:
+        now = datetime.now(timezone.utc)
+        for i in range(5):
+            cluster.add_pod("job-a", f"job-a-{i}", reason=f"Reason{i}", created=now + timedelta(minutes=i))
+        op = make_async_operator(_config(job_names=["job-a"], max_inspected_pods=2), cluster)
+
+        reasons = asyncio.run(op._get_pod_failure_reasons("job-a"))
+
+        assert reasons == {"Reason4", "Reason3"}
+        assert cluster.calls["read_namespaced_pod_log"] == 2
+
+    def test_list_discovers_jobs_by_selector(self, cluster: FakeCluster) -> None:
+        cluster.add_job(job_dict("flickr-alice", active=1, labels={"app": "flickr"}))
+        cluster.add_job(job_dict("unrelated", active=1, labels={"app": "other"}))
+        op = make_async_operator(_config(job_names=[], job_selector="app=flickr", check_mode="list"), cluster)
+
+        _run_cycle(op, "_list_cycle")
+        _run_cycle(op, "_list_cycle")
+
+        assert op._managed.names() == ["flickr-alice"]
+        assert set(op._cached_manifests) == {"flickr-alice"}
+        assert cluster.calls["list_namespaced_job"] == 2
+
+    def test_list_drops_state_of_vanished_jobs(self, cluster: FakeCluster) -> None:
+        cluster.add_job(job_dict("flickr-alice", active=1, labels={"app": "flickr"}))
+        cluster.add_job(job_dict("flickr-bob", active=1, labels={"app": "flickr"}))
+        op = make_async_operator(_config(job_names=[], job_selector="app=flickr", check_mode="list"), cluster)
+        _run_cycle(op, "_list_cycle")
+
+        del cluster.jobs[("flickr-downloader", "flickr-bob")]
+        _run_cycle(op, "_list_cycle")
+
+        assert set(op._cached_manifests) == set(op._cached_uids) == set(op._job_locks) == {"flickr-alice"}
@@ -0,0 +1,108 @@
+"""Tests for :mod:`flickr_immich_k8s_sync_operator.classifier`."""
+
+import dataclasses
+
+from flickr_immich_k8s_sync_operator.classifier import HOLD, IMMEDIATE, RESTART, FailureClassifier, default_rules
+from flickr_immich_k8s_sync_operator.config import OperatorConfig
+
+
+def _config(**overrides: object) -> OperatorConfig:
+    """Return an :class:`OperatorConfig` suitable for classifier tests."""
+    values: dict = {  # type: ignore[type-arg]
+        "namespace": "flickr-downloader",
+        "job_names": ["job-a"],
+        "check_interval": 60,
+        "restart_delay": 3600,
+        "skip_delay_on_oom": False,
+    }
+    values.update(overrides)
+    return OperatorConfig(**values)
+
+
+class TestDefaultRules:
+    """Tests for :func:`default_rules`."""
+
+    def test_built_in_classes_restart_after_regular_delay(self) -> None:
+        rules = default_rules(_config())
+
+        assert [rule.name for rule in rules] == ["oom", "auth", "disk_full", "rate_limited", "network"]
+        assert all(rule.action == RESTART and rule.delay is None for rule in rules)
+
+    def test_skip_delay_on_oom_restarts_oom_immediately(self) -> None:
+        rules = {rule.name: rule for rule in default_rules(_config(skip_delay_on_oom=True))}
+
+        assert rules["oom"].action == IMMEDIATE
+
+    def test_overrides_and_additions(self) -> None:
+        cfg = _config(
+            failure_rules={
+                "auth": {"action": "hold"},
+                "network": {"delay": 300},
+                "quota": {"pattern": "quota exceeded", "delay": 7200},
+            }
+        )
+        rules = {rule.name: rule for rule in default_rules(cfg)}
+
+        assert rules["auth"].action == HOLD
+        assert rules["network"].delay == 300 and rules["network"].reason == "NetworkError"
+        assert rules["quota"] == dataclasses.replace(rules["quota"], reason="quota", pattern="quota exceeded")
+        assert list(rules)[-1] == "quota"
+
+
+class TestFailureClassifier:
+    """Tests for :class:`FailureClassifier`."""
+
+    def test_classifies_log_tails(self) -> None:
+        classifier = FailureClassifier.from_config(_config())
+
+        assert classifier.classify("Error", "HTTPError: 429 Client Error: Too Many Requests") == {"RateLimited"}
+        assert classifier.classify("Error", "oauth_problem=token_rejected") == {"AuthFailed"}
+        assert classifier.classify("Error", "OSError: [Errno 28] No space left on device") == {"DiskFull"}
+        assert classifier.classify("Error", "ConnectionError: Connection reset by peer") == {"NetworkError"}
+        assert classifier.classify("OOMKilled", "") == {"OOMKilled"}
+        assert classifier.classify("Error", "line 1\nline 2\n") == set()
+
+    def test_collects_every_matching_class(self) -> None:
+        classifier = FailureClassifier.from_config(_config())
+
+        assert classifier.classify("OOMKilled", "Read timed out") == {"OOMKilled", "NetworkError"}
+
+    def test_match_follows_rule_order(self) -> None:
+        classifier = FailureClassifier.from_config(_config())
+
+        rule = classifier.match({"Error", "NetworkError", "AuthFailed"})
+
+        assert rule is not None and rule.name == "auth"
+        assert classifier.match({"Error"}) is None
+
+    def test_without_rules_nothing_matches(self) -> None:
+        classifier = FailureClassifier([])
+
+        assert classifier.classify("OOMKilled", "429") == set()
+
+    def test_oom_only_matches_the_termination_reason(self) -> None:
+        classifier = FailureClassifier.from_config(_config(skip_delay_on_oom=True))
+
+        assert classifier.classify("Error", "MemoryError: cannot allocate memory") == set()
+        assert classifier.classify("Error", "OOMKilled") == set()
+        assert classifier.classify("OOMKilled", "out of memory") == {"OOMKilled"}
+
+    def test_patterns_with_groups_are_matched_on_their_own(self) -> None:
+        cfg = _config(
+            failure_rules={
+                "repeated": {"pattern": r"(\w+) failed, \1 failed"},
+                "named": {"pattern": r"(?P<code>E\d+)"},
+                "named_again": {"pattern": r"(?P<code>W\d+)"},
+                "verbose": {"pattern": r"(?x) quota \s exceeded"},
+            }
+        )
+        classifier = FailureClassifier.from_config(cfg)
+
+        assert classifier.classify("Error", "upload failed, upload failed") == {"repeated"}
+        assert classifier.classify("Error", "upload failed, album failed") == set()
+        assert classifier.classify("Error", "E42 W7 Quota exceeded; Connection reset") == {
+            "named",
+            "named_again",
+            "verbose",
+            "NetworkError",
+        }
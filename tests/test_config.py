@@ -4,7 +4,7 @@ import dataclasses
 
 import pytest
 
-from flickr_immich_k8s_sync_operator.config import OperatorConfig
+from flickr_immich_k8s_sync_operator.config import FLICKRSYNC_LABEL, OperatorConfig
 
 
 class TestOperatorConfigFromEnv:
@@ -16,6 +16,39 @@ class TestOperatorConfigFromEnv:
         monkeypatch.delenv("CHECK_INTERVAL", raising=False)
         monkeypatch.delenv("RESTART_DELAY", raising=False)
         monkeypatch.delenv("SKIP_DELAY_ON_OOM", raising=False)
+        monkeypatch.delenv("CHECK_MODE", raising=False)
+        monkeypatch.delenv("LABEL_SELECTOR", raising=False)
+        monkeypatch.delenv("WORKERS", raising=False)
+        monkeypatch.delenv("QUEUE_QPS", raising=False)
+        monkeypatch.delenv("QUEUE_BURST", raising=False)
+        monkeypatch.delenv("ENGINE", raising=False)
+        monkeypatch.delenv("RAW_JSON", raising=False)
+        monkeypatch.delenv("STATE_STORE", raising=False)
+        monkeypatch.delenv("STATE_PATH", raising=False)
+        monkeypatch.delenv("METRICS_PORT", raising=False)
+        monkeypatch.delenv("POD_LOG_TIMEOUT", raising=False)
+        monkeypatch.delenv("MAX_INSPECTED_PODS", raising=False)
+        monkeypatch.delenv("JOB_SELECTOR", raising=False)
+        monkeypatch.delenv("NAMESPACES", raising=False)
+        monkeypatch.delenv("LEADER_ELECTION", raising=False)
+        monkeypatch.delenv("LEASE_NAME", raising=False)
+        monkeypatch.delenv("LEASE_DURATION", raising=False)
+        monkeypatch.delenv("SHARD_GROUP", raising=False)
+        monkeypatch.delenv("RESTART_BUDGET", raising=False)
+        monkeypatch.delenv("RESTART_BUDGET_WINDOW", raising=False)
+        monkeypatch.delenv("RESTART_JITTER", raising=False)
+        monkeypatch.delenv("RATE_LIMIT_BACKOFF", raising=False)
+        monkeypatch.delenv("ADAPTIVE_BACKOFF", raising=False)
+        monkeypatch.delenv("MIN_RESTART_DELAY", raising=False)
+        monkeypatch.delenv("FLICKRSYNC", raising=False)
+        monkeypatch.delenv("STATUS_DEBOUNCE", raising=False)
+        monkeypatch.delenv("MAX_RESTART_DELAY", raising=False)
+        monkeypatch.delenv("FAST_FAILURE_THRESHOLD", raising=False)
+        monkeypatch.delenv("FAILURE_RULES", raising=False)
+        monkeypatch.delenv("RESTART_STRATEGY", raising=False)
+        monkeypatch.delenv("JOB_RESTART_STRATEGIES", raising=False)
+        monkeypatch.delenv("TEMPLATE_SOURCE", raising=False)
+        monkeypatch.delenv("TEMPLATE_CONFIGMAP", raising=False)
 
         cfg = OperatorConfig.from_env()
 
@@ -24,6 +57,39 @@ class TestOperatorConfigFromEnv:
         assert cfg.check_interval == 60
         assert cfg.restart_delay == 3600
         assert cfg.skip_delay_on_oom is False
+        assert cfg.check_mode == "poll"
+        assert cfg.label_selector == ""
+        assert cfg.workers == 4
+        assert cfg.queue_qps == 10.0
+        assert cfg.queue_burst == 100
+        assert cfg.engine == "sync"
+        assert cfg.raw_json is False
+        assert cfg.state_store == "memory"
+        assert cfg.state_path == ""
+        assert cfg.metrics_port == 0
+        assert cfg.pod_log_timeout == 10.0
+        assert cfg.max_inspected_pods == 10
+        assert cfg.job_selector == ""
+        assert cfg.namespaces == []
+        assert cfg.leader_election is False
+        assert cfg.lease_name == "flickr-immich-k8s-sync-operator"
+        assert cfg.lease_duration == 15
+        assert cfg.shard_group == ""
+        assert cfg.restart_budget == 0
+        assert cfg.restart_budget_window == 3600
+        assert cfg.restart_jitter == 0.0
+        assert cfg.rate_limit_backoff == 1.0
+        assert cfg.adaptive_backoff is False
+        assert cfg.min_restart_delay == 60
+        assert cfg.max_restart_delay == 86400
+        assert cfg.fast_failure_threshold == 600
+        assert cfg.failure_rules == {}
+        assert cfg.restart_strategy == "recreate"
+        assert cfg.job_restart_strategies == {}
+        assert cfg.template_source == "job"
+        assert cfg.template_configmap == ""
+        assert cfg.flickrsync is False
+        assert cfg.status_debounce == 2.0
 
     def test_custom_values(self, monkeypatch: pytest.MonkeyPatch) -> None:
         monkeypatch.setenv("NAMESPACE", "  custom-ns  ")
@@ -31,6 +97,9 @@ class TestOperatorConfigFromEnv:
         monkeypatch.setenv("CHECK_INTERVAL", "30")
         monkeypatch.setenv("RESTART_DELAY", "120")
         monkeypatch.setenv("SKIP_DELAY_ON_OOM", "true")
+        monkeypatch.setenv("METRICS_PORT", "9090")
+        monkeypatch.setenv("POD_LOG_TIMEOUT", "2.5")
+        monkeypatch.setenv("MAX_INSPECTED_PODS", "3")
 
         cfg = OperatorConfig.from_env()
 
@@ -39,6 +108,9 @@ class TestOperatorConfigFromEnv:
         assert cfg.check_interval == 30
         assert cfg.restart_delay == 120
         assert cfg.skip_delay_on_oom is True
+        assert cfg.metrics_port == 9090
+        assert cfg.pod_log_timeout == 2.5
+        assert cfg.max_inspected_pods == 3
 
     def test_missing_job_names_raises(self, monkeypatch: pytest.MonkeyPatch) -> None:
         monkeypatch.delenv("JOB_NAMES", raising=False)
@@ -96,3 +168,382 @@ class TestOperatorConfigFromEnv:
         cfg = OperatorConfig.from_env()
 
         assert cfg.skip_delay_on_oom is expected
+
+    def test_raw_json(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("JOB_NAMES", "job-a")
+        monkeypatch.setenv("RAW_JSON", " TRUE ")
+
+        cfg = OperatorConfig.from_env()
+
+        assert cfg.raw_json is True
+
+    def test_state_store_sqlite(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("JOB_NAMES", "job-a")
+        monkeypatch.setenv("STATE_STORE", " SQLite ")
+        monkeypatch.setenv("STATE_PATH", " /state/operator.db ")
+
+        cfg = OperatorConfig.from_env()
+
+        assert cfg.state_store == "sqlite"
+        assert cfg.state_path == "/state/operator.db"
+
+    def test_state_store_requires_path(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("JOB_NAMES", "job-a")
+        monkeypatch.setenv("STATE_STORE", "file")
+        monkeypatch.delenv("STATE_PATH", raising=False)
+
+        with pytest.raises(ValueError, match="STATE_PATH"):
+            OperatorConfig.from_env()
+
+    def test_invalid_state_store_raises(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("JOB_NAMES", "job-a")
+        monkeypatch.setenv("STATE_STORE", "etcd")
+
+        with pytest.raises(ValueError, match="STATE_STORE"):
+            OperatorConfig.from_env()
+
+    def test_check_mode_watch(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("JOB_NAMES", "job-a")
+        monkeypatch.setenv("CHECK_MODE", " Watch ")
+
+        cfg = OperatorConfig.from_env()
+
+        assert cfg.check_mode == "watch"
+
+    def test_check_mode_list_with_selector(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("JOB_NAMES", "job-a")
+        monkeypatch.setenv("CHECK_MODE", "list")
+        monkeypatch.setenv("LABEL_SELECTOR", " app=flickr-downloader ")
+
+        cfg = OperatorConfig.from_env()
+
+        assert cfg.check_mode == "list"
+        assert cfg.label_selector == "app=flickr-downloader"
+
+    def test_invalid_check_mode_raises(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("JOB_NAMES", "job-a")
+        monkeypatch.setenv("CHECK_MODE", "telepathy")
+
+        with pytest.raises(ValueError, match="CHECK_MODE"):
+            OperatorConfig.from_env()
+
+    def test_workers(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("JOB_NAMES", "job-a")
+        monkeypatch.setenv("WORKERS", "16")
+
+        assert OperatorConfig.from_env().workers == 16
+
+    def test_invalid_workers_raises(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("JOB_NAMES", "job-a")
+        monkeypatch.setenv("WORKERS", "0")
+
+        with pytest.raises(ValueError, match="WORKERS"):
+            OperatorConfig.from_env()
+
+    def test_queue_rate_limit(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("JOB_NAMES", "job-a")
+        monkeypatch.setenv("QUEUE_QPS", "0.5")
+        monkeypatch.setenv("QUEUE_BURST", "5")
+
+        cfg = OperatorConfig.from_env()
+
+        assert (cfg.queue_qps, cfg.queue_burst) == (0.5, 5)
+
+    @pytest.mark.parametrize("name, value", [("QUEUE_QPS", "-1"), ("QUEUE_BURST", "0")])
+    def test_invalid_queue_rate_limit_raises(self, monkeypatch: pytest.MonkeyPatch, name: str, value: str) -> None:
+        monkeypatch.setenv("JOB_NAMES", "job-a")
+        monkeypatch.setenv(name, value)
+
+        with pytest.raises(ValueError, match=name):
+            OperatorConfig.from_env()
+
+    def test_job_selector_replaces_job_names(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.delenv("JOB_NAMES", raising=False)
+        monkeypatch.setenv("JOB_SELECTOR", "app=flickr-downloader")
+        monkeypatch.setenv("CHECK_MODE", "watch")
+
+        cfg = OperatorConfig.from_env()
+
+        assert cfg.job_names == []
+        assert cfg.job_selector == "app=flickr-downloader"
+
+    def test_job_selector_with_job_names_raises(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("JOB_NAMES", "job-a")
+        monkeypatch.setenv("JOB_SELECTOR", "app=flickr-downloader")
+        monkeypatch.setenv("CHECK_MODE", "list")
+
+        with pytest.raises(ValueError, match="mutually exclusive"):
+            OperatorConfig.from_env()
+
+    def test_job_selector_with_poll_mode_raises(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.delenv("JOB_NAMES", raising=False)
+        monkeypatch.setenv("JOB_SELECTOR", "app=flickr-downloader")
+        monkeypatch.delenv("CHECK_MODE", raising=False)
+
+        with pytest.raises(ValueError, match="JOB_SELECTOR"):
+            OperatorConfig.from_env()
+
+    def test_namespaces(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("JOB_NAMES", "job-a")
+        monkeypatch.setenv("NAMESPACES", " ns-a , ns-b ")
+
+        assert OperatorConfig.from_env().namespaces == ["ns-a", "ns-b"]
+
+    def test_all_namespaces_with_others_raises(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("JOB_NAMES", "job-a")
+        monkeypatch.setenv("NAMESPACES", "*,ns-a")
+
+        with pytest.raises(ValueError, match="NAMESPACES"):
+            OperatorConfig.from_env()
+
+    @pytest.mark.parametrize("name, value", [("LEADER_ELECTION", "true"), ("SHARD_GROUP", "flickr-operator")])
+    def test_coordination_with_namespaces_raises(self, monkeypatch: pytest.MonkeyPatch, name: str, value: str) -> None:
+        monkeypatch.setenv("JOB_NAMES", "job-a")
+        monkeypatch.setenv("NAMESPACES", "ns-a,ns-b")
+        monkeypatch.setenv(name, value)
+
+        with pytest.raises(ValueError, match=f"{name} cannot be combined with NAMESPACES"):
+            OperatorConfig.from_env()
+
+    def test_leader_election(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("JOB_NAMES", "job-a")
+        monkeypatch.setenv("LEADER_ELECTION", "true")
+        monkeypatch.setenv("LEASE_DURATION", "20")
+        monkeypatch.setenv("POD_NAME", "operator-0")
+
+        cfg = OperatorConfig.from_env()
+
+        assert cfg.leader_election is True
+        assert cfg.lease_duration == 20
+        assert cfg.leader_identity == "operator-0"
+
+    def test_leader_election_with_async_engine_raises(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("JOB_NAMES", "job-a")
+        monkeypatch.setenv("LEADER_ELECTION", "true")
+        monkeypatch.setenv("ENGINE", "async")
+
+        with pytest.raises(ValueError, match="LEADER_ELECTION"):
+            OperatorConfig.from_env()
+
+    def test_shard_group(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("JOB_NAMES", "job-a")
+        monkeypatch.setenv("SHARD_GROUP", "flickr-operator")
+
+        assert OperatorConfig.from_env().shard_group == "flickr-operator"
+
+    def test_shard_group_with_leader_election_raises(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("JOB_NAMES", "job-a")
+        monkeypatch.setenv("SHARD_GROUP", "flickr-operator")
+        monkeypatch.setenv("LEADER_ELECTION", "true")
+
+        with pytest.raises(ValueError, match="mutually exclusive"):
+            OperatorConfig.from_env()
+
+    def test_short_lease_duration_raises(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("JOB_NAMES", "job-a")
+        monkeypatch.setenv("LEASE_DURATION", "2")
+
+        with pytest.raises(ValueError, match="LEASE_DURATION"):
+            OperatorConfig.from_env()
+
+    def test_restart_governor(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("JOB_NAMES", "job-a")
+        monkeypatch.setenv("RESTART_BUDGET", "10")
+        monkeypatch.setenv("RESTART_BUDGET_WINDOW", "1800")
+        monkeypatch.setenv("RESTART_JITTER", "120")
+        monkeypatch.setenv("RATE_LIMIT_BACKOFF", "8")
+
+        cfg = OperatorConfig.from_env()
+
+        assert cfg.restart_budget == 10
+        assert cfg.restart_budget_window == 1800
+        assert cfg.restart_jitter == 120.0
+        assert cfg.rate_limit_backoff == 8.0
+
+    @pytest.mark.parametrize(
+        "name, value",
+        [
+            ("RESTART_BUDGET", "-1"),
+            ("RESTART_BUDGET_WINDOW", "0"),
+            ("RESTART_JITTER", "-5"),
+            ("RATE_LIMIT_BACKOFF", "0.5"),
+        ],
+    )
+    def test_invalid_restart_governor_raises(self, monkeypatch: pytest.MonkeyPatch, name: str, value: str) -> None:
+        monkeypatch.setenv("JOB_NAMES", "job-a")
+        monkeypatch.setenv(name, value)
+
+        with pytest.raises(ValueError, match=name):
+            OperatorConfig.from_env()
+
+    def test_adaptive_backoff(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("JOB_NAMES", "job-a")
+        monkeypatch.setenv("ADAPTIVE_BACKOFF", "true")
+        monkeypatch.setenv("MIN_RESTART_DELAY", "120")
+        monkeypatch.setenv("MAX_RESTART_DELAY", "43200")
+        monkeypatch.setenv("FAST_FAILURE_THRESHOLD", "900")
+
+        cfg = OperatorConfig.from_env()
+
+        assert cfg.adaptive_backoff is True
+        assert cfg.min_restart_delay == 120
+        assert cfg.max_restart_delay == 43200
+        assert cfg.fast_failure_threshold == 900
+
+    def test_max_restart_delay_below_restart_delay_raises(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("JOB_NAMES", "job-a")
+        monkeypatch.setenv("ADAPTIVE_BACKOFF", "true")
+        monkeypatch.setenv("RESTART_DELAY", "3600")
+        monkeypatch.setenv("MAX_RESTART_DELAY", "600")
+
+        with pytest.raises(ValueError, match="MAX_RESTART_DELAY"):
+            OperatorConfig.from_env()
+
+    def test_failure_rules(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("JOB_NAMES", "job-a")
+        monkeypatch.setenv("FAILURE_RULES", '{"auth": {"action": "hold"}, "quota": {"pattern": "quota", "delay": 60}}')
+
+        cfg = OperatorConfig.from_env()
+
+        assert cfg.failure_rules == {"auth": {"action": "hold"}, "quota": {"pattern": "quota", "delay": 60}}
+
+    @pytest.mark.parametrize(
+        "raw, match",
+        [
+            ("not json", "not valid JSON"),
+            ("[]", "JSON object"),
+            ('{"auth": {"action": "ignore"}}', "action"),
+            ('{"network": {"delay": -1}}', "delay"),
+            ('{"quota": {"pattern": "("}}', "invalid pattern"),
+            ('{"quota": {"delay": 60}}', "needs a pattern"),
+            ('{"auth": {"actions": "hold"}}', "must be an object"),
+        ],
+    )
+    def test_invalid_failure_rules_raise(self, monkeypatch: pytest.MonkeyPatch, raw: str, match: str) -> None:
+        monkeypatch.setenv("JOB_NAMES", "job-a")
+        monkeypatch.setenv("FAILURE_RULES", raw)
+
+        with pytest.raises(ValueError, match=match):
+            OperatorConfig.from_env()
+
+    def test_restart_strategies(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("JOB_NAMES", "job-a,job-b,job-c")
+        monkeypatch.setenv("RESTART_STRATEGY", " Apply ")
+        monkeypatch.setenv("JOB_RESTART_STRATEGIES", "job-b = recreate, ")
+
+        cfg = OperatorConfig.from_env()
+
+        assert cfg.restart_strategy == "apply"
+        assert cfg.job_restart_strategies == {"job-b": "recreate"}
+        assert cfg.restart_strategy_for("job-a") == "apply"
+        assert cfg.restart_strategy_for("job-b") == "recreate"
+
+    def test_invalid_restart_strategy_raises(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("JOB_NAMES", "job-a")
+        monkeypatch.setenv("RESTART_STRATEGY", "suspend")
+
+        with pytest.raises(ValueError, match="RESTART_STRATEGY"):
+            OperatorConfig.from_env()
+
+    @pytest.mark.parametrize("raw", ["job-a", "job-a=suspend", "=apply"])
+    def test_invalid_job_restart_strategies_raise(self, monkeypatch: pytest.MonkeyPatch, raw: str) -> None:
+        monkeypatch.setenv("JOB_NAMES", "job-a")
+        monkeypatch.setenv("JOB_RESTART_STRATEGIES", raw)
+
+        with pytest.raises(ValueError, match="JOB_RESTART_STRATEGIES"):
+            OperatorConfig.from_env()
+
+    def test_template_source(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("JOB_NAMES", "job-a")
+        monkeypatch.setenv("TEMPLATE_SOURCE", "ConfigMap")
+        monkeypatch.setenv("TEMPLATE_CONFIGMAP", " job-templates ")
+
+        cfg = OperatorConfig.from_env()
+
+        assert cfg.template_source == "configmap"
+        assert cfg.template_configmap == "job-templates"
+
+    @pytest.mark.parametrize(
+        "env, match",
+        [
+            ({"TEMPLATE_SOURCE": "secret"}, "TEMPLATE_SOURCE must be one of"),
+            ({"TEMPLATE_SOURCE": "configmap"}, "TEMPLATE_CONFIGMAP is required"),
+            (
+                {"TEMPLATE_SOURCE": "cronjob", "ENGINE": "async", "CHECK_MODE": "list"},
+                "not supported with ENGINE=async",
+            ),
+        ],
+    )
+    def test_invalid_template_source_raises(
+        self, monkeypatch: pytest.MonkeyPatch, env: dict[str, str], match: str
+    ) -> None:
+        monkeypatch.setenv("JOB_NAMES", "job-a")
+        for name, value in env.items():
+            monkeypatch.setenv(name, value)
+
+        with pytest.raises(ValueError, match=match):
+            OperatorConfig.from_env()
+
+    def test_flickrsync(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.delenv("JOB_NAMES", raising=False)
+        monkeypatch.delenv("JOB_SELECTOR", raising=False)
+        monkeypatch.delenv("TEMPLATE_SOURCE", raising=False)
+        monkeypatch.setenv("FLICKRSYNC", "true")
+        monkeypatch.setenv("CHECK_MODE", "watch")
+        monkeypatch.setenv("STATUS_DEBOUNCE", "0.5")
+
+        cfg = OperatorConfig.from_env()
+
+        assert cfg.flickrsync is True
+        assert cfg.job_selector == FLICKRSYNC_LABEL
+        assert cfg.template_source == "flickrsync"
+        assert cfg.status_debounce == 0.5
+
+    @pytest.mark.parametrize(
+        "env, match",
+        [
+            ({"JOB_NAMES": "job-a"}, "JOB_NAMES cannot be combined with FLICKRSYNC"),
+            ({"CHECK_MODE": "poll"}, "FLICKRSYNC requires CHECK_MODE=list"),
+            ({"ENGINE": "async"}, "FLICKRSYNC is not supported with ENGINE=async"),
+            ({"STATUS_DEBOUNCE": "-1"}, "STATUS_DEBOUNCE"),
+        ],
+    )
+    def test_invalid_flickrsync_raises(self, monkeypatch: pytest.MonkeyPatch, env: dict[str, str], match: str) -> None:
+        monkeypatch.delenv("JOB_NAMES", raising=False)
+        monkeypatch.delenv("JOB_SELECTOR", raising=False)
+        monkeypatch.setenv("FLICKRSYNC", "true")
+        monkeypatch.setenv("CHECK_MODE", "list")
+        for name, value in env.items():
+            monkeypatch.setenv(name, value)
+
+        with pytest.raises(ValueError, match=match):
+            OperatorConfig.from_env()
+
+    def test_invalid_max_inspected_pods_raises(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("JOB_NAMES", "job-a")
+        monkeypatch.setenv("MAX_INSPECTED_PODS", "0")
+
+        with pytest.raises(ValueError, match="MAX_INSPECTED_PODS"):
+            OperatorConfig.from_env()
+
+    def test_async_engine(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("JOB_NAMES", "job-a")
+        monkeypatch.setenv("ENGINE", "Async")
+        monkeypatch.setenv("CHECK_MODE", "list")
+
+        assert OperatorConfig.from_env().engine == "async"
+
+    def test_async_engine_rejects_watch_mode(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("JOB_NAMES", "job-a")
+        monkeypatch.setenv("ENGINE", "async")
+        monkeypatch.setenv("CHECK_MODE", "watch")
+
+        with pytest.raises(ValueError, match="ENGINE=async"):
+            OperatorConfig.from_env()
+
+    def test_invalid_engine_raises(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("JOB_NAMES", "job-a")
+        monkeypatch.setenv("ENGINE", "steam")
+
+        with pytest.raises(ValueError, match="ENGINE"):
+            OperatorConfig.from_env()
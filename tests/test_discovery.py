@@ -0,0 +1,66 @@
+"""Tests for :mod:`flickr_immich_k8s_sync_operator.discovery`."""
+
+from flickr_immich_k8s_sync_operator.config import OperatorConfig
+from flickr_immich_k8s_sync_operator.discovery import ManagedJobs, describe_jobs
+
+
+def _config(**overrides: object) -> OperatorConfig:
+    values: dict = {  # type: ignore[type-arg]
+        "namespace": "flickr-downloader",
+        "job_names": [],
+        "check_interval": 60,
+        "restart_delay": 3600,
+        "skip_delay_on_oom": False,
+        "check_mode": "list",
+        "job_selector": "app=flickr-downloader",
+    }
+    values.update(overrides)
+    return OperatorConfig(**values)
+
+
+class TestManagedJobs:
+    """Tests for :class:`ManagedJobs`."""
+
+    def test_static_names_are_fixed(self) -> None:
+        managed = ManagedJobs(_config(job_names=["job-b", "job-a"], job_selector=""))
+
+        assert managed.add("job-c") is False
+        managed.sync(["job-c"])
+
+        assert managed.names() == ["job-b", "job-a"]
+        assert managed.accepts("job-c") is False
+
+    def test_sync_applies_delta(self) -> None:
+        managed = ManagedJobs(_config())
+        managed.sync(["job-a", "job-b"])
+        managed.mark_steady("job-b", "7")
+
+        assert managed.sync(["job-a", "job-c"]) == ["job-b"]
+
+        assert managed.names() == ["job-a", "job-c"]
+        assert managed.accepts("anything") is True
+        assert managed.needs_check("job-b", "7") is True
+
+    def test_add_and_discard_report_changes(self) -> None:
+        managed = ManagedJobs(_config())
+
+        assert managed.add("job-a") is True
+        assert managed.add("job-a") is False
+        assert managed.discard("job-a") is True
+        assert managed.discard("job-a") is False
+        assert len(managed) == 0
+
+    def test_needs_check_until_changed(self) -> None:
+        managed = ManagedJobs(_config(job_names=["job-a"], job_selector=""))
+        assert managed.needs_check("job-a", "1") is True
+
+        managed.mark_steady("job-a", "1")
+        assert managed.needs_check("job-a", "1") is False
+        assert managed.needs_check("job-a", "2") is True
+
+        managed.mark_unsteady("job-a")
+        assert managed.needs_check("job-a", "1") is True
+
+    def test_describe_jobs(self) -> None:
+        assert describe_jobs(_config()) == "jobs matching 'app=flickr-downloader'"
+        assert describe_jobs(_config(job_names=["a", "b"], job_selector="")) == "2 job(s)"
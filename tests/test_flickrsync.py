@@ -0,0 +1,114 @@
+"""Tests for :mod:`flickr_immich_k8s_sync_operator.flickrsync`."""
+
+from typing import Any
+
+import pytest
+
+from flickr_immich_k8s_sync_operator.config import FLICKRSYNC_LABEL
+from flickr_immich_k8s_sync_operator.flickrsync import (
+    RESTART_DELAY_ANNOTATION,
+    RESTART_STRATEGY_ANNOTATION,
+    SPEC_HASH_ANNOTATION,
+    FlickrSync,
+    restart_policy,
+)
+from tests.fake_k8s import _deserialize, job_dict
+
+
+def _obj(**spec: Any) -> dict[str, Any]:
+    return {
+        "metadata": {"name": "alice", "namespace": "flickr-downloader", "uid": "sync-uid", "generation": 1},
+        "spec": {"user": "alice", "image": "flickr-dl:2", **spec},
+    }
+
+
+class TestFlickrSync:
+    """Tests for :class:`FlickrSync`."""
+
+    def test_job_manifest(self) -> None:
+        sync = FlickrSync.from_object(
+            _obj(
+                resources={"limits": {"memory": "1Gi"}},
+                restartPolicy={"delay": 600, "strategy": "apply"},
+                podTemplate={
+                    "spec": {
+                        "containers": [
+                            {"name": "downloader", "env": [{"name": "FLICKR_USER", "value": "x"}], "args": ["-v"]}
+                        ],
+                        "volumes": [{"name": "config", "hostPath": {"path": "/srv/flickr/alice"}}],
+                    }
+                },
+            )
+        )
+
+        manifest = sync.manifest()
+
+        assert manifest["kind"] == "Job"
+        assert manifest["metadata"]["name"] == "flickr-downloader-alice"
+        assert manifest["metadata"]["labels"] == {FLICKRSYNC_LABEL: "alice"}
+        assert manifest["metadata"]["annotations"] == {
+            SPEC_HASH_ANNOTATION: sync.spec_hash,
+            RESTART_DELAY_ANNOTATION: "600",
+            RESTART_STRATEGY_ANNOTATION: "apply",
+        }
+        assert manifest["metadata"]["ownerReferences"][0]["uid"] == "sync-uid"
+        assert manifest["metadata"]["ownerReferences"][0]["controller"] is True
+        pod_spec = manifest["spec"]["template"]["spec"]
+        assert pod_spec["restartPolicy"] == "Never"
+        assert pod_spec["volumes"][0]["name"] == "config"
+        assert pod_spec["containers"] == [
+            {
+                "name": "downloader",
+                "image": "flickr-dl:2",
+                "args": ["-v"],
+                "resources": {"limits": {"memory": "1Gi"}},
+                "env": [{"name": "FLICKR_USER", "value": "alice"}],
+            }
+        ]
+
+    def test_schedule_yields_cronjob(self) -> None:
+        manifest = FlickrSync.from_object(_obj(schedule="0 3 * * *")).manifest()
+
+        assert manifest["kind"] == "CronJob"
+        assert manifest["spec"]["schedule"] == "0 3 * * *"
+        assert manifest["spec"]["concurrencyPolicy"] == "Forbid"
+        assert "ownerReferences" not in manifest["spec"]["jobTemplate"]["metadata"]
+        assert manifest["spec"]["jobTemplate"]["spec"]["template"]["spec"]["containers"][0]["name"] == "downloader"
+
+    def test_spec_hash_follows_the_spec(self) -> None:
+        assert FlickrSync.from_object(_obj()).spec_hash == FlickrSync.from_object(_obj()).spec_hash
+        assert FlickrSync.from_object(_obj()).spec_hash != FlickrSync.from_object(_obj(image="other")).spec_hash
+
+    @pytest.mark.parametrize(
+        "spec, match",
+        [
+            ({"user": "Alice"}, "spec.user"),
+            ({"user": "a" * 40}, "at most"),
+            ({"image": ""}, "spec.image"),
+            ({"schedule": 3}, "spec.schedule"),
+            ({"restartPolicy": {"delay": -1}}, "delay"),
+            ({"restartPolicy": {"strategy": "suspend"}}, "strategy"),
+            ({"resources": ["cpu"]}, "spec.resources"),
+        ],
+    )
+    def test_invalid_spec_raises(self, spec: dict[str, Any], match: str) -> None:
+        with pytest.raises(ValueError, match=match):
+            FlickrSync.from_object(_obj(**spec))
+
+
+class TestRestartPolicy:
+    """Tests for :func:`restart_policy`."""
+
+    def test_reads_annotations_of_dict_and_model(self) -> None:
+        job = job_dict("job-a")
+        job["metadata"]["annotations"] = {RESTART_DELAY_ANNOTATION: "600", RESTART_STRATEGY_ANNOTATION: "apply"}
+
+        assert restart_policy(job) == (600, "apply")
+        assert restart_policy(_deserialize(job, "V1Job")) == (600, "apply")
+
+    def test_missing_or_invalid_annotations_are_ignored(self) -> None:
+        job = job_dict("job-a")
+        assert restart_policy(job) == (None, None)
+
+        job["metadata"]["annotations"] = {RESTART_DELAY_ANNOTATION: "soon", RESTART_STRATEGY_ANNOTATION: "suspend"}
+        assert restart_policy(job) == (None, None)
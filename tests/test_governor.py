@@ -0,0 +1,99 @@
+"""Tests for :mod:`flickr_immich_k8s_sync_operator.governor`."""
+
+from flickr_immich_k8s_sync_operator.governor import RestartGovernor, is_rate_limited
+
+
+class _Clock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestIsRateLimited:
+    """Tests for :func:`is_rate_limited`."""
+
+    def test_detects_http_429(self) -> None:
+        assert is_rate_limited("HTTPError: 429 Client Error: Too Many Requests\n")
+        assert is_rate_limited("Rate limit reached, exiting\n")
+
+    def test_ignores_other_failures(self) -> None:
+        assert not is_rate_limited("line 1\nline 2\n")
+        assert not is_rate_limited("downloaded 14290 photos\n")
+
+
+class TestRestartGovernor:
+    """Tests for :class:`RestartGovernor`."""
+
+    def test_defaults_change_nothing(self) -> None:
+        governor = RestartGovernor()
+
+        assert [governor.admit(0) for _ in range(5)] == [0, 0, 0, 0, 0]
+        assert governor.admit(42) == 42
+        assert governor.backoff_factor(True) == 1
+
+    def test_budget_spaces_out_restarts_beyond_burst(self) -> None:
+        clock = _Clock()
+        governor = RestartGovernor(budget=3, window=60, clock=clock)
+
+        assert [governor.admit(0) for _ in range(5)] == [0, 0, 0, 20, 40]
+
+    def test_budget_refills_over_window(self) -> None:
+        clock = _Clock()
+        governor = RestartGovernor(budget=2, window=60, clock=clock)
+        governor.admit(0)
+        governor.admit(0)
+
+        clock.now += 30
+        assert governor.admit(0) == 0
+        assert governor.admit(0) == 30
+
+    def test_restarts_queue_behind_reserved_slots(self) -> None:
+        clock = _Clock()
+        governor = RestartGovernor(budget=1, window=60, clock=clock)
+
+        assert governor.admit(100) == 100
+        assert governor.admit(0) == 160
+        assert governor.admit(500) == 500
+
+    def test_refund_hands_the_slot_to_the_next_restart(self) -> None:
+        clock = _Clock()
+        governor = RestartGovernor(budget=1, window=60, clock=clock)
+
+        assert [governor.admit(0), governor.admit(0)] == [0, 60]
+        governor.refund()
+        assert governor.admit(0) == 60
+
+    def test_jitter_is_added(self) -> None:
+        clock = _Clock()
+        governor = RestartGovernor(jitter=30, clock=clock, rand=lambda: 0.5)
+
+        assert governor.admit(0) == 15
+        assert governor.admit(10) == 25
+
+    def test_backoff_doubles_per_rate_limited_failure(self) -> None:
+        clock = _Clock()
+        governor = RestartGovernor(window=3600, max_backoff=4, clock=clock)
+
+        assert governor.backoff_factor(False) == 1
+        assert [governor.backoff_factor(True) for _ in range(4)] == [1, 2, 4, 4]
+        assert governor.backoff_factor(False) == 1
+
+    def test_backoff_counts_each_failed_instance_once(self) -> None:
+        clock = _Clock()
+        governor = RestartGovernor(window=3600, max_backoff=8, clock=clock)
+
+        assert [governor.backoff_factor(True, uid) for uid in ("uid-1", "uid-1", "uid-2", "uid-1")] == [1, 1, 2, 1]
+        assert governor.backoff_factor(True, "uid-3") == 4
+
+    def test_backoff_decays_after_window(self) -> None:
+        clock = _Clock()
+        governor = RestartGovernor(window=3600, max_backoff=8, clock=clock)
+        governor.backoff_factor(True)
+        governor.backoff_factor(True)
+
+        clock.now += 3600
+        assert governor.backoff_factor(True) == 1
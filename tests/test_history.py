@@ -0,0 +1,88 @@
+"""Tests for :mod:`flickr_immich_k8s_sync_operator.history`."""
+
+from datetime import datetime, timezone
+
+from flickr_immich_k8s_sync_operator.config import OperatorConfig
+from flickr_immich_k8s_sync_operator.history import Failure, FailureHistory
+
+_FAILED_AT = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def _config(**overrides: object) -> OperatorConfig:
+    """Return an :class:`OperatorConfig` with adaptive back-off enabled."""
+    values: dict = {  # type: ignore[type-arg]
+        "namespace": "flickr-downloader",
+        "job_names": ["job-a"],
+        "check_interval": 60,
+        "restart_delay": 600,
+        "skip_delay_on_oom": False,
+        "adaptive_backoff": True,
+        "min_restart_delay": 30,
+        "max_restart_delay": 3000,
+        "fast_failure_threshold": 300,
+    }
+    values.update(overrides)
+    return OperatorConfig(**values)
+
+
+def _failure(uid: str, run_duration: float | None) -> Failure:
+    return Failure(uid, _FAILED_AT, "Error", run_duration)
+
+
+class TestFailureHistory:
+    """Tests for :class:`FailureHistory`."""
+
+    def test_fixed_delay_without_adaptive_backoff(self) -> None:
+        history = FailureHistory(_config(adaptive_backoff=False))
+        history.record("job-a", _failure("uid-1", 5))
+        history.record("job-a", _failure("uid-2", 5))
+
+        assert history.restart_delay("job-a") == 600
+
+    def test_one_off_failure_gets_minimum_delay(self) -> None:
+        history = FailureHistory(_config())
+        history.record("job-a", _failure("uid-1", 5))
+        history.record("job-a", _failure("uid-2", 7200))
+
+        assert history.fast_failure_streak("job-a") == 0
+        assert history.restart_delay("job-a") == 30
+
+    def test_fast_failures_back_off_exponentially(self) -> None:
+        history = FailureHistory(_config())
+        delays = []
+        for i in range(5):
+            history.record("job-a", _failure(f"uid-{i}", 10))
+            delays.append(history.restart_delay("job-a"))
+
+        assert delays == [600, 1200, 2400, 3000, 3000]
+
+    def test_unknown_run_duration_counts_as_fast(self) -> None:
+        history = FailureHistory(_config())
+        history.record("job-a", _failure("uid-1", None))
+
+        assert history.fast_failure_streak("job-a") == 1
+
+    def test_same_instance_is_recorded_once(self) -> None:
+        history = FailureHistory(_config())
+
+        assert history.record("job-a", _failure("uid-1", 10)) is True
+        assert history.record("job-a", _failure("uid-1", 10)) is False
+        assert len(history.get("job-a")) == 1
+
+    def test_history_is_bounded(self) -> None:
+        history = FailureHistory(_config(), size=3)
+        for i in range(5):
+            history.record("job-a", _failure(f"uid-{i}", 10))
+
+        assert [failure.uid for failure in history.get("job-a")] == ["uid-2", "uid-3", "uid-4"]
+
+    def test_reset_clears_history(self) -> None:
+        history = FailureHistory(_config())
+        history.record("job-a", _failure("uid-1", 10))
+        history.record("job-a", _failure("uid-2", 10))
+
+        history.reset("job-a")
+
+        assert history.get("job-a") == []
+        history.record("job-a", _failure("uid-3", 10))
+        assert history.restart_delay("job-a") == 600
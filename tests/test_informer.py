@@ -0,0 +1,236 @@
+"""Tests for :mod:`flickr_immich_k8s_sync_operator.informer`."""
+
+import json
+import threading
+import time
+from typing import Any, Iterator
+
+from kubernetes import client
+
+from flickr_immich_k8s_sync_operator.informer import ClusterJobInformer, JobInformer
+from tests.fake_k8s import FakeCluster, job_dict
+
+
+def _job(name: str, resource_version: str) -> dict:  # type: ignore[type-arg]
+    """Return a minimal serialised Job dict."""
+    return {"metadata": {"name": name, "namespace": "ns", "resourceVersion": resource_version}, "status": {}}
+
+
+class _Response:
+    """Stand-in for the urllib3 response returned with ``_preload_content=False``."""
+
+    def __init__(self, payload: dict) -> None:  # type: ignore[type-arg]
+        self.data = json.dumps(payload).encode()
+
+
+class _FakeBatchApi:
+    """Serves LIST responses from a queue of ``(items, resourceVersion)`` tuples."""
+
+    def __init__(self, lists: list[tuple[list[dict], str]]) -> None:  # type: ignore[type-arg]
+        self.lists = lists
+        self.list_calls = 0
+
+    def list_namespaced_job(self, namespace: str, **kwargs: Any) -> _Response:
+        items, resource_version = self.lists[min(self.list_calls, len(self.lists) - 1)]
+        self.list_calls += 1
+        return _Response({"metadata": {"resourceVersion": resource_version}, "items": items})
+
+
+class _FakeWatch:
+    """Replays scripted watch sessions; each session is a list of events or an exception."""
+
+    def __init__(self, sessions: list[Any], shutdown_event: threading.Event) -> None:
+        self.sessions = sessions
+        self.shutdown_event = shutdown_event
+        self.resource_versions: list[str | None] = []
+
+    def __call__(self) -> "_FakeWatch":
+        return self
+
+    def stream(self, func: Any, *args: Any, **kwargs: Any) -> Iterator[dict]:  # type: ignore[type-arg]
+        self.resource_versions.append(kwargs.get("resource_version"))
+        if not self.sessions:
+            self.shutdown_event.set()
+            return
+        session = self.sessions.pop(0)
+        if isinstance(session, Exception):
+            raise session
+        yield from session
+
+    def stop(self) -> None:
+        pass
+
+
+def _event(event_type: str, obj: dict) -> dict:  # type: ignore[type-arg]
+    return {"type": event_type, "raw_object": obj, "object": None}
+
+
+class TestJobInformer:
+    """Tests for :class:`JobInformer`."""
+
+    def test_relist_populates_store(self) -> None:
+        api = _FakeBatchApi([([_job("a", "1"), _job("b", "2")], "10")])
+        informer = JobInformer(api, "ns")  # type: ignore[arg-type]
+
+        informer.relist()
+
+        assert sorted(informer.names()) == ["a", "b"]
+        assert informer.resource_version == "10"
+        assert informer.wait_for_sync(timeout=0)
+
+    def test_watch_events_update_store(self) -> None:
+        shutdown = threading.Event()
+        api = _FakeBatchApi([([_job("a", "1")], "10")])
+        fake_watch = _FakeWatch(
+            [
+                [
+                    _event("ADDED", _job("b", "11")),
+                    _event("MODIFIED", _job("a", "12")),
+                    _event("DELETED", _job("b", "13")),
+                ]
+            ],
+            shutdown,
+        )
+        seen: list[tuple[str, str]] = []
+        informer = JobInformer(api, "ns", on_event=lambda t, n: seen.append((t, n)), watch_factory=fake_watch)  # type: ignore[arg-type]
+
+        informer.run(shutdown)
+
+        assert informer.names() == ["a"]
+        assert informer.get("a")["metadata"]["resourceVersion"] == "12"  # type: ignore[index]
+        assert informer.resource_version == "13"
+        assert seen == [("ADDED", "a"), ("ADDED", "b"), ("MODIFIED", "a"), ("DELETED", "b")]
+        assert api.list_calls == 1
+        # The second watch resumes from the last seen resourceVersion.
+        assert fake_watch.resource_versions == ["10", "13"]
+
+    def test_bookmark_advances_resource_version_only(self) -> None:
+        api = _FakeBatchApi([([_job("a", "1")], "10")])
+        informer = JobInformer(api, "ns")  # type: ignore[arg-type]
+        informer.relist()
+
+        informer.apply_event(_event("BOOKMARK", {"metadata": {"resourceVersion": "42"}}))
+
+        assert informer.resource_version == "42"
+        assert informer.names() == ["a"]
+
+    def test_gone_triggers_relist(self) -> None:
+        shutdown = threading.Event()
+        api = _FakeBatchApi([([_job("a", "1"), _job("b", "2")], "10"), ([_job("a", "5")], "20")])
+        fake_watch = _FakeWatch([client.ApiException(status=410, reason="Gone")], shutdown)
+        seen: list[tuple[str, str]] = []
+        informer = JobInformer(api, "ns", on_event=lambda t, n: seen.append((t, n)), watch_factory=fake_watch)  # type: ignore[arg-type]
+
+        informer.run(shutdown)
+
+        assert api.list_calls == 2
+        assert informer.names() == ["a"]
+        assert fake_watch.resource_versions == ["10", "20"]
+        assert ("DELETED", "b") in seen
+        assert ("MODIFIED", "a") in seen
+
+
+def _wait_until(condition: Any, timeout: float = 5.0) -> bool:
+    """Poll *condition* until it is true or *timeout* seconds have passed."""
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(0.01)
+    return True
+
+
+class TestJobInformerAgainstFakeCluster:
+    """End-to-end tests of the real :class:`kubernetes.watch.Watch` against the fake API server."""
+
+    def test_follows_job_changes(self) -> None:
+        cluster = FakeCluster()
+        cluster.add_job(job_dict("job-a", active=1))
+        shutdown = threading.Event()
+        seen: list[tuple[str, str]] = []
+        informer = JobInformer(
+            cluster.batch_v1, "flickr-downloader", on_event=lambda t, n: seen.append((t, n))  # type: ignore[arg-type]
+        )
+        thread = threading.Thread(target=informer.run, args=(shutdown,), daemon=True)
+        thread.start()
+        try:
+            assert informer.wait_for_sync(timeout=5)
+            cluster.add_job(job_dict("job-b", active=1))
+            cluster.update_status("job-a", active=None, succeeded=1)
+            cluster.batch_v1.delete_namespaced_job("job-b", "flickr-downloader")
+
+            assert _wait_until(lambda: ("DELETED", "job-b") in seen)
+        finally:
+            shutdown.set()
+            informer.stop()
+            thread.join(timeout=5)
+
+        assert not thread.is_alive()
+        assert seen == [("ADDED", "job-a"), ("ADDED", "job-b"), ("MODIFIED", "job-a"), ("DELETED", "job-b")]
+        stored = informer.get("job-a")
+        assert stored is not None and stored["status"]["succeeded"] == 1
+        assert cluster.calls["list_namespaced_job"] == 1
+        assert cluster.calls["watch_namespaced_job"] >= 1
+
+    def test_label_selector_filters_events(self) -> None:
+        cluster = FakeCluster()
+        shutdown = threading.Event()
+        seen: list[tuple[str, str]] = []
+        informer = JobInformer(
+            cluster.batch_v1,  # type: ignore[arg-type]
+            "flickr-downloader",
+            on_event=lambda t, n: seen.append((t, n)),
+            label_selector="app=flickr-downloader",
+        )
+        thread = threading.Thread(target=informer.run, args=(shutdown,), daemon=True)
+        thread.start()
+        try:
+            assert informer.wait_for_sync(timeout=5)
+            cluster.add_job(job_dict("other", labels={"app": "other"}))
+            cluster.add_job(job_dict("job-a"))
+
+            assert _wait_until(lambda: informer.get("job-a") is not None)
+        finally:
+            shutdown.set()
+            informer.stop()
+            thread.join(timeout=5)
+
+        assert informer.names() == ["job-a"]
+
+
+class TestClusterJobInformer:
+    """Tests for :class:`ClusterJobInformer` and its per-namespace views against the fake API server."""
+
+    def test_dispatches_one_watch_by_namespace(self) -> None:
+        cluster = FakeCluster()
+        cluster.add_job(job_dict("job-a", "ns-a"))
+        cluster.add_job(job_dict("job-a", "ns-b"))
+        shutdown = threading.Event()
+        jobs = ClusterJobInformer(cluster.batch_v1)  # type: ignore[arg-type]
+        seen: dict[str, list[tuple[str, str]]] = {"ns-a": [], "ns-b": []}
+        views = {ns: jobs.view(ns, lambda t, n, ns=ns: seen[ns].append((t, n))) for ns in seen}  # type: ignore[misc]
+        threads = [threading.Thread(target=jobs.run, args=(shutdown,), daemon=True)]
+        threads += [threading.Thread(target=view.run, args=(shutdown,), daemon=True) for view in views.values()]
+        for thread in threads:
+            thread.start()
+        try:
+            assert views["ns-a"].wait_for_sync(timeout=5)
+            assert _wait_until(lambda: seen["ns-a"] and seen["ns-b"])
+            cluster.add_job(job_dict("job-b", "ns-a"))
+            cluster.update_status("job-a", "ns-b", succeeded=1)
+
+            assert _wait_until(lambda: ("MODIFIED", "job-a") in seen["ns-b"] and ("ADDED", "job-b") in seen["ns-a"])
+        finally:
+            shutdown.set()
+            jobs.stop()
+            for thread in threads:
+                thread.join(timeout=5)
+
+        # A Job listed while a view subscribes may be reported as ADDED twice.
+        assert list(dict.fromkeys(seen["ns-a"])) == [("ADDED", "job-a"), ("ADDED", "job-b")]
+        assert list(dict.fromkeys(seen["ns-b"])) == [("ADDED", "job-a"), ("MODIFIED", "job-a")]
+        assert views["ns-b"].get("job-a")["status"]["succeeded"] == 1  # type: ignore[index]
+        assert views["ns-b"].get("job-b") is None
+        assert cluster.calls["list_all_namespaces_job"] == 1
+        assert cluster.calls["list_namespaced_job"] == 0
+        assert cluster.calls["watch_namespaced_job"] == 0
@@ -0,0 +1,124 @@
+"""Tests for :mod:`flickr_immich_k8s_sync_operator.leader`."""
+
+from typing import Any
+
+from kubernetes import client
+
+from flickr_immich_k8s_sync_operator.leader import LeaderElector
+from tests.fake_k8s import FakeCluster
+
+
+class _Clock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _elector(cluster: FakeCluster, identity: str, clock: _Clock, **kwargs: Any) -> LeaderElector:
+    return LeaderElector(
+        cluster.coordination_v1,  # type: ignore[arg-type]
+        "flickr-downloader",
+        "flickr-operator",
+        identity,
+        lease_duration=15,
+        clock=clock,
+        **kwargs,
+    )
+
+
+class TestLeaderElector:
+    """Tests for :class:`LeaderElector`."""
+
+    def test_only_one_replica_leads(self, cluster: FakeCluster) -> None:
+        clock = _Clock()
+        first = _elector(cluster, "pod-1", clock)
+        second = _elector(cluster, "pod-2", clock)
+
+        first.tick()
+        second.tick()
+        first.tick()
+
+        assert first.is_leader() is True
+        assert second.is_leader() is False
+        assert cluster.leases[("flickr-downloader", "flickr-operator")]["spec"]["holderIdentity"] == "pod-1"
+
+    def test_standby_takes_over_expired_lease(self, cluster: FakeCluster) -> None:
+        clock = _Clock()
+        started: list[str] = []
+        first = _elector(cluster, "pod-1", clock)
+        second = _elector(cluster, "pod-2", clock, on_started_leading=lambda: started.append("pod-2"))
+        first.tick()
+        second.tick()
+
+        clock.now += 10
+        second.tick()
+        assert second.is_leader() is False
+
+        clock.now += 6
+        second.tick()
+        assert second.is_leader() is True
+        assert started == ["pod-2"]
+        assert cluster.leases[("flickr-downloader", "flickr-operator")]["spec"]["leaseTransitions"] == 1
+
+    def test_renewed_lease_does_not_expire(self, cluster: FakeCluster) -> None:
+        clock = _Clock()
+        first = _elector(cluster, "pod-1", clock)
+        second = _elector(cluster, "pod-2", clock)
+        first.tick()
+        second.tick()
+
+        for _ in range(5):
+            clock.now += 10
+            first.tick()
+            second.tick()
+
+        assert first.is_leader() is True
+        assert second.is_leader() is False
+
+    def test_release_hands_over_immediately(self, cluster: FakeCluster) -> None:
+        clock = _Clock()
+        first = _elector(cluster, "pod-1", clock)
+        second = _elector(cluster, "pod-2", clock)
+        first.tick()
+        second.tick()
+
+        first.release()
+        second.tick()
+
+        assert first.is_leader() is False
+        assert second.is_leader() is True
+
+    def test_conflicting_update_loses(self, cluster: FakeCluster) -> None:
+        clock = _Clock()
+        elector = _elector(cluster, "pod-1", clock)
+        elector.tick()
+
+        def conflict(*args: Any, **kwargs: Any) -> Any:
+            raise client.ApiException(status=409, reason="Conflict")
+
+        cluster.coordination_v1.replace_namespaced_lease = conflict  # type: ignore[method-assign]
+
+        assert elector.try_acquire_or_renew() is False
+
+    def test_steps_down_when_renewal_keeps_failing(self, cluster: FakeCluster) -> None:
+        clock = _Clock()
+        stopped: list[bool] = []
+        elector = _elector(cluster, "pod-1", clock, on_stopped_leading=lambda: stopped.append(True))
+        elector.tick()
+
+        def unavailable(*args: Any, **kwargs: Any) -> Any:
+            raise client.ApiException(status=503, reason="Service Unavailable")
+
+        cluster.coordination_v1.read_namespaced_lease = unavailable  # type: ignore[method-assign]
+        clock.now += 5
+        elector.tick()
+        assert elector.is_leader() is True
+
+        clock.now += 6
+        elector.tick()
+        assert elector.is_leader() is False
+        assert stopped == [True]
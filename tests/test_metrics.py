@@ -0,0 +1,85 @@
+"""Tests for :mod:`flickr_immich_k8s_sync_operator.metrics`."""
+
+import urllib.error
+import urllib.request
+
+import pytest
+
+from flickr_immich_k8s_sync_operator.metrics import (
+    Counter,
+    Histogram,
+    OperatorMetrics,
+    restart_reason,
+    start_metrics_server,
+)
+
+
+class TestHistogram:
+    """Tests for :class:`Histogram`."""
+
+    def test_buckets_are_cumulative(self) -> None:
+        hist = Histogram("latency_seconds", "Latency.", ("verb",), buckets=(0.1, 1.0))
+        for value in (0.05, 0.5, 0.5, 5.0):
+            hist.observe(value, "get")
+
+        lines = hist.render()
+
+        assert 'latency_seconds_bucket{verb="get",le="0.1"} 1' in lines
+        assert 'latency_seconds_bucket{verb="get",le="1"} 3' in lines
+        assert 'latency_seconds_bucket{verb="get",le="+Inf"} 4' in lines
+        assert 'latency_seconds_sum{verb="get"} 6.05' in lines
+        assert 'latency_seconds_count{verb="get"} 4' in lines
+        assert hist.count("get") == 4
+        assert hist.total("get") == pytest.approx(6.05)
+        assert hist.total("put") == 0.0
+
+    def test_value_on_bucket_bound_counts_into_that_bucket(self) -> None:
+        hist = Histogram("latency_seconds", "Latency.", buckets=(1.0,))
+        hist.observe(1.0)
+        assert 'latency_seconds_bucket{le="1"} 1' in hist.render()
+
+
+class TestCounter:
+    """Tests for :class:`Counter`."""
+
+    def test_render_escapes_labels(self) -> None:
+        counter = Counter("restarts_total", "Restarts.", ("reason",))
+        counter.inc('bad"reason')
+        counter.inc('bad"reason')
+
+        assert counter.render()[-1] == 'restarts_total{reason="bad\\"reason"} 2'
+        assert counter.value('bad"reason') == 2
+
+
+@pytest.mark.parametrize(
+    ("reasons", "expected"),
+    [
+        ({"Error", "OOMKilled"}, "OOMKilled"),
+        ({"Error", "RateLimited"}, "RateLimited"),
+        ({"Error"}, "Error"),
+        (set(), "Unknown"),
+    ],
+)
+def test_restart_reason(reasons: set[str], expected: str) -> None:
+    assert restart_reason(reasons) == expected
+
+
+class TestMetricsServer:
+    """Tests for :func:`start_metrics_server`."""
+
+    def test_serves_metrics(self) -> None:
+        metrics = OperatorMetrics()
+        metrics.restarts.inc("OOMKilled")
+        server = start_metrics_server(metrics, 0, host="127.0.0.1")
+        try:
+            url = f"http://127.0.0.1:{server.server_address[1]}"
+            with urllib.request.urlopen(f"{url}/metrics") as resp:
+                body = resp.read().decode()
+            with pytest.raises(urllib.error.HTTPError):
+                urllib.request.urlopen(f"{url}/other")
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        assert 'flickr_operator_restarts_total{reason="OOMKilled"} 1' in body
+        assert "# TYPE flickr_operator_api_request_duration_seconds histogram" in body
@@ -1,10 +1,34 @@
-"""Tests for :func:`flickr_immich_k8s_sync_operator.operator.build_manifest`."""
+"""Tests for :mod:`flickr_immich_k8s_sync_operator.operator`."""
 
 import copy
+import dataclasses
+import json
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Callable
+from unittest import mock
 
 import pytest
+from kubernetes import client
 
-from flickr_immich_k8s_sync_operator.operator import SERVER_MANAGED_LABELS, build_manifest
+from flickr_immich_k8s_sync_operator import operator as operator_module
+from flickr_immich_k8s_sync_operator.config import FLICKRSYNC_LABEL, OperatorConfig
+from flickr_immich_k8s_sync_operator.flickrsync import RESTART_DELAY_ANNOTATION, RESTART_STRATEGY_ANNOTATION
+from flickr_immich_k8s_sync_operator.governor import RestartGovernor
+from flickr_immich_k8s_sync_operator.operator import (
+    FIELD_MANAGER,
+    SERVER_MANAGED_LABELS,
+    JobRestartOperator,
+    build_manifest,
+    failed_since,
+    manifest_key,
+    started_at,
+    succeeded,
+)
+from flickr_immich_k8s_sync_operator.scheduler import RestartScheduler
+from tests.fake_k8s import FakeCluster, job_dict
 
 
 def _sample_job_dict() -> dict:  # type: ignore[type-arg]
@@ -82,6 +106,14 @@ class TestBuildManifest:
         build_manifest(original)
         assert original == frozen
 
+    def test_result_shares_no_template_objects(self) -> None:
+        original = _sample_job_dict()
+        frozen = copy.deepcopy(original)
+        result = build_manifest(original)
+        result["spec"]["template"]["metadata"]["labels"]["extra"] = "x"
+        result["spec"]["template"]["spec"]["containers"][0]["name"] = "changed"
+        assert original == frozen
+
     def test_handles_missing_template_labels(self) -> None:
         job = _sample_job_dict()
         del job["spec"]["template"]["metadata"]["labels"]
@@ -103,3 +135,1256 @@ class TestBuildManifest:
         containers = result["spec"]["template"]["spec"]["containers"]
         assert len(containers) == 1
         assert containers[0]["name"] == "downloader"
+
+
+class TestFailedSince:
+    """Tests for :func:`failed_since`."""
+
+    def test_not_failed(self) -> None:
+        assert failed_since({"conditions": [{"type": "Complete", "status": "True"}]}) is None
+        assert failed_since({}) is None
+
+    def test_parses_transition_time(self) -> None:
+        status = {"conditions": [{"type": "Failed", "status": "True", "lastTransitionTime": "2025-01-01T00:00:00Z"}]}
+        assert failed_since(status) == datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+    def test_ignores_false_condition(self) -> None:
+        status = {"conditions": [{"type": "Failed", "status": "False", "lastTransitionTime": "2025-01-01T00:00:00Z"}]}
+        assert failed_since(status) is None
+
+
+def _config(**overrides: object) -> OperatorConfig:
+    """Return an :class:`OperatorConfig` suitable for operator tests."""
+    values: dict = {  # type: ignore[type-arg]
+        "namespace": "flickr-downloader",
+        "job_names": ["job-a", "job-b"],
+        "check_interval": 60,
+        "restart_delay": 3600,
+        "skip_delay_on_oom": False,
+    }
+    values.update(overrides)
+    return OperatorConfig(**values)
+
+
+class TestJobStatusHelpers:
+    """Tests for :func:`started_at` and :func:`succeeded`."""
+
+    def test_started_at(self) -> None:
+        assert started_at({}) is None
+        assert started_at({"startTime": "2025-01-01T00:00:00+00:00"}) == datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+    def test_succeeded(self) -> None:
+        assert succeeded({"conditions": [{"type": "Complete", "status": "True"}]})
+        assert not succeeded({"conditions": [{"type": "Failed", "status": "True"}]})
+        assert not succeeded({})
+
+
+class TestWatchModeQueue:
+    """Tests for the work queue feeding the watch-mode workers."""
+
+    def test_ignores_unconfigured_jobs(self, operator_for: Callable[[OperatorConfig], JobRestartOperator]) -> None:
+        op = operator_for(_config(check_mode="watch"))
+        op._on_job_event("ADDED", "someone-else")
+        assert len(op._queue) == 0
+
+    def test_deduplicates_pending_events(self, operator_for: Callable[[OperatorConfig], JobRestartOperator]) -> None:
+        op = operator_for(_config(check_mode="watch"))
+        op._on_job_event("ADDED", "job-a")
+        op._on_job_event("MODIFIED", "job-a")
+        op._on_job_event("MODIFIED", "job-b")
+        assert len(op._queue) == 2
+
+    def test_failed_checks_are_retried_with_backoff(
+        self, operator_for: Callable[[OperatorConfig], JobRestartOperator]
+    ) -> None:
+        op = operator_for(_config(check_mode="watch"))
+        shutdown = threading.Event()
+
+        with mock.patch.object(op, "_check_job_from_store", return_value=False):
+            op._check_queued_job("job-a", shutdown)
+            op._check_queued_job("job-a", shutdown)
+        assert op._queue.num_requeues("job-a") == 2
+
+        with mock.patch.object(op, "_check_job_from_store", return_value=True):
+            op._check_queued_job("job-a", shutdown)
+        assert op._queue.num_requeues("job-a") == 0
+
+    def test_event_for_a_busy_job_is_queued_again(
+        self, operator_for: Callable[[OperatorConfig], JobRestartOperator], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(operator_module, "QUEUE_BUSY_RETRY", 0.05)
+        op = operator_for(_config(check_mode="watch"))
+        shutdown = threading.Event()
+        op._on_job_event("MODIFIED", "job-a")
+
+        with mock.patch.object(op, "_check_job_from_store", return_value=True) as check:
+            with op._job_lock("job-a"):
+                job_name = op._queue.get(timeout=1)
+                assert job_name == "job-a"
+                op._handle_queued_job(job_name, shutdown)
+                op._queue.done(job_name)
+            assert check.call_count == 0
+
+            job_name = op._queue.get(timeout=1)
+            assert job_name == "job-a"
+            op._handle_queued_job(job_name, shutdown)
+        assert check.call_count == 1
+
+    def test_scheduled_work_runs_on_the_queue_workers(
+        self, operator_for: Callable[[OperatorConfig], JobRestartOperator]
+    ) -> None:
+        op = operator_for(_config(check_mode="watch"))
+        shutdown = threading.Event()
+        restart = mock.Mock()
+
+        future = op._dispatch("job-a", shutdown, restart, "uid-1")
+
+        assert not future.done()
+        assert op._queue.get(timeout=1) == "job-a"
+        with mock.patch.object(op, "_check_job_from_store", return_value=True) as check:
+            op._handle_queued_job("job-a", shutdown)
+        restart.assert_called_once_with("job-a", "uid-1", shutdown)
+        assert future.result() is True
+        assert check.call_count == 1
+        assert op._executor._threads == set()  # type: ignore[attr-defined]
+
+    def test_queued_work_is_skipped_on_shutdown(
+        self, operator_for: Callable[[OperatorConfig], JobRestartOperator]
+    ) -> None:
+        op = operator_for(_config(check_mode="watch"))
+        shutdown = threading.Event()
+        restart = mock.Mock()
+        future = op._dispatch("job-a", shutdown, restart)
+
+        shutdown.set()
+        op._run_queue_worker(shutdown)
+
+        assert future.result() is False
+        restart.assert_not_called()
+
+
+class TestListMode:
+    """Tests for the single-LIST-per-cycle check mode."""
+
+    def test_one_list_per_cycle(
+        self, cluster: FakeCluster, operator_for: Callable[[OperatorConfig], JobRestartOperator]
+    ) -> None:
+        names = [f"job-{i}" for i in range(20)]
+        for name in names:
+            cluster.add_job(job_dict(name, active=1))
+        op = operator_for(_config(job_names=names, check_mode="list"))
+
+        op._list_cycle(threading.Event())
+
+        assert cluster.calls == {"list_namespaced_job": 1}
+        assert set(op._cached_manifests) == set(names)
+
+    def test_restarts_failed_job_from_list(
+        self, cluster: FakeCluster, operator_for: Callable[[OperatorConfig], JobRestartOperator]
+    ) -> None:
+        cluster.add_job(job_dict("job-a", failed_at=datetime.now(timezone.utc) - timedelta(hours=2)))
+        cluster.add_job(job_dict("job-b", active=1))
+        op = operator_for(_config(check_mode="list", restart_delay=60))
+        shutdown = threading.Event()
+        shutdown.wait = lambda timeout=None: False  # type: ignore[method-assign]
+
+        op._list_cycle(shutdown)
+
+        assert cluster.calls["list_namespaced_job"] == 1
+        # The only read is the check whether the deleted Job is gone.
+        assert cluster.calls["read_namespaced_job"] == 1
+        assert cluster.calls["delete_namespaced_job"] == 1
+        assert cluster.calls["create_namespaced_job"] == 1
+
+    def test_label_selector_is_passed(
+        self, cluster: FakeCluster, operator_for: Callable[[OperatorConfig], JobRestartOperator]
+    ) -> None:
+        cluster.add_job(job_dict("job-a", active=1, labels={"app": "other"}))
+        op = operator_for(_config(check_mode="list", label_selector="app=flickr-downloader"))
+
+        op._list_cycle(threading.Event())
+
+        assert "job-a" not in op._cached_manifests
+
+    def test_poll_mode_reads_each_job(
+        self, cluster: FakeCluster, operator_for: Callable[[OperatorConfig], JobRestartOperator]
+    ) -> None:
+        cluster.add_job(job_dict("job-a", active=1))
+        op = operator_for(_config())
+
+        op._poll_cycle(threading.Event())
+
+        assert cluster.calls == {"read_namespaced_job": 2}
+
+
+class TestWorkerPool:
+    """Tests for concurrent checking on the worker pool."""
+
+    def test_restarts_run_in_parallel(
+        self, cluster: FakeCluster, operator_for: Callable[[OperatorConfig], JobRestartOperator]
+    ) -> None:
+        long_ago = datetime.now(timezone.utc) - timedelta(hours=2)
+        names = [f"job-{i}" for i in range(4)]
+        for name in names:
+            cluster.add_job(job_dict(name, failed_at=long_ago))
+        op = operator_for(_config(job_names=names, restart_delay=60, workers=4))
+        create_job = op._create_job
+
+        def slow_create(job_name: str, shutdown_event: threading.Event) -> bool:
+            time.sleep(0.2)
+            return create_job(job_name, shutdown_event)
+
+        op._create_job = slow_create  # type: ignore[method-assign]
+        shutdown = threading.Event()
+
+        start = time.monotonic()
+        op._poll_cycle(shutdown)
+        elapsed = time.monotonic() - start
+
+        assert cluster.calls["create_namespaced_job"] == 4
+        assert elapsed < 0.6
+
+    def test_same_job_is_serialised(self, operator_for: Callable[[OperatorConfig], JobRestartOperator]) -> None:
+        op = operator_for(_config())
+        calls: list[str] = []
+        op._run_serialized("job-a", threading.Event(), lambda name, ev: calls.append(name))
+        with op._job_locks["job-a"]:
+            op._run_serialized("job-a", threading.Event(), lambda name, ev: calls.append(name))
+        assert calls == ["job-a"]
+
+
+class TestRestartJob:
+    """Tests for the delete → wait → create restart sequence."""
+
+    def test_waits_for_garbage_collection(
+        self, cluster: FakeCluster, operator_for: Callable[[OperatorConfig], JobRestartOperator]
+    ) -> None:
+        cluster.gc_requests = 3
+        cluster.add_job(job_dict("job-a", failed_at=datetime.now(timezone.utc)))
+        op = operator_for(_config())
+        waits: list[float | None] = []
+        shutdown = threading.Event()
+        shutdown.wait = lambda timeout=None: waits.append(timeout) or False  # type: ignore[method-assign, func-returns-value]
+
+        op._cached_manifests["job-a"] = build_manifest(cluster.jobs[("flickr-downloader", "job-a")])
+        op._cached_uids["job-a"] = cluster.jobs[("flickr-downloader", "job-a")]["metadata"]["uid"]
+        op._restart_job("job-a", shutdown)
+
+        assert cluster.calls["create_namespaced_job"] == 1
+        # Back-off doubles between existence checks and no fixed 15s sleep is used.
+        assert waits == [0.25, 0.5]
+        assert cluster.jobs[("flickr-downloader", "job-a")]["metadata"]["uid"] != op._cached_uids["job-a"]
+
+    def test_retries_create_on_conflict(
+        self, cluster: FakeCluster, operator_for: Callable[[OperatorConfig], JobRestartOperator]
+    ) -> None:
+        op = operator_for(_config())
+        op._cached_manifests["job-a"] = build_manifest(_sample_job_dict())
+        conflicts = [client.ApiException(status=409, reason="AlreadyExists")] * 2
+        create = cluster.batch_v1.create_namespaced_job
+
+        def flaky_create(namespace: str, body: dict) -> dict:  # type: ignore[type-arg]
+            if conflicts:
+                raise conflicts.pop()
+            return create(namespace, body)
+
+        cluster.batch_v1.create_namespaced_job = flaky_create  # type: ignore[method-assign, assignment]
+        waits: list[float | None] = []
+        shutdown = threading.Event()
+        shutdown.wait = lambda timeout=None: waits.append(timeout) or False  # type: ignore[method-assign, func-returns-value]
+
+        op._create_job("job-a", shutdown)
+
+        assert ("flickr-downloader", "flickr-downloader-alice") in cluster.jobs
+        assert len(waits) == 2
+        assert 0.5 <= waits[0] <= 1.0  # type: ignore[operator]
+        assert 1.0 <= waits[1] <= 2.0  # type: ignore[operator]
+
+    def test_gives_up_after_timeout(
+        self, cluster: FakeCluster, operator_for: Callable[[OperatorConfig], JobRestartOperator]
+    ) -> None:
+        cluster.gc_requests = 1000
+        cluster.add_job(job_dict("job-a"))
+        op = operator_for(_config(delete_timeout=0))
+
+        assert op._wait_for_deletion("job-a", "uid-1", threading.Event()) is False
+
+
+class TestApplyRestartStrategy:
+    """Tests for the background delete → server-side apply restart strategy."""
+
+    def _restart(self, cluster: FakeCluster, op: JobRestartOperator, job_name: str) -> list[float | None]:
+        """Restart *job_name* and return the waits of the deletion back-off."""
+        waits: list[float | None] = []
+        shutdown = threading.Event()
+        shutdown.wait = lambda timeout=None: waits.append(timeout) or False  # type: ignore[method-assign, func-returns-value]
+        op._cached_manifests[job_name] = build_manifest(cluster.jobs[("flickr-downloader", job_name)])
+        op._cached_uids[job_name] = cluster.jobs[("flickr-downloader", job_name)]["metadata"]["uid"]
+        op._restart_job(job_name, shutdown)
+        return waits
+
+    def test_apply_skips_the_deletion_wait(
+        self, cluster: FakeCluster, operator_for: Callable[[OperatorConfig], JobRestartOperator]
+    ) -> None:
+        cluster.gc_requests = 3
+        cluster.add_job(job_dict("job-a", failed_at=datetime.now(timezone.utc)))
+        op = operator_for(_config(restart_strategy="apply"))
+
+        waits = self._restart(cluster, op, "job-a")
+
+        job = cluster.jobs[("flickr-downloader", "job-a")]
+        assert waits == []
+        assert dict(cluster.calls) == {"delete_namespaced_job": 1, "patch_namespaced_job": 1}
+        assert job["metadata"]["uid"] != op._cached_uids["job-a"]
+        assert job["metadata"]["managedFields"] == [{"manager": FIELD_MANAGER, "operation": "Apply"}]
+        assert op.metrics.api_latency.count("patch", "jobs") == 1
+        assert op.metrics.restart_duration.count() == 1
+
+    def test_strategy_is_chosen_per_job(
+        self, cluster: FakeCluster, operator_for: Callable[[OperatorConfig], JobRestartOperator]
+    ) -> None:
+        cluster.add_job(job_dict("job-a", failed_at=datetime.now(timezone.utc)))
+        cluster.add_job(job_dict("job-b", failed_at=datetime.now(timezone.utc)))
+        op = operator_for(_config(job_restart_strategies={"job-b": "apply"}))
+
+        self._restart(cluster, op, "job-a")
+        assert cluster.calls["create_namespaced_job"] == 1
+        assert cluster.calls["patch_namespaced_job"] == 0
+
+        self._restart(cluster, op, "job-b")
+        assert cluster.calls["create_namespaced_job"] == 1
+        assert cluster.calls["patch_namespaced_job"] == 1
+
+    def test_waits_while_the_job_is_still_terminating(
+        self, cluster: FakeCluster, operator_for: Callable[[OperatorConfig], JobRestartOperator]
+    ) -> None:
+        cluster.gc_requests = 2
+        cluster.add_job(job_dict("job-a", failed_at=datetime.now(timezone.utc)))
+        delete = cluster.batch_v1.delete_namespaced_job
+
+        def delete_held_by_finalizer(name: str, namespace: str, **kwargs: object) -> object:
+            return delete(name, namespace, body=client.V1DeleteOptions(propagation_policy="Foreground"))
+
+        cluster.batch_v1.delete_namespaced_job = delete_held_by_finalizer  # type: ignore[method-assign]
+        op = operator_for(_config(restart_strategy="apply"))
+
+        waits = self._restart(cluster, op, "job-a")
+
+        assert waits == [0.25]
+        assert cluster.calls["patch_namespaced_job"] == 1
+        assert cluster.jobs[("flickr-downloader", "job-a")]["metadata"]["uid"] != op._cached_uids["job-a"]
+
+
+class TestTemplateSource:
+    """Tests for restarts from a ConfigMap or CronJob template instead of the cached manifest."""
+
+    _TEMPLATE = {
+        "metadata": {"labels": {"app": "flickr-downloader"}},
+        "spec": {
+            "backoffLimit": 1,
+            "template": {"spec": {"containers": [{"name": "downloader", "image": "flickr-dl:2"}]}},
+        },
+    }
+
+    def _operator(
+        self, cluster: FakeCluster, operator_for: Callable[[OperatorConfig], JobRestartOperator], **overrides: object
+    ) -> JobRestartOperator:
+        op = operator_for(_config(check_mode="list", restart_delay=0, **overrides))
+        assert op._templates is not None
+        op._templates._core_v1 = cluster.core_v1  # type: ignore[attr-defined]
+        op._templates._batch_v1 = cluster.batch_v1  # type: ignore[attr-defined]
+        return op
+
+    def test_restarts_from_config_map_without_caching_manifests(
+        self, cluster: FakeCluster, operator_for: Callable[[OperatorConfig], JobRestartOperator]
+    ) -> None:
+        cluster.config_maps[("flickr-downloader", "templates")] = {"data": {"job-a.json": json.dumps(self._TEMPLATE)}}
+        cluster.add_job(job_dict("job-a", failed_at=datetime.now(timezone.utc)))
+        op = self._operator(cluster, operator_for, template_source="configmap", template_configmap="templates")
+
+        op._list_cycle(threading.Event())
+
+        job = cluster.jobs[("flickr-downloader", "job-a")]
+        assert cluster.calls["create_namespaced_job"] == 1
+        assert job["spec"]["backoffLimit"] == 1
+        assert job["spec"]["template"]["spec"]["containers"][0]["image"] == "flickr-dl:2"
+        assert op._cached_manifests == {}
+
+    def test_restarts_from_owner_cronjob(
+        self, cluster: FakeCluster, operator_for: Callable[[OperatorConfig], JobRestartOperator]
+    ) -> None:
+        cluster.cron_jobs[("flickr-downloader", "nightly")] = {
+            "metadata": {"name": "nightly"},
+            "spec": {"schedule": "0 3 * * *", "jobTemplate": self._TEMPLATE},
+        }
+        failed = job_dict("job-a", failed_at=datetime.now(timezone.utc))
+        failed["metadata"]["ownerReferences"] = [
+            {"apiVersion": "batch/v1", "kind": "CronJob", "name": "nightly", "uid": "cronjob-uid"}
+        ]
+        cluster.add_job(failed)
+        op = self._operator(cluster, operator_for, template_source="cronjob")
+
+        op._list_cycle(threading.Event())
+
+        assert cluster.calls["list_namespaced_cron_job"] == 1
+        assert cluster.jobs[("flickr-downloader", "job-a")]["spec"]["backoffLimit"] == 1
+
+    def test_restarts_cronjob_job_twice_in_a_row(
+        self, cluster: FakeCluster, operator_for: Callable[[OperatorConfig], JobRestartOperator]
+    ) -> None:
+        cluster.cron_jobs[("flickr-downloader", "nightly")] = {
+            "metadata": {"name": "nightly"},
+            "spec": {"schedule": "0 3 * * *", "jobTemplate": self._TEMPLATE},
+        }
+        owner = {"apiVersion": "batch/v1", "kind": "CronJob", "name": "nightly", "uid": "cronjob-uid"}
+        failed = job_dict("job-a", failed_at=datetime.now(timezone.utc))
+        failed["metadata"]["ownerReferences"] = [owner]
+        cluster.add_job(failed)
+        op = self._operator(cluster, operator_for, template_source="cronjob")
+
+        op._list_cycle(threading.Event())
+        job = cluster.jobs[("flickr-downloader", "job-a")]
+        assert job["metadata"]["ownerReferences"] == [owner]
+        cluster.update_status(
+            "job-a",
+            conditions=[{"type": "Failed", "status": "True", "lastTransitionTime": "2025-01-01T00:00:00Z"}],
+        )
+        op._list_cycle(threading.Event())
+
+        assert cluster.calls["delete_namespaced_job"] == 2
+        assert cluster.calls["create_namespaced_job"] == 2
+        assert cluster.jobs[("flickr-downloader", "job-a")]["metadata"]["ownerReferences"] == [owner]
+
+    def test_job_without_template_is_not_deleted(
+        self, cluster: FakeCluster, operator_for: Callable[[OperatorConfig], JobRestartOperator]
+    ) -> None:
+        cluster.config_maps[("flickr-downloader", "templates")] = {"data": {}}
+        cluster.add_job(job_dict("job-a", failed_at=datetime.now(timezone.utc)))
+        op = self._operator(cluster, operator_for, template_source="configmap", template_configmap="templates")
+
+        op._list_cycle(threading.Event())
+
+        assert cluster.calls["delete_namespaced_job"] == 0
+        assert ("flickr-downloader", "job-a") in cluster.jobs
+
+
+class TestFlickrSync:
+    """Tests for Jobs created from FlickrSync resources and their annotated restart policy."""
+
+    def test_annotated_restart_policy_overrides_the_configuration(
+        self, cluster: FakeCluster, operator_for: Callable[[OperatorConfig], JobRestartOperator]
+    ) -> None:
+        failed = job_dict("job-a", failed_at=datetime.now(timezone.utc))
+        failed["metadata"]["annotations"] = {RESTART_DELAY_ANNOTATION: "0", RESTART_STRATEGY_ANNOTATION: "apply"}
+        cluster.add_job(failed)
+        op = operator_for(_config(restart_delay=3600))
+
+        op._check_job("job-a", threading.Event())
+
+        assert cluster.calls["patch_namespaced_job"] == 1
+        assert cluster.calls["create_namespaced_job"] == 0
+
+    def test_reconciled_job_is_restarted_from_its_flickrsync(
+        self, cluster: FakeCluster, operator_for: Callable[[OperatorConfig], JobRestartOperator]
+    ) -> None:
+        sync = cluster.add_flickrsync("alice", {"user": "alice", "image": "flickr-dl:2", "restartPolicy": {"delay": 0}})
+        op = operator_for(
+            _config(
+                job_names=[],
+                job_selector=FLICKRSYNC_LABEL,
+                check_mode="list",
+                template_source="flickrsync",
+                flickrsync=True,
+            )
+        )
+        assert op._reconciler is not None and op._templates is not None
+        op._templates._custom_objects = cluster.custom_objects  # type: ignore[attr-defined]
+        op._reconciler.reconcile()
+        old_uid = cluster.jobs[("flickr-downloader", "flickr-downloader-alice")]["metadata"]["uid"]
+        cluster.update_status(
+            "flickr-downloader-alice",
+            conditions=[{"type": "Failed", "status": "True", "lastTransitionTime": "2025-01-01T00:00:00Z"}],
+        )
+
+        op._list_cycle(threading.Event())
+
+        job = cluster.jobs[("flickr-downloader", "flickr-downloader-alice")]
+        assert job["metadata"]["uid"] != old_uid
+        assert job["metadata"]["ownerReferences"][0]["uid"] == sync["metadata"]["uid"]
+        assert op.metrics.api_latency.count("patch", "jobs") == 1
+        assert op.metrics.api_latency.count("list", "flickrsyncs") == 1
+
+    def test_scheduled_run_is_restarted_twice_in_a_row(
+        self, cluster: FakeCluster, operator_for: Callable[[OperatorConfig], JobRestartOperator]
+    ) -> None:
+        cluster.add_flickrsync("alice", {"user": "alice", "image": "flickr-dl:2", "schedule": "0 3 * * *"})
+        owner = {"apiVersion": "batch/v1", "kind": "CronJob", "name": "flickr-downloader-alice", "uid": "cronjob-uid"}
+        run = job_dict("flickr-downloader-alice-28000000", failed_at=datetime.now(timezone.utc))
+        run["metadata"]["labels"] = {FLICKRSYNC_LABEL: "alice"}
+        run["metadata"]["ownerReferences"] = [owner]
+        cluster.add_job(run)
+        op = operator_for(
+            _config(
+                job_names=[],
+                job_selector=FLICKRSYNC_LABEL,
+                check_mode="list",
+                restart_delay=0,
+                template_source="flickrsync",
+            )
+        )
+        assert op._templates is not None
+        op._templates._custom_objects = cluster.custom_objects  # type: ignore[attr-defined]
+
+        op._list_cycle(threading.Event())
+        cluster.update_status(
+            "flickr-downloader-alice-28000000",
+            conditions=[{"type": "Failed", "status": "True", "lastTransitionTime": "2025-01-01T00:00:00Z"}],
+        )
+        op._list_cycle(threading.Event())
+
+        job = cluster.jobs[("flickr-downloader", "flickr-downloader-alice-28000000")]
+        assert cluster.calls["delete_namespaced_job"] == 2
+        assert job["metadata"]["ownerReferences"] == [owner]
+
+
+class TestManifestCache:
+    """Tests for skipping manifest rebuilds of unchanged Jobs."""
+
+    def test_manifest_key_prefers_generation(self) -> None:
+        assert manifest_key("uid-1", 2, "100") == manifest_key("uid-1", 2, "200")
+        assert manifest_key("uid-1", 2, "100") != manifest_key("uid-2", 2, "100")
+        assert manifest_key("uid-1", None, "100") != manifest_key("uid-1", None, "200")
+
+    def test_status_update_does_not_rebuild(
+        self,
+        cluster: FakeCluster,
+        operator_for: Callable[[OperatorConfig], JobRestartOperator],
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        builds: list[str] = []
+
+        def counting_build_manifest(job: dict) -> dict:  # type: ignore[type-arg]
+            builds.append(job["metadata"]["name"])
+            return build_manifest(job)
+
+        monkeypatch.setattr(operator_module, "build_manifest", counting_build_manifest)
+        cluster.add_job(job_dict("job-a", active=1))
+        op = operator_for(_config(job_names=["job-a"]))
+
+        op._check_job("job-a", threading.Event())
+        cluster.update_status("job-a", active=2)
+        op._check_job("job-a", threading.Event())
+
+        assert builds == ["job-a"]
+
+    def test_recreated_job_is_rebuilt(
+        self,
+        cluster: FakeCluster,
+        operator_for: Callable[[OperatorConfig], JobRestartOperator],
+    ) -> None:
+        cluster.add_job(job_dict("job-a", active=1))
+        op = operator_for(_config(job_names=["job-a"]))
+        op._check_job("job-a", threading.Event())
+        first_uid = op._cached_uids["job-a"]
+
+        del cluster.jobs[("flickr-downloader", "job-a")]
+        cluster.add_job(job_dict("job-a", active=1))
+        op._check_job("job-a", threading.Event())
+
+        assert op._cached_uids["job-a"] != first_uid
+
+
+class TestRawJson:
+    """Tests for the ``raw_json`` fast path that skips model deserialization."""
+
+    @pytest.mark.parametrize("check_mode", ["poll", "list"])
+    def test_restarts_failed_job(
+        self,
+        cluster: FakeCluster,
+        operator_for: Callable[[OperatorConfig], JobRestartOperator],
+        check_mode: str,
+    ) -> None:
+        cluster.add_job(job_dict("job-a", failed_at=datetime.now(timezone.utc) - timedelta(hours=2)))
+        cluster.add_job(job_dict("job-b", active=1))
+        cluster.add_pod("job-a", "job-a-xyz", exit_code=137, reason="OOMKilled")
+        op = operator_for(_config(check_mode=check_mode, restart_delay=60, raw_json=True))
+        shutdown = threading.Event()
+        shutdown.wait = lambda timeout=None: False  # type: ignore[method-assign]
+
+        op._list_cycle(shutdown) if check_mode == "list" else op._poll_cycle(shutdown)
+
+        assert cluster.calls["delete_namespaced_job"] == 1
+        assert cluster.calls["create_namespaced_job"] == 1
+        assert set(op._cached_manifests) == {"job-a", "job-b"}
+
+    def test_pod_states_match_model_path(
+        self, cluster: FakeCluster, operator_for: Callable[[OperatorConfig], JobRestartOperator]
+    ) -> None:
+        cluster.add_pod("job-a", "job-a-1", exit_code=137, reason="OOMKilled")
+        cluster.add_pod("job-a", "job-a-2", exit_code=1, reason="Error")
+        cluster.add_pod("job-b", "job-b-1")
+
+        raw = operator_for(_config(raw_json=True))._list_pod_states("job-a")
+        model = operator_for(_config())._list_pod_states("job-a")
+
+        assert sorted(raw) == sorted(model)
+        assert [state[1:] for state in sorted(raw)] == [("job-a-1", 137, "OOMKilled"), ("job-a-2", 1, "Error")]
+
+    def test_job_exists_compares_uid(
+        self, cluster: FakeCluster, operator_for: Callable[[OperatorConfig], JobRestartOperator]
+    ) -> None:
+        job = cluster.add_job(job_dict("job-a", active=1))
+        op = operator_for(_config(raw_json=True))
+
+        assert op._job_exists("job-a", job["metadata"]["uid"]) is True
+        assert op._job_exists("job-a", "some-other-uid") is False
+        assert op._job_exists("job-missing", "uid-1") is False
+
+
+class TestStateStore:
+    """Tests for persisting manifests and restart bookkeeping across operator restarts."""
+
+    def test_reload_skips_manifest_rebuild(
+        self,
+        cluster: FakeCluster,
+        operator_for: Callable[[OperatorConfig], JobRestartOperator],
+        monkeypatch: pytest.MonkeyPatch,
+        tmp_path: Path,
+    ) -> None:
+        cfg = _config(job_names=["job-a"], state_store="sqlite", state_path=str(tmp_path / "state.db"))
+        cluster.add_job(job_dict("job-a", active=1))
+        first = operator_for(cfg)
+        first._check_job("job-a", threading.Event())
+        first._state.close()
+
+        builds: list[str] = []
+
+        def counting_build_manifest(job: dict) -> dict:  # type: ignore[type-arg]
+            builds.append(job["metadata"]["name"])
+            return build_manifest(job)
+
+        monkeypatch.setattr(operator_module, "build_manifest", counting_build_manifest)
+        second = operator_for(cfg)
+        second._check_job("job-a", threading.Event())
+
+        assert second._cached_manifests == first._cached_manifests
+        assert second._manifest_keys == first._manifest_keys
+        assert builds == []
+
+    @pytest.mark.parametrize(
+        ("situation", "expected_deletes", "expected_creates"),
+        [("gone", 0, 1), ("never-deleted", 1, 1), ("recreated", 0, 0)],
+    )
+    def test_resumes_interrupted_restart(
+        self,
+        cluster: FakeCluster,
+        operator_for: Callable[[OperatorConfig], JobRestartOperator],
+        tmp_path: Path,
+        situation: str,
+        expected_deletes: int,
+        expected_creates: int,
+    ) -> None:
+        cfg = _config(job_names=["job-a"], state_store="file", state_path=str(tmp_path / "state.json"))
+        cluster.add_job(job_dict("job-a", failed_at=datetime.now(timezone.utc)))
+        crashed = operator_for(cfg)
+        crashed._check_job("job-a", threading.Event())
+        if situation == "never-deleted":
+            crashed._mark_restarting("job-a", True)
+        else:
+            # Shutdown while waiting for garbage collection leaves the restart unfinished.
+            cluster.gc_requests = 1000
+            stopped = threading.Event()
+            stopped.set()
+            crashed._restart_job("job-a", stopped)
+            del cluster.jobs[("flickr-downloader", "job-a")]
+            if situation == "recreated":
+                cluster.add_job(job_dict("job-a", active=1))
+        assert crashed._state.load()["job-a"].restarting is True
+
+        cluster.gc_requests = 0
+        cluster.reset_calls()
+        resumed = operator_for(cfg)
+        resumed._resume_restarts(threading.Event())
+
+        assert cluster.calls["delete_namespaced_job"] == expected_deletes
+        assert cluster.calls["create_namespaced_job"] == expected_creates
+        assert ("flickr-downloader", "job-a") in cluster.jobs
+        assert resumed._state.load()["job-a"].restarting is False
+
+
+class TestMetrics:
+    """Tests for the metrics recorded while checking and restarting Jobs."""
+
+    def test_restart_records_metrics(
+        self, cluster: FakeCluster, operator_for: Callable[[OperatorConfig], JobRestartOperator]
+    ) -> None:
+        cluster.add_job(job_dict("job-a", failed_at=datetime.now(timezone.utc) - timedelta(hours=2)))
+        cluster.add_pod("job-a", "job-a-xyz", exit_code=137, reason="OOMKilled")
+        op = operator_for(_config(job_names=["job-a", "job-missing"], restart_delay=60))
+
+        op._poll_cycle(threading.Event())
+
+        assert op.metrics.restarts.value("OOMKilled") == 1
+        assert op.metrics.restart_duration.count() == 1
+        assert op.metrics.log_fetch_duration.count() == 1
+        assert op.metrics.api_latency.count("create", "jobs") == 1
+        assert op.metrics.api_latency.count("get", "jobs") == cluster.calls["read_namespaced_job"]
+        assert op.metrics.api_errors.value("404") >= 1
+
+
+class TestRestartScheduling:
+    """Tests for scheduling delayed restarts instead of re-evaluating them every cycle."""
+
+    def test_waiting_job_is_not_re_inspected(
+        self, cluster: FakeCluster, operator_for: Callable[[OperatorConfig], JobRestartOperator]
+    ) -> None:
+        cluster.add_job(job_dict("job-a", failed_at=datetime.now(timezone.utc) - timedelta(seconds=10)))
+        cluster.add_pod("job-a", "job-a-xyz")
+        op = operator_for(_config(job_names=["job-a"], restart_delay=60))
+
+        op._check_job("job-a", threading.Event())
+        op._check_job("job-a", threading.Event())
+
+        assert cluster.calls["list_namespaced_pod"] == 1
+        assert cluster.calls["read_namespaced_pod_log"] == 1
+        assert cluster.calls["delete_namespaced_job"] == 0
+        remaining = op._scheduler.deadline("job-a", op._cached_uids["job-a"])
+        assert remaining is not None and 49 <= remaining <= 50
+
+    def test_due_restart_restarts_failed_instance(
+        self, cluster: FakeCluster, operator_for: Callable[[OperatorConfig], JobRestartOperator]
+    ) -> None:
+        now = [time.monotonic()]
+        cluster.add_job(job_dict("job-a", failed_at=datetime.now(timezone.utc) - timedelta(seconds=10)))
+        cluster.add_pod("job-a", "job-a-xyz", reason="Error")
+        op = operator_for(_config(job_names=["job-a"], restart_delay=60))
+        op._scheduler = RestartScheduler(clock=lambda: now[0])
+        op._check_job("job-a", threading.Event())
+
+        now[0] += 50
+        due = op._scheduler.pop_due()
+        assert [name for name, _, _ in due] == ["job-a"]
+        op._run_scheduled_restart(*due[0], threading.Event())
+
+        assert cluster.calls["delete_namespaced_job"] == 1
+        assert cluster.calls["create_namespaced_job"] == 1
+        assert op.metrics.restarts.value("Error") == 1
+
+    def test_due_restart_of_replaced_job_is_dropped(
+        self, cluster: FakeCluster, operator_for: Callable[[OperatorConfig], JobRestartOperator]
+    ) -> None:
+        cluster.add_job(job_dict("job-a", failed_at=datetime.now(timezone.utc) - timedelta(seconds=10)))
+        op = operator_for(_config(job_names=["job-a"], restart_delay=60))
+        op._check_job("job-a", threading.Event())
+        old_uid = op._cached_uids["job-a"]
+
+        del cluster.jobs[("flickr-downloader", "job-a")]
+        cluster.add_job(job_dict("job-a", active=1))
+        op._run_scheduled_restart("job-a", old_uid, "Error", threading.Event())
+
+        assert cluster.calls["delete_namespaced_job"] == 0
+
+
+class TestPodDiagnosticsCache:
+    """Tests for memoising pod failure diagnostics per Job and Pod UID."""
+
+    def test_logs_are_read_once_per_pod(
+        self, cluster: FakeCluster, operator_for: Callable[[OperatorConfig], JobRestartOperator]
+    ) -> None:
+        cluster.add_job(job_dict("job-a", failed_at=datetime.now(timezone.utc)))
+        cluster.add_pod("job-a", "job-a-1", reason="OOMKilled", exit_code=137)
+        op = operator_for(_config(job_names=["job-a"]))
+        op._check_job("job-a", threading.Event())
+
+        assert op._get_pod_failure_reasons("job-a") == {"OOMKilled"}
+        cluster.add_pod("job-a", "job-a-2", reason="Error")
+        assert op._get_pod_failure_reasons("job-a") == {"OOMKilled", "Error"}
+
+        assert cluster.calls["read_namespaced_pod_log"] == 2
+
+    def test_unavailable_logs_are_retried(
+        self, cluster: FakeCluster, operator_for: Callable[[OperatorConfig], JobRestartOperator]
+    ) -> None:
+        cluster.add_pod("job-a", "job-a-1")
+        del cluster.logs[("flickr-downloader", "job-a-1")]
+        op = operator_for(_config(job_names=["job-a"]))
+
+        op._get_pod_failure_reasons("job-a")
+        op._get_pod_failure_reasons("job-a")
+
+        assert cluster.calls["read_namespaced_pod_log"] == 2
+
+    def test_recreated_job_invalidates_cache(
+        self, cluster: FakeCluster, operator_for: Callable[[OperatorConfig], JobRestartOperator]
+    ) -> None:
+        cluster.add_pod("job-a", "job-a-1")
+        op = operator_for(_config(job_names=["job-a"]))
+        op._cached_uids["job-a"] = "uid-old"
+        op._get_pod_failure_reasons("job-a")
+
+        op._cached_uids["job-a"] = "uid-new"
+        op._get_pod_failure_reasons("job-a")
+
+        assert cluster.calls["read_namespaced_pod_log"] == 2
+        assert op._pod_diagnostics["job-a"][0] == "uid-new"
+
+
+class TestPodLogRetrieval:
+    """Tests for bounded, concurrent pod log retrieval."""
+
+    def test_only_newest_pods_are_inspected(
+        self, cluster: FakeCluster, operator_for: Callable[[OperatorConfig], JobRestartOperator]
+    ) -> None:
+        now = datetime.now(timezone.utc)
+        for i in range(5):
+            cluster.add_pod("job-a", f"job-a-{i}", reason=f"Reason{i}", created=now + timedelta(minutes=i))
+        op = operator_for(_config(job_names=["job-a"], max_inspected_pods=2))
+
+        assert op._get_pod_failure_reasons("job-a") == {"Reason4", "Reason3"}
+        assert cluster.calls["read_namespaced_pod_log"] == 2
+
+    def test_only_newest_pods_are_inspected_raw(
+        self, cluster: FakeCluster, operator_for: Callable[[OperatorConfig], JobRestartOperator]
+    ) -> None:
+        now = datetime.now(timezone.utc)
+        for i in range(5):
+            cluster.add_pod("job-a", f"job-a-{i}", reason=f"Reason{i}", created=now - timedelta(minutes=i))
+        op = operator_for(_config(job_names=["job-a"], max_inspected_pods=2, raw_json=True))
+
+        assert [state[1] for state in op._list_pod_states("job-a")] == ["job-a-0", "job-a-1"]
+
+    def test_log_tails_are_fetched_concurrently_with_timeout(
+        self, cluster: FakeCluster, operator_for: Callable[[OperatorConfig], JobRestartOperator]
+    ) -> None:
+        for i in range(4):
+            cluster.add_pod("job-a", f"job-a-{i}")
+        op = operator_for(_config(job_names=["job-a"], pod_log_timeout=3.0))
+        timeouts: list[object] = []
+
+        def slow_read(name: str, namespace: str, **kwargs: object) -> str:
+            timeouts.append(kwargs.get("_request_timeout"))
+            time.sleep(0.2)
+            return "line"
+
+        with mock.patch.object(cluster.core_v1, "read_namespaced_pod_log", slow_read):
+            started = time.monotonic()
+            op._get_pod_failure_reasons("job-a")
+            elapsed = time.monotonic() - started
+
+        assert timeouts == [3.0] * 4
+        assert elapsed < 0.6
+
+
+class TestJobDiscovery:
+    """Tests for discovering managed Jobs with ``JOB_SELECTOR``."""
+
+    def test_list_discovers_matching_jobs(
+        self, cluster: FakeCluster, operator_for: Callable[[OperatorConfig], JobRestartOperator]
+    ) -> None:
+        cluster.add_job(job_dict("flickr-alice", active=1, labels={"app": "flickr"}))
+        cluster.add_job(job_dict("flickr-bob", active=1, labels={"app": "flickr"}))
+        cluster.add_job(job_dict("unrelated", active=1, labels={"app": "other"}))
+        op = operator_for(_config(job_names=[], job_selector="app=flickr", check_mode="list"))
+
+        op._list_cycle(threading.Event())
+
+        assert op._managed.names() == ["flickr-alice", "flickr-bob"]
+        assert set(op._cached_manifests) == {"flickr-alice", "flickr-bob"}
+
+    def test_list_drops_vanished_jobs(
+        self, cluster: FakeCluster, operator_for: Callable[[OperatorConfig], JobRestartOperator]
+    ) -> None:
+        cluster.add_job(job_dict("flickr-alice", active=1, labels={"app": "flickr"}))
+        cluster.add_job(job_dict("flickr-bob", active=1, labels={"app": "flickr"}))
+        op = operator_for(_config(job_names=[], job_selector="app=flickr", check_mode="list"))
+        op._list_cycle(threading.Event())
+
+        del cluster.jobs[("flickr-downloader", "flickr-bob")]
+        op._list_cycle(threading.Event())
+
+        assert op._managed.names() == ["flickr-alice"]
+        assert set(op._cached_manifests) == set(op._cached_uids) == set(op._job_locks) == {"flickr-alice"}
+
+    def test_unchanged_steady_jobs_are_not_rechecked(
+        self, cluster: FakeCluster, operator_for: Callable[[OperatorConfig], JobRestartOperator]
+    ) -> None:
+        cluster.add_job(job_dict("job-a", active=1))
+        cluster.add_job(job_dict("job-b", active=1))
+        op = operator_for(_config(check_mode="list"))
+        op._list_cycle(threading.Event())
+
+        cluster.update_status("job-b", active=0, succeeded=1)
+        with mock.patch.object(op, "_evaluate_job", wraps=op._evaluate_job) as evaluate:
+            op._list_cycle(threading.Event())
+
+        assert [call.args[0] for call in evaluate.call_args_list] == ["job-b"]
+
+    def test_watch_events_update_managed_set(
+        self, operator_for: Callable[[OperatorConfig], JobRestartOperator]
+    ) -> None:
+        op = operator_for(_config(job_names=[], job_selector="app=flickr", check_mode="watch"))
+
+        op._on_job_event("ADDED", "flickr-alice")
+        op._on_job_event("ADDED", "flickr-bob")
+        op._on_job_event("DELETED", "flickr-bob")
+
+        assert op._managed.names() == ["flickr-alice"]
+        assert len(op._queue) == 2
+
+    def test_deleted_job_state_is_dropped_unless_it_is_being_handled(
+        self, cluster: FakeCluster, operator_for: Callable[[OperatorConfig], JobRestartOperator]
+    ) -> None:
+        cluster.add_job(job_dict("flickr-alice", active=1, labels={"app": "flickr"}))
+        cluster.add_job(job_dict("flickr-bob", active=1, labels={"app": "flickr"}))
+        op = operator_for(_config(job_names=[], job_selector="app=flickr", check_mode="watch"))
+        for job_name in ("flickr-alice", "flickr-bob"):
+            op._on_job_event("ADDED", job_name)
+            op._run_serialized(job_name, threading.Event(), op._check_job)
+        op._pod_diagnostics["flickr-bob"] = ("uid", {})
+
+        with op._job_lock("flickr-alice"):
+            op._on_job_event("DELETED", "flickr-alice")
+        op._on_job_event("DELETED", "flickr-bob")
+
+        for cache in (op._job_locks, op._cached_manifests, op._cached_uids, op._manifest_keys, op._pod_diagnostics):
+            assert "flickr-bob" not in cache
+        assert "flickr-alice" in op._cached_manifests and "flickr-alice" in op._job_locks
+
+    def test_selectors_are_combined(self) -> None:
+        cfg = _config(job_names=[], label_selector="team=media", job_selector="app=flickr")
+
+        assert cfg.list_selector == "team=media,app=flickr"
+        assert _config().list_selector is None
+
+
+class TestLeaderElection:
+    """Tests for the active/standby behaviour with ``leader_election``."""
+
+    def test_standby_caches_manifests_but_does_not_restart(
+        self, cluster: FakeCluster, operator_for: Callable[[OperatorConfig], JobRestartOperator]
+    ) -> None:
+        cluster.add_job(job_dict("job-a", failed_at=datetime.now(timezone.utc) - timedelta(hours=2)))
+        cluster.leases[("flickr-downloader", "flickr-operator")] = {
+            "metadata": {"name": "flickr-operator", "namespace": "flickr-downloader", "resourceVersion": "1"},
+            "spec": {"holderIdentity": "other-pod", "leaseDurationSeconds": 15},
+        }
+        op = operator_for(_config(job_names=["job-a"], leader_election=True, lease_name="flickr-operator"))
+        assert op._leader is not None
+        op._leader._coordination_v1 = cluster.coordination_v1  # type: ignore[assignment]
+        op._leader.tick()
+
+        op._poll_cycle(threading.Event())
+
+        assert op._leader.is_leader() is False
+        assert "job-a" in op._cached_manifests
+        assert cluster.calls["delete_namespaced_job"] == 0
+
+    def test_new_leader_finishes_restart_of_dead_leader(
+        self, cluster: FakeCluster, operator_for: Callable[[OperatorConfig], JobRestartOperator]
+    ) -> None:
+        cluster.add_job(job_dict("job-a", failed_at=datetime.now(timezone.utc) - timedelta(hours=2)))
+        old_uid = cluster.jobs[("flickr-downloader", "job-a")]["metadata"]["uid"]
+        clock = [0.0]
+        replicas = []
+        for identity in ("pod-a", "pod-b"):
+            cfg = _config(job_names=["job-a"], leader_election=True, lease_name="flickr-operator")
+            op = operator_for(dataclasses.replace(cfg, leader_identity=identity))
+            assert op._leader is not None
+            op._leader._coordination_v1 = cluster.coordination_v1  # type: ignore[assignment]
+            op._leader._clock = lambda: clock[0]
+            op._leader.tick()
+            replicas.append(op)
+        leader, standby = replicas
+        shutdown = threading.Event()
+
+        # The leader deletes the failed Job and dies before recreating it.
+        with mock.patch.object(leader, "_create_job", return_value=False):
+            leader._poll_cycle(shutdown)
+        assert ("flickr-downloader", "job-a") not in cluster.jobs
+
+        clock[0] = 60.0
+        assert standby._leader is not None
+        standby._leader.tick()
+        assert standby._take_over_if_needed(shutdown) is True
+
+        job = cluster.jobs[("flickr-downloader", "job-a")]
+        assert job["metadata"]["uid"] != old_uid
+        assert cluster.config_maps[("flickr-downloader", "flickr-operator-restarts")]["data"] == {}
+
+
+class TestSharding:
+    """Tests for splitting the Jobs of a namespace over replicas with ``shard_group``."""
+
+    def test_replicas_check_disjoint_shards(
+        self, cluster: FakeCluster, operator_for: Callable[[OperatorConfig], JobRestartOperator]
+    ) -> None:
+        names = [f"job-{i}" for i in range(20)]
+        for name in names:
+            cluster.add_job(job_dict(name, active=1))
+        replicas = []
+        for identity in ("pod-1", "pod-2"):
+            op = operator_for(_config(job_names=names, shard_group="flickr-operator", leader_identity=identity))
+            assert op._shard is not None
+            op._shard._coordination_v1 = cluster.coordination_v1  # type: ignore[assignment]
+            replicas.append(op)
+        for op in replicas + replicas:
+            assert op._shard is not None
+            op._shard.tick()
+
+        owned = [set(op._owned_names()) for op in replicas]
+        cluster.reset_calls()
+        for op in replicas:
+            op._poll_cycle(threading.Event())
+
+        assert owned[0] | owned[1] == set(names)
+        assert not owned[0] & owned[1]
+        assert cluster.calls["read_namespaced_job"] == len(names)
+
+    def test_rebalance_triggers_takeover(
+        self, cluster: FakeCluster, operator_for: Callable[[OperatorConfig], JobRestartOperator]
+    ) -> None:
+        op = operator_for(_config(shard_group="flickr-operator", leader_identity="pod-1"))
+        assert op._shard is not None
+        op._shard._coordination_v1 = cluster.coordination_v1  # type: ignore[assignment]
+
+        op._shard.tick()
+
+        assert op._takeover.is_set()
+        assert op._owned_names() == ["job-a", "job-b"]
+
+    def test_new_owner_finishes_restart_of_dead_member(
+        self, cluster: FakeCluster, operator_for: Callable[[OperatorConfig], JobRestartOperator]
+    ) -> None:
+        names = [f"job-{i}" for i in range(10)]
+        for name in names:
+            cluster.add_job(job_dict(name, active=1))
+        clock = [0.0]
+        replicas = []
+        for identity in ("pod-1", "pod-2"):
+            op = operator_for(_config(job_names=names, shard_group="flickr-operator", leader_identity=identity))
+            assert op._shard is not None
+            op._shard._coordination_v1 = cluster.coordination_v1  # type: ignore[assignment]
+            op._shard._clock = lambda: clock[0]
+            replicas.append(op)
+        for op in replicas + replicas:
+            assert op._shard is not None
+            op._shard.tick()
+        dying, survivor = replicas
+        shutdown = threading.Event()
+        survivor._take_over_if_needed(shutdown)
+        job_name = dying._owned_names()[0]
+        cluster.update_status(
+            job_name,
+            active=None,
+            conditions=[{"type": "Failed", "status": "True", "lastTransitionTime": "2025-01-01T00:00:00Z"}],
+        )
+
+        # The owner deletes the failed Job and dies before recreating it.
+        with mock.patch.object(dying, "_create_job", return_value=False):
+            dying._check_job(job_name, shutdown)
+        assert ("flickr-downloader", job_name) not in cluster.jobs
+
+        clock[0] = 60.0
+        assert survivor._shard is not None
+        survivor._shard.tick()
+        assert survivor._take_over_if_needed(shutdown) is True
+
+        assert ("flickr-downloader", job_name) in cluster.jobs
+        assert cluster.config_maps[("flickr-downloader", "flickr-operator-restarts")]["data"] == {}
+
+
+class TestRestartGovernor:
+    """Tests for governing restarts across Jobs."""
+
+    def test_budget_postpones_restarts_beyond_it(
+        self, cluster: FakeCluster, operator_for: Callable[[OperatorConfig], JobRestartOperator]
+    ) -> None:
+        for job_name in ("job-a", "job-b"):
+            cluster.add_job(job_dict(job_name, failed_at=datetime.now(timezone.utc) - timedelta(hours=2)))
+            cluster.add_pod(job_name, f"{job_name}-xyz")
+        op = operator_for(_config(restart_budget=1, restart_budget_window=600))
+
+        op._check_job("job-a", threading.Event())
+        op._check_job("job-b", threading.Event())
+
+        assert cluster.calls["delete_namespaced_job"] == 1
+        remaining = op._scheduler.deadline("job-b", op._cached_uids["job-b"])
+        assert remaining is not None and 599 <= remaining <= 600
+
+    def test_rate_limited_failures_stretch_the_delay(
+        self, cluster: FakeCluster, operator_for: Callable[[OperatorConfig], JobRestartOperator]
+    ) -> None:
+        for job_name in ("job-a", "job-b"):
+            cluster.add_job(job_dict(job_name, failed_at=datetime.now(timezone.utc)))
+            cluster.add_pod(job_name, f"{job_name}-xyz", log="flickr: HTTP Error 429: Too Many Requests\n")
+        op = operator_for(_config(restart_delay=60, rate_limit_backoff=4))
+
+        op._check_job("job-a", threading.Event())
+        op._check_job("job-b", threading.Event())
+
+        remaining_a = op._scheduler.deadline("job-a", op._cached_uids["job-a"])
+        remaining_b = op._scheduler.deadline("job-b", op._cached_uids["job-b"])
+        assert remaining_a is not None and 59 <= remaining_a <= 60
+        assert remaining_b is not None and 119 <= remaining_b <= 120
+        assert op._get_pod_failure_reasons("job-a") == {"Error", "RateLimited"}
+
+    def test_dropped_restart_refunds_its_budget_slot(
+        self, cluster: FakeCluster, operator_for: Callable[[OperatorConfig], JobRestartOperator]
+    ) -> None:
+        for job_name in ("job-a", "job-b"):
+            cluster.add_job(job_dict(job_name, failed_at=datetime.now(timezone.utc) - timedelta(hours=2)))
+            cluster.add_pod(job_name, f"{job_name}-xyz")
+        op = operator_for(_config(restart_budget=1, restart_budget_window=600))
+        op._check_job("job-a", threading.Event())
+        op._check_job("job-b", threading.Event())
+        uid = op._cached_uids["job-b"]
+
+        del cluster.jobs[("flickr-downloader", "job-b")]
+        op._run_scheduled_restart("job-b", uid, "Error", threading.Event())
+
+        assert cluster.calls["delete_namespaced_job"] == 1
+        assert 599 <= op._governor.admit(0) <= 600
+
+    def test_oom_skip_respects_budget(
+        self, cluster: FakeCluster, operator_for: Callable[[OperatorConfig], JobRestartOperator]
+    ) -> None:
+        cluster.add_job(job_dict("job-a", failed_at=datetime.now(timezone.utc)))
+        cluster.add_pod("job-a", "job-a-xyz", exit_code=137, reason="OOMKilled")
+        governor = RestartGovernor(budget=1, window=600)
+        governor.admit(0)
+        op = operator_for(_config(skip_delay_on_oom=True))
+        op._governor = governor
+
+        op._check_job("job-a", threading.Event())
+
+        assert cluster.calls["delete_namespaced_job"] == 0
+        remaining = op._scheduler.deadline("job-a", op._cached_uids["job-a"])
+        assert remaining is not None and 599 <= remaining <= 600
+
+
+class TestAdaptiveBackoff:
+    """Tests for restart delays derived from the per-Job failure history."""
+
+    def _fail(self, cluster: FakeCluster, run_seconds: int) -> None:
+        """Replace job-a with a fresh instance that failed just now after *run_seconds*."""
+        now = datetime.now(timezone.utc)
+        cluster.jobs.pop(("flickr-downloader", "job-a"), None)
+        cluster.add_job(job_dict("job-a", failed_at=now, started_at=now - timedelta(seconds=run_seconds)))
+
+    def test_repeated_fast_failures_double_the_delay(
+        self, cluster: FakeCluster, operator_for: Callable[[OperatorConfig], JobRestartOperator]
+    ) -> None:
+        op = operator_for(_config(job_names=["job-a"], restart_delay=60, adaptive_backoff=True))
+        remaining = []
+        for _ in range(3):
+            self._fail(cluster, run_seconds=5)
+            op._check_job("job-a", threading.Event())
+            remaining.append(op._scheduler.deadline("job-a", op._cached_uids["job-a"]))
+
+        assert [round(r or 0, -1) for r in remaining] == [60, 120, 240]
+
+    def test_success_resets_the_history(
+        self, cluster: FakeCluster, operator_for: Callable[[OperatorConfig], JobRestartOperator]
+    ) -> None:
+        op = operator_for(_config(job_names=["job-a"], restart_delay=60, adaptive_backoff=True))
+        self._fail(cluster, run_seconds=5)
+        op._check_job("job-a", threading.Event())
+
+        cluster.jobs.pop(("flickr-downloader", "job-a"))
+        cluster.add_job(job_dict("job-a", succeeded=True))
+        op._check_job("job-a", threading.Event())
+
+        assert op._history.get("job-a") == []
+
+    def test_one_off_failure_restarts_after_minimum_delay(
+        self, cluster: FakeCluster, operator_for: Callable[[OperatorConfig], JobRestartOperator]
+    ) -> None:
+        op = operator_for(_config(job_names=["job-a"], restart_delay=600, adaptive_backoff=True, min_restart_delay=30))
+        self._fail(cluster, run_seconds=7200)
+
+        op._check_job("job-a", threading.Event())
+
+        remaining = op._scheduler.deadline("job-a", op._cached_uids["job-a"])
+        assert remaining is not None and 29 <= remaining <= 30
+
+
+class TestFailureClassification:
+    """Tests for restart policies chosen by failure class."""
+
+    def test_held_failure_is_not_restarted(
+        self, cluster: FakeCluster, operator_for: Callable[[OperatorConfig], JobRestartOperator]
+    ) -> None:
+        cluster.add_job(job_dict("job-a", failed_at=datetime.now(timezone.utc) - timedelta(hours=2)))
+        cluster.add_pod("job-a", "job-a-xyz", log="flickr_api: 401 Unauthorized\n")
+        op = operator_for(_config(failure_rules={"auth": {"action": "hold"}}))
+
+        op._check_job("job-a", threading.Event())
+
+        assert cluster.calls["delete_namespaced_job"] == 0
+        assert op._scheduler.deadline("job-a", op._cached_uids["job-a"]) is None
+
+    def test_class_delay_replaces_restart_delay(
+        self, cluster: FakeCluster, operator_for: Callable[[OperatorConfig], JobRestartOperator]
+    ) -> None:
+        cluster.add_job(job_dict("job-a", failed_at=datetime.now(timezone.utc)))
+        cluster.add_pod("job-a", "job-a-xyz", log="requests.exceptions.ConnectionError: Connection refused\n")
+        op = operator_for(_config(failure_rules={"network": {"delay": 120}}))
+
+        op._check_job("job-a", threading.Event())
+
+        remaining = op._scheduler.deadline("job-a", op._cached_uids["job-a"])
+        assert remaining is not None and 119 <= remaining <= 120
+
+    def test_immediate_class_restarts_right_away(
+        self, cluster: FakeCluster, operator_for: Callable[[OperatorConfig], JobRestartOperator]
+    ) -> None:
+        cluster.add_job(job_dict("job-a", failed_at=datetime.now(timezone.utc)))
+        cluster.add_pod("job-a", "job-a-xyz", log="OSError: [Errno 28] No space left on device\n")
+        op = operator_for(_config(failure_rules={"disk_full": {"action": "immediate"}}))
+
+        op._check_job("job-a", threading.Event())
+
+        assert cluster.calls["delete_namespaced_job"] == 1
+        assert op.metrics.restarts.value("DiskFull") == 1
+
+
+class TestFaultInjection:
+    """Tests of the operator against a slow and unreliable fake API server."""
+
+    def test_failing_requests_do_not_break_the_cycle(
+        self, cluster: FakeCluster, operator_for: Callable[[OperatorConfig], JobRestartOperator]
+    ) -> None:
+        cluster.add_job(job_dict("job-a", failed_at=datetime.now(timezone.utc) - timedelta(hours=2)))
+        cluster.add_job(job_dict("job-b", active=1))
+        cluster.failure_rate = 1.0
+        op = operator_for(_config(check_mode="list"))
+
+        op._list_cycle(threading.Event())
+
+        assert cluster.calls["delete_namespaced_job"] == 0
+        assert op.metrics.api_errors.value("500") == 1
+
+    def test_watch_mode_restarts_failed_job(
+        self, cluster: FakeCluster, operator_for: Callable[[OperatorConfig], JobRestartOperator]
+    ) -> None:
+        cluster.add_job(job_dict("job-a", active=1))
+        cluster.latency = 0.001
+        op = operator_for(_config(check_mode="watch", restart_delay=0))
+        shutdown = threading.Event()
+        thread = threading.Thread(target=op.run, args=(shutdown,), daemon=True)
+        thread.start()
+        try:
+            cluster.update_status(
+                "job-a",
+                active=None,
+                conditions=[{"type": "Failed", "status": "True", "lastTransitionTime": "2025-01-01T00:00:00Z"}],
+            )
+            deadline = time.monotonic() + 5
+            while cluster.calls["create_namespaced_job"] == 0 and time.monotonic() < deadline:
+                time.sleep(0.01)
+        finally:
+            shutdown.set()
+            thread.join(timeout=10)
+
+        assert cluster.calls["create_namespaced_job"] == 1
+        assert op.metrics.restarts.value("Unknown") == 1
@@ -0,0 +1,201 @@
+"""Tests for :mod:`flickr_immich_k8s_sync_operator.reconciler`."""
+
+import threading
+from typing import Any
+
+from kubernetes import client
+
+from flickr_immich_k8s_sync_operator.config import FLICKRSYNC_LABEL
+from flickr_immich_k8s_sync_operator.operator import FIELD_MANAGER
+from flickr_immich_k8s_sync_operator.reconciler import FlickrSyncReconciler, StatusBatcher
+from tests.fake_k8s import FakeCluster
+
+_SPEC = {"user": "alice", "image": "flickr-dl:2", "resources": {"limits": {"memory": "1Gi"}}}
+
+_LISTS = {"list_namespaced_custom_object": 1, "list_namespaced_job": 1, "list_namespaced_cron_job": 1}
+
+
+def _reconciler(cluster: FakeCluster, **kwargs: Any) -> FlickrSyncReconciler:
+    reconciler = FlickrSyncReconciler(client.ApiClient(), "flickr-downloader", 60, 2.0, **kwargs)
+    reconciler._batch_v1 = cluster.batch_v1  # type: ignore[assignment]
+    reconciler._custom_objects = cluster.custom_objects  # type: ignore[assignment]
+    return reconciler
+
+
+def _status(cluster: FakeCluster, name: str = "alice") -> dict[str, Any]:
+    return cluster.flickrsyncs[("flickr-downloader", name)].get("status") or {}
+
+
+class TestStatusBatcher:
+    """Tests for :class:`StatusBatcher`."""
+
+    def _batcher(self, clock: list[float]) -> tuple[StatusBatcher, list[tuple[str, dict[str, Any]]]]:
+        writes: list[tuple[str, dict[str, Any]]] = []
+        batcher = StatusBatcher(lambda name, changes: writes.append((name, changes)), 2.0, clock=lambda: clock[0])
+        return batcher, writes
+
+    def test_changes_are_merged_and_written_after_the_debounce(self) -> None:
+        clock = [0.0]
+        batcher, writes = self._batcher(clock)
+        batcher.update("alice", {"phase": "Pending", "observedGeneration": 1})
+        clock[0] = 1.0
+        batcher.update("alice", {"phase": "Running"})
+        batcher.update("bob", {"phase": "Failed"})
+
+        assert batcher.flush() == 0
+        assert batcher.next_due() == 2.0
+        clock[0] = 3.0
+        assert batcher.flush() == 2
+        assert writes == [("alice", {"phase": "Running", "observedGeneration": 1}), ("bob", {"phase": "Failed"})]
+        assert batcher.next_due() is None
+
+    def test_busy_status_is_written_after_the_maximum_delay(self) -> None:
+        clock = [0.0]
+        batcher, writes = self._batcher(clock)
+        while clock[0] < 10.0:
+            batcher.update("alice", {"active": clock[0]})
+            clock[0] += 1.0
+            batcher.flush()
+
+        assert writes == [("alice", {"active": 9.0})]
+
+    def test_failed_writes_are_retried_and_gone_resources_dropped(self) -> None:
+        attempts: list[str] = []
+
+        def write(name: str, changes: dict[str, Any]) -> None:
+            attempts.append(name)
+            raise client.ApiException(status=404 if name == "gone" else 500)
+
+        batcher = StatusBatcher(write, 2.0)
+        batcher.update("gone", {"phase": "Running"})
+        batcher.update("alice", {"phase": "Running"})
+
+        assert batcher.flush(force=True) == 0
+        assert batcher.pending("gone") == {}
+        assert batcher.pending("alice") == {"phase": "Running"}
+        assert sorted(attempts) == ["alice", "gone"]
+
+
+class TestFlickrSyncReconciler:
+    """Tests for :class:`FlickrSyncReconciler`."""
+
+    def test_creates_job_and_reports_status(self) -> None:
+        cluster = FakeCluster()
+        cluster.add_flickrsync("alice", _SPEC)
+        reconciler = _reconciler(cluster)
+
+        assert reconciler.reconcile() == 1
+        assert reconciler.flush_status() == 1
+
+        job = cluster.jobs[("flickr-downloader", "flickr-downloader-alice")]
+        assert job["metadata"]["labels"] == {FLICKRSYNC_LABEL: "alice"}
+        assert job["metadata"]["ownerReferences"][0]["name"] == "alice"
+        assert job["metadata"]["managedFields"] == [{"manager": FIELD_MANAGER, "operation": "Apply"}]
+        assert job["spec"]["template"]["spec"]["containers"][0]["resources"] == {"limits": {"memory": "1Gi"}}
+        assert _status(cluster) == {
+            "observedGeneration": 1,
+            "jobName": "flickr-downloader-alice",
+            "phase": "Pending",
+            "message": "",
+        }
+
+    def test_observed_generation_skips_unchanged_resources(self) -> None:
+        cluster = FakeCluster()
+        cluster.add_flickrsync("alice", _SPEC)
+        reconciler = _reconciler(cluster)
+        reconciler.reconcile()
+        reconciler.flush_status()
+        cluster.reset_calls()
+
+        assert reconciler.reconcile() == 0
+        assert reconciler.flush_status() == 0
+        assert dict(cluster.calls) == _LISTS
+
+    def test_phase_changes_are_written_once(self) -> None:
+        cluster = FakeCluster()
+        cluster.add_flickrsync("alice", _SPEC)
+        reconciler = _reconciler(cluster)
+        reconciler.reconcile()
+        reconciler.flush_status()
+        cluster.update_status("flickr-downloader-alice", active=1)
+        cluster.reset_calls()
+
+        reconciler.reconcile()
+        reconciler.reconcile()
+        reconciler.flush_status()
+
+        assert _status(cluster)["phase"] == "Running"
+        assert cluster.calls["patch_namespaced_custom_object_status"] == 1
+        assert cluster.calls["patch_namespaced_job"] == 0
+
+    def test_spec_change_replaces_the_job(self) -> None:
+        cluster = FakeCluster()
+        cluster.add_flickrsync("alice", _SPEC)
+        reconciler = _reconciler(cluster)
+        reconciler.reconcile()
+        reconciler.flush_status()
+        old_uid = cluster.jobs[("flickr-downloader", "flickr-downloader-alice")]["metadata"]["uid"]
+
+        cluster.add_flickrsync("alice", {**_SPEC, "image": "flickr-dl:3"})
+        assert reconciler.reconcile() == 1
+        reconciler.flush_status()
+
+        job = cluster.jobs[("flickr-downloader", "flickr-downloader-alice")]
+        assert job["metadata"]["uid"] != old_uid
+        assert job["spec"]["template"]["spec"]["containers"][0]["image"] == "flickr-dl:3"
+        assert _status(cluster)["observedGeneration"] == 2
+
+    def test_missing_job_is_recreated(self) -> None:
+        cluster = FakeCluster()
+        cluster.add_flickrsync("alice", _SPEC)
+        reconciler = _reconciler(cluster)
+        reconciler.reconcile()
+        reconciler.flush_status()
+        cluster.batch_v1.delete_namespaced_job("flickr-downloader-alice", "flickr-downloader")
+
+        assert reconciler.reconcile() == 1
+        assert ("flickr-downloader", "flickr-downloader-alice") in cluster.jobs
+
+    def test_schedule_replaces_job_with_cronjob(self) -> None:
+        cluster = FakeCluster()
+        cluster.add_flickrsync("alice", _SPEC)
+        reconciler = _reconciler(cluster)
+        reconciler.reconcile()
+
+        cluster.add_flickrsync("alice", {**_SPEC, "schedule": "0 3 * * *"})
+        reconciler.reconcile()
+        reconciler.flush_status()
+
+        cronjob = cluster.cron_jobs[("flickr-downloader", "flickr-downloader-alice")]
+        assert cronjob["spec"]["schedule"] == "0 3 * * *"
+        assert ("flickr-downloader", "flickr-downloader-alice") not in cluster.jobs
+        assert _status(cluster)["phase"] == "Scheduled"
+
+    def test_invalid_spec_is_reported(self) -> None:
+        cluster = FakeCluster()
+        cluster.add_flickrsync("alice", {"user": "Alice Smith"})
+        reconciler = _reconciler(cluster)
+
+        assert reconciler.reconcile() == 0
+        reconciler.flush_status()
+
+        assert cluster.jobs == {}
+        assert _status(cluster)["phase"] == "Invalid"
+        assert "spec.user" in _status(cluster)["message"]
+
+    def test_jobs_handled_elsewhere_are_skipped(self) -> None:
+        cluster = FakeCluster()
+        cluster.add_flickrsync("alice", _SPEC)
+        cluster.add_flickrsync("bob", {**_SPEC, "user": "bob"})
+        busy = threading.Lock()
+        busy.acquire()
+
+        reconciler = _reconciler(
+            cluster,
+            acts_on=lambda job_name: job_name != "flickr-downloader-bob",
+            job_lock=lambda job_name: busy,
+        )
+
+        assert reconciler.reconcile() == 0
+        assert cluster.jobs == {}
+        assert reconciler.flush_status() == 0
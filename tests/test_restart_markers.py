@@ -0,0 +1,55 @@
+"""Tests for :mod:`flickr_immich_k8s_sync_operator.restart_markers`."""
+
+from typing import Any, Callable
+
+from kubernetes import client
+
+from flickr_immich_k8s_sync_operator.restart_markers import RestartMarker, RestartMarkers
+from tests.fake_k8s import FakeCluster
+
+_KEY = ("flickr-downloader", "flickr-operator-restarts")
+
+
+def _call(verb: str, resource: str, request: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    return request(*args, **kwargs)
+
+
+def _markers(cluster: FakeCluster, identity: str) -> RestartMarkers:
+    markers = RestartMarkers(client.ApiClient(), "flickr-downloader", "flickr-operator-restarts", identity, _call)
+    markers._core_v1 = cluster.core_v1  # type: ignore[assignment]
+    return markers
+
+
+class TestRestartMarkers:
+    """Tests for :class:`RestartMarkers`."""
+
+    def test_markers_of_all_replicas_are_visible(self) -> None:
+        cluster = FakeCluster()
+        pod_a, pod_b = _markers(cluster, "pod-a"), _markers(cluster, "pod-b")
+
+        assert pod_b.load() == {}
+        pod_a.mark("job-a", "uid-a", {"kind": "Job"})
+        pod_b.mark("job-b", "uid-b", {}, owner={"kind": "CronJob", "name": "cron-b"})
+
+        assert pod_b.load() == {
+            "job-a": RestartMarker("uid-a", "pod-a", {"kind": "Job"}),
+            "job-b": RestartMarker("uid-b", "pod-b", {}, {"kind": "CronJob", "name": "cron-b"}),
+        }
+        assert cluster.calls["create_namespaced_config_map"] == 1
+
+    def test_clear_removes_only_its_key(self) -> None:
+        cluster = FakeCluster()
+        markers = _markers(cluster, "pod-a")
+        markers.clear("job-a")
+        markers.mark("job-a", "uid-a", {})
+        markers.mark("job-b", "uid-b", {})
+
+        markers.clear("job-a")
+
+        assert list(markers.load()) == ["job-b"]
+
+    def test_malformed_markers_are_skipped(self) -> None:
+        cluster = FakeCluster()
+        cluster.config_maps[_KEY] = {"metadata": {"name": _KEY[1]}, "data": {"job-a": "{", "job-b": '{"x": 1}'}}
+
+        assert _markers(cluster, "pod-a").load() == {}
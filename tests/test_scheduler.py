@@ -0,0 +1,84 @@
+"""Tests for :mod:`flickr_immich_k8s_sync_operator.scheduler`."""
+
+import threading
+import time
+
+from flickr_immich_k8s_sync_operator.scheduler import RestartScheduler
+
+
+class _Clock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestRestartScheduler:
+    """Tests for :class:`RestartScheduler`."""
+
+    def test_pops_in_deadline_order(self) -> None:
+        clock = _Clock()
+        scheduler = RestartScheduler(clock=clock)
+        scheduler.schedule("job-b", "uid-b", "Error", 20)
+        scheduler.schedule("job-a", "uid-a", "OOMKilled", 10)
+
+        assert scheduler.pop_due() == []
+        clock.now += 30
+        assert scheduler.pop_due() == [("job-a", "uid-a", "OOMKilled"), ("job-b", "uid-b", "Error")]
+        assert scheduler.pop_due() == []
+
+    def test_reschedule_supersedes_previous_deadline(self) -> None:
+        clock = _Clock()
+        scheduler = RestartScheduler(clock=clock)
+        assert scheduler.schedule("job-a", "uid-1", "Error", 10) is False
+        assert scheduler.schedule("job-a", "uid-2", "Error", 50) is True
+
+        clock.now += 20
+        assert scheduler.pop_due() == []
+        clock.now += 40
+        assert scheduler.pop_due() == [("job-a", "uid-2", "Error")]
+
+    def test_clear_drops_pending_restarts(self) -> None:
+        clock = _Clock()
+        scheduler = RestartScheduler(clock=clock)
+        scheduler.schedule("job-a", "uid-a", "Error", 10)
+        scheduler.schedule("job-b", "uid-b", "Error", 20)
+
+        assert scheduler.clear() == 2
+        clock.now += 30
+        assert scheduler.pop_due() == []
+
+    def test_deadline_is_per_instance(self) -> None:
+        clock = _Clock()
+        scheduler = RestartScheduler(clock=clock)
+        scheduler.schedule("job-a", "uid-1", "Error", 10)
+        clock.now += 4
+
+        assert scheduler.deadline("job-a", "uid-1") == 6
+        assert scheduler.deadline("job-a", "uid-2") is None
+        assert scheduler.deadline("job-b", "uid-1") is None
+
+    def test_run_fires_at_deadline(self) -> None:
+        scheduler = RestartScheduler()
+        fired: list[tuple[str, float]] = []
+        done = threading.Event()
+
+        def on_due(job_name: str, uid: str, reason: str) -> None:
+            fired.append((job_name, time.monotonic()))
+            done.set()
+
+        thread = threading.Thread(target=scheduler.run, args=(on_due,), daemon=True)
+        thread.start()
+        start = time.monotonic()
+        scheduler.schedule("job-a", "uid-1", "Error", 0.1)
+
+        assert done.wait(timeout=2)
+        scheduler.stop()
+        thread.join(timeout=2)
+
+        assert not thread.is_alive()
+        assert fired[0][0] == "job-a"
+        assert 0.1 <= fired[0][1] - start < 0.5
@@ -0,0 +1,108 @@
+"""Tests for :mod:`flickr_immich_k8s_sync_operator.sharding`."""
+
+from typing import Any
+
+from flickr_immich_k8s_sync_operator.sharding import HashRing, ShardMembership
+from tests.fake_k8s import FakeCluster
+
+JOBS = [f"flickr-downloader-user{i}" for i in range(1000)]
+
+
+class _Clock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _member(cluster: FakeCluster, identity: str, clock: _Clock, **kwargs: Any) -> ShardMembership:
+    return ShardMembership(
+        cluster.coordination_v1,  # type: ignore[arg-type]
+        "flickr-downloader",
+        "flickr-operator",
+        identity,
+        lease_duration=15,
+        clock=clock,
+        **kwargs,
+    )
+
+
+class TestHashRing:
+    """Tests for :class:`HashRing`."""
+
+    def test_empty_ring_has_no_owner(self) -> None:
+        assert HashRing().owner("job-a") is None
+
+    def test_keys_are_spread_evenly(self) -> None:
+        ring = HashRing(["pod-1", "pod-2", "pod-3"])
+        counts = {member: 0 for member in ring.members}
+        for job in JOBS:
+            counts[ring.owner(job)] += 1  # type: ignore[index]
+
+        assert all(200 < count < 470 for count in counts.values())
+
+    def test_scale_up_moves_only_the_new_members_share(self) -> None:
+        before = HashRing(["pod-1", "pod-2", "pod-3"])
+        after = HashRing(["pod-1", "pod-2", "pod-3", "pod-4"])
+
+        moved = [job for job in JOBS if before.owner(job) != after.owner(job)]
+
+        assert all(after.owner(job) == "pod-4" for job in moved)
+        assert len(moved) < 0.35 * len(JOBS)
+
+    def test_scale_down_moves_only_the_removed_members_keys(self) -> None:
+        before = HashRing(["pod-1", "pod-2", "pod-3"])
+        after = HashRing(["pod-1", "pod-2"])
+
+        assert all(before.owner(job) == "pod-3" for job in JOBS if before.owner(job) != after.owner(job))
+
+
+class TestShardMembership:
+    """Tests for :class:`ShardMembership`."""
+
+    def test_members_split_the_jobs(self, cluster: FakeCluster) -> None:
+        clock = _Clock()
+        first = _member(cluster, "pod-1", clock)
+        second = _member(cluster, "pod-2", clock)
+        first.tick()
+        second.tick()
+        first.tick()
+
+        assert first.members() == second.members() == {"pod-1", "pod-2"}
+        for job in JOBS[:100]:
+            assert first.owns(job) != second.owns(job)
+
+    def test_owns_nothing_before_joining(self, cluster: FakeCluster) -> None:
+        assert _member(cluster, "pod-1", _Clock()).owns("job-a") is False
+
+    def test_dead_member_expires(self, cluster: FakeCluster) -> None:
+        clock = _Clock()
+        changes: list[bool] = []
+        first = _member(cluster, "pod-1", clock, on_change=lambda: changes.append(True))
+        second = _member(cluster, "pod-2", clock)
+        second.tick()
+        first.tick()
+        assert first.members() == {"pod-1", "pod-2"}
+
+        clock.now += 16
+        first.tick()
+
+        assert first.members() == {"pod-1"}
+        assert all(first.owns(job) for job in JOBS[:100])
+        assert changes == [True, True]
+
+    def test_release_leaves_the_group(self, cluster: FakeCluster) -> None:
+        clock = _Clock()
+        first = _member(cluster, "pod-1", clock)
+        second = _member(cluster, "pod-2", clock)
+        first.tick()
+        second.tick()
+
+        second.release()
+        first.tick()
+
+        assert first.members() == {"pod-1"}
+        assert second.owns(JOBS[0]) is False
@@ -0,0 +1,103 @@
+"""Tests for :mod:`flickr_immich_k8s_sync_operator.state_store`."""
+
+import json
+import os
+from pathlib import Path
+from typing import Callable
+
+import pytest
+
+from flickr_immich_k8s_sync_operator.state_store import (
+    COMPACT_MIN_ENTRIES,
+    FileStateStore,
+    JobRecord,
+    SQLiteStateStore,
+    StateStore,
+)
+
+_MANIFEST = {"apiVersion": "batch/v1", "kind": "Job", "metadata": {"name": "job-a", "namespace": "ns"}}
+
+
+@pytest.fixture(params=["file", "sqlite"])
+def open_store(request: pytest.FixtureRequest, tmp_path: Path) -> Callable[[], StateStore]:
+    """Return a factory (re)opening a persistent store of each backend at the same path."""
+    path = str(tmp_path / f"state.{request.param}")
+
+    def _open() -> StateStore:
+        return FileStateStore(path) if request.param == "file" else SQLiteStateStore(path)
+
+    return _open
+
+
+class TestPersistentStores:
+    """Round-trip tests shared by the file and SQLite backends."""
+
+    def test_records_survive_reopen(self, open_store: Callable[[], StateStore]) -> None:
+        store = open_store()
+        store.put("job-a", JobRecord(_MANIFEST, "uid-1", "uid-1/1"))
+        store.put("job-b", JobRecord(_MANIFEST, "uid-2", "uid-2/1", restarting=True))
+        store.close()
+
+        reopened = open_store()
+
+        assert reopened.load() == {
+            "job-a": JobRecord(_MANIFEST, "uid-1", "uid-1/1"),
+            "job-b": JobRecord(_MANIFEST, "uid-2", "uid-2/1", restarting=True),
+        }
+
+    def test_put_replaces_record(self, open_store: Callable[[], StateStore]) -> None:
+        store = open_store()
+        store.put("job-a", JobRecord(_MANIFEST, "uid-1", "uid-1/1", restarting=True))
+        store.put("job-a", JobRecord(_MANIFEST, "uid-1", "uid-1/1"))
+        store.close()
+
+        assert open_store().get("job-a") == JobRecord(_MANIFEST, "uid-1", "uid-1/1")
+
+
+class TestFileStateStore:
+    """Tests specific to :class:`FileStateStore`."""
+
+    def test_leaves_no_temporary_files(self, tmp_path: Path) -> None:
+        store = FileStateStore(str(tmp_path / "state.json"))
+        store.put("job-a", JobRecord(_MANIFEST, "uid-1", "uid-1/1"))
+        store.put("job-b", JobRecord(_MANIFEST, "uid-2", "uid-2/1"))
+
+        assert os.listdir(tmp_path) == ["state.json"]
+
+    def test_missing_file_starts_empty(self, tmp_path: Path) -> None:
+        assert FileStateStore(str(tmp_path / "state.json")).load() == {}
+
+    def test_put_appends_one_line(self, tmp_path: Path) -> None:
+        path = tmp_path / "state.json"
+        store = FileStateStore(str(path))
+        store.put("job-a", JobRecord(_MANIFEST, "uid-1", "uid-1/1"))
+        size = path.stat().st_size
+
+        store.put("job-b", JobRecord(_MANIFEST, "uid-2", "uid-2/1"))
+
+        lines = path.read_text().splitlines()
+        assert len(lines) == 3
+        assert json.loads(lines[-1])["name"] == "job-b"
+        assert path.stat().st_size - size == len(lines[-1]) + 1
+
+    def test_log_is_compacted(self, tmp_path: Path) -> None:
+        path = tmp_path / "state.json"
+        store = FileStateStore(str(path))
+        for attempt in range(COMPACT_MIN_ENTRIES + 1):
+            store.put("job-a", JobRecord(_MANIFEST, "uid-1", f"uid-1/{attempt}"))
+        store.close()
+
+        assert len(path.read_text().splitlines()) == 1
+        assert FileStateStore(str(path)).get("job-a") == JobRecord(_MANIFEST, "uid-1", f"uid-1/{COMPACT_MIN_ENTRIES}")
+
+    def test_reads_version_1_files_and_skips_torn_lines(self, tmp_path: Path) -> None:
+        path = tmp_path / "state.json"
+        record = {"manifest": _MANIFEST, "uid": "uid-1", "key": "uid-1/1", "restarting": True}
+        path.write_text(json.dumps({"version": 1, "jobs": {"job-a": record}}) + '\n{"name": "job-b", "rec')
+
+        store = FileStateStore(str(path))
+
+        assert store.load() == {"job-a": JobRecord(_MANIFEST, "uid-1", "uid-1/1", restarting=True)}
+        store.put("job-b", JobRecord(_MANIFEST, "uid-2", "uid-2/1"))
+        store.close()
+        assert set(FileStateStore(str(path)).load()) == {"job-a", "job-b"}
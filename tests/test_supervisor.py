@@ -0,0 +1,202 @@
+"""Tests for :mod:`flickr_immich_k8s_sync_operator.supervisor`."""
+
+import threading
+import time
+from datetime import datetime, timezone
+
+import pytest
+from kubernetes import client
+
+from flickr_immich_k8s_sync_operator import supervisor as supervisor_module
+from flickr_immich_k8s_sync_operator.config import OperatorConfig
+from flickr_immich_k8s_sync_operator.operator import JobRestartOperator
+from flickr_immich_k8s_sync_operator.supervisor import NamespaceSupervisor, namespace_config, partition_state_path
+from tests.fake_k8s import FakeCluster, job_dict, make_operator
+
+
+def _config(**overrides: object) -> OperatorConfig:
+    values: dict = {  # type: ignore[type-arg]
+        "namespace": "flickr-downloader",
+        "job_names": ["job-a"],
+        "check_interval": 60,
+        "restart_delay": 3600,
+        "skip_delay_on_oom": False,
+        "namespaces": ["ns-a", "ns-b"],
+    }
+    values.update(overrides)
+    return OperatorConfig(**values)
+
+
+class _RecordingOperator:
+    """Stand-in operator that records its namespace and runs until stopped."""
+
+    def __init__(self, cfg: OperatorConfig, started: list[str], fail: bool = False) -> None:
+        self.cfg = cfg
+        self._started = started
+        self._fail = fail
+        self.stopped = threading.Event()
+
+    def run(self, shutdown_event: threading.Event) -> None:
+        self._started.append(self.cfg.namespace)
+        if self._fail:
+            raise RuntimeError("boom")
+        shutdown_event.wait()
+        self.stopped.set()
+
+
+class TestNamespaceConfig:
+    """Tests for deriving the per-namespace configuration."""
+
+    def test_partitions_state_and_disables_metrics(self) -> None:
+        cfg = namespace_config(_config(state_store="sqlite", state_path="/state/op.db", metrics_port=9090), "ns-a")
+
+        assert cfg.namespace == "ns-a"
+        assert cfg.namespaces == []
+        assert cfg.state_path == "/state/op.ns-a.db"
+        assert cfg.metrics_port == 0
+
+    def test_partition_without_extension(self) -> None:
+        assert partition_state_path("/state/operator", "ns-b") == "/state/operator.ns-b"
+
+
+class TestNamespaceSupervisor:
+    """Tests for :class:`NamespaceSupervisor`."""
+
+    def test_runs_one_operator_per_namespace(self) -> None:
+        started: list[str] = []
+        operators: list[_RecordingOperator] = []
+
+        def factory(cfg: OperatorConfig) -> _RecordingOperator:
+            operators.append(_RecordingOperator(cfg, started, fail=cfg.namespace == "ns-a"))
+            return operators[-1]
+
+        supervisor = NamespaceSupervisor(_config(), api_client=client.ApiClient(), operator_factory=factory)
+        shutdown = threading.Event()
+        thread = threading.Thread(target=supervisor.run, args=(shutdown,))
+        thread.start()
+        while len(started) < 2:
+            threading.Event().wait(0.01)
+        shutdown.set()
+        thread.join(timeout=5)
+
+        assert sorted(started) == ["ns-a", "ns-b"]
+        # The crashing operator of ns-a did not take ns-b down with it.
+        assert operators[1].stopped.is_set()
+
+    def test_crashed_operators_are_restarted_with_backoff(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(supervisor_module, "SUPERVISE_INTERVAL", 0.01)
+        monkeypatch.setattr(supervisor_module, "RESTART_BACKOFF_INITIAL", 0.05)
+        started: list[str] = []
+        operators: list[_RecordingOperator] = []
+
+        def factory(cfg: OperatorConfig) -> _RecordingOperator:
+            # The first two operators of ns-a crash, the third one keeps running.
+            crashing = cfg.namespace == "ns-a" and started.count("ns-a") < 2
+            operators.append(_RecordingOperator(cfg, started, fail=crashing))
+            return operators[-1]
+
+        supervisor = NamespaceSupervisor(_config(), api_client=client.ApiClient(), operator_factory=factory)
+        shutdown = threading.Event()
+        thread = threading.Thread(target=supervisor.run, args=(shutdown,))
+        thread.start()
+        deadline = threading.Event()
+        for _ in range(500):
+            if started.count("ns-a") == 3:
+                break
+            deadline.wait(0.01)
+        shutdown.set()
+        thread.join(timeout=5)
+
+        assert started.count("ns-a") == 3
+        assert started.count("ns-b") == 1
+        assert supervisor._crashes["ns-a"] == 2
+        assert operators[-1].stopped.is_set()
+
+    def test_failed_operator_creation_is_retried_with_backoff(self) -> None:
+        attempts: list[str] = []
+
+        def factory(cfg: OperatorConfig) -> _RecordingOperator:
+            attempts.append(cfg.namespace)
+            raise RuntimeError("boom")
+
+        supervisor = NamespaceSupervisor(
+            _config(namespaces=["ns-a"]), api_client=client.ApiClient(), operator_factory=factory
+        )
+
+        supervisor._reconcile({"ns-a"})
+        supervisor._reconcile({"ns-a"})
+        supervisor._restart_crashed()
+        assert attempts == ["ns-a"]
+
+        supervisor._restart_at["ns-a"] = 0
+        supervisor._restart_crashed()
+        assert attempts == ["ns-a", "ns-a"]
+        assert supervisor._crashes["ns-a"] == 2
+        assert supervisor._restart_at["ns-a"] - time.monotonic() > 1.5
+
+    def test_all_namespaces_share_one_watch(self, cluster: FakeCluster) -> None:
+        failed_at = datetime.now(timezone.utc)
+        cluster.add_job(job_dict("job-a", "ns-a", failed_at=failed_at))
+        cluster.add_job(job_dict("job-a", "ns-b", failed_at=failed_at))
+
+        def factory(cfg: OperatorConfig) -> JobRestartOperator:
+            op = make_operator(cfg, cluster)
+            op._cluster_jobs = supervisor._cluster_jobs
+            return op
+
+        supervisor = NamespaceSupervisor(
+            _config(namespaces=["*"], check_mode="watch", restart_delay=0),
+            api_client=client.ApiClient(),
+            operator_factory=factory,
+        )
+        assert supervisor._cluster_jobs is not None
+        supervisor._core_v1 = cluster.core_v1  # type: ignore[assignment]
+        supervisor._cluster_jobs._informer._batch_v1 = cluster.batch_v1  # type: ignore[assignment]
+        shutdown = threading.Event()
+        thread = threading.Thread(target=supervisor.run, args=(shutdown,), daemon=True)
+        thread.start()
+        try:
+            deadline = time.monotonic() + 5
+            while cluster.calls["create_namespaced_job"] < 2 and time.monotonic() < deadline:
+                time.sleep(0.01)
+        finally:
+            shutdown.set()
+            thread.join(timeout=10)
+
+        assert cluster.calls["create_namespaced_job"] == 2
+        assert cluster.calls["list_all_namespaces_job"] == 1
+        assert cluster.calls["list_namespaced_job"] == 0
+        assert cluster.calls["watch_namespaced_job"] == 0
+
+    def test_all_namespaces_follow_the_cluster(self, cluster: FakeCluster) -> None:
+        cluster.add_job(job_dict("job-a", "ns-a"))
+        cluster.add_job(job_dict("job-a", "ns-b"))
+        started: list[str] = []
+        supervisor = NamespaceSupervisor(
+            _config(namespaces=["*"]),
+            api_client=client.ApiClient(),
+            operator_factory=lambda cfg: _RecordingOperator(cfg, started),
+        )
+        supervisor._core_v1 = cluster.core_v1  # type: ignore[assignment]
+
+        supervisor._reconcile(supervisor._target_namespaces() or set())
+        assert supervisor.namespaces() == ["ns-a", "ns-b"]
+
+        del cluster.jobs[("ns-b", "job-a")]
+        supervisor._reconcile(supervisor._target_namespaces() or set())
+        assert supervisor.namespaces() == ["ns-a"]
+
+        for stop, thread in supervisor._operators.values():
+            stop.set()
+            thread.join(timeout=5)
+
+    def test_operators_share_client_and_metrics(self) -> None:
+        api_client = client.ApiClient()
+        supervisor = NamespaceSupervisor(_config(), api_client=api_client)
+
+        first = supervisor._make_operator(namespace_config(_config(), "ns-a"))
+        second = supervisor._make_operator(namespace_config(_config(), "ns-b"))
+
+        assert isinstance(first, JobRestartOperator) and isinstance(second, JobRestartOperator)
+        assert first._api_client is api_client and second._api_client is api_client
+        assert first.metrics is supervisor.metrics and second.metrics is supervisor.metrics
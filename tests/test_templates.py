@@ -0,0 +1,181 @@
+"""Tests for :mod:`flickr_immich_k8s_sync_operator.templates`."""
+
+import json
+
+from flickr_immich_k8s_sync_operator.templates import (
+    ConfigMapTemplates,
+    CronJobTemplates,
+    FlickrSyncTemplates,
+    cronjob_owner,
+    cronjob_owner_reference,
+    normalize_template,
+)
+from tests.fake_k8s import FakeCluster, _deserialize, job_dict
+
+_POD_TEMPLATE = {"spec": {"containers": [{"name": "downloader", "image": "flickr-dl:2"}], "restartPolicy": "Never"}}
+
+_JOB_TEMPLATE = {"metadata": {"labels": {"app": "flickr"}}, "spec": {"backoffLimit": 2, "template": _POD_TEMPLATE}}
+
+
+def _config_map(cluster: FakeCluster, data: dict[str, str]) -> None:
+    cluster.config_maps[("flickr-downloader", "templates")] = {"metadata": {"name": "templates"}, "data": data}
+
+
+def _configmap_templates(cluster: FakeCluster, ttl: float = 60, clock: list[float] | None = None) -> ConfigMapTemplates:
+    templates = ConfigMapTemplates(cluster.core_v1, "flickr-downloader", "templates", ttl)  # type: ignore[arg-type]
+    if clock is not None:
+        templates._clock = lambda: clock[0]
+    return templates
+
+
+class TestTemplateHelpers:
+    """Tests for :func:`normalize_template`, :func:`cronjob_owner` and :func:`cronjob_owner_reference`."""
+
+    def test_job_template_is_kept(self) -> None:
+        assert normalize_template(_JOB_TEMPLATE) == _JOB_TEMPLATE
+
+    def test_pod_template_is_wrapped(self) -> None:
+        assert normalize_template(_POD_TEMPLATE) == {"metadata": {}, "spec": {"template": _POD_TEMPLATE}}
+
+    def test_other_documents_are_rejected(self) -> None:
+        assert normalize_template("just text") is None
+        assert normalize_template({"spec": {"backoffLimit": 2}}) is None
+
+    def test_cronjob_owner_of_dict_and_model(self) -> None:
+        job = job_dict("nightly-28000000")
+        job["metadata"]["ownerReferences"] = [
+            {"apiVersion": "v1", "kind": "ConfigMap", "name": "other", "uid": "u1"},
+            {"apiVersion": "batch/v1", "kind": "CronJob", "name": "nightly", "uid": "u2"},
+        ]
+
+        assert cronjob_owner(job) == "nightly"
+        assert cronjob_owner(_deserialize(job, "V1Job")) == "nightly"
+        assert cronjob_owner(job_dict("job-a")) is None
+
+    def test_cronjob_owner_reference_of_dict_and_model(self) -> None:
+        reference = {
+            "apiVersion": "batch/v1",
+            "kind": "CronJob",
+            "name": "nightly",
+            "uid": "u2",
+            "controller": True,
+            "blockOwnerDeletion": True,
+        }
+        job = job_dict("nightly-28000000")
+        job["metadata"]["ownerReferences"] = [reference]
+
+        assert cronjob_owner_reference(job) == reference
+        assert cronjob_owner_reference(_deserialize(job, "V1Job")) == reference
+        assert cronjob_owner_reference(job_dict("job-a")) is None
+
+
+class TestConfigMapTemplates:
+    """Tests for :class:`ConfigMapTemplates`."""
+
+    def test_builds_manifest_from_json_and_yaml_keys(self) -> None:
+        cluster = FakeCluster()
+        _config_map(
+            cluster,
+            {
+                "job-a.json": json.dumps(_JOB_TEMPLATE),
+                "job-b.yaml": "spec:\n  containers:\n    - name: downloader\n      image: flickr-dl:2\n",
+            },
+        )
+        templates = _configmap_templates(cluster)
+
+        assert templates.manifest("job-a") == {
+            "apiVersion": "batch/v1",
+            "kind": "Job",
+            "metadata": {"name": "job-a", "namespace": "flickr-downloader", "labels": {"app": "flickr"}},
+            "spec": _JOB_TEMPLATE["spec"],
+        }
+        manifest = templates.manifest("job-b")
+        assert manifest is not None
+        assert manifest["spec"]["template"]["spec"]["containers"][0]["image"] == "flickr-dl:2"
+        assert templates.manifest("job-c") is None
+        assert cluster.calls["read_namespaced_config_map"] == 1
+
+    def test_invalid_entries_are_skipped(self) -> None:
+        cluster = FakeCluster()
+        _config_map(cluster, {"job-a": json.dumps(_JOB_TEMPLATE), "job-b": "spec: [", "job-c": "42"})
+
+        templates = _configmap_templates(cluster)
+
+        assert templates.manifest("job-a") is not None
+        assert templates.manifest("job-b") is None
+        assert templates.manifest("job-c") is None
+
+    def test_reloads_after_ttl(self) -> None:
+        cluster = FakeCluster()
+        _config_map(cluster, {"job-a": json.dumps(_JOB_TEMPLATE)})
+        clock = [0.0]
+        templates = _configmap_templates(cluster, ttl=60, clock=clock)
+        templates.manifest("job-a")
+        _config_map(cluster, {})
+
+        clock[0] = 59.0
+        assert templates.manifest("job-a") is not None
+        clock[0] = 60.0
+        assert templates.manifest("job-a") is None
+        assert cluster.calls["read_namespaced_config_map"] == 2
+
+    def test_failed_reload_keeps_the_index(self) -> None:
+        cluster = FakeCluster()
+        _config_map(cluster, {"job-a": json.dumps(_JOB_TEMPLATE)})
+        clock = [0.0]
+        templates = _configmap_templates(cluster, ttl=60, clock=clock)
+        templates.manifest("job-a")
+        cluster.failure_rate = 1.0
+
+        clock[0] = 120.0
+        assert templates.manifest("job-a") is not None
+
+    def test_missing_config_map_yields_no_templates(self) -> None:
+        templates = _configmap_templates(FakeCluster())
+
+        assert templates.manifest("job-a") is None
+
+
+class TestCronJobTemplates:
+    """Tests for :class:`CronJobTemplates`."""
+
+    def test_indexes_job_templates_by_cronjob_name(self) -> None:
+        cluster = FakeCluster()
+        cluster.cron_jobs[("flickr-downloader", "nightly")] = {
+            "metadata": {"name": "nightly"},
+            "spec": {"schedule": "0 3 * * *", "jobTemplate": _JOB_TEMPLATE},
+        }
+        cluster.cron_jobs[("other-ns", "elsewhere")] = {
+            "metadata": {"name": "elsewhere"},
+            "spec": {"schedule": "0 3 * * *", "jobTemplate": _JOB_TEMPLATE},
+        }
+        templates = CronJobTemplates(cluster.batch_v1, "flickr-downloader", 60)  # type: ignore[arg-type]
+
+        owner = {"apiVersion": "batch/v1", "kind": "CronJob", "name": "nightly", "uid": "cronjob-uid"}
+
+        manifest = templates.manifest("nightly-28000000", owner)
+
+        assert manifest is not None
+        assert manifest["metadata"]["name"] == "nightly-28000000"
+        assert manifest["metadata"]["ownerReferences"] == [owner]
+        assert manifest["spec"] == _JOB_TEMPLATE["spec"]
+        assert templates.manifest("elsewhere") is None
+        assert cluster.calls["list_namespaced_cron_job"] == 1
+
+
+class TestFlickrSyncTemplates:
+    """Tests for :class:`FlickrSyncTemplates`."""
+
+    def test_indexes_valid_resources_by_job_name(self) -> None:
+        cluster = FakeCluster()
+        cluster.add_flickrsync("alice", {"user": "alice", "image": "flickr-dl:2"})
+        cluster.add_flickrsync("broken", {"user": "Bob"})
+        templates = FlickrSyncTemplates(cluster.custom_objects, "flickr-downloader", 60)  # type: ignore[arg-type]
+
+        manifest = templates.manifest("flickr-downloader-alice")
+
+        assert manifest is not None
+        assert manifest["metadata"]["ownerReferences"][0]["kind"] == "FlickrSync"
+        assert manifest["spec"]["template"]["spec"]["containers"][0]["image"] == "flickr-dl:2"
+        assert templates.manifest("flickr-downloader-bob") is None
+        assert cluster.calls["list_namespaced_custom_object"] == 1
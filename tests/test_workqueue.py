@@ -0,0 +1,77 @@
+"""Tests for :mod:`flickr_immich_k8s_sync_operator.workqueue`."""
+
+import threading
+
+from flickr_immich_k8s_sync_operator.workqueue import WorkQueue
+
+
+def _queue(clock: list[float], **kwargs: float) -> WorkQueue:
+    return WorkQueue(clock=lambda: clock[0], **kwargs)  # type: ignore[arg-type]
+
+
+class TestWorkQueue:
+    """Tests for :class:`WorkQueue`."""
+
+    def test_keys_are_deduplicated(self) -> None:
+        queue = WorkQueue()
+        for key in ("job-a", "job-b", "job-a", "job-a"):
+            queue.add(key)
+
+        assert len(queue) == 2
+        assert [queue.get(timeout=0), queue.get(timeout=0), queue.get(timeout=0)] == ["job-a", "job-b", None]
+
+    def test_key_added_while_processing_is_handed_out_after_done(self) -> None:
+        queue = WorkQueue()
+        queue.add("job-a")
+        assert queue.get(timeout=0) == "job-a"
+
+        queue.add("job-a")
+        queue.add("job-a")
+        assert queue.get(timeout=0) is None
+
+        queue.done("job-a")
+        assert queue.get(timeout=0) == "job-a"
+        queue.done("job-a")
+        assert queue.get(timeout=0) is None
+
+    def test_delayed_keys_are_handed_out_when_due(self) -> None:
+        clock = [0.0]
+        queue = _queue(clock)
+        queue.add_after("job-a", 5.0)
+
+        assert queue.get(timeout=0) is None
+        clock[0] = 5.0
+        assert queue.get(timeout=0) == "job-a"
+
+    def test_backoff_doubles_per_key_until_forgotten(self) -> None:
+        queue = _queue([0.0], retry_base=1.0, retry_max=5.0)
+
+        assert [queue.add_rate_limited("job-a") for _ in range(4)] == [1.0, 2.0, 4.0, 5.0]
+        assert queue.add_rate_limited("job-b") == 1.0
+        assert queue.num_requeues("job-a") == 4
+
+        queue.forget("job-a")
+        assert queue.add_rate_limited("job-a") == 1.0
+
+    def test_overall_rate_limit_spreads_retries(self) -> None:
+        clock = [0.0]
+        queue = _queue(clock, qps=2.0, burst=2, retry_base=0.01)
+
+        delays = [queue.add_rate_limited(f"job-{index}") for index in range(4)]
+        assert delays == [0.01, 0.01, 0.5, 1.0]
+
+        clock[0] = 10.0
+        assert queue.add_rate_limited("job-x") == 0.01
+
+    def test_shut_down_wakes_up_waiting_workers(self) -> None:
+        queue = WorkQueue()
+        results: list[str | None] = []
+        worker = threading.Thread(target=lambda: results.append(queue.get()))
+        worker.start()
+
+        queue.shut_down()
+        worker.join(timeout=5)
+
+        assert results == [None]
+        queue.add("job-a")
+        assert len(queue) == 0